@@ -1,17 +1,30 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, Header, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from typing import Optional
-from app.models import User, Role
-from app.auth import decode_access_token
+from typing import AsyncIterator, Optional
+from app import query_stats, replicas
+from app.auth import Principal, decode_access_token, principal_from_claims
 from app.services import UserService
 
 security = HTTPBearer()
 
+# Methods served from the token claims alone, without reloading the user
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
 
 async def get_current_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security)
-) -> User:
-    """Get current authenticated user from JWT token"""
+) -> Principal:
+    """
+    Resolve the authenticated principal from the JWT token.
+
+    Read requests trust the signed role and client claims as long as the
+    token version is current. The version comes from a per-worker cache, so
+    they cost no database round trip except one per user and worker every
+    TOKEN_VERSION_CACHE_SECONDS; a token revoked on another worker stays
+    valid for reads until then. Writes always reload the principal. FastAPI caches this dependency per request,
+    so every role check and router sharing it reuses the same principal.
+    """
     token = credentials.credentials
     payload = decode_access_token(token)
     
@@ -21,6 +34,17 @@ async def get_current_user(
             detail="Invalid authentication credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
+
+    claimed = principal_from_claims(payload)
+    if claimed is not None and request.method in SAFE_METHODS:
+        current_version = await UserService.get_token_version(claimed.id)
+        if current_version != claimed.token_version:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Token has been revoked",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        return claimed
     
     user_id_str: Optional[str] = payload.get("sub")
     if user_id_str is None:
@@ -37,19 +61,26 @@ async def get_current_user(
             detail="Invalid user ID in token",
         )
 
-    user = await UserService.get_user_by_id(user_id)
-    if user is None or not user.is_active:
+    principal = await UserService.get_principal(user_id)
+    if principal is None or not principal.is_active:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found or inactive",
         )
+
+    if claimed is not None and claimed.token_version != principal.token_version:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
     
-    return user
+    return principal
 
 
 async def get_current_active_user(
-    current_user: User = Depends(get_current_user)
-) -> User:
+    current_user: Principal = Depends(get_current_user)
+) -> Principal:
     """Get current active user"""
     if not current_user.is_active:
         raise HTTPException(
@@ -60,13 +91,10 @@ async def get_current_active_user(
 
 
 async def require_admin(
-    current_user: User = Depends(get_current_active_user)
-) -> User:
+    current_user: Principal = Depends(get_current_active_user)
+) -> Principal:
     """Require admin role"""
-    await current_user.fetch_related("roles")
-    role_names = [role.name.lower() for role in current_user.roles]
-    
-    if "admin" not in role_names:
+    if not current_user.is_admin:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin access required"
@@ -75,17 +103,10 @@ async def require_admin(
 
 
 async def require_admin_or_operator(
-    current_user: User = Depends(get_current_active_user)
-) -> User:
+    current_user: Principal = Depends(get_current_active_user)
+) -> Principal:
     """Require admin, operator, or supervisor role"""
-    await current_user.fetch_related("roles")
-    role_names = [role.name.lower() for role in current_user.roles]
-    
-    if (
-        "admin" not in role_names
-        and "operator" not in role_names
-        and "supervisor" not in role_names
-    ):
+    if not current_user.has_role("admin", "operator", "supervisor"):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin, Operator, or Supervisor access required"
@@ -94,16 +115,81 @@ async def require_admin_or_operator(
 
 
 async def require_supervisor_or_admin(
-    current_user: User = Depends(get_current_active_user)
-) -> User:
+    current_user: Principal = Depends(get_current_active_user)
+) -> Principal:
     """Require supervisor or admin role"""
-    await current_user.fetch_related("roles")
-    role_names = [role.name.lower() for role in current_user.roles]
-    
-    if "admin" not in role_names and "supervisor" not in role_names:
+    if not current_user.has_role("admin", "supervisor"):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Supervisor or Admin access required"
         )
     return current_user
 
+
+async def route_reads(
+    request: Request,
+    current_user: Principal = Depends(get_current_active_user)
+) -> AsyncIterator[None]:
+    """
+    Read-only routing policy, applied to whole routers.
+
+    GET and HEAD requests read from a replica, unless the user wrote within
+    REPLICA_STICKY_SECONDS. A replica failing a query is dropped until its
+    next health check. Other methods use the primary, and mark the user as
+    having just written.
+    """
+    if request.method not in ("GET", "HEAD"):
+        try:
+            yield
+        finally:
+            replicas.record_write(current_user.id)
+        return
+
+    alias = replicas.use_replica_for_reads(current_user.id)
+    try:
+        yield
+    except replicas.REPLICA_FAILURES:
+        if alias is not None:
+            replicas.mark_down(alias)
+        raise
+
+
+def query_budget(limit: int):
+    """
+    Dependency declaring how many SQL statements an endpoint may issue per
+    request, authentication included. Budgets cover the worst case: an
+    expired token version cache, a cold analytics cache and new rollup rows.
+    Requests over it are logged, and fail in the test suite
+    (QUERY_BUDGET_STRICT).
+    """
+    async def declare_budget() -> None:
+        query_stats.set_budget(limit)
+    return declare_budget
+
+
+def version_etag(version: int) -> str:
+    """ETag header value for a claim or lead at the given version"""
+    return f'"{version}"'
+
+
+async def if_match_version(
+    if_match: Optional[str] = Header(None, description="ETag of the version the update is based on")
+) -> Optional[int]:
+    """
+    Version a conditional update expects, from the If-Match header.
+
+    Returns None without the header or for 'If-Match: *'; the update then
+    applies to whatever version is current.
+    """
+    if if_match is None or if_match.strip() == "*":
+        return None
+    tag = if_match.strip()
+    if tag.startswith("W/"):
+        tag = tag[2:]
+    try:
+        return int(tag.strip('"'))
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="If-Match must carry an ETag returned by this API",
+        )
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from app.schemas import UserLogin
 from app.services import UserService
-from app.auth import create_access_token
+from app.auth import create_access_token, principal_to_claims
 from app.api.dependencies import get_current_active_user
 from app.models import User
 
@@ -24,8 +24,9 @@ async def login(credentials: UserLogin):
             detail="Incorrect username or password"
         )
     
-    # Create access token
-    access_token = create_access_token(data={"sub": str(user.id)})
+    # Create access token carrying roles, client profile and token version
+    principal = await UserService.get_principal(user.id)
+    access_token = create_access_token(data=principal_to_claims(principal))
     
     return {
         "access_token": access_token,
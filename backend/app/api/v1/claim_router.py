@@ -1,22 +1,31 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File
-from typing import List, Optional
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, status, Query, UploadFile, File, Response
+from typing import List, Literal, Optional
 from app.schemas import (
-    ClaimCreate, ClaimUpdate, ClaimResponse, ClaimFileResponse,
-    ClaimCommentResponse
+    ClaimCreate, ClaimUpdate, ClaimResponse, ClaimSummaryResponse, ClaimFileResponse,
+    ClaimCommentResponse, ClaimFileByHash, ClaimFileUploadRequest, ClaimFileUploadUrl
 )
-from app.services import ClaimService
+from app.services import ClaimService, UserService
 from app.api.dependencies import (
     get_current_active_user, require_admin_or_operator, require_admin,
-    require_supervisor_or_admin
+    require_supervisor_or_admin, if_match_version, version_etag, query_budget, route_reads
 )
 from app.models.supervisor_operator import SupervisorOperator
-from app.models import User, Client
+from app.auth import Principal
 from app.models.claim import ClaimStatus
+from app.pagination import CURSOR_HEADER, next_cursor
+from app.archives import entry_name, stream_zip
+from app.storage import UploadTooLarge, get_blob_store
+from fastapi.responses import StreamingResponse
+from app.auth import create_access_token, decode_access_token
+from app.config import settings
+from datetime import timedelta
 from pydantic import BaseModel
 import os
-from datetime import datetime
 
-router = APIRouter(prefix="/claims", tags=["Claims"])
+router = APIRouter(prefix="/claims", tags=["Claims"], dependencies=[Depends(route_reads)])
+
+# "typ" claim of the tokens vouching for a direct upload
+UPLOAD_TOKEN_TYPE = "claim_file_upload"
 
 
 class CommentCreate(BaseModel):
@@ -29,17 +38,14 @@ class CommentCreate(BaseModel):
 @router.post("", response_model=ClaimResponse, status_code=status.HTTP_201_CREATED)
 async def create_claim(
     claim_data: ClaimCreate,
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_user)
 ):
     """Create claim (clients only create their own claims)"""
-    await current_user.fetch_related("roles")
-    role_names = [r.name.lower() for r in current_user.roles]
-    is_admin = "admin" in role_names
+    is_admin = current_user.is_admin
 
     if not is_admin:
         # Only create claim for your own client profile
-        client = await Client.get_or_none(id=claim_data.client_id, user_id=current_user.id)
-        if not client:
+        if current_user.client_id is None or claim_data.client_id != current_user.client_id:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="You can only create claims for your own client profile"
@@ -52,24 +58,28 @@ async def create_claim(
 # ------------------------------------------------------------
 # LIST CLAIMS — NOW RETURNS CLEAR ERRORS
 # ------------------------------------------------------------
-@router.get("", response_model=List[ClaimResponse])
+@router.get("", response_model=List[ClaimSummaryResponse], dependencies=[Depends(query_budget(4))])
 async def list_claims(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     operator_id: Optional[int] = None,
     supervisor_id: Optional[int] = None,
     client_id: Optional[int] = None,
     claim_status: Optional[ClaimStatus] = Query(None),
-    current_user: User = Depends(get_current_active_user)
+    cursor: Optional[str] = Query(
+        None, description="Keyset paging: '' for the first page, then the previous page's X-Next-Cursor header"
+    ),
+    include: Optional[Literal["comments"]] = Query(
+        None, description="'comments' to embed full comments instead of only comment_count"
+    ),
+    current_user: Principal = Depends(get_current_active_user)
 ):
-    """List claims with clear response handling"""
-
-    await current_user.fetch_related("roles")
-    roles = [r.name.lower() for r in current_user.roles]
+    """List claims newest first; keyset pages carry an X-Next-Cursor header"""
 
-    is_admin = "admin" in roles
-    is_supervisor = "supervisor" in roles
-    is_operator = "operator" in roles
+    is_admin = current_user.is_admin
+    is_supervisor = current_user.is_supervisor
+    is_operator = current_user.is_operator
 
     # ROLE FILTERING
     if is_operator and not is_admin and not is_supervisor:
@@ -80,13 +90,12 @@ async def list_claims(
 
     elif not is_admin:
         # Client profile validation
-        client = await Client.get_or_none(user_id=current_user.id)
-        if not client:
+        if current_user.client_id is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Client profile not found for this user"
             )
-        client_id = client.id
+        client_id = current_user.client_id
 
     # QUERY CLAIMS
     claims = await ClaimService.get_all_claims(
@@ -95,9 +104,16 @@ async def list_claims(
         operator_id=operator_id,
         supervisor_id=supervisor_id,
         client_id=client_id,
-        status=claim_status
+        status=claim_status,
+        cursor=cursor,
+        include_comments=include == "comments"
     )
 
+    if cursor is not None:
+        next_page = next_cursor(claims, limit)
+        if next_page:
+            response.headers[CURSOR_HEADER] = next_page
+
     # ALWAYS return 200 even if list is empty
     return claims
 
@@ -105,24 +121,50 @@ async def list_claims(
 # ------------------------------------------------------------
 # GET CLAIM DETAILS
 # ------------------------------------------------------------
-@router.get("/{claim_id}", response_model=ClaimResponse)
+@router.get("/{claim_id}", response_model=ClaimResponse, dependencies=[Depends(query_budget(3))])
 async def get_claim(
     claim_id: int,
-    current_user: User = Depends(get_current_active_user)
+    response: Response,
+    current_user: Principal = Depends(get_current_active_user)
 ):
+    claim = await _get_viewable_claim(claim_id, current_user)
+    response.headers["ETag"] = version_etag(claim.version)
+    return await ClaimService.attach_latest_comments(claim)
+
+
+# ------------------------------------------------------------
+# LIST COMMENTS
+# ------------------------------------------------------------
+@router.get("/{claim_id}/comments", response_model=List[ClaimCommentResponse])
+async def list_claim_comments(
+    claim_id: int,
+    response: Response,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: str = Query(
+        "", description="'' for the newest comments, then the previous page's X-Next-Cursor header"
+    ),
+    current_user: Principal = Depends(get_current_active_user)
+):
+    """List a claim's comments newest first; each page carries the X-Next-Cursor of the next"""
+    await _get_viewable_claim(claim_id, current_user)
+    comments = await ClaimService.get_claim_comments(claim_id, limit=limit, cursor=cursor)
+
+    next_page = next_cursor(comments, limit)
+    if next_page:
+        response.headers[CURSOR_HEADER] = next_page
+    return comments
+
+
+async def _get_viewable_claim(claim_id: int, current_user: Principal):
+    """Claim by ID, or 404/403 unless the user may view it"""
     claim = await ClaimService.get_claim_by_id(claim_id)
     if not claim:
         raise HTTPException(status_code=404, detail="Claim not found")
 
-    await current_user.fetch_related("roles")
-    roles = [r.name.lower() for r in current_user.roles]
-
-    is_admin = "admin" in roles
+    is_admin = current_user.is_admin
 
     if not is_admin:
-        client = await Client.get_or_none(user_id=current_user.id)
-
-        if client and claim.client_id == client.id:
+        if current_user.client_id is not None and claim.client_id == current_user.client_id:
             pass  # client sees own claim
         elif claim.assigned_operator_id == current_user.id:
             pass  # operator sees assigned claim
@@ -144,21 +186,21 @@ async def get_claim(
 async def update_claim(
     claim_id: int,
     claim_data: ClaimUpdate,
-    current_user: User = Depends(get_current_active_user)
+    response: Response,
+    expected_version: Optional[int] = Depends(if_match_version),
+    current_user: Principal = Depends(get_current_active_user)
 ):
     """Update claim (admin, supervisor managing their operators, or assigned operator)"""
-    claim = await ClaimService.get_claim_by_id(claim_id)
-    if not claim:
-        raise HTTPException(status_code=404, detail="Claim not found")
-
-    # Check permissions
-    await current_user.fetch_related("roles")
-    role_names = [role.name.lower() for role in current_user.roles]
-    is_admin = "admin" in role_names
-    is_supervisor = "supervisor" in role_names
-    is_operator = "operator" in role_names
+    # Check permissions; admins may update any claim, so only the others need the row first
+    is_admin = current_user.is_admin
+    is_supervisor = current_user.is_supervisor
+    is_operator = current_user.is_operator
 
     if not is_admin:
+        claim = await ClaimService.get_claim_by_id(claim_id)
+        if not claim:
+            raise HTTPException(status_code=404, detail="Claim not found")
+
         if is_supervisor:
             # Supervisor can only manage claims assigned to their operators
             if claim.assigned_supervisor_id != current_user.id:
@@ -191,7 +233,14 @@ async def update_claim(
                 detail="You do not have permission to update claims"
             )
 
-    updated = await ClaimService.update_claim(claim_id, claim_data)
+        if expected_version is None:
+            # The checks above hold for the version just read; never write over a newer one
+            expected_version = claim.version
+
+    updated = await ClaimService.update_claim(claim_id, claim_data, expected_version)
+    if not updated:
+        raise HTTPException(status_code=404, detail="Claim not found")
+    response.headers["ETag"] = version_etag(updated.version)
     return updated
 
 
@@ -201,25 +250,157 @@ async def update_claim(
 @router.post("/{claim_id}/files", response_model=ClaimFileResponse)
 async def upload_claim_file(
     claim_id: int,
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_user)
 ):
-    claim = await ClaimService.get_claim_by_id(claim_id)
-    if not claim:
-        raise HTTPException(status_code=404, detail="Claim not found")
+    """
+    Attach a file to a claim; it is streamed to storage, up to MAX_UPLOAD_BYTES, and stored once per content.
 
-    upload_dir = "uploads/claims"
-    os.makedirs(upload_dir, exist_ok=True)
+    Image and PDF thumbnails are rendered after the response is sent.
+    """
+    await _get_viewable_claim(claim_id, current_user)
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    ext = os.path.splitext(file.filename)[1]
-    filename = f"{claim_id}_{timestamp}{ext}"
-    path = os.path.join(upload_dir, filename)
+    stored = await get_blob_store().save(file)
+    claim_file = await ClaimService.upload_file(claim_id, stored, os.path.basename(file.filename or ""))
+    background_tasks.add_task(ClaimService.generate_preview, claim_file)
+    return claim_file
 
-    with open(path, "wb") as buff:
-        buff.write(await file.read())
 
-    return await ClaimService.upload_file(claim_id, path)
+@router.post("/{claim_id}/files/upload-url", response_model=ClaimFileUploadUrl)
+async def get_claim_file_upload_url(
+    claim_id: int,
+    upload_data: ClaimFileUploadRequest,
+    current_user: Principal = Depends(get_current_active_user)
+):
+    """
+    Presigned request uploading a file straight to storage, bypassing the API.
+
+    After the upload succeeds, attach the file with /files/by-hash, passing
+    the returned upload_token. Only available with the s3 storage backend.
+    """
+    await _get_viewable_claim(claim_id, current_user)
+    if upload_data.size > settings.MAX_UPLOAD_BYTES:
+        raise UploadTooLarge(settings.MAX_UPLOAD_BYTES)
+
+    upload = get_blob_store().upload_url(upload_data.sha256, upload_data.size)
+    if upload is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Direct uploads are not available with this storage backend; upload through /files"
+        )
+    return {**upload, "upload_token": _upload_token(claim_id, upload_data.sha256)}
+
+
+def _upload_token(claim_id: int, sha256: str) -> str:
+    """Signed proof that the bearer was handed a direct upload of sha256 for this claim"""
+    return create_access_token(
+        {"typ": UPLOAD_TOKEN_TYPE, "claim": claim_id, "sha256": sha256},
+        timedelta(seconds=settings.PRESIGNED_URL_SECONDS * 2),
+    )
+
+
+def _upload_token_matches(token: Optional[str], claim_id: int, sha256: str) -> bool:
+    payload = decode_access_token(token) if token else None
+    return (
+        payload is not None
+        and payload.get("typ") == UPLOAD_TOKEN_TYPE
+        and payload.get("claim") == claim_id
+        and payload.get("sha256") == sha256
+    )
+
+
+@router.post("/{claim_id}/files/by-hash", response_model=ClaimFileResponse)
+async def attach_claim_file_by_hash(
+    claim_id: int,
+    file_data: ClaimFileByHash,
+    background_tasks: BackgroundTasks,
+    current_user: Principal = Depends(get_current_active_user)
+):
+    """
+    Attach a stored file to a claim by its SHA-256, without sending it again.
+
+    The file must either already be attached to one of the client's claims,
+    or have been uploaded directly through /files/upload-url (pass its
+    upload_token). A 404 means the file is not available; upload it instead.
+    """
+    claim = await _get_viewable_claim(claim_id, current_user)
+
+    claim_file = await ClaimService.attach_stored_file(
+        claim_id,
+        claim.client_id,
+        file_data.sha256,
+        file_data.filename,
+        uploaded_directly=_upload_token_matches(file_data.upload_token, claim_id, file_data.sha256),
+    )
+    if not claim_file:
+        raise HTTPException(status_code=404, detail="No stored file with that hash")
+    background_tasks.add_task(ClaimService.generate_preview, claim_file)
+    return claim_file
+
+
+# ------------------------------------------------------------
+# DOWNLOAD ALL FILES
+# ------------------------------------------------------------
+@router.get("/{claim_id}/files/archive")
+async def download_claim_files_archive(
+    claim_id: int,
+    current_user: Principal = Depends(get_current_active_user)
+):
+    """Download every file of a claim as a ZIP archive, streamed as it is built"""
+    await _get_viewable_claim(claim_id, current_user)
+    files = await ClaimService.get_files_for_claims([claim_id])
+    return StreamingResponse(
+        stream_zip((entry_name(claim_file), claim_file) for claim_file in files),
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="claim-{claim_id}-files.zip"'},
+    )
+
+
+# ------------------------------------------------------------
+# DOWNLOAD FILE
+# ------------------------------------------------------------
+@router.get("/{claim_id}/files/{file_id}")
+async def download_claim_file(
+    claim_id: int,
+    file_id: int,
+    if_none_match: Optional[str] = Header(None),
+    current_user: Principal = Depends(get_current_active_user)
+):
+    """Download a claim file; supports Range requests and ETag revalidation, or redirects to a presigned URL"""
+    await _get_viewable_claim(claim_id, current_user)
+    claim_file = await ClaimService.get_claim_file(claim_id, file_id)
+    if not claim_file:
+        raise HTTPException(status_code=404, detail="File not found")
+
+    response = await get_blob_store().response(
+        claim_file.file_path,
+        claim_file.filename or os.path.basename(claim_file.file_path),
+        claim_file.sha256,
+        claim_file.uploaded_at,
+        if_none_match,
+    )
+    if response is None:
+        raise HTTPException(status_code=404, detail="File not found")
+    return response
+
+
+@router.get("/{claim_id}/files/{file_id}/preview")
+async def get_claim_file_preview(
+    claim_id: int,
+    file_id: int,
+    current_user: Principal = Depends(get_current_active_user)
+):
+    """WebP thumbnail of a claim file, cacheable for good; 404 until has_preview is set"""
+    await _get_viewable_claim(claim_id, current_user)
+    claim_file = await ClaimService.get_claim_file(claim_id, file_id)
+    if not claim_file or not claim_file.has_preview:
+        raise HTTPException(status_code=404, detail="Preview not found")
+
+    response = await get_blob_store().preview_response(claim_file.sha256)
+    if response is None:
+        raise HTTPException(status_code=404, detail="Preview not found")
+    return response
 
 
 # ------------------------------------------------------------
@@ -229,7 +410,7 @@ async def upload_claim_file(
 async def add_claim_comment(
     claim_id: int,
     comment_data: CommentCreate,
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_user)
 ):
     """Add comment to claim (admin, supervisor, operator, or client on their own claims)"""
     claim = await ClaimService.get_claim_by_id(claim_id)
@@ -237,18 +418,15 @@ async def add_claim_comment(
         raise HTTPException(status_code=404, detail="Claim not found")
 
     # Check permissions
-    await current_user.fetch_related("roles")
-    role_names = [role.name.lower() for role in current_user.roles]
-    is_admin = "admin" in role_names
-    is_supervisor = "supervisor" in role_names
-    is_operator = "operator" in role_names
-    is_client = "client" in role_names
+    is_admin = current_user.is_admin
+    is_supervisor = current_user.is_supervisor
+    is_operator = current_user.is_operator
+    is_client = current_user.is_client
 
     if not is_admin:
         if is_client:
             # Client can only comment on their own claims
-            client = await Client.get_or_none(user_id=current_user.id)
-            if not client or claim.client_id != client.id:
+            if current_user.client_id is None or claim.client_id != current_user.client_id:
                 raise HTTPException(
                     status_code=status.HTTP_403_FORBIDDEN,
                     detail="You can only comment on your own claims"
@@ -307,30 +485,23 @@ class ChangeStatusRequest(BaseModel):
     status: ClaimStatus
 
 
-@router.post("/{claim_id}/assign-operator", response_model=ClaimResponse)
+@router.post("/{claim_id}/assign-operator", response_model=ClaimResponse, dependencies=[Depends(query_budget(7))])
 async def assign_claim_to_operator(
     claim_id: int,
     assign_data: AssignOperatorRequest,
-    current_user: User = Depends(require_admin)
+    response: Response,
+    expected_version: Optional[int] = Depends(if_match_version),
+    current_user: Principal = Depends(require_admin)
 ):
     """Assign claim to operator (admin only)"""
-    claim = await ClaimService.get_claim_by_id(claim_id)
-    if not claim:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Claim not found"
-        )
-    
     # Verify operator exists and has operator role
-    operator = await User.get_or_none(id=assign_data.operator_id)
-    if not operator:
+    role_names = await UserService.get_role_names(assign_data.operator_id)
+    if role_names is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Operator not found"
         )
     
-    await operator.fetch_related("roles")
-    role_names = [role.name.lower() for role in operator.roles]
     if "operator" not in role_names:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -338,41 +509,35 @@ async def assign_claim_to_operator(
         )
     
     claim_data = ClaimUpdate(assigned_operator_id=assign_data.operator_id)
-    updated_claim = await ClaimService.update_claim(claim_id, claim_data)
+    updated_claim = await ClaimService.update_claim(claim_id, claim_data, expected_version)
     
     if not updated_claim:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to assign operator to claim"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Claim not found"
         )
     
+    response.headers["ETag"] = version_etag(updated_claim.version)
     return updated_claim
 
 
-@router.post("/{claim_id}/assign-supervisor", response_model=ClaimResponse)
+@router.post("/{claim_id}/assign-supervisor", response_model=ClaimResponse, dependencies=[Depends(query_budget(7))])
 async def assign_claim_to_supervisor(
     claim_id: int,
     assign_data: AssignSupervisorRequest,
-    current_user: User = Depends(require_admin)
+    response: Response,
+    expected_version: Optional[int] = Depends(if_match_version),
+    current_user: Principal = Depends(require_admin)
 ):
     """Assign claim to supervisor (admin only)"""
-    claim = await ClaimService.get_claim_by_id(claim_id)
-    if not claim:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Claim not found"
-        )
-    
     # Verify supervisor exists and has supervisor role
-    supervisor = await User.get_or_none(id=assign_data.supervisor_id)
-    if not supervisor:
+    role_names = await UserService.get_role_names(assign_data.supervisor_id)
+    if role_names is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Supervisor not found"
         )
     
-    await supervisor.fetch_related("roles")
-    role_names = [role.name.lower() for role in supervisor.roles]
     if "supervisor" not in role_names:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -380,14 +545,15 @@ async def assign_claim_to_supervisor(
         )
     
     claim_data = ClaimUpdate(assigned_supervisor_id=assign_data.supervisor_id)
-    updated_claim = await ClaimService.update_claim(claim_id, claim_data)
+    updated_claim = await ClaimService.update_claim(claim_id, claim_data, expected_version)
     
     if not updated_claim:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to assign supervisor to claim"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Claim not found"
         )
     
+    response.headers["ETag"] = version_etag(updated_claim.version)
     return updated_claim
 
 
@@ -395,25 +561,21 @@ async def assign_claim_to_supervisor(
 async def change_claim_status(
     claim_id: int,
     status_data: ChangeStatusRequest,
-    current_user: User = Depends(require_admin)
+    response: Response,
+    expected_version: Optional[int] = Depends(if_match_version),
+    current_user: Principal = Depends(require_admin)
 ):
     """Change claim status (admin only)"""
-    claim = await ClaimService.get_claim_by_id(claim_id)
-    if not claim:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Claim not found"
-        )
-    
     claim_data = ClaimUpdate(status=status_data.status)
-    updated_claim = await ClaimService.update_claim(claim_id, claim_data)
+    updated_claim = await ClaimService.update_claim(claim_id, claim_data, expected_version)
     
     if not updated_claim:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to update claim status"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Claim not found"
         )
     
+    response.headers["ETag"] = version_etag(updated_claim.version)
     return updated_claim
 
 
@@ -421,30 +583,23 @@ async def change_claim_status(
 # SUPERVISOR ENDPOINTS
 # ------------------------------------------------------------
 
-@router.post("/{claim_id}/assign-operator-by-supervisor", response_model=ClaimResponse)
+@router.post("/{claim_id}/assign-operator-by-supervisor", response_model=ClaimResponse, dependencies=[Depends(query_budget(8))])
 async def assign_claim_to_operator_by_supervisor(
     claim_id: int,
     assign_data: AssignOperatorRequest,
-    current_user: User = Depends(require_supervisor_or_admin)
+    response: Response,
+    expected_version: Optional[int] = Depends(if_match_version),
+    current_user: Principal = Depends(require_supervisor_or_admin)
 ):
     """Assign claim to operator (supervisor can assign to their operators, admin can assign to any)"""
-    claim = await ClaimService.get_claim_by_id(claim_id)
-    if not claim:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Claim not found"
-        )
-    
     # Verify operator exists and has operator role
-    operator = await User.get_or_none(id=assign_data.operator_id)
-    if not operator:
+    role_names = await UserService.get_role_names(assign_data.operator_id)
+    if role_names is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Operator not found"
         )
     
-    await operator.fetch_related("roles")
-    role_names = [role.name.lower() for role in operator.roles]
     if "operator" not in role_names:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -452,9 +607,7 @@ async def assign_claim_to_operator_by_supervisor(
         )
     
     # Check if supervisor is assigning to their supervised operator
-    await current_user.fetch_related("roles")
-    current_role_names = [role.name.lower() for role in current_user.roles]
-    is_admin = "admin" in current_role_names
+    is_admin = current_user.is_admin
     
     if not is_admin:
         # Supervisor can only assign to their supervised operators
@@ -469,14 +622,15 @@ async def assign_claim_to_operator_by_supervisor(
             )
     
     claim_data = ClaimUpdate(assigned_operator_id=assign_data.operator_id)
-    updated_claim = await ClaimService.update_claim(claim_id, claim_data)
+    updated_claim = await ClaimService.update_claim(claim_id, claim_data, expected_version)
     
     if not updated_claim:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to assign operator to claim"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Claim not found"
         )
     
+    response.headers["ETag"] = version_etag(updated_claim.version)
     return updated_claim
 
 
@@ -484,7 +638,9 @@ async def assign_claim_to_operator_by_supervisor(
 async def change_claim_status_by_supervisor(
     claim_id: int,
     status_data: ChangeStatusRequest,
-    current_user: User = Depends(require_supervisor_or_admin)
+    response: Response,
+    expected_version: Optional[int] = Depends(if_match_version),
+    current_user: Principal = Depends(require_supervisor_or_admin)
 ):
     """Change claim status (supervisor can change status for their operators' claims, admin can change any)"""
     claim = await ClaimService.get_claim_by_id(claim_id)
@@ -495,9 +651,7 @@ async def change_claim_status_by_supervisor(
         )
     
     # Check if supervisor is managing their operator's claim
-    await current_user.fetch_related("roles")
-    role_names = [role.name.lower() for role in current_user.roles]
-    is_admin = "admin" in role_names
+    is_admin = current_user.is_admin
     
     if not is_admin:
         # Supervisor can only change status for claims assigned to them or their operators
@@ -518,13 +672,18 @@ async def change_claim_status_by_supervisor(
                     detail="You can only change status for claims assigned to you or your operators"
                 )
     
+        if expected_version is None:
+            # The checks above hold for the version just read; never write over a newer one
+            expected_version = claim.version
+    
     claim_data = ClaimUpdate(status=status_data.status)
-    updated_claim = await ClaimService.update_claim(claim_id, claim_data)
+    updated_claim = await ClaimService.update_claim(claim_id, claim_data, expected_version)
     
     if not updated_claim:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to update claim status"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Claim not found"
         )
     
+    response.headers["ETag"] = version_etag(updated_claim.version)
     return updated_claim
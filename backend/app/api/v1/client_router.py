@@ -1,15 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from fastapi.responses import StreamingResponse
+from typing import List, Optional
 from app.schemas import (
-    ClientResponse, ClientProductCreate, ClientProductResponse,
+    ClientResponse, ClientDetailResponse, ClientProductCreate, ClientProductResponse,
     ClientCommentCreate, ClientCommentResponse, ClaimResponse
 )
-from app.services import ClientService, ProductService
-from app.api.dependencies import get_current_active_user, require_admin
-from app.models import User
+from app.services import ClaimService, ClientService, ProductService
+from app.archives import entry_name, stream_zip
+from app.api.dependencies import get_current_active_user, require_admin, query_budget, route_reads
+from app.auth import Principal
+from app.config import settings
+from app.pagination import CURSOR_HEADER, next_cursor
 from pydantic import BaseModel
 
-router = APIRouter(prefix="/clients", tags=["Clients"])
+router = APIRouter(prefix="/clients", tags=["Clients"], dependencies=[Depends(route_reads)])
 
 
 class CommentCreate(BaseModel):
@@ -18,21 +22,30 @@ class CommentCreate(BaseModel):
 
 @router.get("", response_model=List[ClientResponse])
 async def list_clients(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
-    current_user: User = Depends(get_current_active_user)
+    cursor: Optional[str] = Query(
+        None, description="Keyset paging: '' for the first page, then the previous page's X-Next-Cursor header"
+    ),
+    current_user: Principal = Depends(get_current_active_user)
 ):
-    """List clients"""
-    clients = await ClientService.get_all_clients(skip=skip, limit=limit)
+    """List clients; keyset pages (newest first) carry an X-Next-Cursor header"""
+    clients = await ClientService.get_all_clients(skip=skip, limit=limit, cursor=cursor)
+
+    if cursor is not None:
+        next_page = next_cursor(clients, limit)
+        if next_page:
+            response.headers[CURSOR_HEADER] = next_page
     return clients
 
 
-@router.get("/{client_id}", response_model=ClientResponse)
+@router.get("/{client_id}", response_model=ClientDetailResponse)
 async def get_client(
     client_id: int,
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_user)
 ):
-    """Get client profile + products + income"""
+    """Get client profile + products + latest comments"""
     client = await ClientService.get_client_by_id(client_id)
     if not client:
         raise HTTPException(
@@ -40,9 +53,10 @@ async def get_client(
             detail="Client not found"
         )
     
-    # Get products and comments
+    # Get products and the latest comments; older ones page via /comments
     products = await ClientService.get_client_products(client_id)
-    comments = await ClientService.get_client_comments(client_id)
+    comments_limit = settings.DETAIL_COMMENTS_LIMIT
+    comments = await ClientService.get_client_comments(client_id, limit=comments_limit)
     
     # Convert to dict for response
     client_dict = {
@@ -57,6 +71,7 @@ async def get_client(
         "products": [
             {
                 "id": cp.id,
+                "client_id": cp.client_id,
                 "product_id": cp.product_id,
                 "assigned_at": cp.assigned_at,
             }
@@ -65,47 +80,42 @@ async def get_client(
         "comments": [
             {
                 "id": c.id,
+                "client_id": c.client_id,
                 "comment": c.comment,
                 "user_id": c.user_id,
                 "created_at": c.created_at,
             }
-            for c in comments
+            for c in reversed(comments)
         ],
+        "comments_cursor": next_cursor(comments, comments_limit),
     }
     
     return client_dict
 
 
-@router.post("/{client_id}/products", response_model=ClientProductResponse, status_code=status.HTTP_200_OK)
+@router.post("/{client_id}/products", response_model=ClientProductResponse, status_code=status.HTTP_200_OK, dependencies=[Depends(query_budget(6))])
 async def assign_product_to_client(
     client_id: int,
     product_data: ClientProductCreate,
-    current_user: User = Depends(require_admin)
+    current_user: Principal = Depends(require_admin)
 ):
     """Assign product/service to client (admin only)"""
-    client = await ClientService.get_client_by_id(client_id)
-    if not client:
+    if not await ClientService.client_exists(client_id):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Client not found")
 
-    product = await ProductService.get_product_by_id(product_data.product_id)
-    if not product:
+    if not await ProductService.product_exists(product_data.product_id):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Product not found")
 
-    existing_assignment = await ClientService.get_client_product(client_id, product_data.product_id)
-    if existing_assignment:
+    client_product = await ClientService.assign_product(client_id, product_data.product_id)
+    if client_product is None:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Product already assigned to this client")
 
-    client_product = await ClientService.assign_product(
-        client_id,
-        product_data.product_id
-    )
-    
     return client_product
 
 @router.get("/{client_id}/products", response_model=List[ClientProductResponse])
 async def get_client_products(
     client_id: int,
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_user)
 ):
     """Get all products assigned to a client"""
     client = await ClientService.get_client_by_id(client_id)
@@ -121,7 +131,7 @@ async def get_client_products(
 async def add_client_comment(
     client_id: int,
     comment_data: CommentCreate,
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_user)
 ):
     """Add comment to client"""
     client = await ClientService.get_client_by_id(client_id)
@@ -135,10 +145,36 @@ async def add_client_comment(
     return comment
 
 
+@router.get("/{client_id}/comments", response_model=List[ClientCommentResponse])
+async def list_client_comments(
+    client_id: int,
+    response: Response,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: str = Query(
+        "", description="'' for the newest comments, then the previous page's X-Next-Cursor header"
+    ),
+    current_user: Principal = Depends(get_current_active_user)
+):
+    """List a client's comments newest first; each page carries the X-Next-Cursor of the next"""
+    client = await ClientService.get_client_by_id(client_id)
+    if not client:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Client not found"
+        )
+
+    comments = await ClientService.get_client_comments(client_id, limit=limit, cursor=cursor)
+
+    next_page = next_cursor(comments, limit)
+    if next_page:
+        response.headers[CURSOR_HEADER] = next_page
+    return comments
+
+
 @router.get("/{client_id}/claims", response_model=List[ClaimResponse])
 async def get_client_claims(
     client_id: int,
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_user)
 ):
     """Get all claims for a client"""
     client = await ClientService.get_client_by_id(client_id)
@@ -151,3 +187,32 @@ async def get_client_claims(
     claims = await ClientService.get_client_claims(client_id)
     return claims
 
+
+@router.get("/{client_id}/files/archive")
+async def download_client_files_archive(
+    client_id: int,
+    current_user: Principal = Depends(get_current_active_user)
+):
+    """Download the files of all of a client's claims as one ZIP, one folder per claim (admin or the client)"""
+    if not current_user.is_admin and current_user.client_id != client_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You can only export your own files"
+        )
+    client = await ClientService.get_client_by_id(client_id)
+    if not client:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Client not found"
+        )
+
+    claims = await ClientService.get_client_claims(client_id)
+    files = await ClaimService.get_files_for_claims([claim.id for claim in claims])
+    return StreamingResponse(
+        stream_zip(
+            (entry_name(claim_file, f"claim-{claim_file.claim_id}/"), claim_file) for claim_file in files
+        ),
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="client-{client_id}-files.zip"'},
+    )
+
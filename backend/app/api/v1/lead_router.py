@@ -1,16 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from typing import List, Optional
-from app.schemas import LeadCreate, LeadUpdate, LeadResponse, LeadCommentCreate, LeadCommentResponse, UserCreate
-from app.services import LeadService
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from typing import List, Literal, Optional
+from app.schemas import LeadCreate, LeadUpdate, LeadResponse, LeadSummaryResponse, LeadCommentCreate, LeadCommentResponse, UserCreate
+from app.services import LeadService, UserService
 from app.api.dependencies import (
     get_current_active_user, require_admin_or_operator, require_admin,
-    require_supervisor_or_admin
+    require_supervisor_or_admin, if_match_version, version_etag, query_budget, route_reads
 )
-from app.models import User
+from app.auth import Principal
 from app.models.lead import LeadStatus
+from app.pagination import CURSOR_HEADER, next_cursor
 from pydantic import BaseModel
 
-router = APIRouter(prefix="/leads", tags=["Leads"])
+router = APIRouter(prefix="/leads", tags=["Leads"], dependencies=[Depends(route_reads)])
 
 
 class CommentCreate(BaseModel):
@@ -24,26 +25,31 @@ class AssignOperatorRequest(BaseModel):
 @router.post("", response_model=LeadResponse, status_code=status.HTTP_201_CREATED)
 async def create_lead(
     lead_data: LeadCreate,
-    current_user: User = Depends(require_admin_or_operator)
+    current_user: Principal = Depends(require_admin_or_operator)
 ):
     """Create lead (Admin / Operator)"""
     lead = await LeadService.create_lead(lead_data)
     return lead
 
 
-@router.get("", response_model=List[LeadResponse])
+@router.get("", response_model=List[LeadSummaryResponse], dependencies=[Depends(query_budget(3))])
 async def list_leads(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     operator_id: Optional[int] = Query(None),
     status: Optional[LeadStatus] = Query(None),
-    current_user: User = Depends(require_admin_or_operator)
+    cursor: Optional[str] = Query(
+        None, description="Keyset paging: '' for the first page, then the previous page's X-Next-Cursor header"
+    ),
+    include: Optional[Literal["comments"]] = Query(
+        None, description="'comments' to embed full comments instead of only comment_count"
+    ),
+    current_user: Principal = Depends(require_admin_or_operator)
 ):
-    """List leads (filter by operator/admin)"""
+    """List leads newest first (filter by operator/admin); keyset pages carry an X-Next-Cursor header"""
     # Non-admin users can only see their own leads
-    await current_user.fetch_related("roles")
-    role_names = [role.name.lower() for role in current_user.roles]
-    is_admin = "admin" in role_names
+    is_admin = current_user.is_admin
     
     if not is_admin and operator_id and operator_id != current_user.id:
         raise HTTPException(
@@ -59,17 +65,52 @@ async def list_leads(
         skip=skip,
         limit=limit,
         operator_id=operator_id,
-        status=status
+        status=status,
+        cursor=cursor,
+        include_comments=include == "comments"
     )
+
+    if cursor is not None:
+        next_page = next_cursor(leads, limit)
+        if next_page:
+            response.headers[CURSOR_HEADER] = next_page
     return leads
 
 
 @router.get("/{lead_id}", response_model=LeadResponse)
 async def get_lead(
     lead_id: int,
-    current_user: User = Depends(require_admin_or_operator)
+    response: Response,
+    current_user: Principal = Depends(require_admin_or_operator)
+):
+    """Get lead details with its latest comments; the ETag is the lead's version"""
+    lead = await _get_viewable_lead(lead_id, current_user)
+    response.headers["ETag"] = version_etag(lead.version)
+    return await LeadService.attach_latest_comments(lead)
+
+
+@router.get("/{lead_id}/comments", response_model=List[LeadCommentResponse])
+async def list_lead_comments(
+    lead_id: int,
+    response: Response,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: str = Query(
+        "", description="'' for the newest comments, then the previous page's X-Next-Cursor header"
+    ),
+    current_user: Principal = Depends(require_admin_or_operator)
 ):
-    """Get lead details"""
+    """List a lead's comments newest first; each page carries the X-Next-Cursor of the next"""
+    await _get_viewable_lead(lead_id, current_user)
+    comments = await LeadService.get_lead_comments(lead_id, limit=limit, cursor=cursor)
+
+    next_page = next_cursor(comments, limit)
+    if next_page:
+        response.headers[CURSOR_HEADER] = next_page
+    return comments
+
+
+async def _get_viewable_lead(lead_id: int, current_user: Principal):
+    """Lead by ID, or 404/403 unless the user may view it"""
     lead = await LeadService.get_lead_by_id(lead_id)
     if not lead:
         raise HTTPException(
@@ -78,9 +119,7 @@ async def get_lead(
         )
     
     # Check permissions
-    await current_user.fetch_related("roles")
-    role_names = [role.name.lower() for role in current_user.roles]
-    is_admin = "admin" in role_names
+    is_admin = current_user.is_admin
     
     if not is_admin and lead.assigned_operator_id != current_user.id:
         raise HTTPException(
@@ -95,35 +134,39 @@ async def get_lead(
 async def update_lead(
     lead_id: int,
     lead_data: LeadUpdate,
-    current_user: User = Depends(require_admin_or_operator)
+    response: Response,
+    expected_version: Optional[int] = Depends(if_match_version),
+    current_user: Principal = Depends(require_admin_or_operator)
 ):
-    """Update lead info"""
-    lead = await LeadService.get_lead_by_id(lead_id)
-    if not lead:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Lead not found"
-        )
+    """Update lead info; If-Match restricts the update to that version"""
+    # Check permissions; admins may update any lead, so only operators need the row first
+    is_admin = current_user.is_admin
     
-    # Check permissions
-    await current_user.fetch_related("roles")
-    role_names = [role.name.lower() for role in current_user.roles]
-    is_admin = "admin" in role_names
+    if not is_admin:
+        lead = await LeadService.get_lead_by_id(lead_id)
+        if lead and lead.assigned_operator_id != current_user.id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You can only update your assigned leads"
+            )
+        if lead and expected_version is None:
+            # The check above holds for the version just read; never write over a newer one
+            expected_version = lead.version
     
-    if not is_admin and lead.assigned_operator_id != current_user.id:
+    updated_lead = await LeadService.update_lead(lead_id, lead_data, expected_version)
+    if not updated_lead:
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You can only update your assigned leads"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Lead not found"
         )
-    
-    updated_lead = await LeadService.update_lead(lead_id, lead_data)
+    response.headers["ETag"] = version_etag(updated_lead.version)
     return updated_lead
 
 
 @router.delete("/{lead_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_lead(
     lead_id: int,
-    current_user: User = Depends(require_admin_or_operator)
+    current_user: Principal = Depends(require_admin_or_operator)
 ):
     """Delete lead"""
     lead = await LeadService.get_lead_by_id(lead_id)
@@ -134,9 +177,7 @@ async def delete_lead(
         )
     
     # Check permissions
-    await current_user.fetch_related("roles")
-    role_names = [role.name.lower() for role in current_user.roles]
-    is_admin = "admin" in role_names
+    is_admin = current_user.is_admin
     
     if not is_admin and lead.assigned_operator_id != current_user.id:
         raise HTTPException(
@@ -151,7 +192,7 @@ async def delete_lead(
 async def add_lead_comment(
     lead_id: int,
     comment_data: CommentCreate,
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_user)
 ):
     """Add comment to lead (admin, supervisor, or operator)"""
     lead = await LeadService.get_lead_by_id(lead_id)
@@ -162,11 +203,9 @@ async def add_lead_comment(
         )
     
     # Check permissions: admin, supervisor, or assigned operator can comment
-    await current_user.fetch_related("roles")
-    role_names = [role.name.lower() for role in current_user.roles]
-    is_admin = "admin" in role_names
-    is_supervisor = "supervisor" in role_names
-    is_operator = "operator" in role_names
+    is_admin = current_user.is_admin
+    is_supervisor = current_user.is_supervisor
+    is_operator = current_user.is_operator
     
     if not is_admin and not is_supervisor:
         # Operators can only comment on their assigned leads
@@ -189,26 +228,19 @@ async def add_lead_comment(
 async def assign_lead_to_operator(
     lead_id: int,
     assign_data: AssignOperatorRequest,
-    current_user: User = Depends(require_admin)
+    response: Response,
+    expected_version: Optional[int] = Depends(if_match_version),
+    current_user: Principal = Depends(require_admin)
 ):
     """Assign lead to operator (admin only)"""
-    lead = await LeadService.get_lead_by_id(lead_id)
-    if not lead:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Lead not found"
-        )
-    
     # Verify operator exists and has operator role
-    operator = await User.get_or_none(id=assign_data.operator_id)
-    if not operator:
+    role_names = await UserService.get_role_names(assign_data.operator_id)
+    if role_names is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Operator not found"
         )
     
-    await operator.fetch_related("roles")
-    role_names = [role.name.lower() for role in operator.roles]
     if "operator" not in role_names:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -216,21 +248,22 @@ async def assign_lead_to_operator(
         )
     
     lead_data = LeadUpdate(assigned_operator_id=assign_data.operator_id)
-    updated_lead = await LeadService.update_lead(lead_id, lead_data)
+    updated_lead = await LeadService.update_lead(lead_id, lead_data, expected_version)
     
     if not updated_lead:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to assign operator to lead"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Lead not found"
         )
     
+    response.headers["ETag"] = version_etag(updated_lead.version)
     return updated_lead
 
 
 @router.post("/{lead_id}/convert", status_code=status.HTTP_201_CREATED)
 async def convert_lead_to_client(
     lead_id: int,
-    current_user: User = Depends(require_admin_or_operator)
+    current_user: Principal = Depends(require_admin_or_operator)
 ):
     """Convert lead to client"""
     lead = await LeadService.get_lead_by_id(lead_id)
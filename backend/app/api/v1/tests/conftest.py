@@ -0,0 +1,124 @@
+import logging
+import os
+from contextlib import contextmanager
+
+# Point the app at an in-memory database before app.config is imported
+os.environ["DATABASE_URL"] = "sqlite://:memory:"
+# Endpoints issuing more statements than their query_budget fail the test
+os.environ["QUERY_BUDGET_STRICT"] = "true"
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.auth import get_password_hash
+from app.models import User, Role, Client, Claim, SupervisorOperator
+
+PASSWORD = "123456"
+SQL_VERBS = ("SELECT", "INSERT", "UPDATE", "DELETE")
+
+
+class QueryCounter(logging.Handler):
+    """Logging handler counting the SQL statements Tortoise sends to the database"""
+
+    def __init__(self):
+        super().__init__(level=logging.DEBUG)
+        self.queries = []
+        self.statements = []
+
+    def emit(self, record):
+        message = record.getMessage()
+        if message.lstrip().upper().startswith(SQL_VERBS):
+            self.queries.append(message)
+            # Clients log parameterised statements as ("%s: %s", sql, values)
+            if isinstance(record.args, tuple) and len(record.args) == 2:
+                self.statements.append(record.args)
+            else:
+                self.statements.append((message, []))
+
+    @property
+    def count(self):
+        return len(self.queries)
+
+
+@contextmanager
+def count_queries():
+    logger = logging.getLogger("tortoise.db_client")
+    counter = QueryCounter()
+    previous_level = logger.level
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(counter)
+    try:
+        yield counter
+    finally:
+        logger.removeHandler(counter)
+        logger.setLevel(previous_level)
+
+
+async def _seed():
+    """Create one user per role, a client profile and a couple of claims"""
+    roles = {}
+    for name in ("Admin", "Supervisor", "Operator", "Client"):
+        roles[name], _ = await Role.get_or_create(name=name)
+
+    users = {}
+    for name in roles:
+        username = name.lower()
+        user = await User.get_or_none(username=username)
+        if user is None:
+            user = await User.create(
+                username=username,
+                email=f"{username}@example.com",
+                password_hash=get_password_hash(PASSWORD),
+            )
+            await user.roles.add(roles[name])
+        users[username] = user
+
+    client_profile, _ = await Client.get_or_create(
+        user_id=users["client"].id,
+        defaults={"full_name": "Client", "email": "client@example.com"},
+    )
+    await SupervisorOperator.get_or_create(
+        supervisor_id=users["supervisor"].id,
+        operator_id=users["operator"].id,
+    )
+    if not await Claim.filter(client_id=client_profile.id).exists():
+        for i in range(2):
+            await Claim.create(
+                client_id=client_profile.id,
+                assigned_operator_id=users["operator"].id,
+                assigned_supervisor_id=users["supervisor"].id,
+                description=f"Claim {i}",
+            )
+
+    return {username: user.id for username, user in users.items()}, client_profile.id
+
+
+@pytest.fixture(scope="session")
+def client():
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def seed(client):
+    user_ids, client_id = client.portal.call(_seed)
+    return {"user_ids": user_ids, "client_id": client_id}
+
+
+@pytest.fixture(scope="session")
+def auth_headers(client, seed):
+    headers = {}
+    for username in seed["user_ids"]:
+        response = client.post(
+            "/api/v1/auth/login",
+            json={"username": username, "password": PASSWORD},
+        )
+        assert response.status_code == 200
+        headers[username] = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    return headers
+
+
+@pytest.fixture
+def query_counter():
+    return count_queries
@@ -0,0 +1,263 @@
+import asyncio
+
+import pytest
+
+from app.models import AnalyticsRollup, Lead, LeadStatus
+from app.services import RollupService
+
+
+async def _seed_leads(operator_id):
+    if await Lead.filter(email__startswith="analytics-").exists():
+        return
+    statuses = [LeadStatus.NEW, LeadStatus.NEW, LeadStatus.CONTACTED, LeadStatus.LOST]
+    for i, lead_status in enumerate(statuses):
+        await Lead.create(
+            first_name="Lead",
+            last_name=str(i),
+            email=f"analytics-{i}@example.com",
+            status=lead_status,
+            assigned_operator_id=operator_id if i % 2 == 0 else None,
+        )
+    await RollupService.rebuild()
+
+
+@pytest.fixture
+def leads(client, seed):
+    client.portal.call(_seed_leads, seed["user_ids"]["operator"])
+
+
+def test_leads_analytics_is_one_query(client, auth_headers, leads, query_counter):
+    with query_counter() as counter:
+        response = client.get("/api/v1/analytics/leads", headers=auth_headers["admin"])
+
+    assert response.status_code == 200
+    assert counter.count == 1, "\n".join(counter.queries)
+    data = response.json()
+    assert data["total_leads"] == 4
+    assert data["by_status"] == {
+        "uncontacted": 2, "contacted": 1, "qualified": 0, "converted": 0, "lost": 1,
+    }
+
+
+def test_leads_analytics_by_operator(client, auth_headers, seed, leads, query_counter):
+    with query_counter() as counter:
+        response = client.get(
+            "/api/v1/analytics/leads",
+            params={"by_operator": True, "date_to": "2100-01-01T00:00:00"},
+            headers=auth_headers["admin"],
+        )
+
+    assert response.status_code == 200
+    assert counter.count == 1
+    operators = {row["operator_id"]: row for row in response.json()["by_operator"]}
+    assert operators[seed["user_ids"]["operator"]]["total_leads"] == 2
+    assert operators[None]["by_status"]["lost"] == 1
+
+
+async def _seed_revenue(client_id):
+    from decimal import Decimal
+    from app.models import ClientProduct, Product
+
+    if await Product.filter(type="Analytics").exists():
+        return
+    assigned = await Product.create(name="Analytics A", type="Analytics", price=Decimal("10.00"))
+    await Product.create(name="Analytics B", type="Analytics", price=Decimal("5.00"))
+    await ClientProduct.create(client_id=client_id, product_id=assigned.id)
+    await RollupService.rebuild()
+
+
+def test_revenue_analytics_queries(client, auth_headers, seed, query_counter):
+    client.portal.call(_seed_revenue, seed["client_id"])
+
+    with query_counter() as counter:
+        response = client.get("/api/v1/analytics/revenue", headers=auth_headers["admin"])
+
+    assert response.status_code == 200
+    assert counter.count == 2, "\n".join(counter.queries)
+    data = response.json()
+    assert data["by_product"]["Analytics A"]["assigned_count"] == 1
+    assert data["by_product"]["Analytics A"]["revenue"] == 10.0
+    assert data["by_product"]["Analytics B"]["assigned_count"] == 0
+    assert data["by_type"]["Analytics"] == {"assigned_count": 1, "revenue": 10.0}
+
+    response = client.get(
+        "/api/v1/analytics/revenue",
+        params={"date_from": "2100-01-01T00:00:00"},
+        headers=auth_headers["admin"],
+    )
+    assert response.json()["by_product"]["Analytics A"]["assigned_count"] == 0
+
+
+async def _seed_claim_history(client_id):
+    from datetime import datetime
+    from app.models import Claim, ClaimStatus
+
+    if await Claim.filter(description__startswith="history").exists():
+        return
+    for created_at, claim_status in [
+        (datetime(2024, 1, 31, 23, 0), ClaimStatus.SUBMITTED),
+        (datetime(2024, 2, 1, 0, 30), ClaimStatus.RESOLVED),
+        (datetime(2024, 2, 29, 12, 0), ClaimStatus.RESOLVED),
+        (datetime(2024, 4, 15, 9, 0), ClaimStatus.IN_REVIEW),
+    ]:
+        claim = await Claim.create(client_id=client_id, description="history", status=claim_status)
+        await Claim.filter(id=claim.id).update(created_at=created_at)
+    await RollupService.rebuild()
+
+
+def test_claims_timeseries_buckets_by_calendar_month(client, auth_headers, seed, query_counter):
+    client.portal.call(_seed_claim_history, seed["client_id"])
+
+    with query_counter() as counter:
+        response = client.get(
+            "/api/v1/analytics/claims/timeseries",
+            params={"granularity": "month", "date_from": "2024-01-01T00:00:00", "date_to": "2024-05-01T00:00:00"},
+            headers=auth_headers["admin"],
+        )
+
+    assert response.status_code == 200
+    assert counter.count == 1, "\n".join(counter.queries)
+    buckets = {b["period"]: b for b in response.json()["buckets"]}
+    # date_to is exclusive, so no empty trailing bucket for May
+    assert list(buckets) == ["2024-01-01", "2024-02-01", "2024-03-01", "2024-04-01"]
+    assert buckets["2024-01-01"]["total"] == 1
+    assert buckets["2024-02-01"]["by_status"]["resolved"] == 2
+    assert buckets["2024-03-01"]["total"] == 0
+    assert buckets["2024-04-01"]["by_status"]["in_review"] == 1
+
+
+def test_claims_timeseries_weeks_start_on_monday(client, auth_headers, seed):
+    client.portal.call(_seed_claim_history, seed["client_id"])
+
+    response = client.get(
+        "/api/v1/analytics/claims/timeseries",
+        params={"granularity": "week", "date_from": "2024-01-29T00:00:00", "date_to": "2024-02-04T00:00:00"},
+        headers=auth_headers["admin"],
+    )
+
+    assert response.json()["buckets"] == [{
+        "period": "2024-01-29",
+        "total": 2,
+        "by_status": {"submitted": 1, "in_review": 0, "resolved": 1},
+    }]
+
+
+def test_claims_analytics_summary(client, auth_headers, query_counter):
+    with query_counter() as counter:
+        response = client.get("/api/v1/analytics/claims", headers=auth_headers["admin"])
+
+    assert response.status_code == 200
+    assert counter.count == 2, "\n".join(counter.queries)
+    data = response.json()
+    assert data["total_claims"] == sum(data["by_status"].values())
+    assert len(data["monthly_claims"]) == 6
+
+
+async def _seed_supervisor_claims(seed):
+    from datetime import timedelta
+    from app.models import Claim, ClaimStatus
+
+    if await Claim.filter(description__startswith="supervised").exists():
+        return
+    claim = await Claim.create(
+        client_id=seed["client_id"],
+        assigned_supervisor_id=seed["user_ids"]["supervisor"],
+        description="supervised resolved",
+        status=ClaimStatus.RESOLVED,
+    )
+    await Claim.filter(id=claim.id).update(resolved_at=claim.created_at + timedelta(hours=6))
+    await RollupService.rebuild()
+
+
+def test_supervisors_analytics_queries(client, auth_headers, seed, query_counter):
+    client.portal.call(_seed_supervisor_claims, seed)
+
+    with query_counter() as counter:
+        response = client.get("/api/v1/analytics/supervisors", headers=auth_headers["admin"])
+
+    assert response.status_code == 200
+    assert counter.count == 2, "\n".join(counter.queries)
+    [row] = response.json()["supervisors"]
+    assert row["supervisor_id"] == seed["user_ids"]["supervisor"]
+    assert row["assigned_operators"] == 1
+    assert row["total_claims"] == row["resolved_claims"] + row["open_claims"]
+    assert row["resolved_claims"] == 1
+    assert row["avg_resolution_hours"] == 6.0
+
+
+async def _rollup_snapshot():
+    rows = await AnalyticsRollup.filter(count__gt=0).values(
+        "day", "metric", "status", "operator_id", "supervisor_id", "product_id",
+        "count", "resolved_count", "resolution_seconds",
+    )
+    return sorted(
+        (tuple(row.values())[:-1] + (round(row["resolution_seconds"], 3),) for row in rows),
+        key=str,
+    )
+
+
+async def _write_through_services(seed):
+    from app.models import ClaimStatus, Product
+    from app.schemas import ClaimCreate, ClaimUpdate, LeadCreate, LeadUpdate
+    from app.services import ClaimService, ClientService, LeadService
+
+    await RollupService.rebuild()
+    operator_id = seed["user_ids"]["operator"]
+
+    kept = await LeadService.create_lead(LeadCreate(
+        first_name="Rollup", last_name="Kept", email="rollup-kept@example.com",
+    ))
+    await LeadService.update_lead(kept.id, LeadUpdate(
+        status=LeadStatus.QUALIFIED, assigned_operator_id=operator_id,
+    ))
+    dropped = await LeadService.create_lead(LeadCreate(
+        first_name="Rollup", last_name="Dropped", email="rollup-dropped@example.com",
+    ))
+    await LeadService.delete_lead(dropped.id)
+
+    claim = await ClaimService.create_claim(ClaimCreate(
+        client_id=seed["client_id"], description="rollup claim",
+    ))
+    await ClaimService.update_claim(claim.id, ClaimUpdate(
+        status=ClaimStatus.RESOLVED, assigned_supervisor_id=seed["user_ids"]["supervisor"],
+    ))
+    # Racing updates must each move the claim out of the cell they replaced
+    await asyncio.gather(
+        ClaimService.update_claim(claim.id, ClaimUpdate(status=ClaimStatus.IN_REVIEW)),
+        ClaimService.update_claim(claim.id, ClaimUpdate(status=ClaimStatus.SUBMITTED)),
+    )
+
+    product = await Product.create(name="Rollup product", type="Rollup")
+    await ClientService.assign_product(seed["client_id"], product.id)
+
+    incremental = await _rollup_snapshot()
+    await RollupService.rebuild()
+    return incremental, await _rollup_snapshot()
+
+
+def test_incremental_rollups_match_rebuild(client, seed):
+    incremental, rebuilt = client.portal.call(_write_through_services, seed)
+
+    assert incremental == rebuilt
+
+
+def test_dashboard_returns_requested_sections_with_timings(client, auth_headers, seed):
+    response = client.get(
+        "/api/v1/analytics/dashboard",
+        params=[("sections", "leads"), ("sections", "supervisors")],
+        headers=auth_headers["admin"],
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert list(data["sections"]) == ["leads", "supervisors"]
+    assert set(data["timings_ms"]) == {"leads", "supervisors"}
+    assert data["sections"]["leads"] == client.get(
+        "/api/v1/analytics/leads", headers=auth_headers["admin"]
+    ).json()
+
+    response = client.get("/api/v1/analytics/dashboard", headers=auth_headers["admin"])
+    assert set(response.json()["sections"]) == {"leads", "clients", "revenue", "claims", "supervisors"}
+
+    response = client.get("/api/v1/analytics/dashboard", headers=auth_headers["operator"])
+    assert response.status_code == 403
@@ -0,0 +1,85 @@
+import asyncio
+
+from app import metrics
+from app.cache import TaggedCache, analytics_cache
+
+
+def test_repeated_request_is_served_from_cache(client, auth_headers, query_counter):
+    analytics_cache.clear()
+    client.get("/api/v1/analytics/leads", headers=auth_headers["admin"])
+
+    with query_counter() as counter:
+        response = client.get("/api/v1/analytics/leads", headers=auth_headers["admin"])
+
+    assert response.status_code == 200
+    assert counter.count == 0, "\n".join(counter.queries)
+
+
+def test_service_write_invalidates_cached_result(client, auth_headers):
+    analytics_cache.clear()
+    before = client.get("/api/v1/analytics/leads", headers=auth_headers["admin"]).json()
+
+    response = client.post(
+        "/api/v1/leads",
+        json={"first_name": "Cache", "last_name": "Buster", "email": "cache@example.com"},
+        headers=auth_headers["admin"],
+    )
+    assert response.status_code == 201, response.text
+
+    after = client.get("/api/v1/analytics/leads", headers=auth_headers["admin"]).json()
+    assert after["total_leads"] == before["total_leads"] + 1
+
+
+def test_concurrent_misses_share_one_computation():
+    cache = TaggedCache("test_cache", ttl_seconds=60)
+    calls = 0
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"value": calls}
+
+    async def scenario():
+        return await asyncio.gather(*(
+            cache.get_or_compute("key", compute, tags=["leads"]) for _ in range(5)
+        ))
+
+    metrics.reset()
+    results = asyncio.run(scenario())
+
+    assert calls == 1
+    assert all(result == {"value": 1} for result in results)
+    counters = metrics.snapshot()["counters"]
+    assert counters["test_cache.miss"] == 1
+    assert counters["test_cache.stampede"] == 4
+
+
+def test_invalidation_during_computation_is_not_stored():
+    cache = TaggedCache("test_cache", ttl_seconds=60)
+
+    async def compute():
+        cache.invalidate("claims")
+        return "stale"
+
+    async def scenario():
+        await cache.get_or_compute("key", compute, tags=["claims"])
+        return await cache.get_or_compute("key", lambda: asyncio.sleep(0, "fresh"), tags=["claims"])
+
+    assert asyncio.run(scenario()) == "fresh"
+
+
+def test_cache_is_bounded_and_drops_expired_entries():
+    cache = TaggedCache("test_cache", ttl_seconds=60, max_entries=2)
+
+    async def scenario():
+        for key in ("a", "b", "c"):
+            await cache.get_or_compute(key, lambda: asyncio.sleep(0, key), tags=["leads"])
+
+    asyncio.run(scenario())
+    assert list(cache._entries) == ["b", "c"]
+    assert cache._keys_by_tag["leads"] == {"b", "c"}
+
+    cache._sweep(now=float("inf"))
+    assert not cache._entries
+    assert not cache._keys_by_tag
@@ -0,0 +1,247 @@
+"""
+Claim attachments: streamed, size-bounded uploads into a deduplicating blob store, and ranged downloads.
+"""
+import hashlib
+import io
+import os
+import time
+import zipfile
+
+import pytest
+
+from app.auth import get_password_hash
+from app.config import settings
+from app.models import Client, Role, User
+from app.services import ClaimService
+from app.storage import LocalBlobStore
+
+blob_path = LocalBlobStore().blob_path
+
+
+@pytest.fixture
+def upload_settings(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "UPLOAD_DIR", str(tmp_path))
+    monkeypatch.setattr(settings, "UPLOAD_CHUNK_BYTES", 1024)
+    monkeypatch.setattr(settings, "MAX_UPLOAD_BYTES", 10 * 1024)
+    return tmp_path
+
+
+async def _create_other_client():
+    user = await User.create(
+        username="otherclient", email="otherclient@example.com", password_hash=get_password_hash("secret123")
+    )
+    await user.roles.add(await Role.get(name="Client"))
+    await Client.create(user_id=user.id, full_name="Other Client", email="otherclient@example.com")
+
+
+@pytest.fixture
+def claim_id(client, auth_headers, seed):
+    return client.post(
+        "/api/v1/claims",
+        json={
+            "description": "With attachments",
+            "client_id": seed["client_id"],
+            "assigned_operator_id": seed["user_ids"]["operator"],
+            "assigned_supervisor_id": seed["user_ids"]["supervisor"],
+        },
+        headers=auth_headers["admin"],
+    ).json()["id"]
+
+
+def test_upload_is_stored_with_size_and_hash(client, auth_headers, upload_settings, claim_id):
+    content = os.urandom(5000)
+    response = client.post(
+        f"/api/v1/claims/{claim_id}/files",
+        files={"file": ("report.pdf", content, "application/pdf")},
+        headers=auth_headers["operator"],
+    )
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["size"] == len(content)
+    assert body["sha256"] == hashlib.sha256(content).hexdigest()
+    assert body["filename"] == "report.pdf"
+    assert body["file_path"] == blob_path(body["sha256"])
+    with open(body["file_path"], "rb") as stored:
+        assert stored.read() == content
+
+    # No temporary files are left next to the blob
+    stored_files = [name for _, _, names in os.walk(upload_settings / "blobs") for name in names]
+    assert stored_files == [body["sha256"]]
+
+
+def test_oversized_upload_is_rejected_and_not_kept(client, auth_headers, upload_settings, claim_id):
+    response = client.post(
+        f"/api/v1/claims/{claim_id}/files",
+        files={"file": ("scan.png", os.urandom(10 * 1024 + 1), "image/png")},
+        headers=auth_headers["operator"],
+    )
+    assert response.status_code == 413, response.text
+    assert not [name for _, _, names in os.walk(upload_settings) for name in names]
+
+
+def test_download_supports_ranges_and_revalidation(client, auth_headers, upload_settings, claim_id):
+    content = os.urandom(5000)
+    uploaded = client.post(
+        f"/api/v1/claims/{claim_id}/files",
+        files={"file": ("invoice.pdf", content, "application/pdf")},
+        headers=auth_headers["operator"],
+    ).json()
+    url = f"/api/v1/claims/{claim_id}/files/{uploaded['id']}"
+
+    full = client.get(url, headers=auth_headers["operator"])
+    assert full.status_code == 200, full.text
+    assert full.content == content
+    assert full.headers["etag"] == f'"{uploaded["sha256"]}"'
+    assert full.headers["accept-ranges"] == "bytes"
+    assert "last-modified" in full.headers
+
+    partial = client.get(url, headers={**auth_headers["operator"], "Range": "bytes=100-199"})
+    assert partial.status_code == 206
+    assert partial.content == content[100:200]
+    assert partial.headers["content-range"] == "bytes 100-199/5000"
+
+    cached = client.get(url, headers={**auth_headers["operator"], "If-None-Match": full.headers["etag"]})
+    assert cached.status_code == 304
+
+    assert client.get(url, headers=auth_headers["client"]).status_code == 200
+    other = client.get(f"/api/v1/claims/{claim_id}/files/999999", headers=auth_headers["operator"])
+    assert other.status_code == 404
+
+
+def test_identical_uploads_share_one_blob_until_collected(client, auth_headers, upload_settings, claim_id):
+    content = os.urandom(3000)
+    first, second = (
+        client.post(
+            f"/api/v1/claims/{claim_id}/files",
+            files={"file": (name, content, "application/pdf")},
+            headers=auth_headers["operator"],
+        ).json()
+        for name in ("police-report.pdf", "copy.pdf")
+    )
+    assert first["id"] != second["id"]
+    assert first["file_path"] == second["file_path"]
+
+    by_hash = client.post(
+        f"/api/v1/claims/{claim_id}/files/by-hash",
+        json={"sha256": first["sha256"], "filename": "again.pdf"},
+        headers=auth_headers["operator"],
+    )
+    assert by_hash.status_code == 200, by_hash.text
+    assert by_hash.json()["file_path"] == first["file_path"]
+    unknown = client.post(
+        f"/api/v1/claims/{claim_id}/files/by-hash",
+        json={"sha256": hashlib.sha256(b"never uploaded").hexdigest()},
+        headers=auth_headers["operator"],
+    )
+    assert unknown.status_code == 404
+    # The local backend has no presigned uploads
+    direct = client.post(
+        f"/api/v1/claims/{claim_id}/files/upload-url",
+        json={"sha256": first["sha256"], "size": 3000},
+        headers=auth_headers["operator"],
+    )
+    assert direct.status_code == 400
+
+    # An orphaned blob past the grace period is collected; referenced ones stay
+    orphan = blob_path(hashlib.sha256(b"orphan").hexdigest())
+    os.makedirs(os.path.dirname(orphan))
+    with open(orphan, "wb") as out:
+        out.write(b"orphan")
+    expired = time.time() - settings.BLOB_GC_GRACE_SECONDS - 1
+    for path in (orphan, first["file_path"]):
+        os.utime(path, (expired, expired))
+
+    removed = client.portal.call(ClaimService.collect_unreferenced_blobs)
+    assert removed == [os.path.basename(orphan)]
+    assert os.path.exists(first["file_path"])
+
+
+@pytest.mark.parametrize("filename, image_format", [("scan.png", "PNG"), ("report.pdf", "PDF")])
+def test_thumbnail_is_rendered_after_upload(
+    client, auth_headers, upload_settings, monkeypatch, claim_id, filename, image_format
+):
+    Image = pytest.importorskip("PIL.Image")
+    if image_format == "PDF":
+        pytest.importorskip("pypdfium2")
+    monkeypatch.setattr(settings, "MAX_UPLOAD_BYTES", 20 * 1024 * 1024)
+    source = io.BytesIO()
+    Image.effect_noise((1200, 800), 64).convert("RGB").save(source, image_format)
+
+    response = client.post(
+        f"/api/v1/claims/{claim_id}/files",
+        files={"file": (filename, source.getvalue())},
+        headers=auth_headers["operator"],
+    )
+    assert response.status_code == 200, response.text
+    uploaded = response.json()
+    # The test client runs background tasks before returning
+    preview = client.get(
+        f"/api/v1/claims/{claim_id}/files/{uploaded['id']}/preview", headers=auth_headers["operator"]
+    )
+    assert preview.status_code == 200, preview.text
+    assert preview.headers["content-type"] == "image/webp"
+    assert "immutable" in preview.headers["cache-control"]
+    assert max(Image.open(io.BytesIO(preview.content)).size) == settings.PREVIEW_MAX_PIXELS
+    assert len(preview.content) < len(source.getvalue())
+
+
+def test_archives_stream_every_file(client, auth_headers, seed, upload_settings, claim_id):
+    contents = {name: os.urandom(3000) for name in ("a.pdf", "b.png")}
+    for name, content in contents.items():
+        client.post(
+            f"/api/v1/claims/{claim_id}/files",
+            files={"file": (name, content)},
+            headers=auth_headers["operator"],
+        )
+
+    response = client.get(f"/api/v1/claims/{claim_id}/files/archive", headers=auth_headers["operator"])
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"] == "application/zip"
+    assert "content-length" not in response.headers
+    with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+        assert archive.testzip() is None
+        assert {name.split("-", 1)[1]: archive.read(name) for name in archive.namelist()} == contents
+
+    client_id = seed["client_id"]
+    response = client.get(f"/api/v1/clients/{client_id}/files/archive", headers=auth_headers["client"])
+    assert response.status_code == 200, response.text
+    with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+        folder = [name for name in archive.namelist() if name.startswith(f"claim-{claim_id}/")]
+        assert len(folder) == len(contents)
+
+    forbidden = client.get(f"/api/v1/clients/{client_id}/files/archive", headers=auth_headers["operator"])
+    assert forbidden.status_code == 403
+
+
+def test_other_clients_cannot_add_files_to_a_claim(client, auth_headers, upload_settings, claim_id):
+    content = os.urandom(1000)
+    uploaded = client.post(
+        f"/api/v1/claims/{claim_id}/files",
+        files={"file": ("statement.pdf", content, "application/pdf")},
+        headers=auth_headers["client"],
+    )
+    assert uploaded.status_code == 200, uploaded.text
+
+    client.portal.call(_create_other_client)
+    login = client.post("/api/v1/auth/login", json={"username": "otherclient", "password": "secret123"})
+    other = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+    responses = [
+        client.post(
+            f"/api/v1/claims/{claim_id}/files",
+            files={"file": ("forged.pdf", content, "application/pdf")},
+            headers=other,
+        ),
+        client.post(
+            f"/api/v1/claims/{claim_id}/files/upload-url",
+            json={"sha256": uploaded.json()["sha256"], "size": len(content)},
+            headers=other,
+        ),
+        client.post(
+            f"/api/v1/claims/{claim_id}/files/by-hash",
+            json={"sha256": uploaded.json()["sha256"], "filename": "stolen.pdf"},
+            headers=other,
+        ),
+    ]
+    assert [response.status_code for response in responses] == [403, 403, 403]
+    assert len(client.portal.call(ClaimService.get_files_for_claims, [claim_id])) == 1
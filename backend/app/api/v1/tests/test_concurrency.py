@@ -0,0 +1,47 @@
+"""
+Optimistic concurrency on claim updates: ETag out, If-Match in, 409 on a stale version.
+"""
+
+
+def test_stale_if_match_is_rejected(client, auth_headers, seed):
+    user_ids = seed["user_ids"]
+    claim_id = client.post(
+        "/api/v1/claims",
+        json={
+            "description": "Concurrent edits",
+            "client_id": seed["client_id"],
+            "assigned_operator_id": user_ids["operator"],
+            "assigned_supervisor_id": user_ids["supervisor"],
+        },
+        headers=auth_headers["admin"],
+    ).json()["id"]
+
+    detail = client.get(f"/api/v1/claims/{claim_id}", headers=auth_headers["operator"])
+    assert detail.status_code == 200, detail.text
+    etag = detail.headers["ETag"]
+    assert etag == f'"{detail.json()["version"]}"'
+
+    first = client.put(
+        f"/api/v1/claims/{claim_id}",
+        json={"description": "First writer"},
+        headers={**auth_headers["operator"], "If-Match": etag},
+    )
+    assert first.status_code == 200, first.text
+    assert first.json()["version"] == detail.json()["version"] + 1
+    assert first.headers["ETag"] != etag
+
+    second = client.put(
+        f"/api/v1/claims/{claim_id}",
+        json={"description": "Second writer"},
+        headers={**auth_headers["operator"], "If-Match": etag},
+    )
+    assert second.status_code == 409, second.text
+    current = client.get(f"/api/v1/claims/{claim_id}", headers=auth_headers["operator"]).json()
+    assert current["description"] == "First writer"
+
+    malformed = client.put(
+        f"/api/v1/claims/{claim_id}",
+        json={"description": "Bad header"},
+        headers={**auth_headers["operator"], "If-Match": "not-a-version"},
+    )
+    assert malformed.status_code == 400
@@ -0,0 +1,69 @@
+"""
+Connection pool configuration and saturation metrics.
+"""
+import asyncio
+
+from app import metrics
+from app.config import TORTOISE_CONFIG, database_connection, settings
+from app.database import InstrumentedPool
+
+
+class _Pool:
+    """Minimal stand-in with asyncpg.Pool's acquire/release and size accessors"""
+
+    def __init__(self, size):
+        self._idle = list(range(size))
+        self._size = size
+        self._released = asyncio.Event()
+
+    def get_size(self):
+        return self._size
+
+    def get_idle_size(self):
+        return len(self._idle)
+
+    async def acquire(self, *, timeout=None):
+        while not self._idle:
+            self._released.clear()
+            await self._released.wait()
+        return self._idle.pop()
+
+    async def release(self, connection, *, timeout=None):
+        self._idle.append(connection)
+        self._released.set()
+
+
+def test_postgres_connections_get_the_pool_settings(monkeypatch):
+    monkeypatch.setattr(settings, "DB_POOL_MAX_SIZE", 7)
+    monkeypatch.setattr(settings, "DB_STATEMENT_CACHE_SIZE", 0)
+    connection = database_connection("postgres://erp:secret@db:5433/erp")
+
+    assert connection["engine"] == "app.database"
+    credentials = connection["credentials"]
+    assert (credentials["host"], credentials["port"], credentials["database"]) == ("db", 5433, "erp")
+    assert credentials["maxsize"] == 7
+    assert credentials["statement_cache_size"] == 0
+    assert credentials["command_timeout"] == settings.DB_COMMAND_TIMEOUT
+    assert database_connection("sqlite://:memory:")["backend"] == "tortoise.backends.sqlite"
+    assert "aerich.models" in TORTOISE_CONFIG["apps"]["models"]["models"]
+
+
+def test_pool_reports_connections_in_use_and_waiters():
+    metrics.reset()
+
+    async def scenario():
+        pool = InstrumentedPool(_Pool(1), "db.test")
+        held = await pool.acquire()
+        assert metrics.snapshot()["gauges"]["db.test.in_use"] == 1
+
+        waiter = asyncio.create_task(pool.acquire())
+        await asyncio.sleep(0.01)
+        assert pool._waiting == 1
+        await pool.release(held)
+        await pool.release(await waiter)
+
+    asyncio.run(scenario())
+    snapshot = metrics.snapshot()
+    assert snapshot["counters"]["db.test.acquired"] == 2
+    assert snapshot["gauges"]["db.test.in_use"] == 0
+    assert snapshot["gauges"]["db.test.last_wait_ms"] >= 10
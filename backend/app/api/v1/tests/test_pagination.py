@@ -0,0 +1,89 @@
+from app.pagination import CURSOR_HEADER, decode_cursor, encode_cursor
+
+
+async def _seed_same_instant_leads():
+    from datetime import datetime, timezone
+    from app.models import Lead
+
+    if await Lead.filter(email__startswith="page-").exists():
+        return
+    # Identical timestamps force the id tie-breaker to do its job. Aware UTC,
+    # matching what auto_now_add stores
+    created_at = datetime(2023, 6, 1, 12, 0, tzinfo=timezone.utc)
+    for i in range(5):
+        lead = await Lead.create(first_name="Page", last_name=str(i), email=f"page-{i}@example.com")
+        await Lead.filter(id=lead.id).update(created_at=created_at)
+
+
+def test_cursor_pages_match_offset_listing(client, auth_headers, seed):
+    client.portal.call(_seed_same_instant_leads)
+    headers = auth_headers["admin"]
+    everything = client.get("/api/v1/leads", params={"limit": 1000}, headers=headers).json()
+
+    seen, cursor = [], ""
+    for _ in range(len(everything) + 1):
+        response = client.get(
+            "/api/v1/leads", params={"limit": 2, "cursor": cursor}, headers=headers
+        )
+        assert response.status_code == 200
+        seen.extend(lead["id"] for lead in response.json())
+        cursor = response.headers.get(CURSOR_HEADER)
+        if cursor is None:
+            break
+    else:
+        raise AssertionError("cursor paging did not terminate")
+
+    assert seen == [lead["id"] for lead in everything]
+    assert len(seen) == len(set(seen))
+
+
+def test_cursor_is_opaque_and_validated(client, auth_headers):
+    from datetime import datetime
+
+    cursor = encode_cursor(datetime(2024, 1, 2, 3, 4, 5, 6), 42)
+    assert decode_cursor(cursor) == (datetime(2024, 1, 2, 3, 4, 5, 6), 42)
+
+    response = client.get(
+        "/api/v1/claims", params={"cursor": "not-a-cursor"}, headers=auth_headers["admin"]
+    )
+    assert response.status_code == 400
+
+
+def test_offset_mode_sends_no_cursor(client, auth_headers):
+    response = client.get("/api/v1/users", params={"limit": 1}, headers=auth_headers["admin"])
+
+    assert response.status_code == 200
+    assert CURSOR_HEADER not in response.headers
+
+
+def test_claim_detail_embeds_latest_comments_and_pages_the_rest(client, auth_headers, seed, monkeypatch):
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "DETAIL_COMMENTS_LIMIT", 2)
+    headers = auth_headers["admin"]
+    claim_id = client.get("/api/v1/claims", headers=headers).json()[0]["id"]
+    for i in range(5):
+        client.post(f"/api/v1/claims/{claim_id}/comments", json={"comment": f"c{i}"}, headers=headers)
+    everything = client.get(
+        f"/api/v1/claims/{claim_id}/comments", params={"limit": 200}, headers=headers
+    ).json()
+    assert [c["comment"] for c in everything[:5]] == ["c4", "c3", "c2", "c1", "c0"]
+
+    detail = client.get(f"/api/v1/claims/{claim_id}", headers=headers).json()
+    assert [c["comment"] for c in detail["comments"]] == ["c3", "c4"]
+    assert all(c["username"] for c in detail["comments"])
+
+    seen, cursor = [c["id"] for c in reversed(detail["comments"])], detail["comments_cursor"]
+    for _ in range(len(everything) + 1):
+        response = client.get(
+            f"/api/v1/claims/{claim_id}/comments", params={"limit": 2, "cursor": cursor}, headers=headers
+        )
+        assert response.status_code == 200
+        seen.extend(c["id"] for c in response.json())
+        cursor = response.headers.get(CURSOR_HEADER)
+        if cursor is None:
+            break
+    else:
+        raise AssertionError("comment paging did not terminate")
+
+    assert seen == [c["id"] for c in everything]
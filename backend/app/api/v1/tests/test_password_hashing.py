@@ -0,0 +1,27 @@
+from app import metrics
+from app.config import settings
+
+
+def test_login_sheds_load_when_hash_pool_is_full(client, seed, monkeypatch):
+    monkeypatch.setattr(settings, "PASSWORD_HASH_MAX_PENDING", 0)
+
+    response = client.post(
+        "/api/v1/auth/login",
+        json={"username": "admin", "password": "123456"},
+    )
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+    assert metrics.snapshot()["counters"]["password_hash.rejected"] >= 1
+
+
+def test_hash_pool_depth_is_exported(client, seed):
+    response = client.post(
+        "/api/v1/auth/login",
+        json={"username": "admin", "password": "123456"},
+    )
+    assert response.status_code == 200
+
+    gauges = client.get("/metrics").json()["gauges"]
+    assert gauges["password_hash.in_flight"] == 0
+    assert gauges["password_hash.queued"] == 0
@@ -0,0 +1,222 @@
+"""
+SQL statements per request. Endpoints declare their budget with query_budget;
+under QUERY_BUDGET_STRICT, set by conftest, a request over it fails.
+"""
+import pytest
+
+from app.cache import analytics_cache
+from app.models import Role, SupervisorOperator, User
+from app.services import user_service
+
+BUDGETED_READS = [
+    ("/api/v1/products", "admin"),
+    ("/api/v1/products/{product_id}", "client"),
+    ("/api/v1/analytics/dashboard", "admin"),
+    ("/api/v1/analytics/clients", "admin"),
+    ("/api/v1/analytics/revenue", "admin"),
+    ("/api/v1/analytics/supervisors", "admin"),
+    ("/api/v1/claims", "client"),
+    ("/api/v1/claims", "operator"),
+    ("/api/v1/claims?include=comments", "supervisor"),
+    ("/api/v1/claims/{claim_id}", "client"),
+    ("/api/v1/claims/{claim_id}", "supervisor"),
+    ("/api/v1/leads", "operator"),
+]
+
+
+def _cold_caches():
+    """Start from the worst case: token versions and analytics are both reloaded"""
+    user_service._token_versions.clear()
+    analytics_cache.clear()
+
+
+@pytest.fixture
+def claim_id(client, auth_headers):
+    response = client.get("/api/v1/claims", headers=auth_headers["admin"])
+    assert response.status_code == 200
+    return response.json()[0]["id"]
+
+
+@pytest.fixture
+def listed_rows(client, auth_headers, seed, claim_id):
+    """A commented claim, a product and an operator's lead, so no listing is empty"""
+    comment = client.post(
+        f"/api/v1/claims/{claim_id}/comments", json={"comment": "Budgeted"}, headers=auth_headers["admin"]
+    )
+    assert comment.status_code == 200, comment.text
+    product = client.post(
+        "/api/v1/products", json={"name": "Budgeted", "type": "Service"}, headers=auth_headers["admin"]
+    )
+    assert product.status_code == 201, product.text
+    lead = client.post(
+        "/api/v1/leads",
+        json={
+            "first_name": "Budget",
+            "last_name": "Lead",
+            "email": "budget.lead@example.com",
+            "assigned_operator_id": seed["user_ids"]["operator"],
+        },
+        headers=auth_headers["admin"],
+    )
+    assert lead.status_code == 201, lead.text
+    return {"claim_id": claim_id, "product_id": product.json()["id"]}
+
+
+@pytest.mark.parametrize("path,role", BUDGETED_READS)
+def test_reads_stay_within_their_budget_with_cold_caches(client, auth_headers, listed_rows, path, role):
+    _cold_caches()
+    response = client.get(path.format(**listed_rows), headers=auth_headers[role])
+    assert response.status_code == 200, response.text
+    assert response.json()
+
+
+async def _create_staff(username, role):
+    user = await User.create(username=username, email=f"{username}@example.com", password_hash="unused")
+    await user.roles.add(await Role.get(name=role))
+    return user.id
+
+
+def test_assignments_stay_within_their_budget_on_new_claims(client, auth_headers, seed):
+    supervisor_id = seed["user_ids"]["supervisor"]
+    # Users no claim is assigned to yet, so each assignment creates a rollup row
+    operator_ids = [client.portal.call(_create_staff, f"budget-operator-{i}", "Operator") for i in range(2)]
+    new_supervisor_id = client.portal.call(_create_staff, "budget-supervisor", "Supervisor")
+    client.portal.call(
+        lambda: SupervisorOperator.create(supervisor_id=supervisor_id, operator_id=operator_ids[1])
+    )
+
+    assignments = [
+        ("assign-operator", {"operator_id": operator_ids[0]}, "admin"),
+        ("assign-supervisor", {"supervisor_id": new_supervisor_id}, "admin"),
+        ("assign-operator-by-supervisor", {"operator_id": operator_ids[1]}, "supervisor"),
+    ]
+    for endpoint, body, role in assignments:
+        claim_id = client.post(
+            "/api/v1/claims",
+            json={
+                "description": f"Budgeted {endpoint}",
+                "client_id": seed["client_id"],
+                "assigned_operator_id": seed["user_ids"]["operator"],
+                "assigned_supervisor_id": supervisor_id,
+            },
+            headers=auth_headers["admin"],
+        ).json()["id"]
+
+        _cold_caches()
+        response = client.post(f"/api/v1/claims/{claim_id}/{endpoint}", json=body, headers=auth_headers[role])
+        assert response.status_code == 200, response.text
+
+
+def test_read_endpoints_authenticate_without_queries(client, auth_headers, query_counter):
+    # /products does one query of its own; within the token version cache
+    # window the token claims cover authentication
+    client.get("/api/v1/products", headers=auth_headers["client"])
+    with query_counter() as counter:
+        response = client.get("/api/v1/products", headers=auth_headers["client"])
+
+    assert response.status_code == 200
+    assert counter.count == 1, "\n".join(counter.queries)
+
+
+def test_claim_listing_counts_comments_unless_included(client, auth_headers, query_counter, claim_id):
+    def comment_count():
+        claims = client.get("/api/v1/claims", headers=auth_headers["admin"]).json()
+        return next(claim["comment_count"] for claim in claims if claim["id"] == claim_id)
+
+    before = comment_count()
+    for text in ("first", "second"):
+        created = client.post(
+            f"/api/v1/claims/{claim_id}/comments", json={"comment": text}, headers=auth_headers["admin"]
+        )
+        assert created.status_code == 200, created.text
+
+    with query_counter() as counter:
+        summary = client.get("/api/v1/claims", headers=auth_headers["admin"])
+    assert summary.status_code == 200
+    assert counter.count <= 3, "\n".join(counter.queries)
+    assert all(claim["comments"] is None for claim in summary.json())
+
+    full = client.get("/api/v1/claims", params={"include": "comments"}, headers=auth_headers["admin"])
+    assert full.status_code == 200
+    for claim in full.json():
+        assert len(claim["comments"]) == claim["comment_count"]
+    by_id = {claim["id"]: claim["comment_count"] for claim in full.json()}
+    assert by_id == {claim["id"]: claim["comment_count"] for claim in summary.json()}
+    assert by_id[claim_id] == before + 2
+
+
+def test_admin_status_change_updates_claim_in_one_statement(client, auth_headers, seed, query_counter):
+    user_ids = seed["user_ids"]
+    claim_id = client.post(
+        "/api/v1/claims",
+        json={
+            "description": "Status change",
+            "client_id": seed["client_id"],
+            "assigned_operator_id": user_ids["operator"],
+            "assigned_supervisor_id": user_ids["supervisor"],
+        },
+        headers=auth_headers["admin"],
+    ).json()["id"]
+
+    with query_counter() as counter:
+        response = client.post(
+            f"/api/v1/claims/{claim_id}/change-status",
+            json={"status": "resolved"},
+            headers=auth_headers["admin"],
+        )
+    assert response.status_code == 200, response.text
+    assert response.json()["status"] == "resolved"
+
+    # One UPDATE ... RETURNING; SQLite adds a read of the previous row for the rollups
+    claim_queries = [query for query in counter.queries if 'FROM "claims"' in query or 'UPDATE "claims"' in query]
+    assert len(claim_queries) <= 2, "\n".join(claim_queries)
+
+    missing = client.post(
+        "/api/v1/claims/999999/change-status", json={"status": "resolved"}, headers=auth_headers["admin"]
+    )
+    assert missing.status_code == 404
+
+
+def test_server_timing_reports_queries_and_database_time(client, auth_headers, query_counter):
+    with query_counter() as counter:
+        response = client.get("/api/v1/products", headers=auth_headers["admin"])
+
+    assert response.status_code == 200
+    timing = response.headers["server-timing"]
+    assert timing.startswith("db;dur=")
+    assert f'desc="{counter.count} queries"' in timing
+
+
+def test_repeated_statement_shapes_are_flagged(client, seed):
+    from app import query_stats
+    from app.models import Client
+
+    async def lookups():
+        with query_stats.track() as stats:
+            for client_id in (seed["client_id"], seed["client_id"] + 1, seed["client_id"] + 2):
+                await Client.get_or_none(id=client_id)
+        return stats
+
+    stats = client.portal.call(lookups)
+    assert stats.queries == 3
+    assert list(stats.repeated().values()) == [3]
+    shape = next(iter(stats.repeated()))
+    assert 'FROM "clients"' in shape and str(seed["client_id"]) not in shape
+
+    stats.budget = 2
+    with pytest.raises(query_stats.QueryBudgetExceeded, match="over its budget of 2"):
+        query_stats.report("GET", "/api/v1/clients/{client_id}", 200, stats)
+
+
+def test_product_assignment_checks_each_row_once(client, auth_headers, seed):
+    product_id = client.post(
+        "/api/v1/products", json={"name": "Assigned once", "type": "Service"}, headers=auth_headers["admin"]
+    ).json()["id"]
+    path = f"/api/v1/clients/{seed['client_id']}/products"
+    body = {"client_id": seed["client_id"], "product_id": product_id}
+
+    # Within its query budget, enforced by QUERY_BUDGET_STRICT
+    assert client.post(path, json=body, headers=auth_headers["admin"]).status_code == 200
+    assert client.post(path, json=body, headers=auth_headers["admin"]).status_code == 409
+    missing = client.post(path, json={**body, "product_id": 999999}, headers=auth_headers["admin"])
+    assert missing.status_code == 404
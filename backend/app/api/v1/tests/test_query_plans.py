@@ -0,0 +1,67 @@
+"""
+EXPLAIN checks for the hot service queries.
+
+Every SELECT a service call sends must find its rows through an index:
+SQLite reports a full table scan as a plain "SCAN <table>" step.
+"""
+import pytest
+from tortoise import Tortoise
+
+from app.models.claim import ClaimStatus
+from app.models.lead import LeadStatus
+from app.services import ClaimService, ClientService, LeadService, UserService
+
+
+# Each call gets the seeded ids: user ids by username plus "client_profile"
+SERVICE_CALLS = [
+    ("claims by operator", lambda ids: ClaimService.get_all_claims(
+        operator_id=ids["operator"], status=ClaimStatus.SUBMITTED
+    )),
+    ("claims by supervisor", lambda ids: ClaimService.get_all_claims(
+        supervisor_id=ids["supervisor"], status=ClaimStatus.SUBMITTED
+    )),
+    ("claims by client", lambda ids: ClaimService.get_all_claims(
+        client_id=ids["client_profile"], status=ClaimStatus.SUBMITTED
+    )),
+    ("leads by operator", lambda ids: LeadService.get_all_leads(
+        operator_id=ids["operator"], status=LeadStatus.NEW
+    )),
+    ("claim comments", lambda ids: ClaimService.get_claim_comments(1)),
+    ("lead comments", lambda ids: LeadService.get_lead_comments(1)),
+    ("client comments", lambda ids: ClientService.get_client_comments(ids["client_profile"])),
+    ("claim files", lambda ids: ClaimService.get_claim_files(1)),
+    ("claim file by hash", lambda ids: ClaimService.attach_stored_file(
+        1, ids["client_profile"], "0" * 64
+    )),
+    ("client claims", lambda ids: ClientService.get_client_claims(ids["client_profile"])),
+    ("user by username", lambda ids: UserService.get_user_by_username("operator")),
+    ("user by email", lambda ids: UserService.get_user_by_email("operator@example.com")),
+    ("supervisor link", lambda ids: UserService.assign_operator_to_supervisor(
+        ids["supervisor"], ids["operator"]
+    )),
+]
+
+
+async def _full_scans(query_counter, call):
+    with query_counter() as counter:
+        await call()
+
+    connection = Tortoise.get_connection("default")
+    scans = []
+    for sql, params in counter.statements:
+        if not sql.lstrip().upper().startswith("SELECT"):
+            continue
+        _, plan = await connection.execute_query(f"EXPLAIN QUERY PLAN {sql}", list(params))
+        scans.extend(
+            f"{row['detail']}  <-  {sql}"
+            for row in plan
+            if row["detail"].startswith("SCAN") and "USING" not in row["detail"]
+        )
+    return scans
+
+
+@pytest.mark.parametrize("call", [pytest.param(call, id=name) for name, call in SERVICE_CALLS])
+def test_service_query_uses_an_index(client, seed, query_counter, call):
+    ids = {**seed["user_ids"], "client_profile": seed["client_id"]}
+    scans = client.portal.call(_full_scans, query_counter, lambda: call(ids))
+    assert not scans, "\n".join(scans)
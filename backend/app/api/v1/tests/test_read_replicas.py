@@ -0,0 +1,79 @@
+"""
+Read replica routing, with SQLite files standing in for the replicas.
+
+The stand-in replica starts with the primary's schema but none of its
+rows, so which database answered shows in what a listing returns.
+"""
+import pytest
+from tortoise import connections
+from tortoise.utils import get_schema_sql
+
+from app import replicas
+from app.config import settings
+from app.models import Product
+
+REPLICA = "replica_test"
+DOWN = "replica_down"
+
+
+async def _create_replicas(tmp_path):
+    connections.db_config[REPLICA] = {
+        "engine": "tortoise.backends.sqlite",
+        "credentials": {"file_path": str(tmp_path / "replica.sqlite3")},
+    }
+    connections.db_config[DOWN] = {
+        "engine": "tortoise.backends.sqlite",
+        "credentials": {"file_path": str(tmp_path / "missing" / "replica.sqlite3")},
+    }
+    replica = connections.get(REPLICA)
+    await replica.execute_script(get_schema_sql(connections.get("default"), safe=True))
+    await Product.create(name="Replica only", type="Service", using_db=replica)
+
+
+async def _drop_replicas():
+    for alias in (REPLICA, DOWN):
+        await connections.get(alias).close()
+        connections.discard(alias)
+        connections.db_config.pop(alias, None)
+
+
+@pytest.fixture
+def replica(client, monkeypatch, tmp_path):
+    monkeypatch.setattr(replicas, "REPLICAS", [DOWN, REPLICA])
+    monkeypatch.setattr(replicas, "_usable", [])
+    monkeypatch.setattr(replicas, "_last_write", {})
+    monkeypatch.setattr(settings, "REPLICA_CHECK_SECONDS", 3600)
+    client.portal.call(_create_replicas, tmp_path)
+    yield
+    client.portal.call(_drop_replicas)
+
+
+def _product_names(client, headers):
+    response = client.get("/api/v1/products", params={"limit": 1000}, headers=headers)
+    assert response.status_code == 200, response.text
+    return {product["name"] for product in response.json()}
+
+
+def test_reads_use_healthy_replicas_and_fall_back_to_the_primary(client, auth_headers, replica, monkeypatch):
+    assert client.portal.call(replicas.check_replicas) == [REPLICA]
+    assert _product_names(client, auth_headers["client"]) == {"Replica only"}
+
+    # Too much lag: every replica is skipped
+    monkeypatch.setattr(settings, "REPLICA_MAX_LAG_SECONDS", -1)
+    assert client.portal.call(replicas.check_replicas) == []
+    assert "Replica only" not in _product_names(client, auth_headers["client"])
+
+
+def test_writers_read_their_own_writes_from_the_primary(client, auth_headers, replica):
+    client.portal.call(replicas.check_replicas)
+    created = client.post(
+        "/api/v1/products", json={"name": "Written", "type": "Service"}, headers=auth_headers["admin"]
+    )
+    assert created.status_code == 201, created.text
+
+    # The writer is pinned to the primary; everyone else reads the replica
+    assert "Written" in _product_names(client, auth_headers["admin"])
+    assert _product_names(client, auth_headers["client"]) == {"Replica only"}
+
+    response = client.get(f"/api/v1/products/{created.json()['id']}", headers=auth_headers["admin"])
+    assert response.status_code == 200
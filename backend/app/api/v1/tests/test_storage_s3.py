@@ -0,0 +1,79 @@
+"""
+S3 blob store against moto's in-process S3 stand-in.
+"""
+import asyncio
+import hashlib
+import io
+import os
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from fastapi import UploadFile
+
+from app.config import settings
+from app.storage import S3BlobStore, blob_key
+
+boto3 = pytest.importorskip("boto3")
+moto = pytest.importorskip("moto")
+
+BUCKET = "claim-attachments"
+
+
+@pytest.fixture
+def store(monkeypatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setattr(settings, "S3_PART_BYTES", 5 * 1024 * 1024)
+    monkeypatch.setattr(settings, "MAX_UPLOAD_BYTES", 64 * 1024 * 1024)
+    with moto.mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket=BUCKET)
+        yield S3BlobStore(BUCKET, client)
+
+
+def _save(store, content):
+    return asyncio.run(store.save(UploadFile(io.BytesIO(content))))
+
+
+@pytest.mark.parametrize("size", [1000, 11 * 1024 * 1024], ids=["single put", "multipart"])
+def test_upload_is_stored_once_under_its_hash(store, size):
+    content = os.urandom(size)
+    stored = _save(store, content)
+    sha256 = hashlib.sha256(content).hexdigest()
+    assert (stored.path, stored.size, stored.sha256, stored.deduplicated) == (blob_key(sha256), size, sha256, False)
+    assert store.client.get_object(Bucket=BUCKET, Key=stored.path)["Body"].read() == content
+
+    again = _save(store, content)
+    assert again.path == stored.path and again.deduplicated
+    keys = [item["Key"] for item in store.client.list_objects_v2(Bucket=BUCKET)["Contents"]]
+    assert keys == [stored.path]
+    assert not store.client.list_multipart_uploads(Bucket=BUCKET).get("Uploads")
+
+
+def test_downloads_and_uploads_go_through_presigned_urls(store):
+    stored = _save(store, b"invoice")
+    assert asyncio.run(store.find(stored.sha256)).size == len(b"invoice")
+    assert asyncio.run(store.find(hashlib.sha256(b"missing").hexdigest())) is None
+
+    response = asyncio.run(store.response(stored.path, "invoice.pdf", stored.sha256, None))
+    assert response.status_code == 307
+    location = urlparse(response.headers["location"])
+    assert location.path.endswith(stored.path)
+    assert "invoice.pdf" in parse_qs(location.query)["response-content-disposition"][0]
+    cached = asyncio.run(store.response(stored.path, "invoice.pdf", stored.sha256, None, f'"{stored.sha256}"'))
+    assert cached.status_code == 304
+
+    upload = store.upload_url(stored.sha256, len(b"invoice"))
+    assert upload["method"] == "PUT"
+    assert urlparse(upload["url"]).path.endswith(blob_key(stored.sha256))
+    assert upload["headers"]["Content-Length"] == str(len(b"invoice"))
+
+
+def test_garbage_collection_keeps_referenced_blobs(store):
+    kept = _save(store, b"referenced")
+    orphan = _save(store, b"orphan")
+
+    assert asyncio.run(store.collect_garbage({kept.sha256}, grace_seconds=3600)) == []
+    assert asyncio.run(store.collect_garbage({kept.sha256}, grace_seconds=-60)) == [orphan.sha256]
+    keys = [item["Key"] for item in store.client.list_objects_v2(Bucket=BUCKET)["Contents"]]
+    assert keys == [kept.path]
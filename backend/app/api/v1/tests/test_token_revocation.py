@@ -0,0 +1,148 @@
+from app.config import settings
+
+
+def _login(client, username, password):
+    response = client.post(
+        "/api/v1/auth/login",
+        json={"username": username, "password": password},
+    )
+    assert response.status_code == 200
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def test_token_carries_roles_and_client_id(client, auth_headers, seed):
+    from app.auth import decode_access_token
+
+    token = auth_headers["client"]["Authorization"].split(" ", 1)[1]
+    payload = decode_access_token(token)
+
+    assert payload["sub"] == str(seed["user_ids"]["client"])
+    assert payload["roles"] == ["client"]
+    assert payload["cid"] == seed["client_id"]
+    assert payload["ver"] == 0
+
+
+def test_role_change_revokes_existing_tokens(client, auth_headers):
+    response = client.post(
+        "/api/v1/users",
+        json={"username": "revoked", "email": "revoked@example.com", "password": "secret123"},
+        headers=auth_headers["admin"],
+    )
+    assert response.status_code == 201
+    user_id = response.json()["id"]
+
+    headers = _login(client, "revoked", "secret123")
+    assert client.get("/api/v1/products", headers=headers).status_code == 200
+
+    response = client.post(
+        "/api/v1/users/roles/assign",
+        json={"user_id": user_id, "role_id": 1},
+        headers=auth_headers["admin"],
+    )
+    assert response.status_code == 200
+
+    assert client.get("/api/v1/products", headers=headers).status_code == 401
+    assert client.get("/api/v1/products", headers=_login(client, "revoked", "secret123")).status_code == 200
+
+
+def test_deactivation_revokes_existing_tokens(client, auth_headers):
+    response = client.post(
+        "/api/v1/users",
+        json={"username": "deactivated", "email": "deactivated@example.com", "password": "secret123"},
+        headers=auth_headers["admin"],
+    )
+    assert response.status_code == 201
+    user_id = response.json()["id"]
+    headers = _login(client, "deactivated", "secret123")
+
+    response = client.delete(f"/api/v1/users/{user_id}", headers=auth_headers["admin"])
+    assert response.status_code == 200
+
+    assert client.get("/api/v1/products", headers=headers).status_code == 401
+
+
+def test_password_reset_revokes_existing_tokens(client, auth_headers):
+    response = client.post(
+        "/api/v1/users",
+        json={"username": "reset", "email": "reset@example.com", "password": "secret123"},
+        headers=auth_headers["admin"],
+    )
+    assert response.status_code == 201
+    user_id = response.json()["id"]
+    headers = _login(client, "reset", "secret123")
+
+    response = client.patch(
+        f"/api/v1/users/{user_id}/password",
+        json={"password": "changed456"},
+        headers=auth_headers["admin"],
+    )
+    assert response.status_code == 200
+
+    assert client.get("/api/v1/products", headers=headers).status_code == 401
+    assert client.get("/api/v1/products", headers=_login(client, "reset", "changed456")).status_code == 200
+
+
+def test_reads_check_the_token_version_once_per_cache_window(client, seed, query_counter, monkeypatch):
+    from app.services import user_service
+    from app.services.user_service import UserService
+
+    user_id = seed["user_ids"]["operator"]
+    user_service._token_versions.pop(user_id, None)
+    with query_counter() as counter:
+        client.portal.call(UserService.get_token_version, user_id)
+        client.portal.call(UserService.get_token_version, user_id)
+    assert counter.count == 1
+
+    monkeypatch.setattr(settings, "TOKEN_VERSION_CACHE_SECONDS", 0)
+    with query_counter() as counter:
+        client.portal.call(UserService.get_token_version, user_id)
+    assert counter.count == 1
+
+
+def test_revocation_on_another_worker_applies_to_reads_once_the_cache_expires(client, auth_headers, monkeypatch):
+    from tortoise.expressions import F
+
+    from app.models import User
+
+    response = client.post(
+        "/api/v1/users",
+        json={"username": "elsewhere", "email": "elsewhere@example.com", "password": "secret123"},
+        headers=auth_headers["admin"],
+    )
+    assert response.status_code == 201
+    user_id = response.json()["id"]
+    headers = _login(client, "elsewhere", "secret123")
+    assert client.get("/api/v1/products", headers=headers).status_code == 200
+
+    # Another worker revokes the tokens; this worker's cached version is now stale
+    client.portal.call(lambda: User.filter(id=user_id).update(token_version=F("token_version") + 1))
+    assert client.get("/api/v1/products", headers=headers).status_code == 200
+    assert client.post(
+        "/api/v1/products", json={"name": "Stale", "type": "Service"}, headers=headers
+    ).status_code == 401
+
+    monkeypatch.setattr(settings, "TOKEN_VERSION_CACHE_SECONDS", 0)
+    assert client.get("/api/v1/products", headers=headers).status_code == 401
+
+
+def test_creating_a_client_profile_revokes_tokens_without_it(client, auth_headers):
+    from app.auth import decode_access_token
+    from app.schemas.client import ClientCreate
+    from app.services.client_service import ClientService
+
+    response = client.post(
+        "/api/v1/users",
+        json={"username": "newclient", "email": "newclient@example.com", "password": "secret123"},
+        headers=auth_headers["admin"],
+    )
+    assert response.status_code == 201
+    user_id = response.json()["id"]
+    headers = _login(client, "newclient", "secret123")
+    assert client.get("/api/v1/products", headers=headers).status_code == 200
+
+    profile = ClientCreate(user_id=user_id, full_name="New Client", email="newclient@example.com")
+    client.portal.call(ClientService.create_client, profile)
+
+    assert client.get("/api/v1/products", headers=headers).status_code == 401
+    token = _login(client, "newclient", "secret123")["Authorization"].split(" ", 1)[1]
+    assert decode_access_token(token)["cid"] is not None
@@ -1,5 +1,5 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from typing import List, Optional
 from app.schemas import (
     UserCreate, UserUpdate, UserResponse, RoleResponse
 )
@@ -8,7 +8,8 @@ from app.api.dependencies import (
     get_current_active_user, require_admin, require_admin_or_operator,
     require_supervisor_or_admin
 )
-from app.models import User
+from app.auth import Principal
+from app.pagination import CURSOR_HEADER, next_cursor
 from pydantic import BaseModel
 
 router = APIRouter(prefix="/users", tags=["Users"])
@@ -30,7 +31,7 @@ class AssignOperator(BaseModel):
 @router.post("", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def create_user(
     user_data: UserCreate,
-    current_user: User = Depends(require_admin)
+    current_user: Principal = Depends(require_admin)
 ):
     """Create new user (admin only)"""
     try:
@@ -45,19 +46,28 @@ async def create_user(
 
 @router.get("", response_model=List[UserResponse])
 async def list_users(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
-    current_user: User = Depends(require_supervisor_or_admin)
+    cursor: Optional[str] = Query(
+        None, description="Keyset paging: '' for the first page, then the previous page's X-Next-Cursor header"
+    ),
+    current_user: Principal = Depends(require_supervisor_or_admin)
 ):
-    """List users (admin and supervisor)"""
-    users = await UserService.get_all_users(skip=skip, limit=limit)
+    """List users (admin and supervisor); keyset pages (newest first) carry an X-Next-Cursor header"""
+    users = await UserService.get_all_users(skip=skip, limit=limit, cursor=cursor)
+
+    if cursor is not None:
+        next_page = next_cursor(users, limit)
+        if next_page:
+            response.headers[CURSOR_HEADER] = next_page
     return users
 
 
 @router.get("/{user_id}", response_model=UserResponse)
 async def get_user(
     user_id: int,
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_user)
 ):
     """Get user detail"""
     user = await UserService.get_user_by_id(user_id)
@@ -73,13 +83,11 @@ async def get_user(
 async def update_user(
     user_id: int,
     user_data: UserUpdate,
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_user)
 ):
     """Update user info"""
     # Users can only update themselves unless they're admin
-    await current_user.fetch_related("roles")
-    role_names = [role.name.lower() for role in current_user.roles]
-    is_admin = "admin" in role_names
+    is_admin = current_user.is_admin
     
     if not is_admin and current_user.id != user_id:
         raise HTTPException(
@@ -100,13 +108,11 @@ async def update_user(
 async def reset_password(
     user_id: int,
     password_data: PasswordUpdate,
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_user)
 ):
     """Reset password"""
     # Users can only change their own password unless they're admin
-    await current_user.fetch_related("roles")
-    role_names = [role.name.lower() for role in current_user.roles]
-    is_admin = "admin" in role_names
+    is_admin = current_user.is_admin
     
     if not is_admin and current_user.id != user_id:
         raise HTTPException(
@@ -126,7 +132,7 @@ async def reset_password(
 @router.delete("/{user_id}")
 async def deactivate_user(
     user_id: int,
-    current_user: User = Depends(require_admin)
+    current_user: Principal = Depends(require_admin)
 ):
     """Deactivate user (admin only)"""
     success = await UserService.deactivate_user(user_id)
@@ -141,7 +147,7 @@ async def deactivate_user(
 @router.post("/roles/assign")
 async def assign_role(
     role_data: RoleAssign,
-    current_user: User = Depends(require_admin)
+    current_user: Principal = Depends(require_admin)
 ):
     """Assign role to user (admin only)"""
     success = await UserService.assign_role(
@@ -160,7 +166,7 @@ async def assign_role(
 async def assign_operator_to_supervisor(
     supervisor_id: int,
     operator_data: AssignOperator,
-    current_user: User = Depends(require_admin)
+    current_user: Principal = Depends(require_admin)
 ):
     """Bind operators to supervisor (admin only)"""
     success = await UserService.assign_operator_to_supervisor(
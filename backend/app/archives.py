@@ -0,0 +1,86 @@
+"""
+Streaming ZIP archives of claim attachments.
+
+The archive is produced while it is sent. zipfile writes into a sink that
+is drained after every chunk, and each file is read from storage one
+chunk at a time. Memory use therefore stays at a couple of chunks,
+whatever the archive's size. Nothing is staged on disk.
+
+Entries are stored uncompressed: attachments are PDFs and images that
+are already compressed, and deflating them would only burn CPU on the
+event loop. The sink cannot seek, so zipfile writes each entry's sizes
+and CRC in a data descriptor after its data. It also switches to ZIP64
+records when the archive passes 4 GiB.
+"""
+import os
+import zipfile
+from contextlib import aclosing
+from typing import AsyncIterator, Iterable, List, Tuple
+
+from app import metrics
+from app.models import ClaimFile
+from app.storage import get_blob_store
+
+
+class _ChunkSink:
+    """Unseekable file object collecting what zipfile writes until it is drained"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def entry_name(claim_file: ClaimFile, folder: str = "") -> str:
+    """
+    Archive path of a claim file, unique within the archive.
+
+    The file id prefix keeps two uploads of the same name apart.
+    """
+    name = os.path.basename((claim_file.filename or claim_file.file_path).replace("\\", "/"))
+    return f"{folder}{claim_file.id}-{name or 'file'}"
+
+
+async def stream_zip(entries: Iterable[Tuple[str, ClaimFile]]) -> AsyncIterator[bytes]:
+    """
+    Stream a ZIP archive of claim files.
+
+    Files missing from storage are left out; the archive cannot report
+    them once streaming has started.
+
+    Args:
+        entries: (archive path, claim file) pairs
+
+    Yields:
+        Consecutive pieces of the archive
+    """
+    store = get_blob_store()
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, "w", zipfile.ZIP_STORED) as archive:
+        for name, claim_file in entries:
+            source = await store.open_stream(claim_file.file_path)
+            if source is None:
+                metrics.inc("archives.missing_files")
+                continue
+
+            info = zipfile.ZipInfo(name, date_time=claim_file.uploaded_at.timetuple()[:6])
+            # Sizes are only known upfront for files stored since they were recorded
+            large = claim_file.size is None or claim_file.size >= zipfile.ZIP64_LIMIT
+            async with aclosing(source):
+                with archive.open(info, "w", force_zip64=large) as entry:
+                    async for chunk in source:
+                        entry.write(chunk)
+                        yield sink.drain()
+            yield sink.drain()
+            metrics.inc("archives.files")
+    yield sink.drain()
@@ -1,7 +1,11 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Callable, FrozenSet, Optional, TypeVar
 from jose import JWTError, jwt
 from passlib.context import CryptContext
+from app import metrics
 from app.config import settings
 
 # Password hashing context
@@ -9,6 +13,99 @@ from app.config import settings
 # This is a strong, well-vetted hash suitable for application passwords.
 pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
 
+# Dedicated pool for password hashing. hashlib releases the GIL while
+# running PBKDF2, so threads give real parallelism here.
+_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    thread_name_prefix="password-hash",
+)
+_hash_pending = 0
+
+T = TypeVar("T")
+
+
+class PasswordHashingBusy(Exception):
+    """Raised when the password hashing pool has no room for another job"""
+
+
+@dataclass(frozen=True)
+class Principal:
+    """
+    Authenticated caller resolved once per request.
+
+    Holds everything the role checks and routers need so they never have
+    to go back to the database for the current user's roles or client profile.
+    """
+    id: int
+    is_active: bool
+    roles: FrozenSet[str] = field(default_factory=frozenset)
+    client_id: Optional[int] = None
+    token_version: int = 0
+
+    def has_role(self, *names: str) -> bool:
+        """Return True if the principal holds any of the given (lowercase) role names"""
+        return any(name in self.roles for name in names)
+
+    @property
+    def is_admin(self) -> bool:
+        return "admin" in self.roles
+
+    @property
+    def is_supervisor(self) -> bool:
+        return "supervisor" in self.roles
+
+    @property
+    def is_operator(self) -> bool:
+        return "operator" in self.roles
+
+    @property
+    def is_client(self) -> bool:
+        return "client" in self.roles
+
+
+def principal_to_claims(principal: Principal) -> dict:
+    """
+    Build the JWT claims describing a principal.
+
+    Args:
+        principal: The resolved principal to embed in the token
+
+    Returns:
+        Claims carrying the user id, role names, client profile id and token version
+    """
+    return {
+        "sub": str(principal.id),
+        "roles": sorted(principal.roles),
+        "cid": principal.client_id,
+        "ver": principal.token_version,
+    }
+
+
+def principal_from_claims(payload: dict) -> Optional[Principal]:
+    """
+    Rebuild a principal from decoded JWT claims without touching the database.
+
+    Args:
+        payload: The decoded token payload
+
+    Returns:
+        The principal, or None if the token predates role claims or is malformed
+    """
+    if "roles" not in payload or "ver" not in payload:
+        return None
+
+    try:
+        return Principal(
+            id=int(payload["sub"]),
+            # Tokens are only issued to active users and deactivation bumps the version
+            is_active=True,
+            roles=frozenset(str(role).lower() for role in payload["roles"]),
+            client_id=int(payload["cid"]) if payload.get("cid") is not None else None,
+            token_version=int(payload["ver"]),
+        )
+    except (KeyError, ValueError, TypeError):
+        return None
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
@@ -37,6 +134,69 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+def _record_hash_pool_depth() -> None:
+    in_flight = min(_hash_pending, settings.PASSWORD_HASH_WORKERS)
+    metrics.set_gauge("password_hash.in_flight", in_flight)
+    metrics.set_gauge("password_hash.queued", _hash_pending - in_flight)
+
+
+async def _run_in_hash_pool(func: Callable[..., T], *args) -> T:
+    """
+    Run a hashing function in the dedicated pool with bounded queueing.
+
+    Raises:
+        PasswordHashingBusy: If PASSWORD_HASH_MAX_PENDING jobs are already pending
+    """
+    global _hash_pending
+
+    if _hash_pending >= settings.PASSWORD_HASH_MAX_PENDING:
+        metrics.inc("password_hash.rejected")
+        raise PasswordHashingBusy()
+
+    _hash_pending += 1
+    _record_hash_pool_depth()
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_hash_executor, func, *args)
+    finally:
+        _hash_pending -= 1
+        _record_hash_pool_depth()
+        metrics.inc("password_hash.completed")
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password in the hashing pool without blocking the event loop.
+    
+    Args:
+        plain_password: The plain text password
+        hashed_password: The hashed password to verify against
+    
+    Returns:
+        True if passwords match, False otherwise
+
+    Raises:
+        PasswordHashingBusy: If the hashing pool is saturated
+    """
+    return await _run_in_hash_pool(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """
+    Hash a password in the hashing pool without blocking the event loop.
+    
+    Args:
+        password: The plain text password to hash
+    
+    Returns:
+        The hashed password
+
+    Raises:
+        PasswordHashingBusy: If the hashing pool is saturated
+    """
+    return await _run_in_hash_pool(get_password_hash, password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """
     Create a JWT access token.
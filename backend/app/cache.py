@@ -0,0 +1,169 @@
+"""
+In-process response cache with TTL expiry, tag invalidation and single-flight.
+
+Entries are kept per worker process. Services invalidate the tags their
+writes affect once the write has committed; other workers see the change
+when their copy expires, so the TTL bounds cross-worker staleness.
+"""
+import asyncio
+import functools
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, Set, Tuple
+
+from app import metrics
+from app.config import settings
+
+
+class TaggedCache:
+    """
+    TTL cache whose entries are grouped by tags for invalidation.
+
+    Concurrent misses for the same key share one computation. A computation
+    that overlaps an invalidation of one of its tags still answers its
+    callers but is not stored, so a result read before a write committed
+    can never outlive the invalidation.
+
+    At most max_entries are kept, evicting the least recently used, and
+    expired entries are swept once per TTL period.
+    """
+
+    def __init__(self, name: str, ttl_seconds: float, max_entries: int = 1024):
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any, Tuple[str, ...]]]" = OrderedDict()
+        self._next_sweep = 0.0
+        self._keys_by_tag: Dict[str, Set[Hashable]] = {}
+        self._tag_generations: Dict[str, int] = {}
+        self._epoch = 0
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+
+    async def get_or_compute(
+        self,
+        key: Hashable,
+        compute: Callable[[], Awaitable[Any]],
+        tags: Iterable[str],
+    ) -> Any:
+        """
+        Return the cached value for key, computing it at most once at a time.
+
+        Args:
+            key: Hashable cache key
+            compute: Coroutine function producing the value on a miss
+            tags: Tags whose invalidation drops this entry
+
+        Returns:
+            Cached or freshly computed value
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                metrics.inc(f"{self.name}.hit")
+                return entry[1]
+            self._discard(key)
+
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            metrics.inc(f"{self.name}.stampede")
+            return await asyncio.shield(in_flight)
+
+        metrics.inc(f"{self.name}.miss")
+        tags = tuple(tags)
+        generations = self._generations(tags)
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            value = await compute()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Mark retrieved so an error nobody else waited for is not logged
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            if generations == self._generations(tags) and self.ttl_seconds > 0:
+                self._store(key, value, tags)
+            return value
+        finally:
+            del self._in_flight[key]
+
+    def _generations(self, tags: Tuple[str, ...]) -> Tuple[int, ...]:
+        return (self._epoch, *(self._tag_generations.get(tag, 0) for tag in tags))
+
+    def _store(self, key: Hashable, value: Any, tags: Tuple[str, ...]) -> None:
+        now = time.monotonic()
+        if now >= self._next_sweep:
+            self._sweep(now)
+        self._entries[key] = (now + self.ttl_seconds, value, tags)
+        self._entries.move_to_end(key)
+        for tag in tags:
+            self._keys_by_tag.setdefault(tag, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            self._discard(next(iter(self._entries)))
+            metrics.inc(f"{self.name}.evictions")
+
+    def _sweep(self, now: float) -> None:
+        """Drop every expired entry"""
+        for key in [key for key, entry in self._entries.items() if entry[0] <= now]:
+            self._discard(key)
+        self._next_sweep = now + self.ttl_seconds
+
+    def _discard(self, key: Hashable) -> None:
+        """Drop one entry and its tag index references"""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry[2]:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
+
+    def invalidate(self, *tags: str) -> None:
+        """
+        Drop every entry carrying any of the given tags.
+
+        Args:
+            tags: Tags affected by a committed write
+        """
+        for tag in tags:
+            self._tag_generations[tag] = self._tag_generations.get(tag, 0) + 1
+            for key in list(self._keys_by_tag.get(tag, ())):
+                self._discard(key)
+        metrics.inc(f"{self.name}.invalidations", len(tags))
+
+    def clear(self) -> None:
+        """Drop every entry (used by tests and after bulk data changes)"""
+        self._epoch += 1
+        self._entries.clear()
+        self._keys_by_tag.clear()
+
+    def cached(self, *tags: str) -> Callable:
+        """
+        Decorator caching an async function's result per argument tuple.
+
+        Args:
+            tags: Tags whose invalidation drops the cached results
+        """
+        def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                key = (func.__qualname__, args, tuple(sorted(kwargs.items())))
+                return await self.get_or_compute(key, lambda: func(*args, **kwargs), tags)
+
+            wrapper.uncached = func
+            return wrapper
+
+        return decorator
+
+
+analytics_cache = TaggedCache(
+    "analytics_cache", settings.ANALYTICS_CACHE_SECONDS, settings.ANALYTICS_CACHE_MAX_ENTRIES
+)
+"""Cache for the admin analytics aggregates, tagged by the data they read"""
@@ -0,0 +1,143 @@
+"""
+Instrumented database clients.
+
+Tortoise loads this module as the engine of every connection (see
+database_connection in app.config). The clients are Tortoise's own
+asyncpg and SQLite clients. They differ in two ways:
+
+- Every statement, including those run inside transactions, is timed
+  and recorded in the current request's app.query_stats.
+- For PostgreSQL, the pool sees every checkout. It records how long the
+  request waited for a connection and how many connections are in use,
+  as per-worker metrics.
+
+A pool that is too small shows up as a rising db.<connection>.waiting gauge and
+growing wait times, long before requests start timing out.
+"""
+import time
+from typing import Any, Optional
+
+from tortoise.backends.asyncpg.client import AsyncpgDBClient, TransactionWrapper
+from tortoise.backends.base.client import NestedTransactionContext, TransactionContextPooled
+from tortoise.backends.sqlite.client import SqliteClient, SqliteTransactionContext, SqliteTransactionWrapper
+
+from app import metrics, query_stats
+
+
+class QueryTimingMixin:
+    """Records each statement a Tortoise client executes in the request's query stats"""
+
+    async def execute_insert(self, query: str, values: list) -> Any:
+        with query_stats.timed(query):
+            return await super().execute_insert(query, values)
+
+    async def execute_many(self, query: str, values: list) -> None:
+        with query_stats.timed(query):
+            return await super().execute_many(query, values)
+
+    async def execute_query(self, query: str, values: Optional[list] = None) -> Any:
+        with query_stats.timed(query):
+            return await super().execute_query(query, values)
+
+    async def execute_query_dict(self, query: str, values: Optional[list] = None) -> Any:
+        with query_stats.timed(query):
+            return await super().execute_query_dict(query, values)
+
+    async def execute_script(self, query: str) -> None:
+        with query_stats.timed(query):
+            return await super().execute_script(query)
+
+
+class InstrumentedPool:
+    """asyncpg pool proxy timing each acquire and tracking connections in use"""
+
+    def __init__(self, pool: Any, name: str):
+        """
+        Args:
+            pool: The asyncpg pool
+            name: Metric prefix, e.g. 'db.default'
+        """
+        self._pool = pool
+        self._name = name
+        self._waiting = 0
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._pool, attr)
+
+    def _report(self) -> None:
+        size = self._pool.get_size()
+        metrics.set_gauge(f"{self._name}.size", size)
+        metrics.set_gauge(f"{self._name}.in_use", size - self._pool.get_idle_size())
+        metrics.set_gauge(f"{self._name}.waiting", self._waiting)
+
+    async def acquire(self, *, timeout: Optional[float] = None) -> Any:
+        """Check out a connection, recording how long it took"""
+        self._waiting += 1
+        started = time.perf_counter()
+        try:
+            connection = await self._pool.acquire(timeout=timeout)
+        except BaseException:
+            metrics.inc(f"{self._name}.acquire_failed")
+            raise
+        finally:
+            self._waiting -= 1
+
+        waited = time.perf_counter() - started
+        metrics.inc(f"{self._name}.acquired")
+        metrics.inc(f"{self._name}.wait_seconds", waited)
+        metrics.set_gauge(f"{self._name}.last_wait_ms", waited * 1000)
+        self._report()
+        return connection
+
+    async def release(self, connection: Any, *, timeout: Optional[float] = None) -> None:
+        """Return a connection to the pool"""
+        try:
+            await self._pool.release(connection, timeout=timeout)
+        finally:
+            self._report()
+
+
+class InstrumentedAsyncpgTransaction(QueryTimingMixin, TransactionWrapper):
+    """Transaction (or savepoint) of the instrumented asyncpg client"""
+
+    def _in_transaction(self) -> NestedTransactionContext:
+        return NestedTransactionContext(InstrumentedAsyncpgTransaction(self))
+
+
+class InstrumentedAsyncpgDBClient(QueryTimingMixin, AsyncpgDBClient):
+    """Tortoise asyncpg client timing its statements, whose pool reports wait times and connections in use"""
+
+    def _in_transaction(self) -> TransactionContextPooled:
+        return TransactionContextPooled(InstrumentedAsyncpgTransaction(self), self._pool_init_lock)
+
+    async def create_pool(self, **kwargs) -> Any:
+        pool = await super().create_pool(**kwargs)
+        instrumented = InstrumentedPool(pool, f"db.{self.connection_name}")
+        metrics.set_gauge(f"db.{self.connection_name}.max_size", pool.get_max_size())
+        instrumented._report()
+        return instrumented
+
+
+class InstrumentedSqliteTransaction(QueryTimingMixin, SqliteTransactionWrapper):
+    """Transaction (or savepoint) of the instrumented SQLite client"""
+
+    def _in_transaction(self) -> NestedTransactionContext:
+        return NestedTransactionContext(InstrumentedSqliteTransaction(self))
+
+
+class InstrumentedSqliteClient(QueryTimingMixin, SqliteClient):
+    """Tortoise SQLite client timing its statements"""
+
+    def _in_transaction(self) -> SqliteTransactionContext:
+        return SqliteTransactionContext(InstrumentedSqliteTransaction(self), self._lock)
+
+
+CLIENT_CLASSES = {
+    "tortoise.backends.asyncpg": InstrumentedAsyncpgDBClient,
+    "tortoise.backends.sqlite": InstrumentedSqliteClient,
+}
+
+
+def get_client_class(db_info: dict) -> type:
+    """Instrumented client for the Tortoise engine a connection config wraps"""
+    return CLIENT_CLASSES[db_info["backend"]]
@@ -1,6 +1,12 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse
 from tortoise.contrib.fastapi import register_tortoise
-from app.config import settings
+from app import metrics, query_stats
+from app.auth import PasswordHashingBusy
+from app.pagination import InvalidCursor
+from app.storage import UploadTooLarge
+from app.updates import VersionConflict
+from app.config import TORTOISE_CONFIG, settings
 from app.api.v1 import (
     auth_router,
     user_router,
@@ -29,30 +35,60 @@ app.include_router(analytics_router.router, prefix=settings.API_V1_STR)
 # Register Tortoise ORM
 register_tortoise(
     app,
-    db_url=settings.DATABASE_URL,
-    modules={
-        "models": [
-            "app.models.role",
-            "app.models.user",
-            "app.models.user_role",
-            "app.models.supervisor_operator",
-            "app.models.lead",
-            "app.models.lead_comment",
-            "app.models.product",
-            "app.models.client",
-            "app.models.client_product",
-            "app.models.client_comment",
-            "app.models.claim",
-            "app.models.claim_file",
-            "app.models.claim_comment",
-            "app.models.activity_log",
-        ]
-    },
+    config=TORTOISE_CONFIG,
     generate_schemas=True,
     add_exception_handlers=True,
 )
 
 
+@app.middleware("http")
+async def query_stats_middleware(request: Request, call_next):
+    """Count each request's queries and database time; report them in Server-Timing and the app.queries log"""
+    with query_stats.track() as stats:
+        response = await call_next(request)
+    response.headers.append("Server-Timing", stats.server_timing())
+    route = request.scope.get("route")
+    query_stats.report(request.method, getattr(route, "path", request.url.path), response.status_code, stats)
+    return response
+
+
+@app.exception_handler(PasswordHashingBusy)
+async def password_hashing_busy_handler(request: Request, exc: PasswordHashingBusy):
+    """Shed load when the password hashing pool is saturated"""
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Too many concurrent password operations, retry shortly"},
+        headers={"Retry-After": "1"},
+    )
+
+
+@app.exception_handler(InvalidCursor)
+async def invalid_cursor_handler(request: Request, exc: InvalidCursor):
+    """Reject cursors that were not issued by a listing endpoint"""
+    return JSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content={"detail": str(exc)},
+    )
+
+
+@app.exception_handler(VersionConflict)
+async def version_conflict_handler(request: Request, exc: VersionConflict):
+    """A compare-and-swap update lost to a concurrent one; the client reloads and retries"""
+    return JSONResponse(
+        status_code=status.HTTP_409_CONFLICT,
+        content={"detail": f"{exc}; reload it and retry"},
+    )
+
+
+@app.exception_handler(UploadTooLarge)
+async def upload_too_large_handler(request: Request, exc: UploadTooLarge):
+    """Reject uploads over MAX_UPLOAD_BYTES"""
+    return JSONResponse(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        content={"detail": str(exc)},
+    )
+
+
 @app.get("/")
 async def root():
     """Root endpoint"""
@@ -64,3 +100,8 @@ async def health_check():
     """Health check endpoint"""
     return {"status": "healthy"}
 
+
+@app.get("/metrics")
+async def get_metrics():
+    """Per-worker counters and gauges"""
+    return metrics.snapshot()
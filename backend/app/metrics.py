@@ -0,0 +1,48 @@
+"""
+In-process metrics registry.
+
+Counters and gauges are kept per worker process and exposed through the
+/metrics endpoint so they can be scraped alongside /health.
+"""
+from typing import Dict
+
+_counters: Dict[str, float] = {}
+_gauges: Dict[str, float] = {}
+
+
+def inc(name: str, value: float = 1) -> None:
+    """
+    Increment a counter.
+
+    Args:
+        name: Dotted metric name, e.g. 'password_hash.rejected'
+        value: Amount to add
+    """
+    _counters[name] = _counters.get(name, 0) + value
+
+
+def set_gauge(name: str, value: float) -> None:
+    """
+    Set a gauge to its current value.
+
+    Args:
+        name: Dotted metric name, e.g. 'password_hash.queued'
+        value: Current value
+    """
+    _gauges[name] = value
+
+
+def snapshot() -> Dict[str, Dict[str, float]]:
+    """
+    Get a copy of every metric recorded by this worker.
+
+    Returns:
+        Dictionary with 'counters' and 'gauges'
+    """
+    return {"counters": dict(_counters), "gauges": dict(_gauges)}
+
+
+def reset() -> None:
+    """Clear all metrics (used by tests and benchmarks)"""
+    _counters.clear()
+    _gauges.clear()
@@ -26,6 +26,9 @@ from .claim_comment import ClaimComment
 # Activity Logs
 from .activity_log import ActivityLog
 
+# Analytics
+from .analytics_rollup import AnalyticsRollup, RollupMetric
+
 
 __all__ = [
     # Role & Users
@@ -53,4 +56,8 @@ __all__ = [
 
     # Logs
     "ActivityLog",
+
+    # Analytics
+    "AnalyticsRollup",
+    "RollupMetric",
 ]
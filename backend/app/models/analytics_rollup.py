@@ -0,0 +1,41 @@
+from tortoise.models import Model
+from tortoise import fields
+from enum import Enum
+
+
+class RollupMetric(str, Enum):
+    """What an analytics rollup row counts"""
+    LEADS = "leads"
+    CLAIMS = "claims"
+    CLIENT_PRODUCTS = "client_products"
+
+
+class AnalyticsRollup(Model):
+    """
+    Per-day analytics counters maintained alongside lead, claim and
+    product-assignment writes.
+    Each row counts the records of one metric created on `day` that currently
+    fall into the given status / operator / supervisor / product cell.
+    Dimensions that do not apply to a metric are stored as 0 or '' so the
+    unique constraint holds.
+    """
+    id = fields.IntField(pk=True, description="Auto-increment primary key")
+    day = fields.DateField(description="UTC day the counted records were created or assigned")
+    metric = fields.CharEnumField(
+        RollupMetric,
+        description="What is counted: 'leads', 'claims', 'client_products'"
+    )
+    status = fields.CharField(max_length=20, default="", description="Current status, '' if not applicable")
+    operator_id = fields.IntField(default=0, description="Assigned operator, 0 if none")
+    supervisor_id = fields.IntField(default=0, description="Assigned supervisor, 0 if none")
+    product_id = fields.IntField(default=0, description="Assigned product, 0 if not applicable")
+    count = fields.IntField(default=0, description="Number of records in this cell")
+    resolved_count = fields.IntField(default=0, description="Claims in this cell with a resolution time")
+    resolution_seconds = fields.FloatField(default=0, description="Summed claim resolution time in seconds")
+
+    class Meta:
+        table = "analytics_rollups"
+        unique_together = [("day", "metric", "status", "operator_id", "supervisor_id", "product_id")]
+
+    def __str__(self):
+        return f"AnalyticsRollup(day={self.day}, metric={self.metric}, count={self.count})"
@@ -39,13 +39,29 @@ class Claim(Model):
         description="Claim status: 'submitted', 'in_review', 'resolved'"
     )
     description = fields.TextField(description="Claim description")
+    version = fields.IntField(
+        default=1,
+        description="Incremented by every update; compare-and-swap token behind ETag/If-Match"
+    )
     
     # Timestamps
     created_at = fields.DatetimeField(auto_now_add=True)
     updated_at = fields.DatetimeField(auto_now=True)
+    resolved_at = fields.DatetimeField(
+        null=True,
+        description="When the claim was last moved to 'resolved'"
+    )
     
     class Meta:
         table = "claims"
+        # Keyset pagination walks listings newest first by (created_at, id);
+        # the role listings filter by assignee or client, optionally by status
+        indexes = (
+            ("created_at", "id"),
+            ("assigned_operator_id", "status", "created_at"),
+            ("assigned_supervisor_id", "status", "created_at"),
+            ("client_id", "status", "created_at"),
+        )
     
     def __str__(self):
         return f"Claim(id={self.id}, client_id={self.client_id}, status={self.status})"
@@ -25,6 +25,8 @@ class ClaimComment(Model):
     
     class Meta:
         table = "claim_comments"
+        # Comment pages walk one claim's comments by created_at
+        indexes = (("claim_id", "created_at"),)
     
     def __str__(self):
         return f"ClaimComment(id={self.id}, claim_id={self.claim_id}, user_id={self.user_id})"
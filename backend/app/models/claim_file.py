@@ -15,14 +15,29 @@ class ClaimFile(Model):
     )
     file_path = fields.CharField(
         max_length=500,
-        description="Path to the file (PDF/JPG/PNG)"
+        description="Path to the file (PDF/JPG/PNG); a content-addressed blob for hashed files"
     )
+    filename = fields.CharField(
+        max_length=255,
+        null=True,
+        description="Name the file was uploaded under"
+    )
+    size = fields.BigIntField(null=True, description="File size in bytes")
+    sha256 = fields.CharField(
+        max_length=64,
+        null=True,
+        description="SHA-256 hex digest of the file contents"
+    )
+    has_preview = fields.BooleanField(default=False, description="Whether a thumbnail has been rendered")
     
     # Timestamps
     uploaded_at = fields.DatetimeField(auto_now_add=True, description="When the file was uploaded")
     
     class Meta:
         table = "claim_files"
+        # A claim's files are listed newest first; blobs are looked up and
+        # reference-counted by hash
+        indexes = (("claim_id", "uploaded_at"), ("sha256",))
     
     def __str__(self):
         return f"ClaimFile(id={self.id}, claim_id={self.claim_id}, file_path={self.file_path})"
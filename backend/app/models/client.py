@@ -25,6 +25,8 @@ class Client(Model):
     
     class Meta:
         table = "clients"
+        # Keyset pagination walks listings newest first by (created_at, id)
+        indexes = (("created_at", "id"),)
     
     def __str__(self):
         return f"Client(id={self.id}, full_name={self.full_name}, user_id={self.user_id})"
@@ -25,6 +25,8 @@ class ClientComment(Model):
     
     class Meta:
         table = "client_comments"
+        # Comment pages walk one client's comments by created_at
+        indexes = (("client_id", "created_at"),)
     
     def __str__(self):
         return f"ClientComment(id={self.id}, client_id={self.client_id}, user_id={self.user_id})"
@@ -33,6 +33,10 @@ class Lead(Model):
         null=True,
         description="Operator assigned to handle this lead"
     )
+    version = fields.IntField(
+        default=1,
+        description="Incremented by every update; compare-and-swap token behind ETag/If-Match"
+    )
     
     # Timestamps
     created_at = fields.DatetimeField(auto_now_add=True)
@@ -40,6 +44,12 @@ class Lead(Model):
     
     class Meta:
         table = "leads"
+        # Keyset pagination walks listings newest first by (created_at, id);
+        # operators list their own leads, optionally by status
+        indexes = (
+            ("created_at", "id"),
+            ("assigned_operator_id", "status", "created_at"),
+        )
     
     def __str__(self):
         return f"Lead(id={self.id}, name={self.first_name} {self.last_name}, status={self.status})"
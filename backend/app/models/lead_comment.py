@@ -25,6 +25,8 @@ class LeadComment(Model):
     
     class Meta:
         table = "lead_comments"
+        # Comment pages walk one lead's comments by created_at
+        indexes = (("lead_id", "created_at"),)
     
     def __str__(self):
         return f"LeadComment(id={self.id}, lead_id={self.lead_id}, user_id={self.user_id})"
@@ -26,6 +26,10 @@ class User(Model):
         default=True,
         description="Whether the user account is active"
     )
+    token_version = fields.IntField(
+        default=0,
+        description="Incremented to revoke previously issued access tokens"
+    )
     
     # Many-to-many relationship with roles
     roles = fields.ManyToManyField(
@@ -41,6 +45,8 @@ class User(Model):
     
     class Meta:
         table = "users"
+        # Keyset pagination walks listings newest first by (created_at, id)
+        indexes = (("created_at", "id"),)
     
     def __str__(self):
         return f"User(id={self.id}, username={self.username}, email={self.email})"
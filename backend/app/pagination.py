@@ -0,0 +1,105 @@
+"""
+Keyset (cursor) pagination for listings ordered newest first.
+
+Keyset pages are ordered by (created_at, id) descending. A cursor encodes
+the sort key of the last row on a page; the next page is the rows strictly
+after it in that order, which the (created_at, id) index answers without
+scanning the skipped rows. An empty cursor requests the first page.
+
+Offset (skip/limit) pagination is kept alongside, with each listing's
+existing ordering.
+"""
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Optional, Sequence, Tuple
+
+from tortoise.expressions import Q
+from tortoise.queryset import QuerySet
+
+CURSOR_HEADER = "X-Next-Cursor"
+ORDERING = ("-created_at", "-id")
+
+
+class InvalidCursor(Exception):
+    """Raised when a client sends a cursor this API did not issue"""
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """
+    Encode a row's sort key as an opaque, URL-safe cursor.
+
+    Args:
+        created_at: Row creation time
+        row_id: Row primary key
+
+    Returns:
+        Cursor string
+    """
+    raw = json.dumps([created_at.isoformat(), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string from a previous page
+
+    Returns:
+        Tuple of (created_at, id)
+
+    Raises:
+        InvalidCursor: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError) as exc:
+        raise InvalidCursor("Invalid pagination cursor") from exc
+
+
+def paginate(query: QuerySet, skip: int, limit: int, cursor: Optional[str] = None) -> QuerySet:
+    """
+    Select one page of a listing.
+
+    With a cursor the listing is ordered newest first and the page starts
+    right after the row the cursor encodes ('' for the first page); skip is
+    ignored. Without one, skip/limit applies to the query's own ordering.
+
+    Args:
+        query: Listing queryset, already filtered
+        skip: Rows to skip in offset mode
+        limit: Page size
+        cursor: Cursor from the previous page, '' to start keyset paging,
+            None for offset paging
+
+    Returns:
+        Queryset for the page
+    """
+    if cursor is None:
+        return query.offset(skip).limit(limit)
+
+    query = query.order_by(*ORDERING)
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        after = Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=row_id)
+        query = query.filter(after)
+    return query.limit(limit)
+
+
+def next_cursor(rows: Sequence, limit: int) -> Optional[str]:
+    """
+    Cursor for the page after rows, or None if rows is the last page.
+
+    Args:
+        rows: Rows of the current page, in listing order
+        limit: Page size the rows were fetched with
+    """
+    if len(rows) < limit:
+        return None
+    last = rows[-1]
+    return encode_cursor(last.created_at, last.id)
@@ -0,0 +1,102 @@
+"""
+Thumbnail rendering for claim attachments.
+
+Decoding a full-size scan or rasterising a PDF page is CPU-bound and holds
+the GIL, so renders run in a process pool sized to the machine's cores.
+The pool is started on first use. Renders beyond PREVIEW_MAX_PENDING are
+skipped rather than queued without bound; their files simply have no preview.
+
+Pillow renders images and pypdfium2 renders PDFs. Both are imported in
+the worker processes, so a missing package only disables previews.
+"""
+import asyncio
+import io
+import mimetypes
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from app import metrics
+from app.config import settings
+
+PREVIEW_MEDIA_TYPE = "image/webp"
+
+_preview_executor: Optional[ProcessPoolExecutor] = None
+_preview_pending = 0
+
+
+def is_previewable(filename: str) -> bool:
+    """Whether previews are rendered for files of this name's type"""
+    media_type = mimetypes.guess_type(filename)[0] or ""
+    return media_type.startswith("image/") or media_type == "application/pdf"
+
+
+def _render(path: str, filename: str, max_pixels: int) -> Optional[bytes]:
+    """Render a WebP thumbnail of an image, or of a PDF's first page (runs in a worker process)"""
+    from PIL import Image
+
+    if mimetypes.guess_type(filename)[0] == "application/pdf":
+        import pypdfium2
+
+        pdf = pypdfium2.PdfDocument(path)
+        try:
+            page = pdf[0]
+            width, height = page.get_size()
+            image = page.render(scale=max_pixels / max(width, height)).to_pil()
+        finally:
+            pdf.close()
+    else:
+        image = Image.open(path)
+        # Decode straight at a reduced scale where the format allows (JPEG)
+        image.draft("RGB", (max_pixels, max_pixels))
+
+    image.thumbnail((max_pixels, max_pixels))
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA" if "transparency" in image.info else "RGB")
+    out = io.BytesIO()
+    image.save(out, "WEBP", quality=80)
+    return out.getvalue()
+
+
+def _executor() -> ProcessPoolExecutor:
+    global _preview_executor
+    if _preview_executor is None:
+        _preview_executor = ProcessPoolExecutor(max_workers=settings.PREVIEW_WORKERS or os.cpu_count())
+    return _preview_executor
+
+
+async def render_preview(path: str, filename: str) -> Optional[bytes]:
+    """
+    Render a thumbnail in the preview process pool.
+
+    Args:
+        path: Local path of the file
+        filename: Name of the file, which determines how it is decoded
+
+    Returns:
+        WebP thumbnail bytes, or None if the pool is saturated or the file
+        cannot be rendered
+    """
+    global _preview_pending
+
+    if _preview_pending >= settings.PREVIEW_MAX_PENDING:
+        metrics.inc("previews.skipped")
+        return None
+
+    _preview_pending += 1
+    metrics.set_gauge("previews.pending", _preview_pending)
+    try:
+        loop = asyncio.get_running_loop()
+        preview = await loop.run_in_executor(
+            _executor(), _render, path, filename, settings.PREVIEW_MAX_PIXELS
+        )
+    except Exception:
+        # Corrupt or unsupported files, and missing imaging packages, just get no preview
+        metrics.inc("previews.failed")
+        return None
+    finally:
+        _preview_pending -= 1
+        metrics.set_gauge("previews.pending", _preview_pending)
+
+    metrics.inc("previews.rendered")
+    return preview
@@ -0,0 +1,172 @@
+"""
+Per-request database query accounting.
+
+The database clients in app.database time every statement they send and
+record it in the QueryStats of the request being served. Queries run by
+tasks the request spawns count too, since those tasks inherit its
+context. The middleware in app.main reports each request's totals in a
+Server-Timing header and in the app.queries log.
+
+Statements are grouped by shape: the SQL with literals and parameter
+lists collapsed. A shape executed QUERY_REPEAT_THRESHOLD times or more
+in one request is the signature of an N+1 loop, and is logged with its
+count.
+
+Endpoints declare how many statements they may issue with the
+query_budget dependency. A request over its budget is logged; with
+QUERY_BUDGET_STRICT (set by the test suite) it fails instead.
+"""
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, Optional
+
+from app import metrics
+from app.config import settings
+
+logger = logging.getLogger("app.queries")
+
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\$\d+|\b\d+(?:\.\d+)?\b")
+_LISTS = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_SPACES = re.compile(r"\s+")
+
+_current: ContextVar[Optional["QueryStats"]] = ContextVar("query_stats", default=None)
+
+
+class QueryBudgetExceeded(Exception):
+    """Raised in strict mode when a request issues more statements than its endpoint's budget"""
+
+
+def statement_shape(sql: str) -> str:
+    """
+    SQL of a statement with its literals, placeholders and IN lists collapsed to '?'.
+
+    Args:
+        sql: Statement as sent to the database
+
+    Returns:
+        The statement's shape, equal for every execution of the same query
+    """
+    shape = _LITERALS.sub("?", sql)
+    shape = _LISTS.sub("(?)", shape)
+    return _SPACES.sub(" ", shape).strip()
+
+
+@dataclass
+class QueryStats:
+    """Statements issued while serving one request"""
+    queries: int = 0
+    seconds: float = 0.0
+    shapes: Counter = field(default_factory=Counter)
+    budget: Optional[int] = None
+
+    def record(self, sql: str, seconds: float) -> None:
+        self.queries += 1
+        self.seconds += seconds
+        self.shapes[statement_shape(sql)] += 1
+
+    def repeated(self) -> Dict[str, int]:
+        """Shapes executed at least QUERY_REPEAT_THRESHOLD times, with their counts"""
+        return {
+            shape: count
+            for shape, count in self.shapes.items()
+            if count >= settings.QUERY_REPEAT_THRESHOLD
+        }
+
+    @property
+    def over_budget(self) -> bool:
+        return self.budget is not None and self.queries > self.budget
+
+    def server_timing(self) -> str:
+        """Server-Timing header value, e.g. 'db;dur=3.2;desc="4 queries"'"""
+        return f'db;dur={self.seconds * 1000:.1f};desc="{self.queries} queries"'
+
+
+def current() -> Optional[QueryStats]:
+    """Stats of the request being served, or None outside of one"""
+    return _current.get()
+
+
+@contextmanager
+def track() -> Iterator[QueryStats]:
+    """Collect the statements issued within the block, and the tasks it starts"""
+    stats = QueryStats()
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def timed(sql: str) -> Iterator[None]:
+    """Time one statement and record it in the current request's stats"""
+    stats = _current.get()
+    if stats is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        stats.record(sql, time.perf_counter() - started)
+
+
+def set_budget(limit: int) -> None:
+    """Limit the number of statements the current request may issue"""
+    stats = _current.get()
+    if stats is not None:
+        stats.budget = limit
+
+
+def report(method: str, path: str, status_code: int, stats: QueryStats) -> None:
+    """
+    Log a request's query totals, warning about repeated shapes and blown budgets.
+
+    Args:
+        method: HTTP method
+        path: Route path template, e.g. /api/v1/claims/{claim_id}
+        status_code: Response status
+        stats: The request's stats
+
+    Raises:
+        QueryBudgetExceeded: Over budget while QUERY_BUDGET_STRICT is set
+    """
+    repeated = stats.repeated()
+    metrics.inc("queries.statements", stats.queries)
+    metrics.inc("queries.seconds", stats.seconds)
+    if repeated:
+        metrics.inc("queries.repeated_shapes", len(repeated))
+    if stats.over_budget:
+        metrics.inc("queries.over_budget")
+
+    fields = {
+        "method": method,
+        "path": path,
+        "status": status_code,
+        "queries": stats.queries,
+        "db_ms": round(stats.seconds * 1000, 1),
+        "budget": stats.budget,
+        "repeated": repeated,
+    }
+    if repeated or stats.over_budget:
+        logger.warning(
+            "%s %s issued %d queries (budget %s) in %.1f ms; repeated: %s",
+            method, path, stats.queries, stats.budget, fields["db_ms"], repeated,
+            extra={"query_stats": fields},
+        )
+    else:
+        logger.debug(
+            "%s %s issued %d queries in %.1f ms", method, path, stats.queries, fields["db_ms"],
+            extra={"query_stats": fields},
+        )
+
+    if stats.over_budget and settings.QUERY_BUDGET_STRICT:
+        shapes = "\n".join(f"{count} x {shape}" for shape, count in stats.shapes.most_common())
+        raise QueryBudgetExceeded(
+            f"{method} {path} issued {stats.queries} queries, over its budget of {stats.budget}:\n{shapes}"
+        )
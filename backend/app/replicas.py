@@ -0,0 +1,172 @@
+"""
+Read replica routing.
+
+Tortoise asks ReplicaRouter which connection each query should use.
+Writes always go to the primary. Reads go to a replica only when the
+request opted in through use_replica_for_reads. That happens for GET
+requests to the claim, lead, client, product and analytics endpoints (see
+route_reads in app.api.dependencies). Reads in an open transaction stay
+on the transaction's connection.
+
+Each worker checks its replicas every REPLICA_CHECK_SECONDS in the
+background. Replicas that are down, or that lag more than
+REPLICA_MAX_LAG_SECONDS, get no reads until a later check finds them
+healthy again; with none left, reads fall back to the primary. A user
+who wrote within REPLICA_STICKY_SECONDS reads from the primary, so they
+see their own changes.
+"""
+import asyncio
+import random
+import time
+import contextvars
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+
+import asyncpg
+from tortoise import connections
+from tortoise.backends.base.client import TransactionalDBClient
+from tortoise.exceptions import DBConnectionError
+
+from app import metrics
+from app.config import REPLICA_CONNECTIONS, settings
+
+# Seconds since the last replayed transaction; 0 once everything received is replayed
+POSTGRES_LAG_SQL = (
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END AS lag"
+)
+
+# Errors meaning the replica itself is unreachable, as opposed to a failing query
+REPLICA_FAILURES = (
+    DBConnectionError,
+    OSError,
+    asyncio.TimeoutError,
+    asyncpg.PostgresConnectionError,
+    asyncpg.ConnectionDoesNotExistError,
+)
+
+# Past this many tracked writers, entries older than the sticky window are dropped
+_WRITERS_PRUNE_AT = 4096
+
+REPLICAS: List[str] = list(REPLICA_CONNECTIONS)
+
+_reads_from: ContextVar[Optional[str]] = ContextVar("reads_from", default=None)
+_usable: List[str] = []
+_checked_at = float("-inf")
+_check_task: Optional[asyncio.Task] = None
+_last_write: Dict[int, float] = {}
+
+
+class ReplicaRouter:
+    """Tortoise router sending the reads of opted-in requests to their replica"""
+
+    def db_for_read(self, model) -> Optional[str]:
+        alias = _reads_from.get()
+        if alias is None or isinstance(connections.get("default"), TransactionalDBClient):
+            return None
+        return alias
+
+    def db_for_write(self, model) -> Optional[str]:
+        return None
+
+
+async def _lag(alias: str) -> float:
+    client = connections.get(alias)
+    if client.capabilities.dialect == "postgres":
+        rows = await client.execute_query_dict(POSTGRES_LAG_SQL)
+        return float(rows[0]["lag"])
+    # Stand-ins such as SQLite have no replication; answering a query is enough
+    await client.execute_query("SELECT 1")
+    return 0.0
+
+
+async def _probe(alias: str) -> Optional[float]:
+    """Replication lag of a replica in seconds, or None if it is unreachable"""
+    try:
+        return await asyncio.wait_for(_lag(alias), settings.REPLICA_CHECK_TIMEOUT_SECONDS)
+    except Exception:
+        return None
+
+
+async def check_replicas() -> List[str]:
+    """
+    Check every replica's availability and lag.
+
+    Returns:
+        Aliases of the replicas that may serve reads until the next check
+    """
+    global _usable, _checked_at
+
+    lags = await asyncio.gather(*(_probe(alias) for alias in REPLICAS))
+    usable = []
+    for alias, lag in zip(REPLICAS, lags):
+        healthy = lag is not None and lag <= settings.REPLICA_MAX_LAG_SECONDS
+        metrics.set_gauge(f"replicas.{alias}.healthy", int(healthy))
+        if lag is not None:
+            metrics.set_gauge(f"replicas.{alias}.lag_seconds", lag)
+        if healthy:
+            usable.append(alias)
+
+    _usable = usable
+    _checked_at = time.monotonic()
+    return usable
+
+
+def _schedule_check() -> None:
+    """Start a background check when the last one is due for renewal"""
+    global _check_task
+
+    if time.monotonic() - _checked_at < settings.REPLICA_CHECK_SECONDS:
+        return
+    if _check_task is not None and not _check_task.done():
+        return
+    # A fresh context keeps the check's queries out of the triggering request's stats
+    _check_task = asyncio.get_running_loop().create_task(check_replicas(), context=contextvars.Context())
+
+
+def mark_down(alias: str) -> None:
+    """Stop reading from a replica that failed a query, until the next check finds it healthy"""
+    global _usable
+
+    if alias in _usable:
+        _usable = [usable for usable in _usable if usable != alias]
+        metrics.set_gauge(f"replicas.{alias}.healthy", 0)
+        metrics.inc("replicas.failures")
+
+
+def record_write(user_id: int) -> None:
+    """Keep a user's reads on the primary for REPLICA_STICKY_SECONDS"""
+    now = time.monotonic()
+    if len(_last_write) >= _WRITERS_PRUNE_AT:
+        cutoff = now - settings.REPLICA_STICKY_SECONDS
+        for writer in [writer for writer, wrote_at in _last_write.items() if wrote_at < cutoff]:
+            del _last_write[writer]
+    _last_write[user_id] = now
+
+
+def use_replica_for_reads(user_id: int) -> Optional[str]:
+    """
+    Route the current request's reads to a replica, when one may serve them.
+
+    Args:
+        user_id: The user making the request
+
+    Returns:
+        Alias of the chosen replica, or None if reads stay on the primary
+    """
+    if not REPLICAS:
+        return None
+    _schedule_check()
+
+    wrote_at = _last_write.get(user_id)
+    if wrote_at is not None and time.monotonic() - wrote_at < settings.REPLICA_STICKY_SECONDS:
+        metrics.inc("replicas.sticky_reads")
+        return None
+    if not _usable:
+        metrics.inc("replicas.primary_fallbacks")
+        return None
+
+    alias = random.choice(_usable)
+    _reads_from.set(alias)
+    metrics.inc("replicas.routed_reads")
+    return alias
@@ -3,14 +3,16 @@ Pydantic Schemas Package
 """
 from .role import RoleCreate, RoleUpdate, RoleResponse
 from .user import UserCreate, UserUpdate, UserResponse, UserLogin
-from .lead import LeadCreate, LeadUpdate, LeadResponse
+from .lead import LeadCreate, LeadUpdate, LeadResponse, LeadSummaryResponse
 from .lead_comment import LeadCommentCreate, LeadCommentResponse
 from .product import ProductCreate, ProductUpdate, ProductResponse
-from .client import ClientCreate, ClientUpdate, ClientResponse
+from .client import ClientCreate, ClientUpdate, ClientResponse, ClientDetailResponse
 from .client_product import ClientProductCreate, ClientProductResponse
 from .client_comment import ClientCommentCreate, ClientCommentResponse
-from .claim import ClaimCreate, ClaimUpdate, ClaimResponse
-from .claim_file import ClaimFileCreate, ClaimFileResponse
+from .claim import ClaimCreate, ClaimUpdate, ClaimResponse, ClaimSummaryResponse
+from .claim_file import (
+    ClaimFileCreate, ClaimFileByHash, ClaimFileUploadRequest, ClaimFileUploadUrl, ClaimFileResponse
+)
 from .claim_comment import ClaimCommentCreate, ClaimCommentResponse
 from .activity_log import ActivityLogCreate, ActivityLogResponse
 from .supervisor_operator import SupervisorOperatorCreate, SupervisorOperatorResponse
@@ -29,6 +31,7 @@ __all__ = [
     "LeadCreate",
     "LeadUpdate",
     "LeadResponse",
+    "LeadSummaryResponse",
     # Lead Comment
     "LeadCommentCreate",
     "LeadCommentResponse",
@@ -40,6 +43,7 @@ __all__ = [
     "ClientCreate",
     "ClientUpdate",
     "ClientResponse",
+    "ClientDetailResponse",
     # Client Product
     "ClientProductCreate",
     "ClientProductResponse",
@@ -50,8 +54,12 @@ __all__ = [
     "ClaimCreate",
     "ClaimUpdate",
     "ClaimResponse",
+    "ClaimSummaryResponse",
     # Claim File
     "ClaimFileCreate",
+    "ClaimFileByHash",
+    "ClaimFileUploadRequest",
+    "ClaimFileUploadUrl",
     "ClaimFileResponse",
     # Claim Comment
     "ClaimCommentCreate",
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import AliasChoices, BaseModel, Field, field_validator
 from typing import Optional, List
 from datetime import datetime
 from app.models.claim import ClaimStatus
@@ -27,15 +27,38 @@ class ClaimUpdate(BaseModel):
 
 
 class ClaimResponse(ClaimBase):
-    """Schema for claim response"""
+    """Schema for claim response, embedding the latest comments in detail views"""
     id: int
     client_id: int
     assigned_operator_id: Optional[int] = None
     assigned_supervisor_id: Optional[int] = None
+    version: int = Field(1, description="Send back as If-Match (it is also the ETag) to update only this version")
     created_at: datetime
     updated_at: datetime
-    comments: Optional[List[ClaimCommentResponse]] = None
+    comments: Optional[List[ClaimCommentResponse]] = Field(
+        None,
+        validation_alias=AliasChoices("latest_comments", "comments"),
+        description="Latest comments, oldest first",
+    )
+    comments_cursor: Optional[str] = Field(
+        None, description="Cursor for GET /claims/{id}/comments to page through older comments"
+    )
+
+    @field_validator("comments", mode="before")
+    @classmethod
+    def skip_unfetched_comments(cls, value):
+        """Comments that were not loaded serialize as null instead of failing"""
+        if getattr(value, "_fetched", True) is False:
+            return None
+        return value
 
     class Config:
         from_attributes = True
 
+
+class ClaimSummaryResponse(ClaimResponse):
+    """Schema for claims in listings: a comment count instead of comment bodies"""
+    comment_count: int = Field(0, description="Number of comments on the claim")
+    comments: Optional[List[ClaimCommentResponse]] = Field(
+        None, description="Full comments, only with include=comments"
+    )
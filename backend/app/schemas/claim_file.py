@@ -1,5 +1,6 @@
 from pydantic import BaseModel, Field
 from datetime import datetime
+from typing import Dict, Optional
 
 
 class ClaimFileBase(BaseModel):
@@ -12,10 +13,37 @@ class ClaimFileCreate(ClaimFileBase):
     claim_id: int = Field(..., description="ID of the claim this file belongs to")
 
 
+class ClaimFileByHash(BaseModel):
+    """Schema for attaching an already stored file by its content hash"""
+    sha256: str = Field(..., pattern="^[0-9a-f]{64}$", description="SHA-256 hex digest of the file contents")
+    filename: Optional[str] = Field(None, max_length=255, description="Name to attach the file under")
+    upload_token: Optional[str] = Field(
+        None, description="Token from the upload-url response, for a file uploaded directly to storage"
+    )
+
+
+class ClaimFileUploadRequest(BaseModel):
+    """Schema for requesting a direct upload URL"""
+    sha256: str = Field(..., pattern="^[0-9a-f]{64}$", description="SHA-256 hex digest of the file contents")
+    size: int = Field(..., ge=0, description="File size in bytes")
+
+
+class ClaimFileUploadUrl(BaseModel):
+    """Schema for a presigned direct upload"""
+    method: str = Field(..., description="HTTP method of the upload request")
+    url: str = Field(..., description="Presigned URL to send the file to")
+    headers: Dict[str, str] = Field(..., description="Headers the upload request must carry")
+    upload_token: str = Field(..., description="Pass to /files/by-hash once the upload succeeded")
+
+
 class ClaimFileResponse(ClaimFileBase):
     """Schema for claim file response"""
     id: int
     claim_id: int
+    filename: Optional[str] = Field(None, description="Name the file was uploaded under")
+    size: Optional[int] = Field(None, description="File size in bytes")
+    sha256: Optional[str] = Field(None, description="SHA-256 hex digest of the file contents")
+    has_preview: bool = Field(False, description="Whether /preview serves a thumbnail of the file")
     uploaded_at: datetime
 
     class Config:
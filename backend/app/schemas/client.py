@@ -1,6 +1,8 @@
 from pydantic import BaseModel, Field, EmailStr
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
+from .client_comment import ClientCommentResponse
+from .client_product import ClientProductResponse
 
 
 class ClientBase(BaseModel):
@@ -34,3 +36,13 @@ class ClientResponse(ClientBase):
     class Config:
         from_attributes = True
 
+
+class ClientDetailResponse(ClientResponse):
+    """Schema for the client profile: products and the latest comments"""
+    products: List[ClientProductResponse] = Field(default_factory=list)
+    comments: List[ClientCommentResponse] = Field(
+        default_factory=list, description="Latest comments, oldest first"
+    )
+    comments_cursor: Optional[str] = Field(
+        None, description="Cursor for GET /clients/{id}/comments to page through older comments"
+    )
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import AliasChoices, BaseModel, Field, field_validator
 from typing import Optional, List
 from datetime import datetime
 from app.models.lead import LeadStatus
@@ -30,13 +30,36 @@ class LeadUpdate(BaseModel):
 
 
 class LeadResponse(LeadBase):
-    """Schema for lead response"""
+    """Schema for lead response, embedding the latest comments in detail views"""
     id: int
     assigned_operator_id: Optional[int] = None
+    version: int = Field(1, description="Send back as If-Match (it is also the ETag) to update only this version")
     created_at: datetime
     updated_at: datetime
-    comments: Optional[List[LeadCommentResponse]] = None
+    comments: Optional[List[LeadCommentResponse]] = Field(
+        None,
+        validation_alias=AliasChoices("latest_comments", "comments"),
+        description="Latest comments, oldest first",
+    )
+    comments_cursor: Optional[str] = Field(
+        None, description="Cursor for GET /leads/{id}/comments to page through older comments"
+    )
+
+    @field_validator("comments", mode="before")
+    @classmethod
+    def skip_unfetched_comments(cls, value):
+        """Comments that were not loaded serialize as null instead of failing"""
+        if getattr(value, "_fetched", True) is False:
+            return None
+        return value
 
     class Config:
         from_attributes = True
 
+
+class LeadSummaryResponse(LeadResponse):
+    """Schema for leads in listings: a comment count instead of comment bodies"""
+    comment_count: int = Field(0, description="Number of comments on the lead")
+    comments: Optional[List[LeadCommentResponse]] = Field(
+        None, description="Full comments, only with include=comments"
+    )
@@ -6,6 +6,8 @@ from .lead_service import LeadService
 from .client_service import ClientService
 from .product_service import ProductService
 from .claim_service import ClaimService
+from .analytics_service import AnalyticsService
+from .rollup_service import RollupService
 
 __all__ = [
     "UserService",
@@ -13,5 +15,7 @@ __all__ = [
     "ClientService",
     "ProductService",
     "ClaimService",
+    "AnalyticsService",
+    "RollupService",
 ]
 
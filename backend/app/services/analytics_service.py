@@ -0,0 +1,448 @@
+import asyncio
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from enum import Enum
+from time import perf_counter
+from typing import Dict, Iterable, List, Optional, Union
+from pypika_tortoise import SqlContext
+from pypika_tortoise.terms import Function as PypikaFunction
+from tortoise.expressions import Function, Q
+from tortoise.functions import Count, Sum
+from tortoise.queryset import QuerySet
+from app.cache import analytics_cache
+from app.models import AnalyticsRollup, Client, Product, RollupMetric, User
+from app.models.claim import ClaimStatus
+from app.models.lead import LeadStatus
+from app.services.rollup_service import utc_naive
+
+
+class Granularity(str, Enum):
+    """Time series bucket size"""
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+
+
+class DashboardSection(str, Enum):
+    """Independently computed parts of the admin dashboard"""
+    LEADS = "leads"
+    CLIENTS = "clients"
+    REVENUE = "revenue"
+    CLAIMS = "claims"
+    SUPERVISORS = "supervisors"
+
+
+# SQLite has no date_trunc; these produce the same calendar buckets (weeks start on Monday)
+_SQLITE_TRUNC = {
+    Granularity.DAY: "DATE({field})",
+    Granularity.WEEK: "DATE({field},'weekday 0','-6 days')",
+    Granularity.MONTH: "STRFTIME('%Y-%m-01',{field})",
+}
+
+
+class _DateTrunc(PypikaFunction):
+    def __init__(self, term, granularity: Granularity, **kwargs) -> None:
+        super().__init__("DATE_TRUNC", term, **kwargs)
+        self.granularity = Granularity(granularity)
+
+    def get_function_sql(self, ctx: SqlContext) -> str:
+        field_sql = self.args[0].get_sql(ctx.copy(with_alias=False))
+        if ctx.dialect.value == "sqlite":
+            return _SQLITE_TRUNC[self.granularity].format(field=field_sql)
+        return f"DATE_TRUNC('{self.granularity.value}',{field_sql})"
+
+
+class DateTrunc(Function):
+    """
+    Truncates a timestamp to the start of its day, week or month.
+
+    :samp:`DateTrunc("{FIELD_NAME}", Granularity.MONTH)`
+    """
+
+    database_func = _DateTrunc
+
+
+def _truncate(value: Union[date, datetime], granularity: Granularity) -> date:
+    """Python counterpart of DateTrunc, used to lay out empty buckets"""
+    day = value.date() if isinstance(value, datetime) else value
+    if granularity == Granularity.WEEK:
+        return day - timedelta(days=day.weekday())
+    if granularity == Granularity.MONTH:
+        return day.replace(day=1)
+    return day
+
+
+def _next_bucket(bucket: date, granularity: Granularity) -> date:
+    if granularity == Granularity.DAY:
+        return bucket + timedelta(days=1)
+    if granularity == Granularity.WEEK:
+        return bucket + timedelta(weeks=1)
+    if bucket.month == 12:
+        return bucket.replace(year=bucket.year + 1, month=1)
+    return bucket.replace(month=bucket.month + 1)
+
+
+def _bucket_key(value: Union[str, date, datetime]) -> date:
+    """Normalise a bucket returned by the database (timestamp or ISO string) to a date"""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+
+async def _rollup_sums(query: QuerySet, *group_fields: str, **sums) -> List[dict]:
+    """Sum rollup counts over the given fields in one GROUP BY; extra named Sums may be passed"""
+    sums.setdefault("total", Sum("count"))
+    return await (
+        query.annotate(**sums)
+        .group_by(*group_fields)
+        .values(*group_fields, *sums)
+    )
+
+
+def _utc_now() -> datetime:
+    """Current time as a naive UTC datetime, the frame the rollup days use"""
+    return utc_naive(datetime.now(dt_timezone.utc))
+
+
+def _first_day(date_from: datetime) -> date:
+    """First UTC day covered by a range starting at date_from"""
+    return utc_naive(date_from).date()
+
+
+def _last_day(date_to: datetime) -> date:
+    """Last UTC day covered by a range ending (exclusively) at date_to"""
+    date_to = utc_naive(date_to)
+    if date_to.time() == time.min:
+        return date_to.date() - timedelta(days=1)
+    return date_to.date()
+
+
+def _days_between(
+    query: QuerySet,
+    date_from: Optional[datetime],
+    date_to: Optional[datetime],
+) -> QuerySet:
+    """
+    Restrict a rollup queryset to the days covering [date_from, date_to).
+
+    Rollups are per UTC day, so a bound falling inside a day counts that
+    whole day; a date_to at midnight excludes its day. Naive bounds are
+    taken as UTC.
+    """
+    if date_from:
+        query = query.filter(day__gte=_first_day(date_from))
+    if date_to:
+        query = query.filter(day__lte=_last_day(date_to))
+    return query
+
+
+class AnalyticsService:
+    """
+    Service for dashboard aggregates.
+
+    Counts are read from the per-day analytics rollups maintained by
+    RollupService, so each query scans O(days) rows rather than the
+    underlying leads, claims and assignments. Results are cached per
+    argument set and invalidated by the services whose writes they read.
+    """
+
+    @staticmethod
+    @analytics_cache.cached("leads")
+    async def get_leads_analytics(
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        by_operator: bool = False
+    ) -> dict:
+        """
+        Lead totals by status, optionally per operator, from one rollup query.
+
+        The per-operator breakdown uses the same query grouped by
+        (operator, status); overall totals are summed from its rows.
+        """
+        group_fields = ["status"]
+        if by_operator:
+            group_fields.insert(0, "operator_id")
+
+        rows = await _rollup_sums(
+            _days_between(AnalyticsRollup.filter(metric=RollupMetric.LEADS), date_from, date_to),
+            *group_fields
+        )
+
+        status_counts: Dict[str, int] = {status.value: 0 for status in LeadStatus}
+        operators: Dict[Optional[int], dict] = {}
+        for row in rows:
+            status = LeadStatus(row["status"]).value
+            count = int(row["total"])
+            status_counts[status] += count
+            if by_operator:
+                operator_id = row["operator_id"] or None
+                operator = operators.setdefault(operator_id, {
+                    "operator_id": operator_id,
+                    "total_leads": 0,
+                    "by_status": {s.value: 0 for s in LeadStatus},
+                })
+                operator["total_leads"] += count
+                operator["by_status"][status] += count
+
+        result = {
+            "total_leads": sum(status_counts.values()),
+            "by_status": status_counts,
+        }
+        if by_operator:
+            result["by_operator"] = list(operators.values())
+        return result
+
+    @staticmethod
+    @analytics_cache.cached("clients")
+    async def get_clients_analytics() -> dict:
+        """Number of clients, in total and created in the last 30 days"""
+        total_clients = await Client.all().count()
+        recent_clients = await Client.filter(
+            created_at__gte=datetime.now(dt_timezone.utc) - timedelta(days=30)
+        ).count()
+
+        return {
+            "total_clients": total_clients,
+            "recent_clients_30d": recent_clients
+        }
+
+    @staticmethod
+    @analytics_cache.cached("products", "client_products")
+    async def get_revenue_analytics(
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None
+    ) -> dict:
+        """
+        Revenue per product and per product type.
+
+        Assignment counts per product come from the rollups and are priced
+        against the product list, so products without assignments still
+        report zero. date_from/date_to restrict which assignments count,
+        by the day they were assigned.
+        """
+        assignments = await _rollup_sums(
+            _days_between(
+                AnalyticsRollup.filter(metric=RollupMetric.CLIENT_PRODUCTS), date_from, date_to
+            ),
+            "product_id"
+        )
+        assigned_counts = {row["product_id"]: int(row["total"]) for row in assignments}
+        products = await Product.all().order_by("id").values("id", "name", "type", "price")
+
+        revenue_by_product = {}
+        revenue_by_type: Dict[str, dict] = {}
+        total_revenue = Decimal("0.00")
+        for row in products:
+            price = row["price"] or Decimal("0.00")
+            assigned_count = assigned_counts.get(row["id"], 0)
+            revenue = price * assigned_count
+            revenue_by_product[row["name"]] = {
+                "product_id": row["id"],
+                "type": row["type"],
+                "price": float(price),
+                "assigned_count": assigned_count,
+                "revenue": float(revenue),
+            }
+            by_type = revenue_by_type.setdefault(
+                row["type"], {"assigned_count": 0, "revenue": Decimal("0.00")}
+            )
+            by_type["assigned_count"] += assigned_count
+            by_type["revenue"] += revenue
+            total_revenue += revenue
+
+        return {
+            "total_revenue": float(total_revenue),
+            "by_product": revenue_by_product,
+            "by_type": {
+                product_type: {
+                    "assigned_count": totals["assigned_count"],
+                    "revenue": float(totals["revenue"]),
+                }
+                for product_type, totals in revenue_by_type.items()
+            },
+        }
+
+    @staticmethod
+    @analytics_cache.cached("claims")
+    async def get_claims_timeseries(
+        granularity: Granularity = Granularity.MONTH,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None
+    ) -> dict:
+        """
+        Claims per calendar bucket and status from one bucketed rollup query.
+
+        Defaults to the last 12 buckets up to now (UTC). Buckets with no
+        claims are filled in here rather than queried; the layout runs from
+        the bucket holding date_from to the last bucket overlapping the range.
+        """
+        granularity = Granularity(granularity)
+        date_to = utc_naive(date_to) if date_to else _utc_now()
+        if date_from is None:
+            first = _truncate(date_to, granularity)
+            for _ in range(11):
+                first = _truncate(first - timedelta(days=1), granularity)
+            date_from = datetime.combine(first, datetime.min.time())
+        date_from = utc_naive(date_from)
+
+        rows = await (
+            _days_between(AnalyticsRollup.filter(metric=RollupMetric.CLAIMS), date_from, date_to)
+            .annotate(period=DateTrunc("day", granularity), total=Sum("count"))
+            .group_by("period", "status")
+            .values("period", "status", "total")
+        )
+
+        buckets: Dict[date, dict] = {}
+        bucket = _truncate(_first_day(date_from), granularity)
+        last = _truncate(_last_day(date_to), granularity)
+        while bucket <= last:
+            buckets[bucket] = {
+                "period": bucket.isoformat(),
+                "total": 0,
+                "by_status": {status.value: 0 for status in ClaimStatus},
+            }
+            bucket = _next_bucket(bucket, granularity)
+
+        for row in rows:
+            entry = buckets.get(_bucket_key(row["period"]))
+            if entry is None:
+                continue
+            entry["total"] += int(row["total"])
+            entry["by_status"][ClaimStatus(row["status"]).value] += int(row["total"])
+
+        return {
+            "granularity": granularity.value,
+            "date_from": date_from,
+            "date_to": date_to,
+            "buckets": list(buckets.values()),
+        }
+
+    @staticmethod
+    @analytics_cache.cached("claims")
+    async def get_claims_analytics() -> dict:
+        """Claim totals, status split, last-30-day count and the last 6 calendar months"""
+        now = _utc_now()
+        rows = await _rollup_sums(
+            AnalyticsRollup.filter(metric=RollupMetric.CLAIMS),
+            "status",
+            recent=Sum("count", _filter=Q(day__gte=(now - timedelta(days=30)).date())),
+        )
+
+        status_counts = {status.value: 0 for status in ClaimStatus}
+        for row in rows:
+            status_counts[ClaimStatus(row["status"]).value] += int(row["total"])
+
+        first_month = _truncate(now, Granularity.MONTH)
+        for _ in range(5):
+            first_month = _truncate(first_month - timedelta(days=1), Granularity.MONTH)
+        # Uncached: date_to=now makes a new key every time; this result is cached as a whole
+        series = await AnalyticsService.get_claims_timeseries.uncached(
+            Granularity.MONTH,
+            date_from=datetime.combine(first_month, datetime.min.time()),
+            date_to=now,
+        )
+
+        return {
+            "total_claims": sum(status_counts.values()),
+            "by_status": status_counts,
+            "recent_claims_30d": sum(int(row["recent"] or 0) for row in rows),
+            "monthly_claims": {
+                bucket["period"][:7]: bucket["total"]
+                for bucket in reversed(series["buckets"])
+            },
+        }
+
+    @staticmethod
+    @analytics_cache.cached("claims", "users")
+    async def get_supervisors_analytics() -> dict:
+        """
+        Per-supervisor operator count, claim totals, backlog and resolution time.
+
+        Operator counts come from one query over the supervisor bindings and
+        claim figures from one rollup query grouped by supervisor. Average
+        time to resolution is the summed resolution time over the number of
+        claims that have one.
+        """
+        supervisors = await (
+            User.filter(roles__name__iexact="supervisor")
+            .annotate(assigned_operators=Count("supervised_operators__operator_id", distinct=True))
+            .group_by("id", "username")
+            .order_by("id")
+            .values("id", "username", "assigned_operators")
+        )
+        claim_rows = await _rollup_sums(
+            AnalyticsRollup.filter(
+                metric=RollupMetric.CLAIMS,
+                supervisor_id__in=[row["id"] for row in supervisors],
+            ),
+            "supervisor_id",
+            resolved=Sum("count", _filter=Q(status=ClaimStatus.RESOLVED)),
+            resolved_count=Sum("resolved_count"),
+            resolution_seconds=Sum("resolution_seconds"),
+        )
+        claims_by_supervisor = {row["supervisor_id"]: row for row in claim_rows}
+
+        supervisor_performance = []
+        for row in supervisors:
+            claims = claims_by_supervisor.get(row["id"], {})
+            total_claims = int(claims.get("total") or 0)
+            resolved_claims = int(claims.get("resolved") or 0)
+            resolved_count = int(claims.get("resolved_count") or 0)
+            avg_resolution_hours = None
+            if resolved_count:
+                avg_resolution_hours = round(
+                    float(claims["resolution_seconds"]) / resolved_count / 3600, 2
+                )
+
+            supervisor_performance.append({
+                "supervisor_id": row["id"],
+                "supervisor_name": row["username"],
+                "assigned_operators": row["assigned_operators"],
+                "total_claims": total_claims,
+                "resolved_claims": resolved_claims,
+                "open_claims": total_claims - resolved_claims,
+                "resolution_rate": (resolved_claims / total_claims * 100) if total_claims > 0 else 0,
+                "avg_resolution_hours": avg_resolution_hours,
+            })
+
+        return {
+            "supervisors": supervisor_performance
+        }
+
+    @staticmethod
+    async def get_dashboard(sections: Iterable[DashboardSection]) -> dict:
+        """
+        Compute the requested dashboard sections concurrently.
+
+        Sections do not share a transaction, so each runs its queries on
+        its own pooled connection. Each section's wall-clock time is
+        reported alongside the data.
+        """
+        compute = {
+            DashboardSection.LEADS: AnalyticsService.get_leads_analytics,
+            DashboardSection.CLIENTS: AnalyticsService.get_clients_analytics,
+            DashboardSection.REVENUE: AnalyticsService.get_revenue_analytics,
+            DashboardSection.CLAIMS: AnalyticsService.get_claims_analytics,
+            DashboardSection.SUPERVISORS: AnalyticsService.get_supervisors_analytics,
+        }
+
+        async def timed(section: DashboardSection):
+            started = perf_counter()
+            data = await compute[section]()
+            return data, round((perf_counter() - started) * 1000, 2)
+
+        started = perf_counter()
+        sections = list(dict.fromkeys(DashboardSection(section) for section in sections))
+        results = await asyncio.gather(*(timed(section) for section in sections))
+
+        return {
+            "sections": {
+                section.value: data for section, (data, _) in zip(sections, results)
+            },
+            "timings_ms": {
+                section.value: elapsed for section, (_, elapsed) in zip(sections, results)
+            },
+            "total_ms": round((perf_counter() - started) * 1000, 2),
+        }
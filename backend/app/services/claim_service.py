@@ -1,7 +1,18 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
+from tortoise import timezone
+from tortoise.expressions import Case, F, When
+from tortoise.functions import Count
+from tortoise.transactions import in_transaction
+from app.cache import analytics_cache
+from app.config import settings
 from app.models import Claim, ClaimFile, ClaimComment, User, Client
 from app.schemas import ClaimCreate, ClaimUpdate, ClaimFileCreate, ClaimCommentCreate
 from app.models.claim import ClaimStatus
+from app.pagination import next_cursor, paginate
+from app.services.rollup_service import RollupService, claim_cell
+from app.previews import is_previewable, render_preview
+from app.storage import StoredFile, get_blob_store
+from app.updates import VersionConflict, update_returning
 
 
 class ClaimService:
@@ -10,23 +21,36 @@ class ClaimService:
     @staticmethod
     async def create_claim(claim_data: ClaimCreate) -> Claim:
         """Create a new claim"""
-        claim = await Claim.create(
-            client_id=claim_data.client_id,
-            assigned_operator_id=claim_data.assigned_operator_id,
-            assigned_supervisor_id=claim_data.assigned_supervisor_id,
-            status=claim_data.status,
-            description=claim_data.description
-        )
+        async with in_transaction():
+            claim = await Claim.create(
+                client_id=claim_data.client_id,
+                assigned_operator_id=claim_data.assigned_operator_id,
+                assigned_supervisor_id=claim_data.assigned_supervisor_id,
+                status=claim_data.status,
+                description=claim_data.description,
+                resolved_at=timezone.now() if claim_data.status == ClaimStatus.RESOLVED else None
+            )
+            await RollupService.apply(None, claim_cell(claim))
+        analytics_cache.invalidate("claims")
         return claim
 
     @staticmethod
     async def get_claim_by_id(claim_id: int) -> Optional[Claim]:
-        """Get claim by ID with comments and author usernames"""
-        claim = await Claim.get_or_none(id=claim_id).prefetch_related("comments__user")
-        if claim and hasattr(claim, "comments"):
-            for comment in claim.comments:
-                if getattr(comment, "user", None):
-                    comment.username = comment.user.username
+        """Get claim by ID, without its comments"""
+        return await Claim.get_or_none(id=claim_id)
+
+    @staticmethod
+    async def attach_latest_comments(claim: Claim) -> Claim:
+        """
+        Embed a claim's latest comments for its detail view.
+
+        Sets latest_comments (oldest first, at most DETAIL_COMMENTS_LIMIT) and
+        comments_cursor, the cursor of the older comments or None if there are none.
+        """
+        limit = settings.DETAIL_COMMENTS_LIMIT
+        comments = await ClaimService.get_claim_comments(claim.id, limit=limit)
+        claim.comments_cursor = next_cursor(comments, limit)
+        claim.latest_comments = comments[::-1]
         return claim
 
     @staticmethod
@@ -36,10 +60,19 @@ class ClaimService:
         operator_id: Optional[int] = None,
         supervisor_id: Optional[int] = None,
         client_id: Optional[int] = None,
-        status: Optional[ClaimStatus] = None
+        status: Optional[ClaimStatus] = None,
+        cursor: Optional[str] = None,
+        include_comments: bool = False
     ) -> List[Claim]:
-        """Get all claims with optional filtering (including comments and author usernames)"""
-        query = Claim.all().prefetch_related("comments__user")
+        """
+        Get claims newest first with optional filtering, each with a comment_count.
+
+        Comments and author usernames are loaded only with include_comments.
+        Pages by skip/limit, or by keyset when a cursor is given ('' for the first page).
+        """
+        query = Claim.all()
+        if include_comments:
+            query = query.prefetch_related("comments__user")
         
         if operator_id:
             query = query.filter(assigned_operator_id=operator_id)
@@ -50,52 +83,205 @@ class ClaimService:
         if status:
             query = query.filter(status=status)
         
-        claims = await query.offset(skip).limit(limit).order_by("-created_at")
-        for claim in claims:
-            if hasattr(claim, "comments"):
+        claims = await paginate(query.order_by("-created_at", "-id"), skip, limit, cursor)
+        if include_comments:
+            for claim in claims:
+                claim.comment_count = len(claim.comments)
                 for comment in claim.comments:
                     if getattr(comment, "user", None):
                         comment.username = comment.user.username
+        else:
+            counts = await ClaimService.count_comments([claim.id for claim in claims])
+            for claim in claims:
+                claim.comment_count = counts.get(claim.id, 0)
         return claims
 
     @staticmethod
-    async def update_claim(claim_id: int, claim_data: ClaimUpdate) -> Optional[Claim]:
-        """Update claim information"""
-        claim = await Claim.get_or_none(id=claim_id)
-        if not claim:
-            return None
+    async def count_comments(claim_ids: List[int]) -> Dict[int, int]:
+        """Number of comments per claim, for the given claims, in one grouped query"""
+        if not claim_ids:
+            return {}
+        rows = await (
+            ClaimComment.filter(claim_id__in=claim_ids)
+            .annotate(count=Count("id"))
+            .group_by("claim_id")
+            .values("claim_id", "count")
+        )
+        return {row["claim_id"]: row["count"] for row in rows}
+
+    @staticmethod
+    async def update_claim(
+        claim_id: int, claim_data: ClaimUpdate, expected_version: Optional[int] = None
+    ) -> Optional[Claim]:
+        """
+        Update claim information in one UPDATE ... RETURNING.
+
+        Comments are not loaded; the returned claim serializes without them.
 
+        Args:
+            claim_id: Claim ID
+            claim_data: Fields to change
+            expected_version: Version the caller read; the update applies only
+                if the claim is still at it (None updates unconditionally)
+
+        Returns:
+            Updated claim, or None if it does not exist
+
+        Raises:
+            VersionConflict: If the claim is no longer at expected_version
+        """
         update_data = {}
         if claim_data.description is not None:
             update_data["description"] = claim_data.description
         if claim_data.status is not None:
             update_data["status"] = claim_data.status
+            if claim_data.status == ClaimStatus.RESOLVED:
+                # Stamp only the transition; the CASE reads the status being replaced
+                update_data["resolved_at"] = Case(
+                    When(status=ClaimStatus.RESOLVED, then=F("resolved_at")), default=timezone.now()
+                )
+            else:
+                update_data["resolved_at"] = None
         if claim_data.assigned_operator_id is not None:
             update_data["assigned_operator_id"] = claim_data.assigned_operator_id
         if claim_data.assigned_supervisor_id is not None:
             update_data["assigned_supervisor_id"] = claim_data.assigned_supervisor_id
 
-        if update_data:
-            await Claim.filter(id=claim_id).update(**update_data)
-            await claim.refresh_from_db()
+        if not update_data:
+            claim = await Claim.get_or_none(id=claim_id)
+            if claim and expected_version is not None and claim.version != expected_version:
+                raise VersionConflict(f"Claim {claim_id} was modified by another request")
+            return claim
+
+        update_data["version"] = F("version") + 1
+        expected = {"version": expected_version} if expected_version is not None else None
 
+        async with in_transaction():
+            # The rollup cell the claim leaves comes from the row this update
+            # replaces, read under the same lock, so concurrent updates compose
+            result = await update_returning(
+                Claim, claim_id, update_data,
+                previous=("status", "assigned_operator_id", "assigned_supervisor_id", "resolved_at"),
+                expected=expected,
+            )
+            if result is None:
+                return None
+            claim, before = result
+            await RollupService.apply(claim_cell(before), claim_cell(claim))
+
+        analytics_cache.invalidate("claims")
         return claim
 
     @staticmethod
-    async def upload_file(claim_id: int, file_path: str) -> ClaimFile:
-        """Upload a file for a claim"""
+    async def upload_file(claim_id: int, stored: StoredFile, filename: Optional[str] = None) -> ClaimFile:
+        """Record a stored blob as one of a claim's files"""
         claim_file = await ClaimFile.create(
             claim_id=claim_id,
-            file_path=file_path
+            file_path=stored.path,
+            filename=filename,
+            size=stored.size,
+            sha256=stored.sha256
         )
         return claim_file
 
+    @staticmethod
+    async def attach_stored_file(
+        claim_id: int,
+        client_id: int,
+        sha256: str,
+        filename: Optional[str] = None,
+        uploaded_directly: bool = False,
+    ) -> Optional[ClaimFile]:
+        """
+        Attach an already stored blob to a claim without uploading it again.
+
+        Only blobs already attached to one of the same client's claims can
+        be reused. Otherwise the lookup would reveal whether some other
+        client's document is stored. A blob the caller just uploaded
+        through a presigned URL is exempt.
+
+        Args:
+            claim_id: Claim to attach the file to
+            client_id: Client owning the claim
+            sha256: SHA-256 hex digest of the file contents
+            filename: Name to attach the file under
+            uploaded_directly: Whether the caller uploaded this blob for this claim
+
+        Returns:
+            The new claim file, or None if no such blob is available to the client
+        """
+        if not uploaded_directly and not await ClaimFile.filter(
+            sha256=sha256, claim__client_id=client_id
+        ).exists():
+            return None
+        stored = await get_blob_store().find(sha256)
+        if stored is None:
+            return None
+        return await ClaimService.upload_file(claim_id, stored, filename)
+
+    @staticmethod
+    async def generate_preview(claim_file: ClaimFile) -> bool:
+        """
+        Render and store the thumbnail of a claim file, once per blob.
+
+        Runs after the upload has been answered; failures leave the file
+        without a preview rather than raising.
+
+        Args:
+            claim_file: Newly stored claim file
+
+        Returns:
+            True if the blob now has a thumbnail
+        """
+        if not claim_file.sha256 or not is_previewable(claim_file.filename or claim_file.file_path):
+            return False
+
+        store = get_blob_store()
+        # Files sharing the blob share its thumbnail
+        if not await ClaimFile.filter(sha256=claim_file.sha256, has_preview=True).exists():
+            async with store.local_copy(claim_file.file_path) as path:
+                preview = await render_preview(path, claim_file.filename or claim_file.file_path)
+            if preview is None:
+                return False
+            await store.save_preview(claim_file.sha256, preview)
+        await ClaimFile.filter(sha256=claim_file.sha256, has_preview=False).update(has_preview=True)
+        return True
+
+    @staticmethod
+    async def collect_unreferenced_blobs() -> List[str]:
+        """
+        Remove stored blobs that no claim file references.
+
+        A blob's reference count is the number of claim_files rows carrying
+        its hash. It is counted from the table rather than kept in a
+        counter, so rows removed by cascading deletes release their blobs too.
+
+        Returns:
+            Hashes of the removed blobs
+        """
+        referenced = set(
+            await ClaimFile.filter(sha256__isnull=False).distinct().values_list("sha256", flat=True)
+        )
+        return await get_blob_store().collect_garbage(referenced, settings.BLOB_GC_GRACE_SECONDS)
+
     @staticmethod
     async def get_claim_files(claim_id: int) -> List[ClaimFile]:
         """Get all files for a claim"""
         files = await ClaimFile.filter(claim_id=claim_id).order_by("-uploaded_at")
         return files
 
+    @staticmethod
+    async def get_files_for_claims(claim_ids: List[int]) -> List[ClaimFile]:
+        """Get the files of several claims, grouped by claim, oldest first"""
+        if not claim_ids:
+            return []
+        return await ClaimFile.filter(claim_id__in=claim_ids).order_by("claim_id", "uploaded_at", "id")
+
+    @staticmethod
+    async def get_claim_file(claim_id: int, file_id: int) -> Optional[ClaimFile]:
+        """Get one of a claim's files, or None if the claim has no such file"""
+        return await ClaimFile.get_or_none(id=file_id, claim_id=claim_id)
+
     @staticmethod
     async def add_comment(claim_id: int, user_id: int, comment: str) -> ClaimComment:
         """Add a comment to a claim"""
@@ -107,8 +293,22 @@ class ClaimService:
         return comment_obj
 
     @staticmethod
-    async def get_claim_comments(claim_id: int) -> List[ClaimComment]:
-        """Get all comments for a claim"""
-        comments = await ClaimComment.filter(claim_id=claim_id).order_by("-created_at")
+    async def get_claim_comments(claim_id: int, limit: int = 100, cursor: str = "") -> List[ClaimComment]:
+        """
+        Get one page of a claim's comments, newest first, with author usernames.
+
+        Args:
+            claim_id: Claim ID
+            limit: Page size
+            cursor: Cursor from the previous page, '' for the newest comments
+
+        Returns:
+            Comments of the page
+        """
+        comments = await paginate(
+            ClaimComment.filter(claim_id=claim_id).select_related("user"), 0, limit, cursor
+        )
+        for comment in comments:
+            comment.username = comment.user.username
         return comments
 
@@ -1,7 +1,13 @@
 
 from typing import List, Optional
-from app.models import Client, ClientProduct, ClientComment, Product, Claim
+from tortoise.exceptions import IntegrityError
+from tortoise.transactions import in_transaction
+from app.cache import analytics_cache
+from app.models import Client, ClientProduct, ClientComment, Claim
 from app.schemas import ClientCreate, ClientUpdate, ClientCommentCreate, ClientProductCreate
+from app.pagination import paginate
+from app.updates import update_returning
+from app.services.rollup_service import RollupService, client_product_cell
 
 
 class ClientService:
@@ -9,7 +15,13 @@ class ClientService:
 
     @staticmethod
     async def create_client(client_data: ClientCreate) -> Client:
-        """Create a new client"""
+        """
+        Create a new client.
+
+        The user's existing tokens carry no client profile id, so they are revoked.
+        """
+        from app.services.user_service import UserService
+
         client = await Client.create(
             user_id=client_data.user_id,
             full_name=client_data.full_name,
@@ -17,6 +29,8 @@ class ClientService:
             phone=client_data.phone,
             address=client_data.address
         )
+        await UserService.bump_token_version(client_data.user_id)
+        analytics_cache.invalidate("clients")
         return client
 
     @staticmethod
@@ -25,18 +39,23 @@ class ClientService:
         return await Client.get_or_none(id=client_id)
 
     @staticmethod
-    async def get_all_clients(skip: int = 0, limit: int = 100) -> List[Client]:
-        """Get all clients with pagination"""
-        clients = await Client.all().offset(skip).limit(limit)
+    async def client_exists(client_id: int) -> bool:
+        """Check that a client exists without loading it"""
+        return await Client.filter(id=client_id).exists()
+
+    @staticmethod
+    async def get_all_clients(
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> List[Client]:
+        """Get clients by skip/limit, or newest first by keyset when a cursor is given"""
+        clients = await paginate(Client.all(), skip, limit, cursor)
         return clients
 
     @staticmethod
     async def update_client(client_id: int, client_data: ClientUpdate) -> Optional[Client]:
-        """Update client information"""
-        client = await Client.get_or_none(id=client_id)
-        if not client:
-            return None
-
+        """Update client information; returns None if the client does not exist"""
         update_data = {}
         if client_data.full_name is not None:
             update_data["full_name"] = client_data.full_name
@@ -47,33 +66,33 @@ class ClientService:
         if client_data.address is not None:
             update_data["address"] = client_data.address
 
-        if update_data:
-            await Client.filter(id=client_id).update(**update_data)
-            await client.refresh_from_db()
+        if not update_data:
+            return await Client.get_or_none(id=client_id)
 
-        return client
+        result = await update_returning(Client, client_id, update_data)
+        return result[0] if result else None
 
     @staticmethod
     async def assign_product(client_id: int, product_id: int) -> Optional[ClientProduct]:
-        """Assign a product to a client"""
-        client = await Client.get_or_none(id=client_id)
-        product = await Product.get_or_none(id=product_id)
-        
-        if not client or not product:
+        """
+        Assign a product to a client.
+
+        The client and the product must exist. The unique constraint on the
+        pair detects an existing assignment, so nothing is looked up first.
+
+        Returns:
+            The new assignment, or None if the product was already assigned
+        """
+        try:
+            async with in_transaction():
+                client_product = await ClientProduct.create(
+                    client_id=client_id,
+                    product_id=product_id
+                )
+                await RollupService.apply(None, client_product_cell(client_product))
+        except IntegrityError:
             return None
-
-        # Check if already assigned
-        existing = await ClientProduct.get_or_none(
-            client_id=client_id,
-            product_id=product_id
-        )
-        if existing:
-            return existing
-
-        client_product = await ClientProduct.create(
-            client_id=client_id,
-            product_id=product_id
-        )
+        analytics_cache.invalidate("client_products")
         return client_product
 
     @staticmethod
@@ -98,10 +117,19 @@ class ClientService:
         return comment_obj
 
     @staticmethod
-    async def get_client_comments(client_id: int) -> List[ClientComment]:
-        """Get all comments for a client"""
-        comments = await ClientComment.filter(client_id=client_id).order_by("-created_at")
-        return comments
+    async def get_client_comments(client_id: int, limit: int = 100, cursor: str = "") -> List[ClientComment]:
+        """
+        Get one page of a client's comments, newest first.
+
+        Args:
+            client_id: Client ID
+            limit: Page size
+            cursor: Cursor from the previous page, '' for the newest comments
+
+        Returns:
+            Comments of the page
+        """
+        return await paginate(ClientComment.filter(client_id=client_id), 0, limit, cursor)
 
     @staticmethod
     async def get_client_claims(client_id: int) -> List[Claim]:
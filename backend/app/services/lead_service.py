@@ -1,7 +1,16 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
+from tortoise.expressions import F
+from tortoise.functions import Count
+from tortoise.transactions import in_transaction
+from app.cache import analytics_cache
+from app.config import settings
 from app.models import Lead, LeadComment, User, Client
 from app.schemas import LeadCreate, LeadUpdate, LeadCommentCreate
 from app.models.lead import LeadStatus
+from app.pagination import next_cursor, paginate
+from app.services.user_service import UserService
+from app.services.rollup_service import RollupService, lead_cell
+from app.updates import VersionConflict, update_returning
 
 
 class LeadService:
@@ -10,26 +19,37 @@ class LeadService:
     @staticmethod
     async def create_lead(lead_data: LeadCreate) -> Lead:
         """Create a new lead"""
-        lead = await Lead.create(
-            first_name=lead_data.first_name,
-            last_name=lead_data.last_name,
-            email=lead_data.email,
-            phone=lead_data.phone,
-            status=lead_data.status,
-            assigned_operator_id=lead_data.assigned_operator_id
-        )
+        async with in_transaction():
+            lead = await Lead.create(
+                first_name=lead_data.first_name,
+                last_name=lead_data.last_name,
+                email=lead_data.email,
+                phone=lead_data.phone,
+                status=lead_data.status,
+                assigned_operator_id=lead_data.assigned_operator_id
+            )
+            await RollupService.apply(None, lead_cell(lead))
+        analytics_cache.invalidate("leads")
         await lead.fetch_related("comments")
         return lead
 
     @staticmethod
     async def get_lead_by_id(lead_id: int) -> Optional[Lead]:
-        """Get lead by ID with comments and author usernames"""
-        lead = await Lead.get_or_none(id=lead_id).prefetch_related("comments__user")
-        if lead and hasattr(lead, "comments"):
-            for comment in lead.comments:
-                # Attach username for Pydantic schema
-                if getattr(comment, "user", None):
-                    comment.username = comment.user.username
+        """Get lead by ID, without its comments"""
+        return await Lead.get_or_none(id=lead_id)
+
+    @staticmethod
+    async def attach_latest_comments(lead: Lead) -> Lead:
+        """
+        Embed a lead's latest comments for its detail view.
+
+        Sets latest_comments (oldest first, at most DETAIL_COMMENTS_LIMIT) and
+        comments_cursor, the cursor of the older comments or None if there are none.
+        """
+        limit = settings.DETAIL_COMMENTS_LIMIT
+        comments = await LeadService.get_lead_comments(lead.id, limit=limit)
+        lead.comments_cursor = next_cursor(comments, limit)
+        lead.latest_comments = comments[::-1]
         return lead
 
     @staticmethod
@@ -37,31 +57,72 @@ class LeadService:
         skip: int = 0,
         limit: int = 100,
         operator_id: Optional[int] = None,
-        status: Optional[LeadStatus] = None
+        status: Optional[LeadStatus] = None,
+        cursor: Optional[str] = None,
+        include_comments: bool = False
     ) -> List[Lead]:
-        """Get all leads with optional filtering (including comments and author usernames)"""
-        query = Lead.all().prefetch_related("comments__user")
+        """
+        Get leads newest first with optional filtering, each with a comment_count.
+
+        Comments and author usernames are loaded only with include_comments.
+        Pages by skip/limit, or by keyset when a cursor is given ('' for the first page).
+        """
+        query = Lead.all()
+        if include_comments:
+            query = query.prefetch_related("comments__user")
         
         if operator_id:
             query = query.filter(assigned_operator_id=operator_id)
         if status:
             query = query.filter(status=status)
         
-        leads = await query.offset(skip).limit(limit)
-        for lead in leads:
-            if hasattr(lead, "comments"):
+        leads = await paginate(query.order_by("-created_at", "-id"), skip, limit, cursor)
+        if include_comments:
+            for lead in leads:
+                lead.comment_count = len(lead.comments)
                 for comment in lead.comments:
                     if getattr(comment, "user", None):
                         comment.username = comment.user.username
+        else:
+            counts = await LeadService.count_comments([lead.id for lead in leads])
+            for lead in leads:
+                lead.comment_count = counts.get(lead.id, 0)
         return leads
 
     @staticmethod
-    async def update_lead(lead_id: int, lead_data: LeadUpdate) -> Optional[Lead]:
-        """Update lead information"""
-        lead = await Lead.get_or_none(id=lead_id)
-        if not lead:
-            return None
+    async def count_comments(lead_ids: List[int]) -> Dict[int, int]:
+        """Number of comments per lead, for the given leads, in one grouped query"""
+        if not lead_ids:
+            return {}
+        rows = await (
+            LeadComment.filter(lead_id__in=lead_ids)
+            .annotate(count=Count("id"))
+            .group_by("lead_id")
+            .values("lead_id", "count")
+        )
+        return {row["lead_id"]: row["count"] for row in rows}
 
+    @staticmethod
+    async def update_lead(
+        lead_id: int, lead_data: LeadUpdate, expected_version: Optional[int] = None
+    ) -> Optional[Lead]:
+        """
+        Update lead information in one UPDATE ... RETURNING.
+
+        Comments are not loaded; the returned lead serializes without them.
+
+        Args:
+            lead_id: Lead ID
+            lead_data: Fields to change
+            expected_version: Version the caller read; the update applies only
+                if the lead is still at it (None updates unconditionally)
+
+        Returns:
+            Updated lead, or None if it does not exist
+
+        Raises:
+            VersionConflict: If the lead is no longer at expected_version
+        """
         update_data = {}
         if lead_data.first_name is not None:
             update_data["first_name"] = lead_data.first_name
@@ -76,18 +137,41 @@ class LeadService:
         if lead_data.assigned_operator_id is not None:
             update_data["assigned_operator_id"] = lead_data.assigned_operator_id
 
-        if update_data:
-            await Lead.filter(id=lead_id).update(**update_data)
-            await lead.refresh_from_db()
-
-        await lead.fetch_related("comments")
+        if not update_data:
+            lead = await Lead.get_or_none(id=lead_id)
+            if lead and expected_version is not None and lead.version != expected_version:
+                raise VersionConflict(f"Lead {lead_id} was modified by another request")
+            return lead
+
+        update_data["version"] = F("version") + 1
+        expected = {"version": expected_version} if expected_version is not None else None
+
+        async with in_transaction():
+            # The rollup cell the lead leaves comes from the row this update
+            # replaces, read under the same lock, so concurrent updates compose
+            result = await update_returning(
+                Lead, lead_id, update_data, previous=("status", "assigned_operator_id"), expected=expected
+            )
+            if result is None:
+                return None
+            lead, before = result
+            await RollupService.apply(lead_cell(before), lead_cell(lead))
+
+        analytics_cache.invalidate("leads")
         return lead
 
     @staticmethod
     async def delete_lead(lead_id: int) -> bool:
         """Delete a lead"""
-        deleted = await Lead.filter(id=lead_id).delete()
-        return deleted > 0
+        async with in_transaction():
+            lead = await Lead.select_for_update().get_or_none(id=lead_id)
+            if not lead:
+                return False
+
+            await Lead.filter(id=lead_id).delete()
+            await RollupService.apply(lead_cell(lead), None)
+        analytics_cache.invalidate("leads")
+        return True
 
     @staticmethod
     async def add_comment(lead_id: int, user_id: int, comment: str) -> LeadComment:
@@ -100,34 +184,57 @@ class LeadService:
         return comment_obj
 
     @staticmethod
-    async def get_lead_comments(lead_id: int) -> List[LeadComment]:
-        """Get all comments for a lead"""
-        comments = await LeadComment.filter(lead_id=lead_id).order_by("-created_at")
+    async def get_lead_comments(lead_id: int, limit: int = 100, cursor: str = "") -> List[LeadComment]:
+        """
+        Get one page of a lead's comments, newest first, with author usernames.
+
+        Args:
+            lead_id: Lead ID
+            limit: Page size
+            cursor: Cursor from the previous page, '' for the newest comments
+
+        Returns:
+            Comments of the page
+        """
+        comments = await paginate(
+            LeadComment.filter(lead_id=lead_id).select_related("user"), 0, limit, cursor
+        )
+        for comment in comments:
+            comment.username = comment.user.username
         return comments
 
     @staticmethod
     async def convert_lead_to_client(lead_id: int, user_id: int) -> Optional[Client]:
         """Convert a lead to a client"""
-        lead = await Lead.get_or_none(id=lead_id)
-        if not lead:
-            return None
-
-        # Check if user already has a client profile
-        existing_client = await Client.get_or_none(user_id=user_id)
-        if existing_client:
-            return existing_client
-
-        # Create client from lead data
-        client = await Client.create(
-            user_id=user_id,
-            full_name=f"{lead.first_name} {lead.last_name}",
-            email=lead.email,
-            phone=lead.phone,
-            address=None
-        )
-
-        # Update lead status to converted
-        await Lead.filter(id=lead_id).update(status=LeadStatus.CONVERTED)
+        async with in_transaction():
+            lead = await Lead.select_for_update().get_or_none(id=lead_id)
+            if not lead:
+                return None
+
+            # Check if user already has a client profile
+            existing_client = await Client.get_or_none(user_id=user_id)
+            if existing_client:
+                return existing_client
+
+            # Create client from lead data
+            client = await Client.create(
+                user_id=user_id,
+                full_name=f"{lead.first_name} {lead.last_name}",
+                email=lead.email,
+                phone=lead.phone,
+                address=None
+            )
+            # The user's existing tokens do not carry the new client profile id
+            await UserService.bump_token_version(user_id)
+
+            # Update lead status to converted
+            old_cell = lead_cell(lead)
+            await Lead.filter(id=lead_id).update(status=LeadStatus.CONVERTED, version=F("version") + 1)
+            lead.status = LeadStatus.CONVERTED
+            await RollupService.apply(old_cell, lead_cell(lead))
+        # A GET between the bump and the commit may have cached the old version
+        UserService.forget_token_version(user_id)
+        analytics_cache.invalidate("leads", "clients")
 
         return client
 
@@ -1,5 +1,6 @@
 from typing import List, Optional
 from decimal import Decimal
+from app.cache import analytics_cache
 from app.models import Product
 from app.schemas import ProductCreate, ProductUpdate
 
@@ -16,6 +17,7 @@ class ProductService:
             description=product_data.description,
             price=product_data.price
         )
+        analytics_cache.invalidate("products")
         return product
 
     @staticmethod
@@ -23,6 +25,11 @@ class ProductService:
         """Get product by ID"""
         return await Product.get_or_none(id=product_id)
 
+    @staticmethod
+    async def product_exists(product_id: int) -> bool:
+        """Check that a product exists without loading it"""
+        return await Product.filter(id=product_id).exists()
+
     @staticmethod
     async def get_all_products(skip: int = 0, limit: int = 100) -> List[Product]:
         """Get all products with pagination"""
@@ -49,6 +56,7 @@ class ProductService:
         if update_data:
             await Product.filter(id=product_id).update(**update_data)
             await product.refresh_from_db()
+            analytics_cache.invalidate("products")
 
         return product
 
@@ -56,5 +64,7 @@ class ProductService:
     async def delete_product(product_id: int) -> bool:
         """Delete a product"""
         deleted = await Product.filter(id=product_id).delete()
+        # Deleting a product cascades to its client assignments
+        analytics_cache.invalidate("products", "client_products")
         return deleted > 0
 
@@ -0,0 +1,179 @@
+from collections import defaultdict
+from datetime import date, datetime, timezone as dt_timezone
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from tortoise.exceptions import IntegrityError
+from tortoise.expressions import F
+from tortoise.transactions import in_transaction
+from app.cache import analytics_cache
+from app.models import AnalyticsRollup, RollupMetric, Lead, Claim, ClientProduct
+
+REBUILD_CHUNK_SIZE = 1000
+
+# Columns of the analytics_rollups unique constraint
+KEY_FIELDS = ("day", "metric", "status", "operator_id", "supervisor_id", "product_id")
+
+
+class RollupCell(NamedTuple):
+    """One record's contribution to the analytics rollups"""
+    day: date
+    metric: RollupMetric
+    status: str = ""
+    operator_id: int = 0
+    supervisor_id: int = 0
+    product_id: int = 0
+    resolved_count: int = 0
+    resolution_seconds: float = 0.0
+
+    def key(self) -> Dict[str, object]:
+        """Columns identifying the rollup row this cell is counted in"""
+        return {field: getattr(self, field) for field in KEY_FIELDS}
+
+
+def utc_naive(value: datetime) -> datetime:
+    """Naive UTC datetime, whether the driver returned an aware or a naive value"""
+    if value.tzinfo is not None:
+        return value.astimezone(dt_timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def lead_cell(lead: Lead) -> RollupCell:
+    """Rollup cell a lead is counted in: creation day, status and operator"""
+    return RollupCell(
+        day=utc_naive(lead.created_at).date(),
+        metric=RollupMetric.LEADS,
+        status=getattr(lead.status, "value", lead.status),
+        operator_id=lead.assigned_operator_id or 0,
+    )
+
+
+def claim_cell(claim: Claim) -> RollupCell:
+    """Rollup cell a claim is counted in, carrying its resolution time if resolved"""
+    resolved_count, resolution_seconds = 0, 0.0
+    if claim.resolved_at is not None:
+        resolved_count = 1
+        resolution_seconds = (utc_naive(claim.resolved_at) - utc_naive(claim.created_at)).total_seconds()
+    return RollupCell(
+        day=utc_naive(claim.created_at).date(),
+        metric=RollupMetric.CLAIMS,
+        status=getattr(claim.status, "value", claim.status),
+        operator_id=claim.assigned_operator_id or 0,
+        supervisor_id=claim.assigned_supervisor_id or 0,
+        resolved_count=resolved_count,
+        resolution_seconds=resolution_seconds,
+    )
+
+
+def client_product_cell(client_product: ClientProduct) -> RollupCell:
+    """Rollup cell a product assignment is counted in: assignment day and product"""
+    return RollupCell(
+        day=utc_naive(client_product.assigned_at).date(),
+        metric=RollupMetric.CLIENT_PRODUCTS,
+        product_id=client_product.product_id,
+    )
+
+
+class RollupService:
+    """
+    Service maintaining the per-day analytics rollups.
+
+    Writers call apply() with a record's cell before and after the change,
+    inside the same transaction as the change itself, so the rollups move
+    with the data. Writes that bypass the services (cascading deletes, manual
+    SQL) are reconciled by rebuild().
+    """
+
+    @staticmethod
+    async def apply(old: Optional[RollupCell], new: Optional[RollupCell]) -> None:
+        """
+        Move one record from its old rollup cell to its new one.
+
+        Args:
+            old: Cell before the change, None for a newly created record
+            new: Cell after the change, None for a deleted record
+        """
+        if old == new:
+            return
+        if old is not None:
+            await RollupService._bump(old, -1)
+        if new is not None:
+            await RollupService._bump(new, 1)
+
+    @staticmethod
+    async def _bump(cell: RollupCell, sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) a cell's contribution with an atomic increment"""
+        changes = {
+            "count": F("count") + sign,
+            "resolved_count": F("resolved_count") + sign * cell.resolved_count,
+            "resolution_seconds": F("resolution_seconds") + sign * cell.resolution_seconds,
+        }
+        updated = await AnalyticsRollup.filter(**cell.key()).update(**changes)
+        if updated or sign < 0:
+            # A missing row on removal means the rollups predate the record; rebuild() fixes that
+            return
+
+        try:
+            # Savepoint, so losing the insert race does not abort the caller's transaction
+            async with in_transaction():
+                await AnalyticsRollup.create(
+                    **cell.key(),
+                    count=1,
+                    resolved_count=cell.resolved_count,
+                    resolution_seconds=cell.resolution_seconds,
+                )
+        except IntegrityError:
+            await AnalyticsRollup.filter(**cell.key()).update(**changes)
+
+    @staticmethod
+    async def rebuild() -> int:
+        """
+        Recompute every rollup row from the source tables.
+
+        Records are read in id-ordered chunks and summed in memory per cell,
+        then the rollups are replaced. Scan and replacement share one
+        transaction that holds SHARE locks on the source tables on Postgres,
+        so service writes wait for the rebuild instead of landing between
+        the scan and the replacement and being lost; reads carry on. SQLite
+        serialises the transaction with every other write anyway.
+
+        Returns:
+            Number of rollup rows written
+        """
+        totals: Dict[Tuple, List] = defaultdict(lambda: [0, 0, 0.0])
+        sources = [
+            (Lead, lead_cell),
+            (Claim, claim_cell),
+            (ClientProduct, client_product_cell),
+        ]
+        async with in_transaction() as connection:
+            if connection.capabilities.dialect == "postgres":
+                await connection.execute_script(
+                    'LOCK TABLE "leads", "claims", "client_products" IN SHARE MODE'
+                )
+
+            for model, to_cell in sources:
+                last_id = 0
+                while True:
+                    chunk = await model.filter(id__gt=last_id).order_by("id").limit(REBUILD_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    for record in chunk:
+                        cell = to_cell(record)
+                        entry = totals[cell[:len(KEY_FIELDS)]]
+                        entry[0] += 1
+                        entry[1] += cell.resolved_count
+                        entry[2] += cell.resolution_seconds
+                    last_id = chunk[-1].id
+
+            rows = [
+                AnalyticsRollup(
+                    **dict(zip(KEY_FIELDS, key)),
+                    count=count,
+                    resolved_count=resolved_count,
+                    resolution_seconds=resolution_seconds,
+                )
+                for key, (count, resolved_count, resolution_seconds) in totals.items()
+            ]
+            await AnalyticsRollup.all().delete()
+            await AnalyticsRollup.bulk_create(rows, batch_size=REBUILD_CHUNK_SIZE)
+        analytics_cache.clear()
+        return len(rows)
@@ -1,10 +1,20 @@
-from typing import List, Optional
+import time
+from typing import Dict, FrozenSet, List, Optional, Tuple
+from tortoise.expressions import F
+from app.cache import analytics_cache
+from app.config import settings
+from app.pagination import paginate
 from app.models import User, Role, UserRole, SupervisorOperator
 from app.schemas import UserCreate, UserUpdate
-from app.auth import get_password_hash, verify_password
+from app.auth import Principal, get_password_hash_async, verify_password_async
 from tortoise.exceptions import IntegrityError
 from app.services.client_service import ClientService
 from app.schemas.client import ClientCreate
+from app.updates import update_returning
+
+# Per-worker cache of user_id -> (token_version, time it was read)
+_token_versions: Dict[int, Tuple[int, float]] = {}
+
 
 class UserService:
     """Service for user-related operations"""
@@ -12,7 +22,7 @@ class UserService:
     @staticmethod
     async def create_user(user_data: UserCreate) -> User:
         """Create a new user with roles"""
-        password_hash = get_password_hash(user_data.password)
+        password_hash = await get_password_hash_async(user_data.password)
         
         try:
             user = await User.create(
@@ -34,6 +44,7 @@ class UserService:
                     )
                     await ClientService.create_client(client_data)
 
+            analytics_cache.invalidate("users")
             # Reload user with roles
             await user.fetch_related("roles")
             return user
@@ -48,6 +59,75 @@ class UserService:
             await user.fetch_related("roles")
         return user
 
+    @staticmethod
+    async def get_principal(user_id: int) -> Optional[Principal]:
+        """Resolve user, role names and client profile id in a single query"""
+        rows = await User.filter(id=user_id).values(
+            "id", "is_active", "token_version", "roles__name", "client_profile__id"
+        )
+        if not rows:
+            return None
+
+        _token_versions[user_id] = (rows[0]["token_version"], time.monotonic())
+        return Principal(
+            id=rows[0]["id"],
+            is_active=rows[0]["is_active"],
+            roles=frozenset(
+                row["roles__name"].lower() for row in rows if row["roles__name"]
+            ),
+            client_id=rows[0]["client_profile__id"],
+            token_version=rows[0]["token_version"],
+        )
+
+    @staticmethod
+    async def get_role_names(user_id: int) -> Optional[FrozenSet[str]]:
+        """
+        Get a user's lowercase role names in a single query.
+
+        Returns:
+            The role names, or None if the user does not exist
+        """
+        names = await User.filter(id=user_id).values_list("roles__name", flat=True)
+        if not names:
+            return None
+        return frozenset(name.lower() for name in names if name)
+
+    @staticmethod
+    async def get_token_version(user_id: int) -> Optional[int]:
+        """
+        Get the user's current token version, served from the worker cache while fresh.
+
+        This is the one database read GET authentication may do: at most once
+        per user and worker every TOKEN_VERSION_CACHE_SECONDS. Revocations
+        only clear the cache of the worker that made them, so other workers
+        accept revoked tokens on GET until their copy expires.
+        """
+        cached = _token_versions.get(user_id)
+        if cached and time.monotonic() - cached[1] < settings.TOKEN_VERSION_CACHE_SECONDS:
+            return cached[0]
+
+        version = await User.filter(id=user_id).first().values_list("token_version", flat=True)
+        if version is not None:
+            _token_versions[user_id] = (version, time.monotonic())
+        return version
+
+    @staticmethod
+    async def bump_token_version(user_id: int) -> None:
+        """Revoke every access token issued to the user so far"""
+        await User.filter(id=user_id).update(token_version=F("token_version") + 1)
+        UserService.forget_token_version(user_id)
+
+    @staticmethod
+    def forget_token_version(user_id: int) -> None:
+        """
+        Drop this worker's cached token version of a user.
+
+        Inside a transaction, call it again once the transaction commits: a
+        read in between would cache the pre-commit version for a full
+        TOKEN_VERSION_CACHE_SECONDS.
+        """
+        _token_versions.pop(user_id, None)
+
     @staticmethod
     async def get_user_by_username(username: str) -> Optional[User]:
         """Get user by username"""
@@ -59,30 +139,44 @@ class UserService:
         return await User.get_or_none(email=email)
 
     @staticmethod
-    async def get_all_users(skip: int = 0, limit: int = 100) -> List[User]:
-        """Get all users with pagination"""
-        users = await User.all().offset(skip).limit(limit).prefetch_related("roles")
+    async def get_all_users(
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> List[User]:
+        """Get users by skip/limit, or newest first by keyset when a cursor is given"""
+        users = await paginate(User.all(), skip, limit, cursor).prefetch_related("roles")
         return users
 
     @staticmethod
     async def update_user(user_id: int, user_data: UserUpdate) -> Optional[User]:
-        """Update user information"""
-        user = await User.get_or_none(id=user_id)
-        if not user:
-            return None
-
+        """Update user information; returns None if the user does not exist"""
         update_data = {}
         if user_data.username is not None:
             update_data["username"] = user_data.username
         if user_data.email is not None:
             update_data["email"] = user_data.email
         if user_data.password is not None:
-            update_data["password_hash"] = get_password_hash(user_data.password)
+            update_data["password_hash"] = await get_password_hash_async(user_data.password)
         if user_data.is_active is not None:
             update_data["is_active"] = user_data.is_active
+        # Tokens carry the roles, so a role change revokes them once the new roles are in place
+        if user_data.role_ids is None and (
+            user_data.is_active is not None or user_data.password is not None
+        ):
+            update_data["token_version"] = F("token_version") + 1
 
         if update_data:
-            await User.filter(id=user_id).update(**update_data)
+            result = await update_returning(User, user_id, update_data)
+            if result is None:
+                return None
+            user = result[0]
+            if "token_version" in update_data:
+                UserService.forget_token_version(user_id)
+        else:
+            user = await User.get_or_none(id=user_id)
+            if not user:
+                return None
 
         # Update roles if provided
         if user_data.role_ids is not None:
@@ -95,23 +189,33 @@ class UserService:
                     full_name=user.username,
                     email=user.email
                 )
+                # Revokes the user's tokens, which lack the new client profile id
                 await ClientService.create_client(client_data)
+            else:
+                await UserService.bump_token_version(user_id)
+            analytics_cache.invalidate("users")
 
-        await user.refresh_from_db()
         await user.fetch_related("roles")
         return user
 
     @staticmethod
     async def update_password(user_id: int, new_password: str) -> bool:
         """Update user password"""
-        password_hash = get_password_hash(new_password)
-        updated = await User.filter(id=user_id).update(password_hash=password_hash)
+        password_hash = await get_password_hash_async(new_password)
+        # Tokens issued before a password reset must stop working
+        updated = await User.filter(id=user_id).update(
+            password_hash=password_hash, token_version=F("token_version") + 1
+        )
+        UserService.forget_token_version(user_id)
         return updated > 0
 
     @staticmethod
     async def deactivate_user(user_id: int) -> bool:
         """Deactivate a user"""
-        updated = await User.filter(id=user_id).update(is_active=False)
+        updated = await User.filter(id=user_id).update(
+            is_active=False, token_version=F("token_version") + 1
+        )
+        UserService.forget_token_version(user_id)
         return updated > 0
 
     @staticmethod
@@ -124,6 +228,8 @@ class UserService:
             return False
 
         await user.roles.add(role)
+        await UserService.bump_token_version(user_id)
+        analytics_cache.invalidate("users")
         return True
 
     @staticmethod
@@ -147,6 +253,7 @@ class UserService:
             supervisor_id=supervisor_id,
             operator_id=operator_id
         )
+        analytics_cache.invalidate("users")
         return True
 
     @staticmethod
@@ -159,7 +266,7 @@ class UserService:
         if not user or not user.is_active:
             return None
 
-        if not verify_password(password, user.password_hash):
+        if not await verify_password_async(password, user.password_hash):
             return None
 
         await user.fetch_related("roles")
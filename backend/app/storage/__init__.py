@@ -0,0 +1,36 @@
+"""
+Storage Package - Claim attachment blob stores
+
+STORAGE_BACKEND selects where attachments live: "local" keeps them under
+UPLOAD_DIR, "s3" in the S3-compatible bucket S3_BUCKET.
+"""
+from typing import Optional
+
+from app.config import settings
+from .base import BlobStore, StoredFile, UploadTooLarge, blob_key
+from .local import LocalBlobStore
+from .s3 import S3BlobStore
+
+_store: Optional[BlobStore] = None
+
+
+def get_blob_store() -> BlobStore:
+    """The configured blob store, created on first use"""
+    global _store
+    if _store is None:
+        if settings.STORAGE_BACKEND == "s3":
+            _store = S3BlobStore(settings.S3_BUCKET)
+        else:
+            _store = LocalBlobStore()
+    return _store
+
+
+__all__ = [
+    "BlobStore",
+    "StoredFile",
+    "UploadTooLarge",
+    "blob_key",
+    "LocalBlobStore",
+    "S3BlobStore",
+    "get_blob_store",
+]
@@ -0,0 +1,283 @@
+"""
+Storage backend interface for claim attachments.
+"""
+import asyncio
+import hashlib
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, AsyncContextManager, AsyncIterator, Collection, Dict, List, Optional, Tuple
+
+from fastapi import Response, UploadFile
+
+from app import metrics
+from app.config import settings
+
+
+class UploadTooLarge(Exception):
+    """Raised when an upload exceeds MAX_UPLOAD_BYTES"""
+
+    def __init__(self, limit: int):
+        super().__init__(f"File exceeds the {limit} byte upload limit")
+        self.limit = limit
+
+
+@dataclass(frozen=True)
+class StoredFile:
+    """A stored blob: its location, size and content hash"""
+    path: str
+    size: int
+    sha256: str
+    deduplicated: bool = False
+
+
+# Previews are named by content hash, so a preview URL's response never changes
+PREVIEW_CACHE_CONTROL = "private, max-age=31536000, immutable"
+
+
+def blob_key(sha256: str) -> str:
+    """Location of a blob relative to the store's root, sharded two levels deep"""
+    return f"blobs/{sha256[:2]}/{sha256[2:4]}/{sha256}"
+
+
+def preview_key(sha256: str) -> str:
+    """Location of a blob's thumbnail, next to the blobs in a parallel tree"""
+    return f"previews/{sha256[:2]}/{sha256[2:4]}/{sha256}.webp"
+
+
+def referenced_hash(name: str) -> str:
+    """Hash a stored object's file name refers to (blob or preview)"""
+    return name.split(".", 1)[0]
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or any(tag.removeprefix("W/") == etag for tag in tags)
+
+
+def not_modified(sha256: Optional[str], if_none_match: Optional[str]) -> Optional[Response]:
+    """304 response if if_none_match names the ETag of the blob with this hash"""
+    if sha256 and if_none_match and _etag_matches(if_none_match, f'"{sha256}"'):
+        return Response(status_code=304, headers={"etag": f'"{sha256}"'})
+    return None
+
+
+class BlobStore(ABC):
+    """
+    Content-addressed store for claim attachments.
+
+    Each distinct file is stored once as a blob, named by its SHA-256.
+    Claim files reference blobs by hash, so re-uploading the same report to
+    another claim costs no storage. Uploads can never collide, because equal
+    names mean equal contents. collect_garbage() removes blobs once no claim
+    file references them any more.
+
+    save() reads uploads in UPLOAD_CHUNK_BYTES chunks, so memory use does
+    not grow with the file. It hashes them and hands them to the backend's
+    blocking primitives in a worker thread. Data is staged under a
+    temporary name and only becomes a blob once complete, so readers never
+    see a partial blob.
+    """
+
+    async def save(self, upload: UploadFile) -> StoredFile:
+        """
+        Stream an upload into the store.
+
+        Args:
+            upload: Uploaded file, read chunk by chunk
+
+        Returns:
+            The blob's location, size in bytes and SHA-256 hex digest;
+            deduplicated is True if an identical blob was already stored
+
+        Raises:
+            UploadTooLarge: If the upload exceeds MAX_UPLOAD_BYTES; nothing is kept
+        """
+        limit = settings.MAX_UPLOAD_BYTES
+        if upload.size is not None and upload.size > limit:
+            metrics.inc("uploads.rejected")
+            raise UploadTooLarge(limit)
+
+        staged = await asyncio.to_thread(self._begin)
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            while chunk := await upload.read(settings.UPLOAD_CHUNK_BYTES):
+                size += len(chunk)
+                if size > limit:
+                    metrics.inc("uploads.rejected")
+                    raise UploadTooLarge(limit)
+                await asyncio.to_thread(self._write_hashed, staged, digest, chunk)
+            sha256 = digest.hexdigest()
+            path, deduplicated = await asyncio.to_thread(self._commit, staged, sha256)
+        except BaseException:
+            # Shielded: the cleanup finishes even if the request is cancelled meanwhile
+            await asyncio.shield(asyncio.get_running_loop().run_in_executor(None, self._abort, staged))
+            raise
+
+        if deduplicated:
+            metrics.inc("uploads.deduplicated_bytes", size)
+        else:
+            metrics.inc("uploads.bytes", size)
+        return StoredFile(path=path, size=size, sha256=sha256, deduplicated=deduplicated)
+
+    def _write_hashed(self, staged: Any, digest: "hashlib._Hash", chunk: bytes) -> None:
+        self._write(staged, chunk)
+        digest.update(chunk)
+
+    async def find(self, sha256: str) -> Optional[StoredFile]:
+        """
+        Look up a stored blob by hash, marking it as freshly referenced.
+
+        Args:
+            sha256: SHA-256 hex digest
+
+        Returns:
+            The stored blob, or None if no blob has that hash
+        """
+        return await asyncio.to_thread(self._find, sha256)
+
+    async def open_stream(self, path: str) -> Optional[AsyncIterator[bytes]]:
+        """
+        Read a stored file as a stream of chunks, without holding it in memory.
+
+        Args:
+            path: Location of the file, as returned by save()
+
+        Returns:
+            Async iterator over UPLOAD_CHUNK_BYTES chunks, or None if the
+            file is missing. Close the iterator if it is not read to the end.
+        """
+        source = await asyncio.to_thread(self._open, path)
+        if source is None:
+            return None
+        return self._read_chunks(source)
+
+    async def _read_chunks(self, source: Any) -> AsyncIterator[bytes]:
+        try:
+            while chunk := await asyncio.to_thread(source.read, settings.UPLOAD_CHUNK_BYTES):
+                yield chunk
+        finally:
+            source.close()
+
+    async def save_preview(self, sha256: str, preview: bytes) -> None:
+        """
+        Store the WebP thumbnail of a blob.
+
+        Args:
+            sha256: Hash of the blob the thumbnail shows
+            preview: WebP image bytes
+        """
+        await asyncio.to_thread(self._put_preview, sha256, preview)
+
+    async def collect_garbage(self, referenced: Collection[str], grace_seconds: float) -> List[str]:
+        """
+        Remove blobs, and their previews, that no claim file references.
+
+        Blobs stored or re-referenced within the grace period are kept.
+        This covers uploads whose claim file row is not committed yet.
+        Leftovers of interrupted uploads are removed along with them.
+
+        Args:
+            referenced: Hashes of every referenced blob
+            grace_seconds: Minimum age of a blob before it can be removed
+
+        Returns:
+            Names of the removed blobs and leftovers
+        """
+        removed = await asyncio.to_thread(self._collect_garbage, referenced, grace_seconds)
+        metrics.inc("uploads.blobs_collected", len(removed))
+        return removed
+
+    def upload_url(self, sha256: str, size: int) -> Optional[Dict[str, Any]]:
+        """
+        Presigned request letting a client store a blob directly, bypassing the API.
+
+        Args:
+            sha256: SHA-256 hex digest the stored contents must match
+            size: Exact size of the contents in bytes
+
+        Returns:
+            The method, url and headers of the request to send, or None if
+            the backend only accepts uploads through the API
+        """
+        return None
+
+    @abstractmethod
+    async def response(
+        self,
+        path: str,
+        filename: str,
+        sha256: Optional[str],
+        modified_at: datetime,
+        if_none_match: Optional[str] = None,
+    ) -> Optional[Response]:
+        """
+        Response delivering a stored file to the client.
+
+        The ETag is the content hash. It stays stable across copies of the
+        file, and an If-None-Match naming it gets a 304.
+
+        Args:
+            path: Location of the file, as returned by save()
+            filename: Name to offer the client, which also determines the media type
+            sha256: Stored content hash, if known
+            modified_at: When the file was stored
+            if_none_match: The request's If-None-Match header
+
+        Returns:
+            The response, or None if the file is missing from the store
+        """
+
+    @abstractmethod
+    def local_copy(self, path: str) -> AsyncContextManager[str]:
+        """
+        Local filesystem path holding a stored file for the duration of the context.
+
+        Args:
+            path: Location of the file, as returned by save()
+        """
+
+    @abstractmethod
+    async def preview_response(self, sha256: str) -> Optional[Response]:
+        """
+        Response delivering a blob's thumbnail, cacheable for good.
+
+        Args:
+            sha256: Hash of the blob
+
+        Returns:
+            The response, or None if no thumbnail is stored
+        """
+
+    @abstractmethod
+    def _open(self, path: str) -> Optional[Any]:
+        """Open a stored file for reading; returns an object with read(size) and close(), or None if missing"""
+
+    @abstractmethod
+    def _put_preview(self, sha256: str, preview: bytes) -> None:
+        """Blocking implementation of save_preview()"""
+
+    @abstractmethod
+    def _begin(self) -> Any:
+        """Start staging an upload; returns the backend's handle for it"""
+
+    @abstractmethod
+    def _write(self, staged: Any, chunk: bytes) -> None:
+        """Append a chunk to a staged upload"""
+
+    @abstractmethod
+    def _commit(self, staged: Any, sha256: str) -> Tuple[str, bool]:
+        """Turn a complete staged upload into the blob for sha256; returns (location, deduplicated)"""
+
+    @abstractmethod
+    def _abort(self, staged: Any) -> None:
+        """Discard a staged upload"""
+
+    @abstractmethod
+    def _find(self, sha256: str) -> Optional[StoredFile]:
+        """Blocking implementation of find()"""
+
+    @abstractmethod
+    def _collect_garbage(self, referenced: Collection[str], grace_seconds: float) -> List[str]:
+        """Blocking implementation of collect_garbage()"""
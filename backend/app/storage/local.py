@@ -0,0 +1,191 @@
+"""
+Local filesystem storage for claim attachments.
+
+Blobs live under UPLOAD_DIR/blobs and their thumbnails under
+UPLOAD_DIR/previews. Uploads are staged as temporary files
+in that directory, and a rename moves them into place atomically.
+Several workers can share the store only if they share the filesystem.
+
+Downloads are served by FileResponse. It streams from disk in fixed
+chunks, answers Range requests with 206, and hands the path to the
+server (http.response.pathsend) where the server supports zero-copy.
+"""
+import asyncio
+import os
+import tempfile
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import AsyncIterator, BinaryIO, Collection, List, Optional, Tuple
+
+from fastapi import Response
+from fastapi.responses import FileResponse
+
+from app.config import settings
+from app.storage.base import (
+    PREVIEW_CACHE_CONTROL, BlobStore, StoredFile, blob_key, not_modified, preview_key, referenced_hash
+)
+
+TEMP_PREFIX = ".upload-"
+
+
+def _discard(path: str) -> None:
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def _touch(path: str) -> Optional[os.stat_result]:
+    """Refresh a blob's mtime so the garbage collector's grace period covers a new reference"""
+    try:
+        os.utime(path)
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
+
+def _stat(path: str) -> Optional[os.stat_result]:
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
+
+class LocalBlobStore(BlobStore):
+    """Blob store in a local (or shared network) directory"""
+
+    @property
+    def root(self) -> str:
+        """Directory holding the blob shards"""
+        return os.path.join(settings.UPLOAD_DIR, "blobs")
+
+    def blob_path(self, sha256: str) -> str:
+        """Path of the blob with the given SHA-256 hex digest"""
+        return os.path.join(settings.UPLOAD_DIR, *blob_key(sha256).split("/"))
+
+    def preview_path(self, sha256: str) -> str:
+        """Path of the thumbnail of the blob with the given SHA-256 hex digest"""
+        return os.path.join(settings.UPLOAD_DIR, *preview_key(sha256).split("/"))
+
+    @asynccontextmanager
+    async def local_copy(self, path: str) -> AsyncIterator[str]:
+        """The stored file itself; it is already local"""
+        yield path
+
+    def _open(self, path: str) -> Optional[BinaryIO]:
+        try:
+            return open(path, "rb")
+        except FileNotFoundError:
+            return None
+
+    def _put_preview(self, sha256: str, preview: bytes) -> None:
+        path = self.preview_path(sha256)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=TEMP_PREFIX)
+        try:
+            with os.fdopen(fd, "wb") as out:
+                out.write(preview)
+            os.replace(temp_path, path)
+        except BaseException:
+            _discard(temp_path)
+            raise
+
+    async def preview_response(self, sha256: str) -> Optional[Response]:
+        """FileResponse for a blob's thumbnail"""
+        path = self.preview_path(sha256)
+        stat_result = await asyncio.to_thread(_stat, path)
+        if stat_result is None:
+            return None
+        return FileResponse(
+            path,
+            media_type="image/webp",
+            headers={"cache-control": PREVIEW_CACHE_CONTROL},
+            stat_result=stat_result,
+        )
+
+    def _begin(self) -> Tuple[BinaryIO, str]:
+        os.makedirs(self.root, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.root, prefix=TEMP_PREFIX)
+        return os.fdopen(fd, "wb"), temp_path
+
+    def _write(self, staged: Tuple[BinaryIO, str], chunk: bytes) -> None:
+        staged[0].write(chunk)
+
+    def _commit(self, staged: Tuple[BinaryIO, str], sha256: str) -> Tuple[str, bool]:
+        out, temp_path = staged
+        out.close()
+        path = self.blob_path(sha256)
+        if _touch(path) is not None:
+            _discard(temp_path)
+            return path, True
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Same filesystem: the rename is atomic, and a concurrent identical upload
+        # replacing the blob writes the same bytes
+        os.replace(temp_path, path)
+        return path, False
+
+    def _abort(self, staged: Tuple[BinaryIO, str]) -> None:
+        out, temp_path = staged
+        out.close()
+        _discard(temp_path)
+
+    def _find(self, sha256: str) -> Optional[StoredFile]:
+        path = self.blob_path(sha256)
+        stat_result = _touch(path)
+        if stat_result is None:
+            return None
+        return StoredFile(path=path, size=stat_result.st_size, sha256=sha256, deduplicated=True)
+
+    def _collect_garbage(self, referenced: Collection[str], grace_seconds: float) -> List[str]:
+        cutoff = time.time() - grace_seconds
+        removed = []
+        for root in (self.root, os.path.join(settings.UPLOAD_DIR, "previews")):
+            for directory, _, filenames in os.walk(root):
+                for filename in filenames:
+                    if referenced_hash(filename) in referenced:
+                        continue
+                    path = os.path.join(directory, filename)
+                    stat_result = _stat(path)
+                    if stat_result is None or stat_result.st_mtime > cutoff:
+                        continue
+                    # Unreferenced blobs and previews, and temporary files left by interrupted uploads
+                    _discard(path)
+                    removed.append(filename)
+        return removed
+
+    async def response(
+        self,
+        path: str,
+        filename: str,
+        sha256: Optional[str],
+        modified_at: datetime,
+        if_none_match: Optional[str] = None,
+    ) -> Optional[Response]:
+        """
+        FileResponse for a stored file, with Last-Modified set to the upload time.
+
+        Files stored before hashing fall back to validators derived from the
+        file's modification time and size.
+        """
+        stat_result = await asyncio.to_thread(_stat, path)
+        if stat_result is None:
+            return None
+
+        headers = {}
+        if sha256:
+            cached = not_modified(sha256, if_none_match)
+            if cached is not None:
+                return cached
+            if modified_at.tzinfo is None:
+                modified_at = modified_at.replace(tzinfo=timezone.utc)
+            headers["etag"] = f'"{sha256}"'
+            headers["last-modified"] = format_datetime(modified_at.astimezone(timezone.utc), usegmt=True)
+
+        return FileResponse(
+            path,
+            headers=headers,
+            filename=filename,
+            stat_result=stat_result,
+        )
@@ -0,0 +1,290 @@
+"""
+S3-protocol storage for claim attachments (AWS S3, MinIO, Ceph and the like).
+
+Every API worker talks to the same bucket, so workers can run on any host.
+Clients download through short-lived presigned URLs, and can upload through
+them too, so file bytes need not pass through the API at all.
+
+Uploads through the API stream into a multipart upload under uploads/, one
+S3_PART_BYTES part at a time. Once the hash is known, the completed object
+is copied to its blob key. Uploads smaller than one part skip the
+multipart upload and are sent with a single PUT straight to the blob key.
+"""
+import asyncio
+import base64
+import mimetypes
+import os
+import tempfile
+import time
+import uuid
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, AsyncIterator, Collection, Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+from fastapi import Response
+from fastapi.responses import RedirectResponse
+
+from app.config import settings
+from app.storage.base import (
+    PREVIEW_CACHE_CONTROL, BlobStore, StoredFile, blob_key, not_modified, preview_key, referenced_hash
+)
+
+STAGING_PREFIX = "uploads/"
+
+
+@dataclass
+class _StagedUpload:
+    """Upload in progress: the bytes not yet sent, and the multipart upload once started"""
+    key: str
+    buffer: bytearray = field(default_factory=bytearray)
+    upload_id: Optional[str] = None
+    parts: List[Dict[str, Any]] = field(default_factory=list)
+
+
+def _checksum(sha256: str) -> str:
+    """S3's x-amz-checksum-sha256 form of a hex digest"""
+    return base64.b64encode(bytes.fromhex(sha256)).decode()
+
+
+class S3BlobStore(BlobStore):
+    """Blob store in an S3-compatible bucket"""
+
+    def __init__(self, bucket: str, client: Any = None):
+        """
+        Args:
+            bucket: Bucket holding the blobs
+            client: boto3 S3 client; built from the S3_* settings if omitted
+        """
+        if client is None:
+            try:
+                import boto3
+            except ImportError as exc:
+                raise RuntimeError("STORAGE_BACKEND=s3 requires the boto3 package") from exc
+            client = boto3.client(
+                "s3",
+                endpoint_url=settings.S3_ENDPOINT_URL,
+                region_name=settings.S3_REGION,
+                aws_access_key_id=settings.S3_ACCESS_KEY_ID,
+                aws_secret_access_key=settings.S3_SECRET_ACCESS_KEY,
+            )
+        self.bucket = bucket
+        self.client = client
+
+    def _head(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            return self.client.head_object(Bucket=self.bucket, Key=key)
+        except self.client.exceptions.ClientError as exc:
+            if exc.response["Error"]["Code"] in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise
+
+    def _touch(self, key: str) -> None:
+        """Copy a blob onto itself to refresh LastModified, which the garbage collector's grace period reads"""
+        self.client.copy_object(
+            Bucket=self.bucket,
+            Key=key,
+            CopySource={"Bucket": self.bucket, "Key": key},
+            MetadataDirective="REPLACE",
+        )
+
+    @asynccontextmanager
+    async def local_copy(self, path: str) -> AsyncIterator[str]:
+        """Download the object to a temporary file, removed on exit"""
+        fd, temp_path = tempfile.mkstemp(prefix=".download-")
+        os.close(fd)
+        try:
+            await asyncio.to_thread(self.client.download_file, self.bucket, path, temp_path)
+            yield temp_path
+        finally:
+            os.unlink(temp_path)
+
+    def _open(self, path: str) -> Optional[Any]:
+        try:
+            return self.client.get_object(Bucket=self.bucket, Key=path)["Body"]
+        except self.client.exceptions.NoSuchKey:
+            return None
+
+    def _put_preview(self, sha256: str, preview: bytes) -> None:
+        self.client.put_object(
+            Bucket=self.bucket, Key=preview_key(sha256), Body=preview, ContentType="image/webp"
+        )
+
+    def _get_preview(self, sha256: str) -> Optional[bytes]:
+        try:
+            return self.client.get_object(Bucket=self.bucket, Key=preview_key(sha256))["Body"].read()
+        except self.client.exceptions.NoSuchKey:
+            return None
+
+    async def preview_response(self, sha256: str) -> Optional[Response]:
+        """
+        The thumbnail bytes, relayed through the API.
+
+        Thumbnails are small, and relaying them lets the browser cache the
+        API's stable URL for good, which a redirect to an expiring
+        presigned URL would not allow.
+        """
+        preview = await asyncio.to_thread(self._get_preview, sha256)
+        if preview is None:
+            return None
+        return Response(preview, media_type="image/webp", headers={"cache-control": PREVIEW_CACHE_CONTROL})
+
+    def _begin(self) -> _StagedUpload:
+        return _StagedUpload(key=f"{STAGING_PREFIX}{uuid.uuid4().hex}")
+
+    def _write(self, staged: _StagedUpload, chunk: bytes) -> None:
+        staged.buffer.extend(chunk)
+        if len(staged.buffer) >= settings.S3_PART_BYTES:
+            self._send_part(staged)
+
+    def _send_part(self, staged: _StagedUpload) -> None:
+        if staged.upload_id is None:
+            staged.upload_id = self.client.create_multipart_upload(
+                Bucket=self.bucket, Key=staged.key
+            )["UploadId"]
+        number = len(staged.parts) + 1
+        part = self.client.upload_part(
+            Bucket=self.bucket,
+            Key=staged.key,
+            UploadId=staged.upload_id,
+            PartNumber=number,
+            Body=bytes(staged.buffer),
+        )
+        staged.parts.append({"PartNumber": number, "ETag": part["ETag"]})
+        staged.buffer.clear()
+
+    def _commit(self, staged: _StagedUpload, sha256: str) -> Tuple[str, bool]:
+        key = blob_key(sha256)
+        if staged.upload_id is None:
+            if self._head(key) is not None:
+                self._touch(key)
+                return key, True
+            self.client.put_object(
+                Bucket=self.bucket, Key=key, Body=bytes(staged.buffer), ChecksumSHA256=_checksum(sha256)
+            )
+            return key, False
+
+        if staged.buffer:
+            self._send_part(staged)
+        self.client.complete_multipart_upload(
+            Bucket=self.bucket,
+            Key=staged.key,
+            UploadId=staged.upload_id,
+            MultipartUpload={"Parts": staged.parts},
+        )
+        staged.upload_id = None
+        try:
+            if self._head(key) is not None:
+                self._touch(key)
+                return key, True
+            # Server-side copy, limited to 5 GB per object (far above MAX_UPLOAD_BYTES)
+            self.client.copy_object(
+                Bucket=self.bucket, Key=key, CopySource={"Bucket": self.bucket, "Key": staged.key}
+            )
+            return key, False
+        finally:
+            self.client.delete_object(Bucket=self.bucket, Key=staged.key)
+
+    def _abort(self, staged: _StagedUpload) -> None:
+        if staged.upload_id is not None:
+            self.client.abort_multipart_upload(
+                Bucket=self.bucket, Key=staged.key, UploadId=staged.upload_id
+            )
+
+    def _find(self, sha256: str) -> Optional[StoredFile]:
+        key = blob_key(sha256)
+        head = self._head(key)
+        if head is None:
+            return None
+        self._touch(key)
+        return StoredFile(path=key, size=head["ContentLength"], sha256=sha256, deduplicated=True)
+
+    def _collect_garbage(self, referenced: Collection[str], grace_seconds: float) -> List[str]:
+        cutoff = time.time() - grace_seconds
+        removed = []
+        paginator = self.client.get_paginator("list_objects_v2")
+        for prefix in ("blobs/", "previews/", STAGING_PREFIX):
+            for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
+                stale = [
+                    item["Key"]
+                    for item in page.get("Contents", [])
+                    if referenced_hash(item["Key"].rsplit("/", 1)[-1]) not in referenced
+                    and item["LastModified"].timestamp() <= cutoff
+                ]
+                if stale:
+                    self.client.delete_objects(
+                        Bucket=self.bucket,
+                        Delete={"Objects": [{"Key": key} for key in stale], "Quiet": True},
+                    )
+                    removed.extend(key.rsplit("/", 1)[-1] for key in stale)
+
+        # Multipart uploads of workers that died mid-upload
+        paginator = self.client.get_paginator("list_multipart_uploads")
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=STAGING_PREFIX):
+            for upload in page.get("Uploads", []):
+                if upload["Initiated"].timestamp() <= cutoff:
+                    self.client.abort_multipart_upload(
+                        Bucket=self.bucket, Key=upload["Key"], UploadId=upload["UploadId"]
+                    )
+                    removed.append(upload["Key"].rsplit("/", 1)[-1])
+        return removed
+
+    def upload_url(self, sha256: str, size: int) -> Optional[Dict[str, Any]]:
+        """
+        Presigned PUT of the blob for sha256.
+
+        The signature covers the length and the SHA-256 checksum, so the
+        bucket rejects any body that is not exactly the announced file.
+        """
+        checksum = _checksum(sha256)
+        url = self.client.generate_presigned_url(
+            "put_object",
+            Params={
+                "Bucket": self.bucket,
+                "Key": blob_key(sha256),
+                "ContentLength": size,
+                "ChecksumSHA256": checksum,
+            },
+            ExpiresIn=settings.PRESIGNED_URL_SECONDS,
+        )
+        return {
+            "method": "PUT",
+            "url": url,
+            "headers": {"Content-Length": str(size), "x-amz-checksum-sha256": checksum},
+        }
+
+    async def response(
+        self,
+        path: str,
+        filename: str,
+        sha256: Optional[str],
+        modified_at: datetime,
+        if_none_match: Optional[str] = None,
+    ) -> Optional[Response]:
+        """
+        Redirect to a presigned GET of the blob.
+
+        The bucket serves the bytes, including Range requests. The
+        existence of the object is not checked first, to save a round trip;
+        a missing blob is a 404 from the bucket.
+        """
+        cached = not_modified(sha256, if_none_match)
+        if cached is not None:
+            return cached
+
+        # Signing is local computation; no request is sent
+        url = self.client.generate_presigned_url(
+            "get_object",
+            Params={
+                "Bucket": self.bucket,
+                "Key": path,
+                "ResponseContentDisposition": f"attachment; filename*=utf-8''{quote(filename)}",
+                "ResponseContentType": mimetypes.guess_type(filename)[0] or "application/octet-stream",
+            },
+            ExpiresIn=settings.PRESIGNED_URL_SECONDS,
+        )
+        headers = {"cache-control": "private, no-store"}
+        if sha256:
+            headers["etag"] = f'"{sha256}"'
+        return RedirectResponse(url, status_code=307, headers=headers)
@@ -0,0 +1,126 @@
+"""
+Single-row updates that read the row back in the same statement.
+
+The ORM's update() only reports a row count, so services used to load the
+row, update it and reload it. update_returning() sends one
+UPDATE ... RETURNING instead; a missing row is simply no row returned.
+
+Expected values turn the update into a compare-and-swap: claims and leads
+carry a version column that every update increments, and a writer that
+read version n updates only if the row is still at n.
+"""
+from typing import Any, Dict, Iterable, Optional, Tuple, Type, TypeVar
+
+from pypika_tortoise import Table
+from tortoise import BaseDBAsyncClient
+from tortoise.expressions import Expression, ResolveContext
+from tortoise.models import Model
+
+MODEL = TypeVar("MODEL", bound=Model)
+
+
+class VersionConflict(Exception):
+    """Raised when a compare-and-swap update finds the row changed since it was read"""
+
+
+async def update_returning(
+    model: Type[MODEL],
+    pk: Any,
+    changes: Dict[str, Any],
+    previous: Iterable[str] = (),
+    expected: Optional[Dict[str, Any]] = None,
+    connection: Optional[BaseDBAsyncClient] = None,
+) -> Optional[Tuple[MODEL, Optional[MODEL]]]:
+    """
+    Update one row by primary key and return it as updated.
+
+    Callers that need the row as it was before the update (to move it
+    between rollup cells, say) name the fields in previous. On Postgres
+    they come back from the same statement, read from a FOR UPDATE
+    sub-select of the row; SQLite cannot return columns of a FROM table,
+    so they are read just before the update, inside the caller's
+    transaction, which SQLite serialises against other writers.
+
+    Args:
+        model: Model class of the row
+        pk: Primary key of the row
+        changes: New values by field name (concrete columns, e.g. client_id);
+            expressions such as F() see the row before the update
+        previous: Fields whose pre-update values are needed
+        expected: Values the row must still hold for the update to apply
+        connection: Connection to run on; defaults to the model's write
+            connection, which is the open transaction inside in_transaction()
+
+    Returns:
+        (updated, before), or None if no row has that key. before is None
+        without previous fields; otherwise its previous fields hold the old
+        values and every other field the updated one.
+
+    Raises:
+        VersionConflict: If the row exists but no longer holds the expected values
+    """
+    if connection is None:
+        connection = model._choose_db(for_write=True)
+    meta = model._meta
+    table = Table(meta.db_table)
+    pk_column = table[meta.db_pk_column]
+    previous_columns = [meta.fields_db_projection[field] for field in previous]
+
+    query = connection.query_class.update(table)
+    for field, value in changes.items():
+        column = meta.fields_db_projection[field]
+        if isinstance(value, Expression):
+            context = ResolveContext(model=model, table=table, annotations={}, custom_filters={})
+            value = value.resolve(context).term
+        else:
+            value = meta.fields_map[field].to_db_value(value, None)
+        query = query.set(table[column], value)
+    returning = [table[column] for column in meta.fields_db_projection.values()]
+
+    before_values: Dict[str, Any] = {}
+    if previous_columns and connection.capabilities.dialect == "postgres":
+        # Prefixed names keep unqualified columns in the SET expressions unambiguous
+        before = (
+            connection.query_class.from_(table)
+            .select(
+                pk_column.as_("previous_pk"),
+                *(table[column].as_(f"previous_{column}") for column in previous_columns),
+            )
+            .where(pk_column == pk)
+            .for_update()
+            .as_("previous")
+        )
+        query = query.from_(before).where(pk_column == before.previous_pk)
+        returning += [before[f"previous_{column}"] for column in previous_columns]
+    else:
+        query = query.where(pk_column == pk)
+        if previous_columns:
+            select = (
+                connection.query_class.from_(table)
+                .select(*(table[column] for column in previous_columns))
+                .where(pk_column == pk)
+            )
+            rows = await connection.execute_query_dict(*select.get_parameterized_sql())
+            if not rows:
+                return None
+            before_values = rows[0]
+
+    for field, value in (expected or {}).items():
+        column = meta.fields_db_projection[field]
+        query = query.where(table[column] == meta.fields_map[field].to_db_value(value, None))
+
+    rows = await connection.execute_query_dict(*query.returning(*returning).get_parameterized_sql())
+    if not rows:
+        # Only a failed compare-and-swap needs telling apart from a missing row
+        if expected and await model.filter(pk=pk).using_db(connection).exists():
+            raise VersionConflict(f"{model.__name__} {pk} was modified by another request")
+        return None
+
+    row = dict(rows[0])
+    for column in previous_columns:
+        if f"previous_{column}" in row:
+            before_values[column] = row.pop(f"previous_{column}")
+    updated = model._init_from_db(**row)
+    if not previous_columns:
+        return updated, None
+    return updated, model._init_from_db(**{**row, **before_values})
@@ -0,0 +1,45 @@
+"""
+Helpers shared by the benchmark scripts.
+"""
+import os
+import statistics
+from typing import List, Optional
+
+from tortoise import Tortoise
+
+# Benchmarks default to an in-memory database; pass --db-url to use Postgres
+os.environ.setdefault("DATABASE_URL", "sqlite://:memory:")
+
+
+async def init_db(db_url: Optional[str] = None) -> None:
+    """
+    Initialize Tortoise with the application models and create the schema.
+
+    Args:
+        db_url: Optional database URL overriding DATABASE_URL
+    """
+    from app.config import TORTOISE_CONFIG, database_connection
+
+    config = TORTOISE_CONFIG
+    if db_url:
+        config = {**TORTOISE_CONFIG, "connections": {"default": database_connection(db_url)}}
+    await Tortoise.init(config=config)
+    await Tortoise.generate_schemas(safe=True)
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """
+    Get the given percentile of a list of samples.
+
+    Args:
+        samples: Measured values
+        pct: Percentile between 0 and 100
+
+    Returns:
+        The percentile value, or 0.0 if there are no samples
+    """
+    if not samples:
+        return 0.0
+    if len(samples) == 1:
+        return samples[0]
+    return statistics.quantiles(samples, n=100, method="inclusive")[int(pct) - 1]
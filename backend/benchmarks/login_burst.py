@@ -0,0 +1,103 @@
+"""
+Login burst benchmark.
+
+Fires concurrent logins at the API while probing an unrelated endpoint
+(/health) and reports login throughput and probe latency. Run from backend/:
+
+    python -m benchmarks.login_burst --logins 200 --concurrency 20
+
+Pass --inline to hash on the event loop, as the API did before hashing
+moved to the dedicated pool, to compare the two.
+"""
+import argparse
+import asyncio
+import time
+
+from benchmarks.common import init_db, percentile
+
+import httpx
+from tortoise import Tortoise
+
+from app import auth, metrics
+from app.main import app
+from app.models import User
+from app.services import user_service
+
+USERNAME = "bench_login"
+PASSWORD = "bench-password"
+
+
+async def _verify_inline(plain_password: str, hashed_password: str) -> bool:
+    return auth.verify_password(plain_password, hashed_password)
+
+
+async def run(args: argparse.Namespace) -> None:
+    await init_db(args.db_url)
+    await User.get_or_create(
+        username=USERNAME,
+        defaults={
+            "email": f"{USERNAME}@example.com",
+            "password_hash": auth.get_password_hash(PASSWORD),
+        },
+    )
+
+    if args.inline:
+        user_service.verify_password_async = _verify_inline
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        stop = asyncio.Event()
+        probe_latencies = []
+        statuses = {}
+        slots = asyncio.Semaphore(args.concurrency)
+
+        async def probe() -> None:
+            # Latency is measured from when each probe was due, not when the
+            # loop got round to sending it, so event loop stalls are counted.
+            interval = args.probe_interval / 1000
+            due = time.perf_counter()
+            while not stop.is_set():
+                due += interval
+                await asyncio.sleep(max(0.0, due - time.perf_counter()))
+                await client.get("/health")
+                probe_latencies.append((time.perf_counter() - due) * 1000)
+
+        async def login() -> None:
+            async with slots:
+                response = await client.post(
+                    "/api/v1/auth/login",
+                    json={"username": USERNAME, "password": PASSWORD},
+                )
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+        probe_task = asyncio.create_task(probe())
+        started = time.perf_counter()
+        await asyncio.gather(*(login() for _ in range(args.logins)))
+        elapsed = time.perf_counter() - started
+        stop.set()
+        await probe_task
+
+    await Tortoise.close_connections()
+
+    print(f"mode:              {'inline' if args.inline else 'pool'}")
+    print(f"logins:            {args.logins} at concurrency {args.concurrency}")
+    print(f"status codes:      {statuses}")
+    print(f"login throughput:  {args.logins / elapsed:.1f}/s")
+    print(f"/health p50:       {percentile(probe_latencies, 50):.1f} ms")
+    print(f"/health p99:       {percentile(probe_latencies, 99):.1f} ms")
+    print(f"/health max:       {max(probe_latencies, default=0.0):.1f} ms")
+    print(f"metrics:           {metrics.snapshot()}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--probe-interval", type=float, default=20.0, help="milliseconds between probes")
+    parser.add_argument("--inline", action="store_true", help="hash on the event loop")
+    parser.add_argument("--db-url", default=None)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
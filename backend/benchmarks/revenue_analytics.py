@@ -0,0 +1,115 @@
+"""
+Revenue analytics benchmark.
+
+Seeds products and client-product assignments, then times
+AnalyticsService.get_revenue_analytics against the per-product COUNT loop
+it replaced. Run from backend/:
+
+    python -m benchmarks.revenue_analytics --products 10000 --assignments 1000000
+
+The legacy loop issues one query per product; pass --skip-legacy on large
+datasets where it would take too long.
+"""
+import argparse
+import asyncio
+import time
+from decimal import Decimal
+
+from benchmarks.common import init_db
+
+from tortoise import Tortoise
+
+from app.models import Client, ClientProduct, Product, User
+from app.services import AnalyticsService
+
+BATCH_SIZE = 10000
+
+
+async def seed(products: int, assignments: int) -> None:
+    # Each client holds at most one assignment per product (unique together),
+    # so spread the assignments over enough clients.
+    clients = -(-assignments // products)
+
+    await Product.bulk_create(
+        [
+            Product(name=f"Product {i}", type=f"Type {i % 10}", price=Decimal("9.99") + i % 50)
+            for i in range(products)
+        ],
+        batch_size=BATCH_SIZE,
+    )
+    await User.bulk_create(
+        [
+            User(username=f"bench_client_{i}", email=f"bench_client_{i}@example.com", password_hash="x")
+            for i in range(clients)
+        ],
+        batch_size=BATCH_SIZE,
+    )
+    user_ids = await User.filter(username__startswith="bench_client_").values_list("id", flat=True)
+    await Client.bulk_create(
+        [Client(user_id=user_id, full_name="Bench", email="bench@example.com") for user_id in user_ids],
+        batch_size=BATCH_SIZE,
+    )
+    client_ids = await Client.all().values_list("id", flat=True)
+    product_ids = await Product.all().values_list("id", flat=True)
+
+    batch = []
+    for n in range(assignments):
+        batch.append(ClientProduct(
+            client_id=client_ids[n // products],
+            product_id=product_ids[n % products],
+        ))
+        if len(batch) == BATCH_SIZE:
+            await ClientProduct.bulk_create(batch)
+            batch = []
+    if batch:
+        await ClientProduct.bulk_create(batch)
+
+
+async def legacy_revenue() -> dict:
+    """The per-product COUNT loop /analytics/revenue used before"""
+    products = await Product.all()
+    await ClientProduct.all().prefetch_related("product")
+
+    revenue_by_product = {}
+    total_revenue = Decimal("0.00")
+    for product in products:
+        count = await ClientProduct.filter(product_id=product.id).count()
+        revenue = (product.price or Decimal("0.00")) * count
+        revenue_by_product[product.name] = {"assigned_count": count, "revenue": float(revenue)}
+        total_revenue += revenue
+    return {"total_revenue": float(total_revenue), "by_product": revenue_by_product}
+
+
+async def timed(label: str, coro_fn) -> dict:
+    started = time.perf_counter()
+    result = await coro_fn()
+    print(f"{label:<12} {time.perf_counter() - started:8.2f} s   total_revenue={result['total_revenue']:.2f}")
+    return result
+
+
+async def run(args: argparse.Namespace) -> None:
+    await init_db(args.db_url)
+
+    started = time.perf_counter()
+    await seed(args.products, args.assignments)
+    print(f"seeded {args.products} products / {args.assignments} assignments in {time.perf_counter() - started:.1f} s")
+
+    current = await timed("aggregate", AnalyticsService.get_revenue_analytics)
+    if not args.skip_legacy:
+        legacy = await timed("legacy loop", legacy_revenue)
+        assert legacy["total_revenue"] == current["total_revenue"]
+
+    await Tortoise.close_connections()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--products", type=int, default=10000)
+    parser.add_argument("--assignments", type=int, default=1000000)
+    parser.add_argument("--skip-legacy", action="store_true")
+    parser.add_argument("--db-url", default=None)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
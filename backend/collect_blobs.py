@@ -0,0 +1,27 @@
+import asyncio
+
+from tortoise import Tortoise
+
+from app.config import TORTOISE_CONFIG, settings
+from app.services.claim_service import ClaimService
+
+
+async def collect_blobs() -> None:
+    """
+    Initialize Tortoise ORM and remove the stored claim file blobs that no
+    claim file references any more.
+
+    Blobs younger than BLOB_GC_GRACE_SECONDS are kept, so this is safe to run
+    (from cron, say) while uploads are in progress.
+    """
+    await Tortoise.init(config=TORTOISE_CONFIG)
+
+    removed = await ClaimService.collect_unreferenced_blobs()
+    print(f"Removed {len(removed)} unreferenced blobs from {settings.STORAGE_BACKEND} storage")
+
+    await Tortoise.close_connections()
+    print("Done.")
+
+
+if __name__ == "__main__":
+    asyncio.run(collect_blobs())
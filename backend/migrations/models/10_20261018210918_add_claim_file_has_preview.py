@@ -0,0 +1,111 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "claim_files" ADD "has_preview" BOOL NOT NULL DEFAULT False;
+        COMMENT ON COLUMN "claim_files"."has_preview" IS 'Whether a thumbnail has been rendered';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "claim_files" DROP COLUMN "has_preview";"""
+
+
+MODELS_STATE = (
+    "eJztXVlz27YW/isYv9idkR1bibP1yVsS33rJeLnpNM6oMAVJnFCkysWObif//Z6DhTslbh"
+    "IlhQ9NZRIAwQ8HB2fnv1tjq88MZ+/GMtjWe/LvlknH+CNyvUO26GQSXMULLn3kPbZsaMGv"
+    "0EfHtanmwsUBNRwGl/rM0Wx94uqWiU1xMMKHIDab2MxhpqubQ+I5zCZ8HKKbxB0x4kwdl4"
+    "33cNi+pcG40KzUCA8mdnHek6P+WDc75NabMPtJdyy7Q67hJ3Xx14mhw0D4NM/U//FYz7WG"
+    "DEax4Zlfv8Fl3eyzH/Ca8s/J995AZ0Y/gpjexwH49Z47nfBr56b7gTfEF3nsaZbhjc2g8W"
+    "TqjizTb62LOQyZiRNjOLxrewik6RmGBFxhK2YaNBFTDPXpswH1DFwO7J1cjSPPtXZ1U7PZ"
+    "GF6eTGx9TO0p+c6mcdhlf80ycYVhlg5/8SE+fbd78OrNq7cvX796C034DP0rb36K1w4wER"
+    "05Mld3Wz/5fepS0YLDG+DJ/59A9GRE7XRIVfsYqDDlOKgKwkWgyikUp/KebHOa2+6Q7YDq"
+    "8C9Fd/hbUN52TsTH9EfPYObQHcGfh/sz4P3v0c3Jp6ObncP933BsCzam2K5X8k6X38IVCB"
+    "APv0oC+Dv2I4OWY91K4S/R9eFXTQL8A54yewGu+S9qkNB1Yg04U7AlN5sP9Qxo787+vMNB"
+    "xo7zjxGGdOfy6E+O9ngq71xcX31UzUNLcHJxfRyDHnYhgtOjbhL5U7jj6mOWjn60Zwz8vu"
+    "y6p36U2Qql10JdnE/Y8A79a9OYSkqYhf755dnt3dHl58gSnB7dneGdbgR+dXXndWwT+IOQ"
+    "L+d3nwj+Sf66vjrjCFqOO7T5E4N2d39t4ZwosMyeaT33aD/EEtRVBUxkYb1Jv+TCRnu2C9"
+    "vowvLJ49E/+B46rPDCI9W+P1O734vcCREAiCY9ZDw9mxkUAXSSlHAsB/nwx41slLLmUiS7"
+    "hwGVWLa0FRfnGnUcfWiyPnEtzk/x3Qrx0+BqGFOra2WBmrw17o4zcU5B9pKa0zsL/+W77B"
+    "yeT00tTVAIwbtMgeE+EF13xjDNXZDK8P+/VQO2I1+oFxPo1etxYgTuom77YvzAsjnyKAcq"
+    "WHtCXPVXRd7jVC1uuSPb8oajDDIFlOEac4UEd3R7cnTKt2QvLupycoC3p0N+CV/5Zyc69x"
+    "QlRb1TtpLiE8d8JYWvR4qKQQ2D0/tcHaXoAA/mPb+qUZOM6BPoN0Au+sRgkioktP6G64nL"
+    "YVohPmsZ6ZO9fHrM15jkAOv4rdVtlqTb4DoW1W/CfZrVce75ACQ8oeaVFzamulEET7/DSo"
+    "DJZ0NA/ACG4ZRB9GA/D6TQKhNTfi8K6gRO/GcLOP6IOqMi4CY61gNyefnlE8wDBBc1rzII"
+    "dw8PcyAMrTIR5veiCOtOD44j/SmFFRxbwOipmcFkw/1i4D5Cx0Wh61N1BN0vI37M+GcUoZ"
+    "pmecB5dYcE06ykdh9fX19EVIPj87hefX95fAYkzuGHRrqQNxQ3DjB3re/M7D3BoZtq6cg8"
+    "2BL95p9xdcG+n8T8XB1vQh632RNMD4469qRbnmNMAXvHg3uwFMBSCJ98Xs5Sy/HXWjc2TA"
+    "lurRsburC/vHWD62xcLYMDK6xMVbRuhPeKMp70HN8bUA2qwKugPArLBU09VZz4O2PPcYUC"
+    "699Awqhox4hAqJADEC35jIrk1jSGwfMTKIZu1Y2jT4ogX/YrIngBQyzZwSOpK2yNHFGzbz"
+    "Cxfw05o5rAwuGgyRhFrRqwOhEjNcDfnkcWAaY/smzEDJHSgrnUBJbG/Zk1wSWco5sNmL8V"
+    "NYPqY8fna1WRg8FWa1dqakoLAq6uU3X50IUYfRg8CxVNtiD0+Hi1bVMYa8N3KdowdHfaM6"
+    "xhRbSO5FAX1rAhsIDaBpY95mgxbp4R812WFy9xWkxsa6AbaRYwOcC1ye4s+CfvkbHU7Xsf"
+    "tncZuvld+Uf5tsXphKU6McFaJLpZ3tDAnVfNG1pWFVsTb6h6vbg3NHAmR72hIY9n3Bkadp"
+    "TW4A0Vtpa57tCsuM3w82a7RXsFAjhx1F0Rg5nlfRSez3SvaL6uD+YlnTjSVSoCDfTs8NAU"
+    "R+fXLRWXwOO9vrUBnM04OVur70YYB5NW3xAXzLlbQj2W5zNZSCBT3a4RzoILYRnq0TSWFc"
+    "2mdWCZsFpHoU3i+gH0BFj7P9iiA8JWzhqNByJ99g++MCGliiSJPV8DmBsTuBgHM8Th0sHM"
+    "9qZUDIGcKSOm2LdTpMV0K3i23BjYWiL2qvkCZPCg3cBJkEN6zNnvwTwGAnGI7xzA9Q4m6x"
+    "AQ54nASohMng1HI3OgY8gIk2mCD1KGSIazI1skjZqnfNRa4bQVTlvhtA1JaBc2LSQhvK6K"
+    "ZRYTlmO9mhaYa3WZ162KhE71Qhgn+jWNcu1O9QUrKrNcV2ugriwthiEucycIb74ak+1eXQ"
+    "OglxJwEwc5xkFXSbnhoScp6owKSclWYPy4l/kqCw6Wls4zsVz8RQ3p5AGtwyaPnqObGG1r"
+    "TSaW7cKauzqoFwl9po5BH8wTapLHqHIbaD6o6gwsw7Ced70qOUEd8jXwtceIAbaI63EcQ/"
+    "3aLKJl6TAD3XbcXtE8omivpvMycCdsA7XipEjZbKKF5L4YtAS4kU4rgi3OabWgbTpXqzKk"
+    "K5qtBdAUola/Q8M1OySqfDrQZPyY2xsTTdDKg2k3G9JuAtHggEtCegYTTYiKUcXI7708so"
+    "XWgJELIg0T650izYh5vSfbobZYjCbyxz8eNXR4a3XnidnyjgF6famKNQcHeWj+IJvkD+Lr"
+    "UzyHq5HsrYPkQoSztx6nhMG8pkRYoH7HALYJtdkuNfu7zjOdiOQtkPVG8BRydkeHL84Hu5"
+    "fU1UbNmApa6+lGGNla6+mGLmx2tHQ5M2pW91IsdCVTQRZs4ksAuDwD1ErCndf6lEV4Rc1Q"
+    "oaNrvTN5uAAXjnIHqcCwzCG6uqtBX7UU01xTncIrw2IXgnO24S6StpDTgKfAEjY3tI1hr+"
+    "9oc1OjEcvkBJxlris0xIN5RrWR3wfLIDiOpelII+RZd0eE8pYEdk+QvQCCIOXG3dz2Oo6H"
+    "2BKtCa6JMIKAaKOgZpfLDHVp2pohtxxxYbKFmEeqRNTWxWzl0dyKRohx5eRGoR5NO5irH8"
+    "JtGHHNaXwLlt+VZFtRZM+ZLL9SpJpXVA/tz/l++PWOzV5Qymkc0bkB2s243T/bVt/TUuV4"
+    "dWumDD8RjXKK73LIF7cY6qGlVv9XA6Kz3BHN4PdgwGB5ksJ81QFT/e7KXR8u1hlkt4rBSh"
+    "TpbOX4X+JjA+XZkSTm0u7dbi4/ZHeGH7Kb9ENyNAqAqdqvCpg4gfeE7Q33OmQbDiHPxlMI"
+    "XV83jBrkDP1n/E/JQtrPN9RnY1RrEJvV6mmmwMK0FCo/ZRqwNiPD3676xNVR0WlPdm4EcH"
+    "9ulaA+PTs5vzy62Dk47HRjdTgV5q8ShNsq+Ruq5LfexI1Y2PLlIaUILCTl2iqChbSM5QsH"
+    "8VRSza84s6KuF1kSJ0VbC4rlZCtrUrHJp6vJ4jYpGhW88kDnNYfkgEm9rEjnB/MSg9+x2g"
+    "6ug3CaCL9KqMBO+yWE1Ve8BvDU4iHM4U5Naw3yE24OwVmtliK2vnG2PqhtpO1WndK+j+vq"
+    "xdqG1jiv6hrqsiq4FqLU1pvayuOtotUubGbY5gq4dStVclxgWcyFOHwL6LRhL9ZaKrQScr"
+    "4g8mVknJrSbysqtZGTZ90LgofRqj3yMlGZuY6KzI3gg55xx3sc667ru8ZrKF2dtI/MCyVQ"
+    "JYMXHEiwqtxxMSEGNdihZgQPJHjhPKtUr1gkgRh/Vxny8tQdm9/lwbzDKGAHKF/XRkHkAL"
+    "WjAQLidtj4lVomLLAmypHaCmFNWab81IPiQnWs60pJ1fitPlFFWR36zzQ49XNCvykCd1KT"
+    "kpyl0GaK9Gk6mLIusa7uCFU5l2LIRjs1DW0dLqAFx6kGU6kYWZn7QworSLp5hZ/Ivp0fsz"
+    "oJJJOK4G6cAzOObHTfrlLwalSFzJRCcyWjpXzsKrePNGc22TxvacFh8qSlSfWjYmJaZG+1"
+    "qWltalqbmtY6U1oVYG1slW2C2nolqG2M4L/oNLWCQn+bqLa+iWrCDZIq40uXxCzZXrlh8o"
+    "j00DY1cFEK6Xwswr9ZAcvqpMvzhcdQwjzvGWwXkNSdCdP0ga6FZXltVrFYzHMLPpOx1Gqx"
+    "kR6Jis7ZfSL7uC1E26iqsYZlEn0n5VbWfvarJPpNMeVLN3s2e9LZM/4Bu9QynuBGzmWIRN"
+    "C9yxFA9y4zfu7dCmV/1SoJIPQrn/zV1p1sRotode4N1bnbAMaNWNhENJM6IUssbKxrDStb"
+    "X7i370MXwjd60HmV9bH1JETroqLBmqy4wmfmXv5Fa40WiHOr+1jM1p+KYl7Pt5zqQz30Aa"
+    "GI5oriFGse+E0xFVcL22xNmw3FxXaq2TZ/jaLEC8C5WFXiOZx6HUGvmS0Xxj3nl9/ypHMM"
+    "dIPVEW7/AcZpwlbCscaXWFA6Qk2JGzDVhvI2fJDWqmB2QFNZ/gtFcHN8GD2fwPM6MjgxBQ"
+    "FFDvA3dETwy9R1qTYScUU8Gl6Vv0PvRJZXo/yA/Lvc+NE7h3w+/dAh//n8sUM+X33kHg0L"
+    "/RJiFC5RFIhNQlwE4/AmhkX7Ib+CM6Ldw9et82CJX7EzWG9C3VG6/yAd10inpo3Wn2EeKp"
+    "qSk+MOEOsLoNUXQKq//Y4xdZaJH3bcldnhaHs1rEe+G0bUGcHf/i4tXkcuXyG5WZXkErn4"
+    "OJvi3xUM+jScjX8F0whWA60zapsTDwYrV/Dg8DBPxYPDw+ySB3gv9n0x/X8pGB/rw0yGon"
+    "o0rJfj4UNwLkQ3yePUzU27gpm863ZfvnzT3X/5+u3hqzdvDt/u+1wleWsWezk+/4gcJoJ4"
+    "ypetBU8vQMxBj4ZJ+fbT0S7MhIzYD9LXh8xxiTUIaFsyllKc4/WrHAT9+lUmPeOtKM7Ay3"
+    "oT4R5NoWrLMhg10/GO9YyB/ghdF8XSM0ShLyMuPwDvdkfe+NHEKjQwSRAemQmCCnKRvNlS"
+    "s8j3+voiYtY9Po97H+8vj89udg5ixRRTAuxCgkwC+3kulEjXlfKhBKb2BC/PSfOb4ltJC1"
+    "QN5NjcxsegS/O2x2r668LNjtJ+Udnq2EAy/mIsA52EvTGgppUL/JuZ4xM1R8xToYtm+CD6"
+    "uTNzZmnOxQbJl92D41ZO7gnWvQ24a3N72tyeNs6oFZnWw5rdJvasW2LPJoihi8/qmSeJtk"
+    "k9m5HUc6S5+pPuTi+s4VaKaB++PVOyp7Jhz7CGOQV7NTaBLmkiuSeKevEKUWgXRauFM3Vc"
+    "Nk7K9xXGejCBDAae6AAwGVNX1xwp0/d1FwfRjbzusFZmX1Y9KS09NyPbCB30aFpiP+IzIR"
+    "NmA82NWb+jvo4ko6+FWokpMQDqE7PxEn4PsFRizGK+SUVt2AICwQJLEOvW9DrcwYO5/Z9P"
+    "6z3Z5iAj7KL+NP+FK1HOk5jLkVjgi1QSvUKcJNKnafnw/FR5W8S0CCZluktlKK1SuvFK6W"
+    "aoUP7hwPdLcHY1rkGtv7RfHtp1F/aVdHtjGYY32UoT+GNNZgv9qnHP5q3zfoOW2bt9Og0J"
+    "27xwL7MdMkZQ4T9YG8pVW73PuOjTCUztCeG/4ngPpqyvtht8WIs827rLfB+AbT2LMR1OMj"
+    "bTLLuP37Al+NmPMYOpaEQeC+hB+Bum8zc0pS7RPNuGAY3pgwlwGKB8yNCmof7ETJkWTV74"
+    "1QPgZxCOC3+oyn0aM7A87imcKKbD1Rg+fN8ipuUSWCNjKqoVyNlgxVwMDcQ3d8g+1iTY3i"
+    "YOf/aDKbYTCQiZjCygoOxKuvBCnNHzwbnz3E8zj9clSOS8BNXr2uq7DWlLcvmSUk46orL5"
+    "LNFmybz77oTgFudJgnxz9/1d+MyA1P3NZxcsvjsDVhRmYkJjQP9JlWd+aYagd9OazxfkHb"
+    "pilH2p+ji+xuMEWpBfFryUFnSQJ8zvIDvK7yAZ5DejOkZG9FkTFTG2kqCfiKNA8vwO8mN9"
+    "4LNvXePPK4Fx/R+PKpdqWkeGaSmw91MYssqjUZPqwBnI0TbzYlyzvlk2mbSeHNLacQ2m1T"
+    "iya1ULexamck4+oCUYQ91GEjwfinh3VftGAb3i3+FD8VzJCNzkj+cdSNHNIOnXXygKabJj"
+    "o9ieiMppYUBVMBSfqcdN28rw1RDOfBI9Bxbf7KeICh8Mi85CO9E9hvgA+y8R81tvPFZegT"
+    "jKuBKhmVYTeK/vjy/OyOebs5Pz2/Prq6hpj9/kGp4fN31zdnRR7MNfCzVvMJCuR1tpVg1x"
+    "pzPTmBG0mWfByLay/joOwvyW5gWrtpnFw7IVguzqYctWxPKjuPjsKdwaBUCUzdcTwIV8xl"
+    "hmDyVB/M/t9VWWvOR3iQF5b8ILfu3rKA4auuN+W01YZ6CIbx1xGSVCSeNRo52oLwgHOG76"
+    "ePn5f4EZmXU="
+)
@@ -0,0 +1,92 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "users" ADD "token_version" INT NOT NULL DEFAULT 0;
+        COMMENT ON COLUMN "users"."token_version" IS 'Incremented to revoke previously issued access tokens';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "users" DROP COLUMN "token_version";"""
+
+
+MODELS_STATE = (
+    "eJztXVlz27YW/isYvdidkZ3YN26bvMlLErd2nEns207jDIemIAljilS42NF08t97sJHgJp"
+    "EiJVIKXhKZxAHBDwfAdxaA//am7hDb/uEn18a9N+jfnmNO6Y/E9T7qmbNZfJVeCMwHJtHz"
+    "oAS7Yj74gWdaAVwcmbaP4dIQ+5ZHZgFxHVqUVoZYFcjDMw/72AmIM0ahjz3E6kHEQcEEI3"
+    "/uB3h6SKsduhbUC8VWquHeoSL+GzQYTonTR5/DGfaeiO96fXQDP82A/jqzCVREnxY65FuI"
+    "jcAdY6jFg2d++QqXiTPE3+E1xZ+zR2NEsD1MIEaGtAJ23QjmM3bt0gnesoL0RR4My7XDqR"
+    "MXns2DietEpQlvwxg7tGGYVh94IQXSCW1bAC6x5S2Ni/AmKjJDPDJDm3YHlc72xiAM3APi"
+    "WB6ewsujmUempjdHj3iehl3IW65Dexha6bMXH9OnHxwfvfrt1e//+/XV71CEtTC68tsP/t"
+    "oxJlyQIfPhtveD3TcDk5dg8MZ4sv8ziJ5NTC8fUlk+BSo0OQ2qhHAdqDINpU15g/aYzu31"
+    "0V6sdfQvqXf0N9e8vZKIT83vho2dcTCBP09eLoD3/4NPZ+8Hn/ZPXv5C63ZhYPLh+kHcOW"
+    "a3aA/EiKuvkgH+Fn8v0OWU2Er4C3Qj+GWRGP94TlncATfsl2kj5TpyR2xS8MRsthzqBdDe"
+    "Xvx9SyuZ+v43W4V0/3rwN0N7Ohd3rm4+vJPFlS44u7o5TUEPo5CCY5hBFvlzuBOQKc5HPy"
+    "mZAn8oRA/lj1WGwsp9IS8uV2x4h+GNY8+FJixC//L64vPt4PpjogvOB7cX9M5xAn55df/X"
+    "1CCIKkF/Xd6+R/RP9M/NhwuGoOsHY489MS53+0+PtsmEKdNw3GfDHCpTgrwqgUl0bDgbrt"
+    "ixSUndsa12LGs8XfpHj8piRS88mNbjs+kNjcQdRQGAmhh04jE8bJsUQD+rCaeikrd/fhKF"
+    "cvpcULI7qFDSso31OF/XTN8nYwcPUeCy+ZS+W6X5NL6qYuoeu0WgZm9Nj6eFOOcge20681"
+    "uX/stG2SU833SsPKKgwLtJwnAXU9f9KTTzAFgZ/f+XesD2xQsZKUIvX48pI8wu8nZE40eu"
+    "x5CnPFDCanC6GvWKuMe0mt8KJp4bjicFagoowzUccAY3+Hw2OGdD0khTXaYO8PbmmF2ir/"
+    "yjn2x7jpEi36nYSImUY7mRwvojx8QwbZvp+1IbpWoF984du2qZDpqYT2DfgLqQmY2FVgho"
+    "owFn8MuqrqBoapmQ2aG2Yzplx9A+q2rLqDLt2jN3rAKkNqh9QwVPTWJXwTMS6ASYrDUIqA"
+    "ZMDv4qiB69LAMplCrElN1LgjqD1f3Zhdl9YvqTKuBmBJsBeXWu8h7aASRFtmsVhI9PTkog"
+    "DKUKEWb3kggT34ClhzzlTAWnLkzqplMwyapyKXAfQHBd6EZanUD3rwlbUqL1CJmW5YYw8x"
+    "Ifxc2sZWKf3txcJcyA08u0DX13fXoBKs7gh0KEcws5G8eYB+4jdownWGBzvRqFC1tGbvka"
+    "1xTsL7OYX8rljXNvDz9B82Cpw0/EDX17Dtj7IdyDroApBbHGl51ZGln+tCdjxwxe7cnY0Y"
+    "796T0ZzD5jJhgsWKrhVNOToY4V6Sgx/MjzXw+qOIIgowebBU0+la/4+9PQD7ixGt2gilHT"
+    "Z5GAUCIHILriGTXVrW0M4+dnUFRuNY1jpIrAL4c1EbyCKjYczBHapXoeJ6YztDEfv7ZoUU"
+    "Ng0eqgyJRSrQawOuM1tTC/PU9cBJP+xPUoZhQpK25LQ2BZLHbZEFw8ELrbgEVD0bJNMvWj"
+    "ea0uclBZt0alJZu0JuCaWlU3D50y0avgudTQxGtCj9XX2DCFunZ8lFIfBgnmhu2Oa6I1EF"
+    "VdueOWwAJtG7nelKGFmXuGt3dTEbvMajHz3BGx8zxgooIbB9+68E/ZJWOjw/dO9XfZxHmU"
+    "sVA2bGlzVFbHG9gIo1sU+YxDd/Uin6uaYlsS+ZSvl458xoHjZORTiW6mA59qULSByCf3tS"
+    "wNfRblaKrPWxwCNSoka9JaD3i+ZVGkkUc58yOg5UTvnWtz5ouwKE8qIMWpoDlBzS89mYPA"
+    "cru+6iBnO0FO7fXdCedg1uurzIIlR4sisbmYyVqSlpoOjbApuBKWikTbWNZ0mzaBZcZrnY"
+    "Q2i+tbsBOg7//E607+6pw3mi6I5nO08KmKlEtJMmO+ATB3JkkxDaYyw+WDWRxNqZnuuJAj"
+    "5vi3c9hivhe8mDfGvpaEv2o5gYwfdBAHCUqwx5Jy984pKIiPouAA7e+4sT4COo84VpwyhR"
+    "4sjdgHQcUJU+iCj7cHoYJgRzElTbqnItQ0OdXkVJNTnZKgOzYvJUHtVzllViPLKam2CXOj"
+    "IfOmTRFlVa+EcUaubZQbD6qv2VBZFLraAnNlYzkMac6dUbzlZkxxeHULgN5Iwk0a5NQM2i"
+    "XjhqWe5JgzMiWl2ICJ8l6Wmyy0srytOzM3oL9MWwR5wOrw0EPoE4dm27qzmesF0OcBAfMi"
+    "Y880Uem9c2Y66CFp3MaWDzV1Rq5tu88Hod7/0zHrY0Q8PzCq7gBKSrW9o4Lq8B7oGW0UWn"
+    "Uf0Fp2rdjmCuAmhDqCLW1Tt6Bte5dVbUg7us8KoKmkrZFAyydrCFRZc6DI9KF0HCW5taoM"
+    "psfFkB5nEAX2FoQ5GRAU0gtoaIbkJU2aSHpzagulAaMAyAjm/Z3DQ3i73qA9pSw9Mibxx7"
+    "fQtAm8tbzzhD1xxwaLfKVzZY6Oyuj8UbHKH6X7R/vfdsJNo/1vO9qxxfm2qzniisRX8hV1"
+    "cjPBmp1EGQA358LoJNxl/RdFilfVkaEsXdu9F4QRCTVPGj1g23XGNFhaD/q6B/csdfZIvA"
+    "p8Pgqci10/icT3ki4gCRb32lDvCpV6pF4bWRtyHabARQ6fSlXcOxemNYlk6EZ633ctQnUE"
+    "PZNggkxWEsHoifPfH+ZwmboHtcenWx4fZU9CEtTiMxQVkbaNZzGyUACNrTRH5BIffViipp"
+    "2l7Qk2X1eajRSJtiOR9ddanW/a8H6vNdN0SWBrMvOSu6o7paplGbkyPpcHbLc7iXdNexPT"
+    "iC7N5G0nPvvRc4ehlUvX5a2FVH3GC5Vk6aLKF59pToCVeyS8rJBGVX1eDH6PRhi6J8vZ61"
+    "aYG6CVcV31BMd4GySvTJ/c2F0e3+4J9KtPR0KZV44mHpcKex0vCHsdZ8NeDI0KYMryXQGT"
+    "NuANwofjwz7ag0Uo9OgqRCMtn7BpowsarmF/iilEn+nfnCtR9kGqVd2zTGEKs3K0/BxbML"
+    "XZBeFdKZM2R7nQoRBuBfCobbWgPr84u7weXO0fnfSPUwc2SsxfZRRXG/k7auTroOFOdOzq"
+    "5wgKCsyZcmNHRylWxubJQXrPoRUdTdLRCIs4OyXHWotPVSk21oRhU85WE6eg5FhU8Mojwg"
+    "6nERVm7bIqwvfONc2Spsey0H7gsREePlFOYtFGVreMrBE8tXp2rCrUtoUgvuHlI9qqbhld"
+    "25vCGYGqkzh7TTL7CNfupXEqfVzWTFVEuoJrJU3VkVPNvbVRpTu2MBOzAyHcWsf7rfGsxL"
+    "UEdyvYr2rEaiuNVwE56xDxMiL1TNqyNQ3YxMqz7adEq2g1nkyZOa63iWN6W8GHRsH98GFK"
+    "giAKgzdwnnHWF7IsbUCeI7vmpIGuzo7rSSdowOe0IFEgMxcu80AZ1bIGeP0H0mlX5jCq5S"
+    "L3zi1N7PVB84k1ibMETC+ZDMBvq46u3LOjYs+hqEkfG9WWZyraTVCdVKdEO8Wq6Qfc+NG6"
+    "ctF/NuNVvyT0u0K4s5aUmFkqDaaETNuJk03RuqazUUVbqiGbFGob2ibCPWvOSY2bUjOLsv"
+    "Tp+h1U3bLkJzFul+enzmJmUhPcnQtWppFNjtsuJaomTchCFlpqf1nOF5BKx0NLbhBbFhmt"
+    "WE2ZnWbC/NB7zbaBpOq9Zj0dMdGO9Z+c5+sdZx3ZxaPZfTse9JrMXu88296dZzzWkUvkRd"
+    "xhEYGXsZYyvB3K5mYiCibO6kLsawXQrX4+aa9ch2TsTDIeLkDH/Rm2yIhYKmG3Fh0TSjeu"
+    "xR9I0Ey+W0x+C0+xiwJ9vaLhEh1iFxWlW6SIY3j4ieBn+gcMAtd+ghsluyGRhfa6RBLa68"
+    "IctNcd2i3V6EJLoe/8ZiltWu2oaaWT0XaiY/WxgJXzV5q2pyPIVv1eR3EFLaPe8IfQmwZ+"
+    "V7xD9dKxtDejpXy3fj13xs9xfugacK52gOiSmXobQW94Wq6Me8nP/JRJ0x4R8a3zmmm0b6"
+    "GeNuw3hjV9iTWlGTeUkA1NbSkfOwJpq862jXWqyGUpFW6J29KIFLys75IpU5wo4MP8Rn2P"
+    "7LIZBKY14fkCLMtVHmFFHZJFjszVK2QfYaVfOPLRx/O3ffTHx3d99PHDO+bEdKkrktfCGI"
+    "X2VHbLU0l7xpiZwSTfWZmPa0KobQ/ZR2iHTH9ierYPWvgClPAF6GDZ/Uepk5vKHd206Oym"
+    "zI7YcGa75nBFT0pCtFOulDgDmWFP049lc0tCvysulry0BDq1V7Q7Y5H2zc561GXtFqegrr"
+    "UNzhb2V62HFKapuKpNnQvzLkzbTDLRZeypatImRb90suUi0lStknIJm7Rena+5DdxJ52v2"
+    "dFBRx55+ZmKkkzU7kvimyWYLzrXqfFMnau5GoubACsgTCeZX7riXQ+DV2wv5uykKGrY7Lk"
+    "nfZd0IRPKId8hPY2Bb+xHhvgl/7gd4mmXxNeq6d0ANRiEXAJjseUAsXzD3IQloJcTW/s6O"
+    "cXbemVWcnbFE24x9wFqCZtgDnZviYV8eYS9SrbjxmPh6MPvU3ErZmOv5cIDpwRDgCFbogp"
+    "RY2/1wCw9G7gjxZr1BewxkCjs/OJD9oj2xmvO5lO+5wmcDBHqVZpKETNv88PKcoQ1zL28W"
+    "oon2wUYnFG2U7rxRuhsmVLQ4sPESr12tW1Dbz/ZXh3bbyT72iDXp5fF8fmcxxY/LLOP2xd"
+    "PQz8Ogy0/Fa2bKNE2sIlVWRFrmaOVRTJLek5MypPfkpJj00nupxG8YGlXsDV58OwFcywHt"
+    "8MQgN87yx+ebD0VxlkgkBeSdAy/4ZUisoI9s4gdfuwnrAhTpWy+OtaTDKimyRCs4rXZibv"
+    "PLy4//APoIKfg="
+)
@@ -0,0 +1,94 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "claims" ADD "resolved_at" TIMESTAMPTZ;
+        COMMENT ON COLUMN "claims"."resolved_at" IS 'When the claim was last moved to ''resolved''';
+        UPDATE "claims" SET "resolved_at" = "updated_at" WHERE "status" = 'resolved';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "claims" DROP COLUMN "resolved_at";"""
+
+
+MODELS_STATE = (
+    "eJztXVlz27YW/isYvdidkZ3YN26bvMlLErd2nEns207jDIemIAljilC42NF08t97sJHgJp"
+    "EiJVIKXxKZxAHBDwfAdxaA//amdIht7/ATtXHvDfq355hT9iN2vY965mwWXWUXfPOBS/Rc"
+    "KMGvmA+e75qWDxdHpu1huDTEnuWSmU+ow4qyyhCvArl45mIPOz5xxijwsIt4PYg4yJ9g5M"
+    "09H08PWbVDakG9UGylGu4dJuK9QYPhlDh99DmYYfeJeNTtoxv4afrs15lNoCL2tMAh3wJs"
+    "+HSMoRYXnvnlK1wmzhB/h9eUf84ejRHB9jCGGBmyCvh1w5/P+LVLx3/LC7IXeTAsagdTJy"
+    "o8m/sT6oSliWjDGDusYZhV77sBA9IJbFsCrrAVLY2KiCZqMkM8MgObdQeTTvfGIPDpAXEs"
+    "F0/h5dHMJVPTnaNHPE/CLuUt6rAehlZ6/MXH7OkHx0evfnv1+/9+ffU7FOEtDK/89kO8do"
+    "SJEOTIfLjt/eD3Td8UJTi8EZ78/xSiZxPTzYZUlU+ACk1OgqogXAeqXENZU96gPa5ze320"
+    "F2kd+0vpHfstNG+vIOJT87thY2fsT+DPk5cL4P3/4NPZ+8Gn/ZOXv7C6KQxMMVw/yDvH/B"
+    "brgQhx/VVSwN/i7zm6nBBbCX+Jbgi/KhLhH80pizvghv8ybaRdR3TEJwVXzmbLoV4A7e3F"
+    "37eskqnnfbN1SPevB39ztKdzeefq5sM7VVzrgrOrm9ME9DAKGTiG6aeRP4c7PpnibPTjkg"
+    "nwh1L0UP1YZSis3Bfq4nLFhncY3jj2XGrCIvQvry8+3w6uP8a64Hxwe8HuHMfgV1f3f00M"
+    "grAS9Nfl7XvE/kT/3Hy44AhSzx+7/IlRudt/eqxNJkyZhkOfDXOoTQnqqgIm1rHBbLhix8"
+    "Ylu45ttGN549nSP3rUFit24cG0Hp9Nd2jE7mgKANTEYBOP4WLbZAB6aU04lZW8/fOTLJTR"
+    "55KS3UGFipZtrMfFumZ6Hhk7eIh8yudT9m6l5tPoqo4pPaZ5oKZvTY+nuThnIHttOvNbyv"
+    "7lo+wSnm86VhZR0ODdJGG4i6jr/hSaeQCsjP3/SzVg+/KFjAShV6/HlRFmF3U7pPEj6nLk"
+    "GQ9UsBqCroa9Iu9xrRa3/IlLg/EkR00BZbiGfcHgBp/PBud8SBpJqsvVAd7eHPNL7JV/9O"
+    "NtzzBS1DvlGymhciw3Unh/ZJgYpm1zfV9qo5St4N6541ct00ET8wnsG1AXMrOx1AoJbTjg"
+    "DHFZ1xUUTi0TMjvs7JhW2TGsz8raMrpMs/bMHa8A6Q1q3lDBU5PYZfAMBVoBJm8NAqoBk4"
+    "O3CqJHL4tACqVyMeX34qDOYHV/pjC7T0xvUgbclGA9IK/OVd5DO4CkqHatgvDxyUkBhKFU"
+    "LsL8Xhxh4hmw9JCnjKnglMKkbjo5k6wulwD3AQTXhW6o1TF0/5rwJSVcj5BpWTSAmZd4KG"
+    "pmJRP79ObmKmYGnF4mbei769MLUHEOPxQigluo2TjC3KeP2DGeYIHN9GrkLmwpueVrXF2w"
+    "v0xjfqmWN8G9XfwEzYOlDj8RGnj2HLD3ArgHXQFTCuKNLzqz1LL8dZ6MHTN4O0/GjnbsT+"
+    "/J4PYZN8FgwdINp4qeDH2sKEeJ4YWe/2pQRREEFT3YLGjqqWLF358Gni+M1fAGU4yKPosY"
+    "hAo5AJHKZ1RUt6YxjJ6fQlG7VTeOoSoCvxxWRPAKqthwMEdql+55nJjO0MZi/NqyRTWBxa"
+    "qDIlNGtWrA6kzU1MD89jyhCCb9CXUZZgwpK2pLTWBZPHZZE1wiELrbgIVD0bJNMvXCea0q"
+    "clBZu0alpZq0JuDqWlU3D5020evgUWZo4jWhx+urbZhCXTs+SpkPg/hzw6bjimgNZFVXdN"
+    "wQWKBtI+pOOVqYu2dEezcVsUutFjOXjoid5QGTFdw4+JbCP0WXjI0O3zvd32UT51HFQvmw"
+    "Zc3RWZ1oYC2MblHkMwrdVYt8rmqKbUnkU71eMvIZBY7jkU8tupkMfOpB0Roin8LXsjT0mZ"
+    "ejqT9vcQjUKJGsyWo9EPmWeZFGEeXMjoAWE713rs2ZJ8OiIqmA5KeCZgQ1v/RUDgLP7fra"
+    "BTmbCXJ2Xt+dcA6mvb7aLFhwtGgSm4uZrCVpqe7QCJ+CS2GpSTSNZUW3aR1YprzWcWjTuL"
+    "4FOwH6/k+87uSv1nmj2YJoPocLn65ImZQkNeZrAHNnkhSTYGozXDaY+dGUiumOCzlihn87"
+    "gy1me8HzeWPka4n5q5YTyOhBB1GQoAB7LCh375yCgngoDA6w/o4a6yGg80hgJShT4MLSiD"
+    "0Q1JwwuS74aHsQygl25FPSuHsqRK0jpx057chpl5LQdWxWSoLer2rKLEeWE1JNE+ZaQ+Z1"
+    "myLaql4K45Rc0yjXHlRfs6GyKHS1BebKxnIYkpw7pXjLzZj88OoWAL2RhJskyIkZtE3GDU"
+    "89yTBnVEpKvgET5r0sN1lYZVlbd2bUZ79MWwZ5wOpw0UPgEYdl29LZjLo+9LlPwLxI2TN1"
+    "VHrvnJkOeogbt5Hlw0ydEbVt+nwQdPt/WmZ9jIjr+UbZHUBxqaZ3VDAd3gM9Y41Cq+4DWs"
+    "uuFdtcAdyYUEuwZW1qF7RN77KqDGlL91kBNKW0NRRo+GQNiSpvDhSZPhSOo8S3VhXB9Dgf"
+    "0uMUosDe/CAjA4JBegENTZG8uEkTSm9ObaE0YOQDGcGivzN4iGjXG7SnlWVHxsT++BaYNo"
+    "G3VneesCvv2GCRr3SuzNFREZ0/ylf5o2T/dP63nXDTdP63He3Y/Hzb1RxxeeIr+YpauZlg"
+    "zU6iFICbc2G0Eu6i/os8xSvryNCWru3eC8KJhJ4njR6wTZ0xC5ZWg77qwT1LnT0Krxyfjw"
+    "bnYtdPLPG9oAtIgSW8Nsy7wqQemddG1YaowxU4z+FTqop758K0JqEM20jvedQiTEfQM/En"
+    "yOQlEYyeKP/9YQ6XmXuw8/i0y+Oj7UmIg5p/hqIm0rTxLEcW8qGxpeaITOLTHZbY0c7C9g"
+    "Sfr0vNRppE05HI6mttl29a836vNdN0RWArMvOCu6pbpapFGbk2PpcHbLc7iXdNexOTiC7N"
+    "5G0mPvvRpcPAyqTr6tZCqj4ThQqydFnli88sJ8DKPBJeVciiqp4oBr9HIwzdk+bsVSvMDN"
+    "CquK5+gmO0DVJU1p3c2F4e3+wJ9KtPR1KZV44mHhcKex0vCHsdp8NeHI0SYKrybQGTNeAN"
+    "wofjwz7ag0UocNkqxCItn7BpowsWruF/yimkO9O/Plei6oNEq9pnmcIUZmVo+Tm2YGqzc8"
+    "K7SiZpjgqhQyncCOBh2ypBfX5xdnk9uNo/OukfJw5sVJi/SiluZ+TvqJHfBQ13omNXP0dQ"
+    "UmDBlGs7OkqzMjZPDpJ7Dq3waJKWRljk2SkZ1lp0qkq+sSYNm2K2mjwFJcOiglceEX44ja"
+    "wwbZeVEb53rlmWNDuWhfWDiI2I8Il2EktnZLXLyBrBU8tnx+pCTVsI8hteHmKtapfRtb0p"
+    "nCGoXRJnr05mH+LavjROrY+LmqmaSFtwLaWpXeS0496dUdV1bG4mZgtCuJWO91vjWYlrCe"
+    "6WsF/1iNVWGq8Sct4h8mVk6pmyZSsasLGVZ9tPidbRqj2ZMnVcbx3H9DaCD4uCe8HDlPh+"
+    "GAav4TzjtC9kWdqAOkd2zUkDbZ0d15NOUIPPaUGiQGouXOaBMsplDYj6D5TTrshhVMtF7p"
+    "1bltjrgeYTaxJlCZhuPBlA3NYdXZlnR0WeQ1lTd2xUU56pcDdBeVKdEG0Vq2YfcBNH66pF"
+    "/9mMVv2C0O8K4U5bUnJmKTWYYjJNJ07WRevqzkaVbSmHbFyoaWjrCPesOSc1akrFLMrCp+"
+    "u3UHWLkp/YuF2enzqLmElFcHcuWJlENj5u25SoGjchc1loof1lGV9AKhwPLbhBbFlktGQ1"
+    "RXaaSfOj22u2DSS122vW6yImnWP9J+f53Y6zluzi6dh9Mx70isy+23m2vTvPRKwjk8jLuM"
+    "MiAq9iLUV4O5TNzESUTJzXhfjXCqBbvWzSXroOxdi5ZDRcgI57M2yREbF0wm4tOiaUbVyL"
+    "PpDQMfl2MfktPMUuDPT18oZLeIhdWJRtkSKO4eIngp/ZHzAIqP0ENwp2QywL7XWBJLTXuT"
+    "lor1u0W6rWhZZB3/rNUp1ptaOmVZeMthMdm8pMUTP1Ch2bEK2hZ+tL3Q3joYJjsWgoP4x5"
+    "Sp8Egyq7RG1Jjyt8Fo7ln/QoyBI5S3X7UELIVv1GS34FDaOufSEkZqA8YdfDzQO/Kx7Bai"
+    "l4nQeroRzHfjUX1s9xZuwacC53aOySmXobQa95Wi6Ne8FPOxVJzR8R+X37iqnTb6GeJmx2"
+    "jjV7iTWllteUhA9NbSgHPwRpq84zjnQqz02tFG6Jq9oIFbyov5orU5Qc4sH8xvzN/LLp+6"
+    "Y1ETkiPLNZHVvGnNB5zuvVK+Qf3mVftfLQx/O3ffTHx3d99PHDO+64psz9LGrhjKLzTrfL"
+    "O816xpiZ/iTbQZ2Na0yoaa/oR2iHSnnjerYPWvgClPAF6GDRPWeJ07qKHde16Lyu1C7oYG"
+    "ZTc7ii9ywm2ir3WeRl4dgzJ4tqbkHod8WtlpWKwqb2knZnJNK82VmNuqzd4pTUtbLB2cCe"
+    "uvWQwiQV17WpdaH9ham6cSa6jD2VTdRl6BdOsF1EmspVUixJl9Xb5ehuA3fqcnSjpbkLJH"
+    "fxxp+QGHUJui1JduzIZgPOtfJ8s0vO3Y3k3IHlkyfiz6/ouJdB4PXbC/m7KQsaNh0XpO+q"
+    "bgQiWcQ7ECdw8OMcEBG+CW/u+XiaZvEV6rp3QA1GgRAAmOy5TyxPMvch8VklxO78nS3j7K"
+    "Izyzg7I4mmGfuAtwTNsAs6N8XDvvpsgUyvE8Zj7IvR/POCK2XgrudjEaYLQ0AgWKILEmJN"
+    "98MtPBjRERLNeoP2OMgMdnFYJP/FemI153Mh33OJT0VI9ErNJDGZpvnh5TlHG+Ze0SzENl"
+    "f4G51QOqN0543S3TChwsWBj5do7Wrcgtp+tr86tNtO9rFLrEkvi+eLO4spflRmGbfPn4Z+"
+    "HgZdfCpeM1NmaWIlqbIm0jBHK45inPSenBQhvScn+aSX3UskfsPQKGNviOLbCeBaDuWHJ/"
+    "qZcZY/Pt98yIuzhCIJIO8ceMEvQ2L5fWQTz//aTlgXoMjeenGsJRlWSZAlVsFpuVOS619e"
+    "fvwHVUHKtg=="
+)
@@ -0,0 +1,138 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "analytics_rollups" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "day" DATE NOT NULL,
+    "metric" VARCHAR(15) NOT NULL,
+    "status" VARCHAR(20) NOT NULL DEFAULT '',
+    "operator_id" INT NOT NULL DEFAULT 0,
+    "supervisor_id" INT NOT NULL DEFAULT 0,
+    "product_id" INT NOT NULL DEFAULT 0,
+    "count" INT NOT NULL DEFAULT 0,
+    "resolved_count" INT NOT NULL DEFAULT 0,
+    "resolution_seconds" DOUBLE PRECISION NOT NULL DEFAULT 0,
+    CONSTRAINT "uid_analytics_r_day_420278" UNIQUE ("day", "metric", "status", "operator_id", "supervisor_id", "product_id")
+);
+COMMENT ON COLUMN "analytics_rollups"."id" IS 'Auto-increment primary key';
+COMMENT ON COLUMN "analytics_rollups"."day" IS 'UTC day the counted records were created or assigned';
+COMMENT ON COLUMN "analytics_rollups"."metric" IS 'What is counted: ''leads'', ''claims'', ''client_products''';
+COMMENT ON COLUMN "analytics_rollups"."status" IS 'Current status, '''' if not applicable';
+COMMENT ON COLUMN "analytics_rollups"."operator_id" IS 'Assigned operator, 0 if none';
+COMMENT ON COLUMN "analytics_rollups"."supervisor_id" IS 'Assigned supervisor, 0 if none';
+COMMENT ON COLUMN "analytics_rollups"."product_id" IS 'Assigned product, 0 if not applicable';
+COMMENT ON COLUMN "analytics_rollups"."count" IS 'Number of records in this cell';
+COMMENT ON COLUMN "analytics_rollups"."resolved_count" IS 'Claims in this cell with a resolution time';
+COMMENT ON COLUMN "analytics_rollups"."resolution_seconds" IS 'Summed claim resolution time in seconds';
+COMMENT ON TABLE "analytics_rollups" IS 'Per-day analytics counters maintained alongside lead, claim and';
+        INSERT INTO "analytics_rollups" ("day", "metric", "status", "operator_id", "supervisor_id", "product_id", "count", "resolved_count", "resolution_seconds")
+    SELECT ("created_at" AT TIME ZONE 'UTC')::DATE, 'leads', "status", COALESCE("assigned_operator_id", 0), 0, 0, COUNT(*), 0, 0
+    FROM "leads"
+    GROUP BY 1, 3, 4;
+        INSERT INTO "analytics_rollups" ("day", "metric", "status", "operator_id", "supervisor_id", "product_id", "count", "resolved_count", "resolution_seconds")
+    SELECT ("created_at" AT TIME ZONE 'UTC')::DATE, 'claims', "status", COALESCE("assigned_operator_id", 0), COALESCE("assigned_supervisor_id", 0), 0,
+           COUNT(*), COUNT("resolved_at"), COALESCE(SUM(EXTRACT(EPOCH FROM ("resolved_at" - "created_at"))), 0)
+    FROM "claims"
+    GROUP BY 1, 3, 4, 5;
+        INSERT INTO "analytics_rollups" ("day", "metric", "status", "operator_id", "supervisor_id", "product_id", "count", "resolved_count", "resolution_seconds")
+    SELECT ("assigned_at" AT TIME ZONE 'UTC')::DATE, 'client_products', '', 0, 0, "product_id", COUNT(*), 0, 0
+    FROM "client_products"
+    GROUP BY 1, 6;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "analytics_rollups";"""
+
+
+MODELS_STATE = (
+    "eJztXVlz27YW/isYvdidkZPYN+6SN29p3XrJeLnttO6oNAlJnFCkysWuppP/3nOwkOAmcZ"
+    "NIKXxoKpMACH44AL6z4PDfwcwxqOW9uXMsOvhA/h3Y2gx/xK4PyUCbz6OreMHXnlmNgQsl"
+    "2BXt2fNdTffh4lizPAqXDOrprjn3TcfGotgYYU0Ql85d6lHbN+0JCTzqEtYOMW3iTynxFp"
+    "5PZ2+wWcPRoV0oVqmFJxureB/IiTEz7SG5D+bUfTE9xx2SW/ip+fjrzDKhIXxaYJt/B3Tk"
+    "OxMKrbjwzD/+hMumbdB/4DXFn/PPo7FJLSOGmGlgA+z6yF/M2bVL2//ICuKLPI90xwpmdl"
+    "R4vvCnjh2WNnkfJtTGjlFs3ncDBNIOLEsALrHlPY2K8C4qdQw61gILhwNrp0fjJPCdA9PW"
+    "XTqDlydz15xp7oJ8posk7KK+7tg4wtBLj734BJ9+cHT4/rv33//v2/ffQxHWw/DKd1/4a0"
+    "eY8IoMmZuHwRd2X/M1XoLBG+HJ/p9C9GyqudmQyvIJUKHLSVAlhOtAlUkoduUD2WMytzck"
+    "e5HU4V9S7vA3l7y9gojPtH9GFrUn/hT+PH63BN7/n9yd/XRyt3/87hts24GJyafrjbhzxG"
+    "7hCESIq6+SAv6B/pMjy4lqlfAX6IbwyyIR/tGasnwAbtkvzSLKdeKM2aLgitVsNdRLoH24"
+    "+O0BG5l53t+WCun+9clvDO3ZQty5ur35URZXhuDs6vY0AT3MQgRnpPlp5M/hjm/OaDb68Z"
+    "oJ8A1R9Y38UWUqVB4LeXG1YMM7GLe2tRCSsAz9y+uL+4eT60+xITg/ebjAO0cx+OXV/W8T"
+    "kyBshPx6+fATwT/J77c3FwxBx/MnLntiVO7h9wH2SYMlc2Q7ryPNUJYEeVUCExvYYG5UHN"
+    "h4zX5gWx1Y1nnc+seflc0KLzxr+udXzTVGsTuKAAA1GeHCM3KppSGAXloSTkUjH3+5E4Uy"
+    "xlxQskdoUNKyjY0439c0zzMnNjWI77D1FN+t1HoaXVUxdY6cPFDTt2ZHs1ycM5C91uzFg4"
+    "P/sll2Cc/XbD2LKCjwbpIwPEbUdX8G3TwAVob//6YesEPxQqMEoZevx4QRVhd5O6TxY8dl"
+    "yCMPlLCOOF0NR0XcY1LNb/lT1wkm0xwxBZThGvU5gzu5Pzs5Z1NylKS6TBzg7bUJu4Sv/G"
+    "UY73uGkiLfKV9JCYVjtZLCxiNDxdAsi8n7Sh2lbANP9iO7qms2mWovoN+AuJhziwqpENCG"
+    "E27EL6uyQsKlZWrO3/R6TKf0GByzsrqMWqddfeaRNUDUDrWvqNCZZlpl8AwrdAJM1hsCVA"
+    "MWB68KoofvikAKpXIxZffioM5hd391YHWfat60DLipis2AXJ2r/AT9AJIi+1UF4aPj4wII"
+    "Q6lchNm9OMKmN4Ktx3zJWApOHVjUNTtnkVXrJcB9horrQjeU6hi6v07ZlhLuR0TTdSeAld"
+    "f0SNTNWir26e3tVUwNOL1M6tCP16cXIOIMfihkcm4hV+MIc9/5TO3RC2ywmVaN3I0tVW/1"
+    "HtcU7O/SmF/K7Y1zb5e+QPdgq6MvphN41gKw9wK4B0MBSwphnS+6sjSy/fWWjB1TeHtLxo"
+    "4O7FdvyWD6GVPBYMNSFaealgx1rkhDycgLLf/1oIo8CNJ7sFnQ5FP5jr8/CzyfK6vhDRSM"
+    "mjaLGIQSOQDREc+oKW5tYxg9P4WicqtpHENRBH5p1ETwCprYsDNHSJdqeZxqtmFRPn8t0a"
+    "OGwMLmoMgMqVYDWJ3xllpY316nDoFFf+q4iBkipUd9aQgsnfkuG4KLO0J3G7BwKuqWZs68"
+    "cF2rixw01q1ZqcsurQm4pnbVzUOnLPQqeA4qmnRN6LH2Gpum0NaOz1K0YZj+YmQ5k5ponY"
+    "imrpxJS2CBtI0dd8bQosw8w/u7KY9dareYu87YtLIsYKKBW5s+OPBP0S1jo9P3UbV3Wab9"
+    "WfpC2bTF7qisjnewEUa3zPMZue7qeT6rqmJb4vmUr5f0fEaO47jnU/FuJh2fqlO0Ac8nt7"
+    "WsdH3mxWiqz1vuAh2VCNbEVg94vGWep5F7ObM9oMWqPtnX2twTblEeVGDmh4JmODX/GMgY"
+    "BBbb9Wfv5GzHydlbfXfCOJi2+iqrYMHZotTYnM9kLUFLTbtG2BJcCkulRttY1jSbNoFlym"
+    "odhzaN60fQE2Dsf6HrDv7qnDUaN0TtNdz4VEHKpCSpOd8AmDsTpJgEU1nhssHM96bUDHdc"
+    "yhEz7NsZbDHbCp7PGyNbS8xetZpARg86iJwEBdhjwXpP9ikIiEdC5wCOd9RZjwCdJxwrTp"
+    "kCF7ZG6kFFxQiTa4KPjgeRHGdHPiWNm6dC1Hpy2pPTnpz2IQn9wGaFJKjjKpfMcmQ5Uatt"
+    "wtyoy7xpVUTZ1UthnKrXNsqNO9XXrKgsc11tgbqysRiGJOdOCd5qNSbfvboFQG8k4CYJcm"
+    "IF7ZJyw0JPMtQZGZKSr8CEcS+rVRZsLOvoztzx8ZdmCScPaB0ueQ4808ZoW2c+d1wfxtw3"
+    "Qb1I6TNNNPpkn2k2eY4rt5Hmg6rO2LEs5/Ug6M//dEz7GJuu54/KngCK12r7RAXK8B7IGX"
+    "aKVD0HtJZTK5ZWAdxYpY5gi33qFrRtn7KqDWlHz1kBNKWkNazQcmYNgSrrDhSZPRf2o8SP"
+    "VhXB9Cgf0qMUosDe/CAjAgIhvYCOpkheXKUJa29ObKE0YOQDGaF8vDN4CO/XB7KnlMWUMb"
+    "E//g40y4S3lndeqCvuWKCRV8orc3hYROYP80X+MDk+vf1tJ8w0vf1tRwc2P962miEur3ol"
+    "W1EnDxOs2UiUAnBzJoxOwl3UfpEneGUNGcrWtd1nQRiRUOOkyTO1HHuCztJ60NdN3LPS2C"
+    "PxyrH5KHAuN/3EAt8LmoAkWNxqg9YVrPUZrTayNeLYTIDzDD6lmniyLzR9GtbBg/Se5+gm"
+    "ygh5Nf0p0VhJArMnin9/XsBlNA/2Fp9uWXyUMwlxUPNzKCpV2laexcwiPnS21BqRSXz6ZI"
+    "k97SysT7D1utRqpNRo2xNZf6/t400bPu+1ZpouCWxNZl7wVHWnRLUoI1fm52qH7XYH8a7p"
+    "bGIS0ZWRvO34Zz+5jhHomXRd3lpK1ee8UEGWLpp8e48xAXpmSnjZIHpVPV4Mfo/HFIYnzd"
+    "nrNpjpoJV+XTWDY3QMkjfWZ27sLo9vNwN99eVICHNlb+JRIbfX0RK311Ha7cXQKAGmLN8V"
+    "MLEDHwh9M3kzJHuwCQUu7kLoabmjmkUu0F3D/hRLSJ/TvzlTohyDRK+6p5nCEqZnSPk51W"
+    "Fps3Lcu7JOUh3lld6Iyq0AHvatFtTnF2eX1ydX+4fHw6NEwkaJ+fuU4PZK/o4q+b3TcCcG"
+    "tnoeQUGBOVNuLHWUomVsnhwkzxzqYWqSjnpYRO6UDG0tyqqSr6wJxaaYriayoGRoVPDKY5"
+    "MlpxENpvWyMpWf7GuMksa0LDgO3DfC3SdKJpZeyeqWkjWGp5aPjlUrta0hiG94eQR71S2l"
+    "a3tDOENQ+yDOQZPMPsS1e2GcyhgXVVOVKl3BtZSk9p7Tnnv3SlU/sLmRmB1w4dZK77fGXI"
+    "lrce6W0F9Vj9VWKq8CcjYg4mVE6JnUZWsqsLGdZ9uzRKtoNR5MmUrX20Sa3lbwQS+4FzzP"
+    "TN8P3eAN5DNO20JWhQ3IPLJrDhro6uq4nnCCBmxOSwIFUmvhKgvUqFzUAG//QBrtiiSjWl"
+    "3lyX7AwF4PJN/Up1GUgObGgwH4bdXQlZk7KrIcipb6tFFtWabC0wTlSXWiaqdYNX7AjafW"
+    "lZv+qxbt+gWh3xXCndakxMpSajLF6rQdONkUrWs6GlX0pRyy8UptQ9uEu2fNMalRV2pGUR"
+    "bOrt9B0S1KfmLzdnV86jxiJjXB3TlnZRLZ+LztUqBqXIXMZaGFzpdlfAGpsD+04AGxVZ7R"
+    "ks0UOWkm1I/+rNk2kNT+rNmg95j0hvWvnOf3J846coqnZ/ftWNBrMvv+5Nn2njzjvo5MIi"
+    "/8DssIvPS1FOHtUDYzElEwcdYWYV8rgGH1skl76TYkY2c1o+kCdNybU90cm7pK2PVlaULx"
+    "4Fr0gYSeyXeLyW9hFrvQ0TfImy5hEruwKB6RMu2RS19M+op/wCRwrBe4UXAYYlFoPxQIQv"
+    "shNwbthw6dlmp0o0XoO39YqletdlS16oPRdmJgU5EpcqWuMLCJqg2MbHOhu6E/lHMs9Iay"
+    "ZMwz54UzqLJb1JaMuMRn6Vz+SlNBlohZatqGEkJW9Rst+Q20jLryhZCYgvJCXY+2D/yuWA"
+    "TrheD1FqyWYhyH9UxYX0fO2DXgXC5p7IqVehtBb3hZLo17wU87FQnNH5vi+/Y1Q6c/Qjtt"
+    "6OwMa3yJNYWWNxSED11tKQY/BGmr8hlHMpVnppYCt8JUPQoFvKi9mglTFBziwfqG9mZ2Wf"
+    "N9TZ/yGBEW2SzTlqEROs94Xb1B9uFd/KqVRz6dfxySnz/9OCSfbn5khmsHzc+8FcYoeut0"
+    "t6zTODKjueZPsw3U2bjGKrVtFf0E/ZAhb0zO9kEK34IQvgUZLHrmLJGtq1i6rmX5ulKnoI"
+    "O55WhGRetZrGqnzGeRlYVhj0YW2d2C0O+KWS0rFAWX9pJ6Z1SlfbWzHnVZu8YpqGtthbOF"
+    "M3XrIYVJKq5KU+dc+0tDdeNMdBV7Khuoi+gXDrBdRprKNVIsSBfb7WN0t4E79TG60dbcO5"
+    "J7f+NXSIz6AN2OBDv2ZLMF41p5vtkH5+5GcO6J7psvpr+4ciaDDAKv3l7K3zVRcGQ5k4L0"
+    "XbZNoEoW8Q54Bg6WzoGY3DbhLTyfztIsvkZbTzaIwTjgFQAma+GbuieYu2H62Ihp9fbOjn"
+    "F2PphljJ1RjbYZ+wnrCZlTF2RuRo2h/GyBCK/jymPsi9Hs84KVInDX87EIzYUpwBEsMQSJ"
+    "am2PwwM8mDhjwrv1gewxkBF2niyS/cKRqGZ8LmR7LvGpCIFeqZUkVqdtfnh5ztCGtZd3i+"
+    "DhCn+jC0qvlO68UrobKlS4ObD5Eu1drWtQ28/2q0O77WRfsts7x7KC+SCL8CeKLCf9svDI"
+    "ZaWLfhyOugeGtlDINsuyR12PzBBU+A/GRmOqrWlQRn2GkUE9Rf5rtvdki2QoB9EXL8ira/"
+    "o0tPS7zitv02Mi41LdcQ38uBzBHN0zCl3RidgW0E/wF3TnLyiq+UQPXBcatBZPNsBhgfIh"
+    "XNwT84Xa4vwVeRueAoSfUbwV/CHT7OjUwlx257Cj2B5TY1jzhkNsxycwRtaCnzoUvcH0dh"
+    "j7gW/ukXd4tnBvj3js2U82n04kEmQydSxjSdo7eCG20LPG8Vd0ni0RlpcOao5SzfSp8lrS"
+    "lsTwpVlOznk5XnwZtdnw2v1wRnCKs1MgbHIb4Sx8pSDq4eRzS2bKWwIrkpkEaYzkv8oZ0K"
+    "h225rPr7h2mHKhNITq44UajxdpQWEOz0pa0OFxAS3o8Dj/0w7HSS1o2THcbGlu5ejtIA36"
+    "Gd8KxJo/xPXYHIfLt6mz51XAuPkvPVQ7S9TEEaJKYL/LWJBloLTs1BD2QIa2XRTjhvXNqq"
+    "eFmjkk1DiuUbdaR3arElcuw1T0KQS0wsLQtJEE94cy3l1ZvlVAb9hHc5CeS47ATP643wGL"
+    "bgfJ8IBtWUjTFVvF9oxnQFEBlSFPrKcBM21Lw1dLOLNOjDwYfNvIoAofLUdbhnaqegLxMd"
+    "bfIOb3wWwmvQJJlHEklJ7WI7y3j6dXF+TT3cXZ5f3l7U3ctMduMg0v/Drs3cXJVbmvdKzV"
+    "vEGBXU8HWVYNfme41JgRlVllwci3sn49DsLiluY1q7Z4Cq6kJ1Cp0rIiVhzFOOM/LqJWQa"
+    "l8zn+cUqxwapQAURTfTgDX8s1BeKKfGUb68/3tTR5fCqskgHy04QX/MEykg5bp+X92E9Yl"
+    "KOJbx1xGqVDSZNToMO4LwgZO295evvwHfoZJfA=="
+)
@@ -0,0 +1,108 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX IF NOT EXISTS "idx_users_created_eeb5e9" ON "users" ("created_at", "id");
+        CREATE INDEX IF NOT EXISTS "idx_leads_created_447a29" ON "leads" ("created_at", "id");
+        CREATE INDEX IF NOT EXISTS "idx_clients_created_62088b" ON "clients" ("created_at", "id");
+        CREATE INDEX IF NOT EXISTS "idx_claims_created_b16b0f" ON "claims" ("created_at", "id");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_claims_created_b16b0f";
+        DROP INDEX IF EXISTS "idx_clients_created_62088b";
+        DROP INDEX IF EXISTS "idx_leads_created_447a29";
+        DROP INDEX IF EXISTS "idx_users_created_eeb5e9";"""
+
+
+MODELS_STATE = (
+    "eJztXVlz27YW/isYvTidkZ3YN+6SN29p3XrJOPZtp3FGpUlI4oQiVS52NZ38956DhQQ3iZ"
+    "tESuFDU5kEQPDDAfCdBYf/DmaOQS3v4M6x6OAd+XdgazP8Ebs+JANtPo+u4gVfe2I1Bi6U"
+    "YFe0J893Nd2Hi2PN8ihcMqinu+bcNx0bi2JjhDVBXDp3qUdt37QnJPCoS1g7xLSJP6XEW3"
+    "g+nR1gs4ajQ7tQrFILjzZW8d6RE2Nm2kPyMZhT99n0HHdIbuGn5uOvM8uEhvBpgW3+HdCR"
+    "70wotOLCMz99hsumbdB/4DXFn/Mvo7FJLSOGmGlgA+z6yF/M2bVL23/PCuKLPI10xwpmdl"
+    "R4vvCnjh2WNnkfJtTGjlFs3ncDBNIOLEsALrHlPY2K8C4qdQw61gILhwNrp0fjJPCdfdPW"
+    "XTqDlydz15xp7oJ8oYsk7KK+7tg4wtBLj734BJ++f3T49oe3P/7v+7c/QhHWw/DKD1/5a0"
+    "eY8IoMmZv7wVd2X/M1XoLBG+HJ/p9C9GyqudmQyvIJUKHLSVAlhOtAlUkoduUd2WMytzck"
+    "e5HU4V9S7vA3l7y9gojPtH9GFrUn/hT+PH6zBN7/n9yd/XJy9+r4zXfYtgMTk0/XG3HniN"
+    "3CEYgQV18lBfw9/SdHlhPVKuEv0A3hl0Ui/KM1ZfkA3LJfmkWU68QZs0XBFavZaqiXQHt/"
+    "8cc9NjLzvL8tFdJX1yd/MLRnC3Hn6vbmZ1lcGYKzq9vTBPQwCxGckeankT+HO745o9nox2"
+    "smwDdE1QP5o8pUqDwW8uJqwYZ3MG5tayEkYRn6l9cXH+9Prj/EhuD85P4C7xzF4JdXX32f"
+    "mARhI+T3y/tfCP5J/ry9uWAIOp4/cdkTo3L3fw6wTxosmSPbeRlphrIkyKsSmNjABnOj4s"
+    "DGa/YD2+rAss7j1j/+omxWeOFJ07+8aK4xit1RBACoyQgXnpFLLQ0B9NKScCoaef/bnSiU"
+    "MeaCkj1Ag5KWbWzE+b6meZ45salBfIetp/hupdbT6KqKqXPk5IGavjU7muXinIHstWYv7h"
+    "38l82yS3i+ZutZREGBd5OE4SGirq9m0M19YGX4/+/qATsULzRKEHr5ekwYYXWRt0MaP3Zc"
+    "hjzyQAnriNPVcFTEPSbV/JY/dZ1gMs0RU0AZrlGfM7iTj2cn52xKjpJUl4kDvL02YZfwlb"
+    "8O433PUFLkO+UrKaFwrFZS2HhkqBiaZTF5X6mjlG3g0X5gV3XNJlPtGfQbEBdzblEhFQLa"
+    "cMKN+GVVVki4tEzN+UExPeZTgjnAOH7udZsN6TY4jmX1G7VOuzrOA2uAqB1qX3mhM820yu"
+    "AZVugEmKw3BOgHLBheFUQP3xSBFErlYsruxUGdw47/4sCKP9W8aRlwUxWbAbk6f/kF+gHE"
+    "RfarCsJHx8cFEIZSuQize3GETW8E25H5nLEUnDqw0Gt2ziKr1kuA+wQV14VuKNUxdH+fsm"
+    "0m3KOIputOACuv6ZGom7XU7tPb26uYanB6mdSrH65PL0DEGfxQyOR8Q67GEea+84Xao2fY"
+    "dDMtHbkbW6re6j2uKdjfpDG/lNsb5+MufYbuwVZHn00n8KwFYO8FcA+GApYUwjpfdGVpZP"
+    "vrrRs7pgT31o0dHdhv3rrBdDamlsGGpSpTNa0b6lyRxpORF3oD6kEVeRWkR2GzoMmn8h3/"
+    "1SzwfK7AhjdQMGraMWIQSuQAREc8o6a4tY1h9PwUisqtpnEMRRH4pVETwStoYsMOHiFdqj"
+    "VyqtmGRfn8tUSPGgILm4MiM6RaDWB1xltqYX17mToEFv2p4yJmiJQe9aUhsHTmz2wILu4c"
+    "3W3AwqmoW5o588J1rS5y0Fi3ZqUuu7Qm4JraVTcPnbLQq+A5qGjSNaHH2mtsmkJbOz5L0Y"
+    "Zh+ouR5UxqonUimrpyJi2BBdI2dtwZQ4sy8wzv76a8eKndYu46Y9PKsoCJBm5teu/AP0W3"
+    "jI1O3wfV3mWZ9hfpH2XTFrujsjrewUYY3TJvaOTOq+cNraqKbYk3VL5e0hsaOZPj3lDF45"
+    "l0hqqO0ga8odzWstIdmhe3qT5vuVt0VCKAE1vd5zGYed5H7vnM9ooWq/poX2tzT7hKeaCB"
+    "mR8emuHo/DSQcQks3utzH8DZjpOzt/ruhHEwbfVVVsGCs0WpsTmfyVoCmZp2jbAluBSWSo"
+    "22saxpNm0Cy5TVOg5tGtf3oCfA2P9G1x0Q1jlrNG6I2ku48amClElJUnO+ATB3JnAxCaay"
+    "wmWDme9NqRkCuZQjZti3M9hithU8nzdGtpaYvWo1gYwetB85CQqwx4L1Hu1TEBCPhM4BHO"
+    "+osx4BOk84VpwyBS5sjdSDiooRJtcEHx0ZIjnOjnxKGjdPhaj15LQnpz057UMS+oHNCklQ"
+    "x1UumeXIcqJW24S5UZd506qIsquXwjhVr22UG3eqr1lRWea62gJ1ZWMxDEnOnRK81WpMvn"
+    "t1C4DeSMBNEuTECtol5YaFnmSoMzIkJV+BCeNeVqss2FjWcZ654+MvzRJOHtA6XPIUeKaN"
+    "0bbOfO64Poy5b4J6kdJnmmj00T7TbPIUV24jzQdVnbFjWc7LftCfCdoCjWRsup4/KnsqKF"
+    "6r7VMWKNd7IHvYKVL1bNBaTrJYWgVwY5U6gi32qVvQtn3yqjakHT17BdCUktawQssZOASq"
+    "rDtQZPZU2LcSP25VBNOjfEiPUogCo/ODjKgIhPQCOpoifnE1J6y9ObGF0oCRDwSF8vHO4C"
+    "a8X+/InlIWU8vE/vg70CwT3lreeaauuGOBll4p/8zhYRGZP8wX+cPk+PQ2uZ0w3fQ2uR0d"
+    "2PwY3GrGubzqlexHnTxgsGbDUQrAzZk1Ogl3UZtGnuCVNW4oW9d2nw9hREKNnSZP1HLsCT"
+    "pQ60FfN8HPSgOQxCvHDqTAudwcFAuGL2gWkmBxSw5aXLDWF7TkyNaIYzMBzjMClWri0b7Q"
+    "9GlYBw/Xe56jmygj5MX0p0RjJQnMnigm/mkBl9FkWNAK1Ft8NuWDjmQzDmp+rkWlStvKs5"
+    "hZxIfOllojMolPn1Sxp52F9Qm2XpdajZQabXsn6++1fQxqw2fA1kzTJYGtycwLnrTulKgW"
+    "ZeTK/FztxN3uwN41nVdMIroyurcdn+0H1zECPZOuy1tLqfqcFyrI0kWTrz9inICemTpeNo"
+    "ieVo8Xg9/jMYXhSXP2ug1mOm2lr1fN9BgdjeSNVcjw2PP4byJTffXlSAhzZW/iUSG319ES"
+    "t9dR2u3F0CgBpizfFTCxA+8IPZgcDMkebEKBi7sQelruqGaRC3TXsD/FEtLn/m/OlCjHIN"
+    "Gr7mmmsITpGVJ+TnVY2qwc966sk1RHeaUDUbkVwMO+1YL6/OLs8vrk6tXh8fAokcRRYv42"
+    "Jbi9kr+jSn7vNNyJga2eW1BQYM6UG0snpWgZmycHyXOIepiupKMeFpFPJUNbizKt5CtrQr"
+    "EppquJzCgZGhW88thkCWtEg2m9rEzlR/saI6cxVQuOA/eNcPeJkp2lD5ntvuI1hqeWj5hV"
+    "K7WtNYjvf3kEe9UtRWx7wzpDUPvAzkGTbD/EtXuhncoYF1VdlSpdwbWUpPbe1J6P94pWP7"
+    "C50ZkdcOvWSgO4xpyKa3H4ltBpVS/WViq0AnI2IOJlRDia1G9rKrWxnWfbs0mraDUeYJlK"
+    "69tEOt9W8EHPuBc8zUzfD13jDeQ9TttHVoUSyHyzaw4k6OrquJ4QgwbsUEuCB1Jr4Sqr1K"
+    "hcJAFvf18a8ookrVpd5dG+x2BfDyTf1KdR5IDmxgME+G3V+JWZYyqyJoqW+vRSbVmmwhMG"
+    "5Ul1omqnWDV+6I2n4JWb/osW7foFod8Vwp3WpMTKUmoyxeq0HUzZFK1rOkJV9KUcsvFKbU"
+    "PbhAtozXGqUVdqRlYWzsLfQdEtSn5i83Z1zOo8YiY1wd05B2YS2fi87VLwalyFzGWhhc6c"
+    "ZXwpqbCPtOChsVXe0pLNFDl9JtSP/vzZNpDU/vzZoPeY9Ib1b5zn96fQOnKyp2f37VjQaz"
+    "L7/jTa9p5G476OTCIv/A7LCLz0tRTh7VA2MzpRMHHWFmFfNYBh9bJJe+k2JGNnNaPpAnTc"
+    "m1PdHJu6Stj1ZelE8TBb9CGFPjiy++x+C7Pdhc6/Qd4UCpPdhUXxKJVpj1z6bNIX/AMmhm"
+    "M9w42CwxCLTPupQGDaT7lxaT916FRVo5svQt/5Q1W9urWj6lYfoLYTA5uKVpErdYWBTVRt"
+    "YGSbC+cNfaScd6GHlCVtnjnPnFWV3aK2ZMQlPkvn8jeaMrJEHFPTdpUQsqrfd8lvoGXUla"
+    "+LxJSWZ+p6tH3gd8VKWC8sr7dqtRT3OKxn1vo2csuuAedyyWVXrNTbCHrDy3Jp3At+FqpI"
+    "uP7YtGgT4dTvoZ02dHaGNb7EmsLNGwrMh662FJcfgrRVeY8jmcozXUuBW2G+HoUCXtSGzY"
+    "QpChjxYH1DGzS7rPm+pk953AiLdpbpzdAwnWfQrt4g+2gvfhHLIx/O3w/Jrx9+HpIPNz8z"
+    "Y7aDJmneCmMUfexJt6zTODKjueZPsw3U2bjGKrVtFf0A/ZBhcEzOXoEUvgYhfA0yWPQcWi"
+    "KrV7G0XsvyeqVORgdzy9GMitazWNVOmc8iKwvDHo0ssrsFod8Vs1pWeAou7SX1zqhK+2pn"
+    "Peqydo1TUNfaCmcL5+zWQwqTVFyVps65+5eG78aZ6Cr2VDZ4F9EvHHS7jDSVa6RY4C6228"
+    "ftbgN36uN2o625dyT3/sZvkBj1QbsdCYDsyWYLxrXyfLMP2N2NgN0T3TefTX9x5UwGGQRe"
+    "vb2Uv2ui4MhyJgXpu2ybQJUs4h3wrBwsxQMxuW3CW3g+naVZfI22Hm0Qg3HAKwBM1sI3dU"
+    "8wd8P0sRHT6u2dHePsfDDLGDujGm0z9hPWEzKnLsjcjBpD+XkDEV7HlcfYl6XZZwgrReCu"
+    "56MSmgtTgCNYYggS1doeh3t4MHHGhHfrHdljICPsPIEk+4UjUc34XMj2XOKTEgK9UitJrE"
+    "7b/PDynKENay/vFsEDF/5GF5ReKd15pXQ3VKhwc2DzJdq7Wtegtp/tV4d228m+ZLd3jmUF"
+    "80EW4U8UWU76ZeGRy0oX/YgcdfcNbaGQbZZ5j7oemSGo8B+MjcZUW9OgjPoMI4N6ivzXbO"
+    "/RFglS9qMvY5AX1/RpaOl3nRfepsdExqW64xr4ETqCebtnFLqiE7EtoJ/gL+jOX1BU84ke"
+    "uC40aC0ebYDDAuVDuLgn5jO1xfkr8jo8GQg/o3gr+EOm3tGphfntzmFHsT2mxrDmDYfYjk"
+    "9gjKwFP4koeoMp7zD2A9/cI2/wvOHeHvHYsx9tPp1IJMhk6ljGklR48EJsoWeN46/oPFsi"
+    "LC8d1Byln+nT57WkLYnhS7OcnPNyvPgyarPhtfv+jOAUZ6dA2OQ2wln4QkHUw8nnlsyetw"
+    "RWJDMJ0hjJf5UzoFHttjWf33HtMOVCaQjVxws1Hi/SgsK8npW0oMPjAlrQ4XH+5x6Ok1rQ"
+    "smO42dLcytHbQRr0M74ViDV/iOuxOQ6Xb1Nnz6uAcfNff6h2lqiJI0SVwH6TsSDLQGnZqS"
+    "HsgQxtuyjGDeubVU8LNXNIqHFco261juxWJbNchqnoUwhohYWhaSMJ7g9lvLuyfKuA3rAP"
+    "6SA9lxyBmfxxvwMW3Q6S4QHbspCmK7aK7RnPiqICKkOeWE8DZtqWhq+WcGadGHkw+LaRQR"
+    "XeW462DO1U9QTiY6y/Qcw/BrOZ9AokUcaRUHpaj/DePpxeXZAPdxdnlx8vb2/ipj12k2l4"
+    "4Vdk7y5Orsp9uWOt5g0K7Ho6yLJq8DvDpcaMqMwqC0a+lfXbcRAWtzSvWbXFU3AlPYFKlZ"
+    "YVseIoxhn/cRG1Ckrlc/7jlGKFU6MEiKL4dgK4lu8QwhP9zDDSXz/e3uTxpbBKAsgHG17w"
+    "k2EiHbRMz//cTViXoIhvHXMZpUJJk1Gjw7gvCBs4bXt7+fofgA5jEA=="
+)
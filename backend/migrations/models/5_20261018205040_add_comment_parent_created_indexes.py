@@ -0,0 +1,107 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX IF NOT EXISTS "idx_lead_commen_lead_id_49d4d3" ON "lead_comments" ("lead_id", "created_at");
+        CREATE INDEX IF NOT EXISTS "idx_client_comm_client__c000ca" ON "client_comments" ("client_id", "created_at");
+        CREATE INDEX IF NOT EXISTS "idx_claim_comme_claim_i_3f066a" ON "claim_comments" ("claim_id", "created_at");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_claim_comme_claim_i_3f066a";
+        DROP INDEX IF EXISTS "idx_client_comm_client__c000ca";
+        DROP INDEX IF EXISTS "idx_lead_commen_lead_id_49d4d3";"""
+
+
+MODELS_STATE = (
+    "eJztXVlz27YW/isYvzidkZ3YN+6SN29p3XrJeLntNM6oNAlJHFOkysWuppP/3nOwkOAmcZ"
+    "NIKXxoKpMACH44AL6z4PDfnaljUMvbv3UsuvOB/Ltja1P8Ebs+IDvabBZdxQu+9sRq7LhQ"
+    "gl3Rnjzf1XQfLo40y6NwyaCe7poz33RsLIqNEdYEcenMpR61fdMek8CjLmHtENMm/oQSb+"
+    "75dLqPzRqODu1CsUotPNpYxftAjo2paQ/IXTCj7ovpOe6A3MBPzcdfp5YJDeHTAtv8O6BD"
+    "3xlTaMWFZ37+ApdN26D/wGuKP2fPw5FJLSOGmGlgA+z60J/P2LUL2//ICuKLPA11xwqmdl"
+    "R4Nvcnjh2WNnkfxtTGjlFs3ncDBNIOLEsALrHlPY2K8C4qdQw60gILhwNrp0fjOPCdPdPW"
+    "XTqFlycz15xq7pw803kSdlFfd2wcYeilx158jE/fOzx4/8P7H//3/fsfoQjrYXjlh6/8tS"
+    "NMeEWGzPX9zld2X/M1XoLBG+HJ/p9C9HSiudmQyvIJUKHLSVAlhKtAlUkoduUD2WUytzsg"
+    "u5HU4V9S7vA3l7zdgohPtX+GFrXH/gT+PHq3AN7/H9+e/nJ8++bo3XfYtgMTk0/Xa3HnkN"
+    "3CEYgQV18lBfw9/SdHlhPVKuEv0A3hl0Ui/KM1ZfEA3LBfmkWU68QZsUXBFavZcqgXQHt/"
+    "/sc9NjL1vL8tFdI3V8d/MLSnc3Hn8ub6Z1lcGYLTy5uTBPQwCxGcoeankT+DO745pdnox2"
+    "smwDdE1X35o8pUqDwW8uJywYZ3MG5say4kYRH6F1fnd/fHV59iQ3B2fH+Odw5j8Murb75P"
+    "TIKwEfL7xf0vBP8kf95cnzMEHc8fu+yJUbn7P3ewTxosmUPbeR1qhrIkyKsSmNjABjOj4s"
+    "DGa/YD2+rAss7j1j96VjYrvPCk6c+vmmsMY3cUAQBqMsSFZ+hSS0MAvbQknIhGPv52Kwpl"
+    "jLmgZA/QoKRlaxtxvq9pnmeObWoQ32HrKb5bqfU0uqpi6hw6eaCmb00Pp7k4ZyB7pdnzew"
+    "f/ZbPsAp6v2XoWUVDgXSdheIio65spdHMPWBn+/7t6wA7ECw0ThF6+HhNGWF3k7ZDGjxyX"
+    "IY88UMI65HQ1HBVxj0k1v+VPXCcYT3LEFFCGa9TnDO747vT4jE3JYZLqMnGAt9fG7BK+8t"
+    "dBvO8ZSop8p3wlJRSO5UoKG48MFUOzLCbvS3WUsg082g/sqq7ZZKK9gH4D4mLOLCqkQkAb"
+    "Trghv6zKCgmXlok52y+mx3xOMAcYxy+9brMm3QbHsax+o9ZpV8d5YA0QtUPtKy90qplWGT"
+    "zDCp0Ak/WGAP2ABcOrgujBuyKQQqlcTNm9OKgz2PFfHVjxJ5o3KQNuqmIzIFfnL79AP4C4"
+    "yH5VQfjw6KgAwlAqF2F2L46w6Q1hOzJfMpaCEwcWes3OWWTVeglwn6DiqtANpTqG7u8Tts"
+    "2EexTRdN0JYOU1PRJ1s5bafXJzcxlTDU4uknr1w9XJOYg4gx8KmZxvyNU4wtx3nqk9fIFN"
+    "N9PSkbuxpeot3+Oagv1dGvMLub1xPu7SF+gebHX0xXQCz5oD9l4A92AoYEkhrPNFV5ZGtr"
+    "/eurFlSnBv3djSgf3mrRtMZ2NqGWxYqjJV07qhzhVpPBl6oTegHlSRV0F6FNYLmnwq3/Hf"
+    "TAPP5wpseAMFo6YdIwahRA5AdMQzaopb2xhGz0+hqNxqGsdQFIFfGjURvIQm1uzgEdKlWi"
+    "Mnmm1YlM9fS/SoIbCwOSgyRarVAFanvKUW1rfXiUNg0Z84LmKGSOlRXxoCS2f+zIbg4s7R"
+    "7QYsnIq6pZlTL1zX6iIHjXVrVuqySysCrqlddf3QKQu9Cp6DiiZdEXqsvcamKbS15bMUbR"
+    "imPx9azrgmWseiqUtn3BJYIG0jx50ytCgzz/D+rsuLl9otZq4zMq0sC5ho4Mam9w78U3TL"
+    "WOv0fVDtXZZpP0v/KJu22B2V1fEONsLoFnlDI3dePW9oVVVsQ7yh8vWS3tDImRz3hioez6"
+    "QzVHWUNuAN5baWpe7QvLhN9XmL3aLDEgGc2Ooej8HM8z5yz2e2V7RY1Uf7Spt5wlXKAw3M"
+    "/PDQDEfn5x0Zl8Divb70AZztODl7q+9WGAfTVl9lFSw4W5Qa6/OZrCSQqWnXCFuCS2Gp1G"
+    "gby5pm0yawTFmt49Cmcf0IegKM/W901QFhnbNG44aovYYbnypImZQkNecbAHNrAheTYCor"
+    "XDaY+d6UmiGQCzlihn07gy1mW8HzeWNka4nZq5YTyOhBe5GToAB7LFjv0T4BAfFI6BzA8Y"
+    "466xGg84RjxSlT4MLWSD2oqBhhck3w0ZEhkuPsyKekcfNUiFpPTnty2pPTPiShH9iskAR1"
+    "XOWSWY4sJ2q1TZgbdZk3rYoou3opjFP12ka5caf6ihWVRa6rDVBX1hbDkOTcKcFbrsbku1"
+    "c3AOi1BNwkQU6soF1SbljoSYY6I0NS8hWYMO5lucqCjWUd55k5Pv7SLOHkAa3DJU+BZ9oY"
+    "bevMZo7rw5j7JqgXKX2miUYf7VPNJk9x5TbSfFDVGTmW5bzuBf2ZoA3QSEam6/nDsqeC4r"
+    "XaPmWBcr0LsoedIlXPBq3kJIulVQA3Vqkj2GKfugVt2yevakPa0bNXAE0paQ0rtJyBQ6DK"
+    "ugNFpk+FfSvx41ZFMD3Mh/QwhSgwOj/IiIpASM+hoyniF1dzwtrrE1soDRj5QFAoH+8Mbs"
+    "L79YHsKmUxtUzsj78DzTLhreWdF+qKOxZo6ZXyzxwcFJH5g3yRP0iOT2+T2wrTTW+T29KB"
+    "zY/BrWacy6teyX7UyQMGKzYcpQBcn1mjk3AXtWnkCV5Z44aydW32+RBGJNTYafJELcceow"
+    "O1HvR1E/wsNQBJvHLsQAqci81BsWD4gmYhCRa35KDFBWs9oyVHtkYcmwlwnhGoVBOP9rmm"
+    "T8I6eLje8xzdRBkhr6Y/IRorSWD2RDHxT3O4jCbDwlYghgefEgqz6k1Ba3NOR0IbBzU/Ca"
+    "NSpW2tWkw54kNnSy0emYyoz7bY89HCioaycBVcjZQabbst62/CfXBqw4fDVszfJbOtSdkL"
+    "HsHulKgWperK/Fzu3d3siN8VHWRMIro07LcdZ+4n1zECPZPHy1sLOfyMFypI30WTb+8wgE"
+    "DPzCkvG0QXrMeLwe/RiMLwpMl83QYzvbnSCaymgIzOTPLGKqR+7Hn8N5HCvvpyJIS5spvx"
+    "sJA/7HCBP+ww7Q9jaJQAU5bvCpjYgQ+E7o/3B2QXNqHAxV0IXTC3VLPIOfpx2J9iCek/Ct"
+    "CcjVGOQaJX3dNMYQnTM6T8jOqwtFk5fl9ZJ6mO8kr7onIrgId9qwX12fnpxdXx5ZuDo8Fh"
+    "IrujxPx9SnB7JX9Llfzem7gVA1s96aCgwJwpN5ZnStEy1k8OkgcU9TCPSUddLyLRSoa2Fq"
+    "VgyVfWhGJTTFcTKVMyNCp45ZHJMtmIBtN6WZnKj/YVhlRjDhccB+404X4VJW1LH0vbfcVr"
+    "BE8tH0qrVmpbaxAfBvMI9qpbitjmxnuGoPYRnztNsv0Q1+7FfCpjXFR1Vap0BddSktp7U3"
+    "s+3ita/cDmhm12wK1bKz/gCpMtrsThW0KnVb1YG6nQCsjZgIiXEXFqUr+tqdTGdp5NTzOt"
+    "otV45GUq328TeX5bwQc9417wNDV9P3SNN5AQOW0fWRZKIBPRrjiQoKur42pCDBqwQy0IHk"
+    "ithcusUsNykQS8/T1pyCuSzWp5lUf7HqOAPZB8U59EkQOaGw8Q4LdV41dm8qnImiha6vNO"
+    "tWWZCo8elCfViaqdYtX4BTiem1du+q9atOsXhH5bCHdakxIrS6nJFKvTdjBlU7Su6QhV0Z"
+    "dyyMYrtQ1tEy6gFcepRl2pGVlZOD1/B0W3KPmJzdvlMauziJnUBHfrHJhJZOPztkvBq3EV"
+    "MpeFFjqMlvEJpcI+0oKnyZZ5S0s2U+RYmlA/ah5Mi82t/mhafzStP5rWO1N6FWBjbJX9Ab"
+    "XNOqC2NcR/1cfUSpL+/qDa5h5U426QTI4vXBKLuL10wxSh9FA2M3BRkHTWFmFfQoBh9bL5"
+    "fOk2JJlnNaPpAkzdm1HdHJm6yuX1RSlI8Zxb9PGFPm6y++x+AzPkhX7BnbwpFCbIC4viKS"
+    "vTHrr0xaSv+AdMDMd6gRsFhyEWtPZTgZi1n3JD1n7q0IGrRjdfhL7z5616dWtL1a0+dm0r"
+    "BjYVyCJX6goDm6jawMg2F+kbuk8570LnKUv0PHVeOKsqu0VtyIhLfBbO5W80zWSJEKem7S"
+    "ohZFW/CZPfQMuoK18kiSktL9T1aPvAb4uVsF7EXm/VaikkclDPrPVt5KNdAc7lEtIuWak3"
+    "EfSGl+XSuBf8lFSRSP6RadEmIq0/Qjtt6OwMa3yJFUWiNxSzD11tKWQ/BGmjciVHMpVnup"
+    "YCt8R8PQwFvKgNmwlTFEviwfqGNmh2WfN9TZ/wkBIWCC0zn6FhOs+gXb1B9qFf/IqWRz6d"
+    "fRyQXz/9PCCfrn9mxmwHTdK8FcYo+nRq3bJO48gMZ5o/yTZQZ+Maq9S2VfQT9ENGyDE5ew"
+    "NS+BaE8C3IYNEjaomEX8Uyfi1K+ZU6NB3MLEczKlrPYlU7ZT6LrCwMezSyyO4WhH5bzGpZ"
+    "4Sm4tJfUO6Mq7aud9ajLyjVOQV1rK5wtHMFbDSlMUnFVmjrn7l8Y2RtnosvYU9m4XkS/cD"
+    "zuItJUrpFiMb3Ybu2Q3mjc+4jePqK3j+jtXcw9ZdoMQ0Yfzrtp4bzbQENXH8u7jIn2obzb"
+    "Ecp7rPvmi+nPL53xTga1V28vZPaaKDi0nHFBYi/bJlAli5IHPJUHywtBTG618OaeT6dpfl"
+    "+jrUcbxGAU8AoAkzX3Td0TnN4wfWzEtHpLaMc4Ox/MMmbQqEbbjP2Y9YTMqAsyN6XGQH4T"
+    "QQTecbUy9p1q9lHDSrG5q/kShebCFOAIlhiCRLW2x+EeHkycEeHd+kB2GcgIO886yX7hSF"
+    "QzSxeySpf4DoVAr9RKEqvTNj+8OGNow9rLu0XwKIa/1gWlV0q3XindDhUq3BzYfIn2rtY1"
+    "qM1n+9Wh3XSyL9ntrWNZwWwni/Aniiwm/bLw0GWli355jrp7hjZXyDZL10ddj0wRVPgPxk"
+    "Zjqq1pUEZ9BpGpPUX+a7b3aIusKnvR5zTIq2v6NPQBuM4rb9NjIuNS3XEN/HIdwWTfUwpd"
+    "0YnYFtCD8Bd05y8oqvlED1wXGrTmjzbAYYHyIZzfY/OF2uJkFnkbnhmEn1EkFvwh8/Xo1M"
+    "KkeGewo9geU2NY84ZDbMcnMEbWnJ9RFL3BPHkYFYJv7pF3eBJxd5d47NmPNp9OJBJkMnEs"
+    "Y0H+PHghttCzxvFXdNItEbCXDneOctb0Ofda0pbE8KVZTs5JOl58EbVZ89p9f0pwirPzIW"
+    "xyG+EsfKUg6uHkc0um3FsAK5KZBGmM5L/K6dCodtuaz++4dphyoTSE6uOFGo8XaUFhMtBK"
+    "WtDBUQEt6OAo/xsRR0ktaNEB3WxpbuVQ7k4a9FO+FYg1f4DrsTkKl29TZ8+rgHHzn4yods"
+    "qoicNFlcB+l7EgyxBq2akB7IEMbbsoxg3rm1XPETVzfKhxXKNutY7sRmXAXISp6FMIaIWF"
+    "oWkjCe4PZby7snyrgF6zr+8gPZccgZn8cb8DFt0OkuHR27KQpiu2iu0pz5eiAiqDoVhPA2"
+    "baloavlnBmnRh6MPi2kUEVPlqOtgjtVPUE4iOsv0bM74LpVHoFkijjSCg9rUd4bx5OLs/J"
+    "p9vz04u7i5vruGmP3WQaXvjp2dvz48tyn/tYqXmDArue7GRZNfidwUJjRlRmmQUj38r67T"
+    "gIi1uaV6za4vm4kp5ApUrLilhxFOOM/6iIWgWl8jn/UUqxwqlRAkRRfDMBXMnHC+GJfmYY"
+    "6a93N9d5fCmskgDywYYX/GyYSAct0/O/dBPWBSjiW8dcRqlQ0mTU6CDuC8IGTtreXr7+B7"
+    "E3fXc="
+)
@@ -0,0 +1,111 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX IF NOT EXISTS "idx_leads_assigne_d1b1a1" ON "leads" ("assigned_operator_id", "status", "created_at");
+        CREATE INDEX IF NOT EXISTS "idx_claims_assigne_10d404" ON "claims" ("assigned_operator_id", "status", "created_at");
+        CREATE INDEX IF NOT EXISTS "idx_claims_client__996bd3" ON "claims" ("client_id", "status", "created_at");
+        CREATE INDEX IF NOT EXISTS "idx_claims_assigne_b1b4b6" ON "claims" ("assigned_supervisor_id", "status", "created_at");
+        CREATE INDEX IF NOT EXISTS "idx_claim_files_claim_i_541e00" ON "claim_files" ("claim_id", "uploaded_at");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_claim_files_claim_i_541e00";
+        DROP INDEX IF EXISTS "idx_claims_assigne_b1b4b6";
+        DROP INDEX IF EXISTS "idx_claims_client__996bd3";
+        DROP INDEX IF EXISTS "idx_claims_assigne_10d404";
+        DROP INDEX IF EXISTS "idx_leads_assigne_d1b1a1";"""
+
+
+MODELS_STATE = (
+    "eJztXVlz27YW/isYvzidkZPYt+6SN29p3esl49i3ncYZlSYhCROKVLnY1XTy3+85WEhwk7"
+    "hJlBQ+NJVJHBD8cACcnf/uTV2L2v7rO9eme+/Iv3uOMcUfiesDsmfMZvFVvBAYT5xiz4MW"
+    "/Irx5AeeYQZwcWTYPoVLFvVNj80C5jrYFDsjvAvi0ZlHfeoEzBmT0Kce4f0Q5pBgQok/9w"
+    "M6fY3dWq4J/UKzWj08OkjivyMn1pQ5A/IxnFHvmfmuNyC38NMI8NeZzaAjfFrosL9DOgzc"
+    "MYVePHjmp89wmTkW/QdeU/45+zIcMWpbCcSYhR3w68NgPuPXLp3gPW+IL/I0NF07nDpx49"
+    "k8mLhO1JqJMYypgwOj2H3ghQikE9q2BFxhK0YaNxFD1GgsOjJCG6cDqbOzcRIG7gFzTI9O"
+    "4eXJzGNTw5uTL3Sehl3Sm66DMwyj9PmLj/HpB0eH3//4/U//+eH7n6AJH2F05cev4rVjTA"
+    "QhR+bmfu8rv28EhmjB4Y3x5P/PIHo2Mbx8SFX7FKgw5DSoCsJVoMo5FIfyjuxzntsfkP2Y"
+    "6/AvxXf4W3DefknEp8Y/Q5s642ACfx6/XQDv/07uzn49uXt1/PY77NuFhSmW6428c8Rv4Q"
+    "zEiOuvkgH+nv5TwMspslr4S3Qj+FWTGP94T1k8Abf8l2ET7TpxR3xT8ORuthzqBdDeX/xx"
+    "j51Mff9vW4f01fXJHxzt6Vzeubq9+UU116bg7Or2NAU9rEIEZ2gEWeTP4U7ApjQf/SRlCn"
+    "xLkr5WP+oshdpzoS4uZ2x4B+vWseeSExahf3l98fH+5PpDYgrOT+4v8M5RAn519dUPqUUQ"
+    "dUJ+v7z/leCf5M/bmwuOoOsHY48/MW53/+cejsmALXPouC9Dw9K2BHVVAZOY2HBm1ZzYJG"
+    "U/sZ1OLB88Hv2jL9phhReeDPPLi+FZw8QdjQFANBnixjP0qG0ggH6WE05lJ+//eycb5cy5"
+    "FMkeoEMllq1txsW5Zvg+GzvUIoHL91N8t0r7aXxVx9Q9cotAzd6aHk0Lcc5B9tpw5vcu/s"
+    "tX2SU833DMPEFBg3edAsNDLLq+msIwD0Aqw/9/1wzYgXyhYUqgV6/HmRF2F3U7EuNHrseR"
+    "RzlQwToU4mo0K/Ie52pxK5h4bjieFLApoAzXaCAkuJOPZyfnfEkO06IuZwd4e2PML+Erfx"
+    "0kx56jpKh3KlZSIuZYrqTw+chRMQzb5vy+VEep2sGj88CvmoZDJsYz6DfALmxmU8kVEtpo"
+    "wQ3FZZ1XSLS1TNjsdTk95lNKcoB5/NzrNmvSbXAeq+o3Ok23Os4D74DoA+peeaFTg9lV8I"
+    "wINgJMPhoC4gdsGH4dRA/floEUWhViyu8lQZ3Bif/iwo4/MfxJFXAzhO2AXF9++RXGAYKL"
+    "GlcdhI+Oj0sgDK0KEeb3kggzfwjHEXvO2QpOXdjoDadgk9XpUuA+AeGq0I24OoHu7xN+zE"
+    "RnFDFM0w1h52U+iYfZSO0+vb29SqgGp5dpvfrh+vQCWJzDD42YkDfUbhxjHrhfqDN8hkM3"
+    "19JReLBl6JafcW3B/jaL+aU63oQ87tFnGB4cdfSZuaFvzwF7P4R7MBWwpRA++LI7SyvHX2"
+    "/d2DEluLdu7OjEfvPWDa6zcbUMDixdmWpo3dDXijKeDP3IG9AMqtiroDwK6wVNPVWc+K+m"
+    "oR8IBTa6gYzR0I6RgFAhByC68hkN2a1rDOPnZ1DUbrWNY8SKIF9aDRG8gi7W7OCR3KVbIy"
+    "eGY9lUrF9bjqglsLA7aDJFUasFrM5ETx3sby8Tl8CmP3E9xAyRMuOxtASWyf2ZLcElnKO7"
+    "DVi0FE3bYFM/2teaIgedbdaqNNWQVgRcW6fq+qHTNnodPBcVTboi9Hh/rS1T6GvHVynaMF"
+    "gwH9ruuCFaJ7KrK3fcEVjAbSPXm3K0KDfPiPGuy4uXOS1mnjtidp4FTHZw69B7F/4pe2Ss"
+    "dfk+6PYumzlflH+UL1scji7ViQG2ItEt8obG7rxm3tC6qtiWeEPV66W9obEzOekN1TyeaW"
+    "eo7ihtwRsqbC1L3aFFcZv68xa7RYcVAjix1wMRg1nkfRSez3yvaDnSR+famPnSVSoCDVhx"
+    "eGiOo/PTnopL4PFen/sAzm6cnL3VdyeMg1mrr7YLllwtGsX6fCYrCWRq2zXCt+BKWGoUXW"
+    "PZ0GzaBpYZq3US2iyu70FPgLn/L111QNjGWaPxQDReooNPZ6RckSSz5lsAc2cCF9Ngajtc"
+    "PpjF3pSGIZALZcQc+3aOtJhvBS+WG2NbS8JetVyAjB90EDsJSkiPJekenVNgEJ9EzgGc73"
+    "iwPgFxngishMgUenA0Uh8INSNMoQk+ThkiBc6OYpE0aZ6KUOuF01447YXTPiShn9i8kAR9"
+    "XtWWWU1YTlF1LTC36jJvWxXRTvVKGGfouka5daf6ihWVRa6rLVBX1hbDkJa5M4y3XI0pdq"
+    "9uAdBrCbhJg5zaQTdJueGhJznqjApJKVZgoriX5SoLdpaXzjNzA/xl2NLJA1qHR55CnzkY"
+    "bevOZq4XwJwHDNSLjD7TRqePzpnhkKekchtrPqjqjFzbdl8OwiY5QQPyKfa1p5gBlkgQch"
+    "w1uj6LaF06zIh5fjCsmkeUpOo6LwNXwj5wKw6K1M0mWknui23UADdBtCHY4pg2C9quc7Ua"
+    "Q7qh2VoATSVujQg6rtkhUeXDgSbTp9LemGSCVhlMj4ohPcogGh9wWUgvYKAZUTGpGEXU62"
+    "NbaA0YBSDSUDHfOdKMGNc7sq+1xWI0iT/+Dg2bwVurO8/Uk3ds0OtrVaw5PCzD84fFLH+Y"
+    "np/eircTxp7eirejE1sctVvPnFdEXsvitJEpCSs2NWUAXJ8hZCPhLmsFKWK8quYQ7eja7o"
+    "wSLkjo0dbkidquM0aXazPom5YEWmoyUngVWI40OBcbkBLh8yUNSQosYftBGw1SfUHbj+qN"
+    "uA5n4CKzUaUuHp0Lw5xENJiO7/uuyZBHyAsLJsTgLQmsnjiK/mkOl9HIWNpuxPEQS6I3BX"
+    "Xhzo6ZNglqcdlGjaRrrVouORLAYCttHrkSUV+fsZdHSysa2sZVcjfSKLp2dDY/hPtw1pbT"
+    "yVYsvyvJtqHIXjJpe6NYtayorq3P5f7g7Y4RXlHqYxrRpYHC3bh/P3iuFZq5cry6tVCGn4"
+    "lGJcV32eWbjxhyYOZWoVcdotPWF83g92hEYXqywnzTDnP9v8ptrBeNjLMsRWc1ikX2cvw3"
+    "UfS+/nYkmbm2m/GolD/saIE/7CjrD+NoVABTtd8UMHEA7wh9PX49IPtwCIUenkLogrmjhk"
+    "0u0I/D/5RbSP8ZgfZsjGoOUqPaPM0UtjAzh8vPqQlbm13g91U0aXVUEL2WxJ0AHo2tEdTn"
+    "F2eX1ydXrw6PB0epepAK8+8zjNsr+Tuq5PfexJ2Y2PplCqUILCTl1ipTaVrG+oWDdEqjGV"
+    "U+2VDXiyzNkqOtxUVbipU1qdiU09VkkZUcjQpeecR47RvZYVYvq0L86FxjEDZWfcF5EE4T"
+    "4VfRCr30Ffk3X/EawVOrh9LqRF1rDfJTYj7BUW2WIra98Z4RqH3E516b0n6E6+bFfGpzXF"
+    "Z11Ug2BddKnNp7U3t5vFe0+oktDNvcALduo4qCKyzPuBKHbwWdVvdibaVCKyHnEyJfRsap"
+    "Kf22oVKbOHm2vTC1jlbrkZeZCsFtVAbuBB/0jPvh05QFQeQab6GEctY+siyUQJWuXXEgwa"
+    "bujqsJMWjBDrUgeCCzFy6zSg2rRRKI/g+UIa9M/avlJI/OPUYB+8D5zJzEkQOGlwwQELd1"
+    "41duuarYmih76itVdWWZilIPqgvVKdKNkqrxm3Gimq869F+M+NQvCf2uCNxZTUruLJUWU4"
+    "Km62DKtsS6tiNU5ViqIZsk6hraNlxAK45TjYfSMLKydEH/DWTdssJPYt0uj1mdxZJJQ3B3"
+    "zoGZRja5bjcpeDWpQhZKoaWS0XI+ulTaR1oym2yZt7RiN2XS0qT60TAxLbG2+tS0PjWtT0"
+    "3rnSm9CrA1tso+QW27EtR2RvBfdZpaRaG/T1Tb3kQ14QbJlfGlS2KRbK/cMGVEemibG7go"
+    "hXTeF+HfToBp9fPl+cp9KGGeU8bLBSR1f0ZNNmKmLsubi4qWYp5b/LmGtVYtTVBkKgsX0y"
+    "TWcV8QtVNVYwvL9UVOyr2i9RxV64uaYsoXc4YefWb0Bf+AVeraz3Cj5DQkIuh+LhFA93Nh"
+    "/NzPG5T91aokgNBvfPJXr/vtqO7XB9LtxMRmomrUTl1jYlOkLcxse2HHkS9XCIHoyeVVp6"
+    "fusxDxqh5RWzLjCp+Fa/kbrXlZId6qbSNPsRxfFfN2vm3THuraB1USGtQz9XzaPfC7YrJs"
+    "Fj7Ym9g6is8cNLOxfRvFcVeAc7XquEt26m0EveVtuTLuJb+EVSatYMRs2kbY93vopwudnW"
+    "ONL7GisPiWEghgqB3lD0QgbVXh5piniuzoiuGW2NKHEYOXNahzZooDW3zY39Agzi8bQWCY"
+    "ExHfwqOyVRk2tJIXWdfrd8i/U4wfAfPJh/P3A/Lbh18G5MPNL9yy7qJ9XPTCJYoKMTKIi9"
+    "g4wpntGlZvuF73l7xsOpwZwSTfdp2Pa4Koa4PpBxiHiuTjLPgKGPQN8OcbYM+yqXSpwmTl"
+    "KpMtKk2WSe7W2TsD9TLDWoJ0oyxrsQGGY4/2FzXcktDvisUtL4wm3t1Kq6QxSfcaaTOpZu"
+    "XKqJRqG+uiHaQKrkZeTEvpOjdtXFjCwgjkpJC6TLCqGn+M6JeOG14kT1XrpFzsMfbbOPQ4"
+    "nvc+HKCPPO4jj3vvcy8ybYeNow873raw410QQ1cfc7xMEu1Djncj5PjEDNgzC+ZX7ngvR7"
+    "TXby+U7A3ZcGi745KCveqbAEmeSB6KkiO8fgVhwmrhz/2ATrPyfYO+Hh1gg1EoCAAmex4w"
+    "05cyvcUC7ITZZY2kvcy+rmoXZn7kaLEZNKboWmI/4SMhM+oBz02pNVDfbpAxeUKtTHxPm3"
+    "98sVbY7mq+mGF4sAQEghWmIEXW9Tzcw4OJOyJiWO/IPgcZYRfVMfkvnIl6ZulSVukK38uQ"
+    "6FXaSRI0XcuHl+ccbdh7xbAIpowEa91QeqV055XS3VChosOBr5f47Opcg9p+ab8+tNsu7C"
+    "vp9s617XC2lyfwp5osFvpV46HHW5f9Qh71DixjrgnbvKwg9XwyRVDhP5gbg6u2zKJc9BnE"
+    "pvaM8N+wv0dHVn85iD/7QV48FtDIB+C5L6JPn7OMR03Xs/ALewSLkk8pDMUk8lhAD8JfMJ"
+    "y/oKkREDP0POjQnj86AIcNyod0fo/ZM3Vk0hZ5E+U2ws84SAv+UHWFTGpj8b5zOFEcn6sx"
+    "vHvLJY4bEJgjey5yKeVosJ4fBozgm/vkLWZM7u8Tnz/70RHLicSMTCaubS2o8wcvxDd63j"
+    "n+ipPg0lmTmUjouLZOXxuwI21JTl9WyilIshPNF4k2a967788ILnGeOsIXtxWtwhcKrB4t"
+    "Pq9iacAFsKIwkxIaY/6vkzgaU3et+fyOewdTG6UlVR8/0nj8WAuKipbW0oIOj0toQYfHxd"
+    "+yOE5rQYtyd/O5uZN83b0s6GfiKJB7/gD3YzaKtm9m8ufVwLj9T1vUS0BqI++oFthvczZk"
+    "FV2tBjWAM5Cj7ZTFuGV9s26KUTuZRa3jGg+rc2S3qlLnIkzlmCJAa2wMbRtJ8Hyo4t1V7T"
+    "sF9IZ/JQjFcyUjcJM/nncgRXeDZJSVWxXSLGGn2J6Jui46oCoYio805KZtZfjqCGc+iKEP"
+    "k+9YOaLCe9s1FqGdIU8hPkL6NWL+MZxOlVcgjTLOhDbSZgLv7cPp1QX5cHdxdvnx8vYmad"
+    "rjN7mGF30i9+7i5KraZ0lWat6gIF1P9vKsGuLOYKExI26zzIJRbGX9dhyE5S3NK1ZtMXWu"
+    "oidQI+lYESuPYlLiPy6jVkGrYpn/OKNY4dKoAKJsvp0AruQji/DEIDeM9LePtzdF8lJEkg"
+    "LywYEX/GQxFAdt5gefNxPWBSjiWydcRplQ0nTU6CDpC8IOTrs+Xr7+H0xoyIc="
+)
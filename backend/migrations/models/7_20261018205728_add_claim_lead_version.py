@@ -0,0 +1,109 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "leads" ADD "version" INT NOT NULL DEFAULT 1;
+        ALTER TABLE "claims" ADD "version" INT NOT NULL DEFAULT 1;
+        COMMENT ON COLUMN "leads"."version" IS 'Incremented by every update; compare-and-swap token behind ETag/If-Match';
+COMMENT ON COLUMN "claims"."version" IS 'Incremented by every update; compare-and-swap token behind ETag/If-Match';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "leads" DROP COLUMN "version";
+        ALTER TABLE "claims" DROP COLUMN "version";"""
+
+
+MODELS_STATE = (
+    "eJztXVlz27YW/isYvzidkZ3YN+6S++QtrVsvGS+3ncYZFSYhiWOKVLnY1XTy3+85WEhwk0"
+    "iREiWFD01lEgDBD9t3Vv67M3ZNZvv7t67Ndj6Qf3ccOsYfies9skMnk/gqXgjoE6+x40EJ"
+    "foU++YFHjQAuDqjtM7hkMt/wrElguQ4WxcYIb4J4bOIxnzmB5QxJ6DOP8HaI5ZBgxIg/9Q"
+    "M23sdmTdeAdqHYQi08OljF/0COzbHl9MhdOGHei+W7Xo/cwE8a4K9T24KG8GmhY/0dsn7g"
+    "Dhm04sEzP3+By5Zjsn/gNeWfk+f+wGK2mUDMMrEBfr0fTCf82oUTfOQF8UWe+oZrh2MnLj"
+    "yZBiPXiUpbog9D5mDHGDYfeCEC6YS2LQFX2IqexkVEF7U6JhvQ0MbhwNrZ0TgOA3fPcgyP"
+    "jeHlycSzxtSbkmc2TcMu6xuugyMMvfT5iw/x6XuHB+9/eP/jf75//yMU4T2MrvzwVbx2jI"
+    "moyJG5vt/5yu/TgIoSHN4YT/7/DKKnI+rlQ6rKp0CFLqdBVRAuA1U+Q7ErH8gun3O7PbIb"
+    "zzr8S807/C1m3m5JxMf0n77NnGEwgj+P3s2A93/Ht6e/HN++OXr3HbbtwsIUy/Va3jnkt3"
+    "AEYsT1V8kAf8/+KZjLqWoL4S/RjeBXRWL84z1l9gDc8F/UJtp14g74puDJ3Ww+1DOgvT//"
+    "4x4bGfv+37YO6Zur4z842uOpvHN5c/2zKq4NwenlzUkKeliFCE6fBlnkz+BOYI1ZPvrJmi"
+    "nwTVl1X/1YZCksPBbq4vyJDe9g3jj2VM6EWehfXJ3f3R9ffUoMwdnx/TneOUzAr66++T61"
+    "CKJGyO8X978Q/JP8eXN9zhF0/WDo8SfG5e7/3ME+Udgy+4772qemtiWoqwqYxMCGE3PBgU"
+    "3W7Aa21YHlncejf/CsHVZ44Ykaz6/UM/uJO9oEAGrSx42n7zGbIoB+diacyEY+/nYrC+WM"
+    "uaRkD9CgomUrG3FxrlHft4YOM0ng8v0U363Sfhpf1TF1D90iULO3xofjQpxzkL2izvTexX"
+    "/5KruA51PHyCMKGryrJAwPMXV9M4Zu7gErw/9/Vw/YnnyhforQq9fjkxF2F3U7ovED1+PI"
+    "Iw9UsPYFXY1GRd7js1rcCkaeGw5HBdMUUIZrLBAM7vju9PiML8l+mury6QBvT4f8Er7y11"
+    "6y7zlCinqnYiElmhzzhRQ+HjkiBrVtPt/nyihVG3h0HvhVgzpkRF9AvoHpYk1sJmeFhDZa"
+    "cH1xWZ8rJNpaRtZkv5wc8znFHGAcv3SyzYpkGxzHqvKNXqddGeeBN0D0DrUvvLAxtewqeE"
+    "YV1gJM3hsC9AM2DH8RRA/elYEUShViyu8lQZ3Aif/qwo4/ov6oCriZis2AvDh/+QX6AcRF"
+    "9WsRhA+PjkogDKUKEeb3kghbfh+OI+slZys4cWGjp07BJqvXS4H7BBWXhW40qxPo/j7ix0"
+    "x0RhFqGG4IO6/lk7ibtcTuk5uby4RocHKRlqsfrk7OYYpz+KGQJfiG2o1jzAP3mTn9Fzh0"
+    "czUdhQdbpt78M64p2N9lMb9Qx5vg4x57ge7BUcdeLDf07Slg74dwD4YCthTCO192Z2nk+O"
+    "u0G1smBHfajS0d2G9eu8FlNi6WwYGlC1M1tRv6WlHKk74fWQPqQRVbFZRFYbWgqaeKE//N"
+    "OPQDIcBGN3Bi1NRjJCBUyAGIrnxGzenWNobx8zMoareaxjGaisAvzZoIXkITKzbwyNmlay"
+    "NH1DFtJtavLXvUEFjYHBQZI9VqAKtT0VIL+9vryCWw6Y9cDzFDpIy4Lw2BZXB7ZkNwCePo"
+    "dgMWLUXDptbYj/a1ushBY+u1Kg3VpSUB19SpunrotI1eB89FQZMtCT3eXmPLFNra8lWKOg"
+    "wrmPZtd1gTrWPZ1KU7bAksmG0D1xtztBhXz4j+rsqKlzktJp47sOw8DZhs4MZh9y78U/bI"
+    "WOnyfdD1XbblPCv7KF+22B2d1YkONsLoZllDY3NePWvooqLYhlhD1eulraGxMTlpDdUsnm"
+    "ljqG4obcAaKnQtc82hRX6b+vNmm0X7FRw4sdU94YNZZH0Uls98q2i5qo/OFZ340lQqHA2s"
+    "YvfQHEPn5x3ll8D9vb50DpztGDk7re9WKAezWl9tFyy5WrQaq7OZLMWRqWnTCN+CK2Gp1W"
+    "gby5pq0yawzGitk9Bmcf0IcgKM/W9s2Q5ha6eNxgORvkYHnz6RcilJZs03AObWOC6mwdR2"
+    "uHwwi60pNV0gZ3LEHP12DlvM14IX88ZY15LQV80nkPGD9mIjQQn2WLLeo3MCE8QnkXEAxz"
+    "vurE+AzhOBlaBMoQdHI/OhoqaEKVTBxyFDpMDYUUxJk+qpCLWOnHbktCOnnUtCN7B5Lgn6"
+    "uKotsxpZTtVqmzA3ajJvWhTRTvVKGGfqtY1y40b1JQsqs0xXGyCurMyHIc25MxNvvhhTbF"
+    "7dAKBX4nCTBjm1g66TcMNdT3LEGeWSUizARH4v80UWbCwvnGfiBviL2tLIA1KHR55C33LQ"
+    "29adTFwvgDEPLBAvMvJME40+OqfUIU9J4TaWfFDUGbi27b7uhXVignrkc2xrT00GWCJByH"
+    "HU6nVRRKuSYQaW5wf9qnFEyVptx2XgStiF2YqdIotGEy0l9sWmC4CbqLQm2GKf1gvatmO1"
+    "akO6ptFaAE2l2RpVaDlnh0SVdweKjJ9KW2OSAVplMD0shvQwg2h8wGUhPYeOZqhiUjCKaq"
+    "9u2kJpwCgASsPEeOewGdGvD2RXK4vJaBJ//B1S24K3VndemCfv2CDXL5Sx5uCgzJw/KJ7y"
+    "B+nxqR7D1Ur01kF2IPToracpYdCvKREaqP+iA9uEemyPOuae/0onIngLuN4InkLO7+nw7c"
+    "Vg74oGxqgdVUGnPd0KJVunPd3SgS32ll5MjVpUfaEtdC1DQZas4ssAuDoF1FrCXVb7VDTx"
+    "qqqhtKNrsyN5OIHTvdyBFdiuM0RTdz3o66ZimquqU3gVaOw0OGcr7hJhCyUVeAosoXND3R"
+    "jWekadm2qNuA6fwEXqukpNPDrn1BhFdTANgu+7hoVzhLxawYhQXpLA6omjF4AIUq7cLa2v"
+    "43iIJdGp4NpwI4gnbRLU4nSZWpW2tRlyyZEAOltp88hlRF1ezI6PlhY0tI2r5G6k1WjbwF"
+    "z/EO7ciBsO41syf1fMtiZlLxksv1ZTtSxV19bnfDv8ZvtmLynkNI3oXAftdszunzzXDI1c"
+    "Hq9uzeTwE1GoJH2XTb69Q1cPIzf7v2oQjeW+KAa/BwMGw5Ml83UbzLW7K3O9nqwzjm4VjS"
+    "2QpLPj8d/ExwYW347kZF7YvHtYyg55OMMOeZi1Q3I0KoCpyq8LmNiBD4TtD/d7ZBcOodDD"
+    "UwhNX7eM2uQc7Wf8T7mFdJ9vaE7HqMYg1av1k0xhCzNyZvkZM2Brswvs7apOWhwVlfZl5V"
+    "YAj/pWC+qz89OLq+PLNwdHvcNUHk6F+fvMxO2E/C0V8jtr4lYM7OLpISUFFky5sYxgmpSx"
+    "enKQDiU1oowza2p6kSlxcqS1OFlOsbAmBZtysppMbpMjUcErDyyec0g2mJXLqlR+dK7Q+R"
+    "2z7eA4CKOJsKtoCXa6LyGsv+A1gKdWd2HWK7UtNchPuPkEe7Vegtjm+tlGoHaetjtNsv0I"
+    "1/XztdXGuKzoqlVZF1wrzdTOmtrx8U7Q6ga20G1zDcy6tTI5LjEt5lIMvhVkWt2KtZECrY"
+    "ScD4h8GemnpuTbmkJt4uTZ9ITgOlqNe15mMjM3kZG5FXzQMu6HT2MrCCLTeAOpq7P6kXmu"
+    "BCpl8JIdCdZ1d1yOi0EDeqgZzgOZvXCeVqpfzZNAtL+nFHll8o7Nr/Lo3KMXsA8z3zJGse"
+    "cA9ZIOAuK2rvzKTRMWaxNlS12GsLY0U1HoQXVSnaq6Vqwav9UnsiirQ/+Vxqd+Sei3hXBn"
+    "JSm5s1RaTIk6bTtTNkXrmvZQlX2phmyyUtvQNmECWrKfatyVmp6VpT+ksIZTtyz5Sazb+T"
+    "6rk5iZ1AR36wyYaWST63adnFeTImQhCy0VjJbzsavSNtKS0WTzrKUVmykTlibFj5qBaYm1"
+    "1YWmdaFpXWhaZ0zpRICN0VV2AWqbFaC2NcR/2WFqFUl/F6i2uYFqwgySy/GlSWIWt1dmmD"
+    "KUHsrmOi5Kks7bIvybFTCsfj6fr9yGIvO8ZrxcgKn7E2ZYA8vQubwxK1ksxrnFn8lYabbY"
+    "RI1MRufiOol13CWibVXU2MA0iZGRcqdoPUdZEqOiGPJlOX2PvVjsFf+AVeraL3Cj5DAkPO"
+    "h+KuFA91Oh/9xPaxT91SgTQOjXPviryzvZjhTRydxbKnN3DoxbMbAZbyZ1Qi4wsKmqDYxs"
+    "c+7ekQ1dkG+0oPMs62P3RVDrqtRgQ0Zc4TNzLX+juUYr+Lk1fSwWy09VMW/mW07Noa59QC"
+    "ghuSKdYu0Dvy2q4npum51qsyW/2F493ea3kZR4CThXy0o8Z6feRNAb3pYr417yy29lwjkG"
+    "ls2acLf/CO20oSvhWONLLCkcoaHADehqS3EbEUgblTA7nlNF9gs14ebYMPrRBC9ryOCTKX"
+    "Yo8mF/Q0MEv0yDgBoj4VfEveFV+ju0ThRZNRZvkH+XGz9655NPZx975NdPP/fIp+ufuUXD"
+    "RbuEaIUzigq+SYiL2DjCie1SszMYrPrLdTbrT2gwyrcZ5OOaqNS2ovoT9EN5UPIp+AYm6F"
+    "uYn29hepYNYUwlhCuXEW5WSrhMUL0+vTNQz1OsJaqulWYtVsBw7FH/orpbEvpt0bjluS/F"
+    "u1tpkTSu0r5EWo/VLF0Ylay2tizaQojmcvhimqXrs2nt3EFmen4nSeo8YlXV7xvRL+2vPY"
+    "tPVWuknM83tlvb5Tse984No/P47jy+O+tzR5k2Q8fRuXtvmrv3NtDQ5ft6z2Oinav3drh6"
+    "HxuB9WIF00t3uJND7fXbM5k9lQX7tjssSexV2wSq5FHyUKR64XlDiCW0Fv7UD9g4y+9rtP"
+    "XowDQYhKICwGRPA8vwJac3rQAbseyyStKOs68qy4iR77FbrAaNa7TN2I95T8iEeTDnxszs"
+    "qW9mSJ88IVYmvh/PP3q5kLv0cr5UQj1YAgLBCkOQqtb2ONzDg4k7IKJbH8guBxlhF1lJ+S"
+    "8cicXU0qW00hW+UyLRq7STJOq0zQ8vzjjasPeKbhEM1QlWuqF0QunWC6XbIUJFhwNfL/HZ"
+    "1boEtflsf3FoN53sK3Z769p2ONnJI/ypIrNJvyrc93jpsl8mZN6eSaca2ebpHJnnkzGCCv"
+    "/B2FAu2lom49SnF6vaM+S/ZnuPjsy6sxd/boW8elbAIhuA576KNn0+ZTxmuJ6JXzYkmAx+"
+    "zKArBpHHAloQ/oLu/AVFaUCM0POgQXv66AAcNggf0vg9tF6YI4PlyNsophR+xk5a8IfK52"
+    "QwG5MmnsGJ4vhcjOHNmy5x3IDAGNlTEcMqe4N5FNFhBN/cJ+8wUnV3l/j82Y+OWE4knshk"
+    "5NrmjPyK8EJ8o+eN4684+DAdrZrxhI5zGnU5GVuSluTwZVlOQXCjKD6L2qx4774/JbjEee"
+    "gIX9xmtApfGUz1aPF5FVMyzoAVyUyKNMbzPyvyzA/YjWu3Lfn8jnuHpTZKU4o+fiTx+LEU"
+    "FCWLXUgKOjgqIQUdHBV/Q+QoLQXNipnOn82txEnvZEE/FUeB3PN7uB9bg2j7tgz+vAUwbv"
+    "6TIosFIDURd7QQ2O9yNmTlXa061YMzkKPtlMW4YXlz0RCjZiKLGsc17lbryG5UhtRZmMo+"
+    "RYAusDE0rSTB86GKdVeVbxXQa/51JqTniiNwlT+ed8Ci20EyisqtCmm2YqvYnop8Ojqgyh"
+    "mK9zTkqm2l+GoJZ96Jvg+D75g5VOGj7dJZaGeqpxAfYP0VYn4XjsfKKpBGGUdC62k9wnvz"
+    "cHJ5Tj7dnp9e3F3cXCdVe/wml/CiTxPfnh9fVvsczFLVGwzY9WgnT6sh7vRmKjPiMvM0GM"
+    "Va1m/HQFhe07xk0bYwpUyxQFCcU2bVglh5FJOM/6iMWAWlijn/UUawwqVRAURZfDMBXMrH"
+    "LeGJQa4b6a93N9dFfCmqkgLywYEX/GxaSAdtyw++rCesM1DEt06YjDKupGmv0V7SFoQNnL"
+    "R9vHz9P5ehuYo="
+)
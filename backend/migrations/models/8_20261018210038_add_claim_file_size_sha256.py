@@ -0,0 +1,111 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "claim_files" ADD "size" BIGINT;
+        ALTER TABLE "claim_files" ADD "sha256" VARCHAR(64);
+        COMMENT ON COLUMN "claim_files"."size" IS 'File size in bytes';
+COMMENT ON COLUMN "claim_files"."sha256" IS 'SHA-256 hex digest of the file contents';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "claim_files" DROP COLUMN "size";
+        ALTER TABLE "claim_files" DROP COLUMN "sha256";"""
+
+
+MODELS_STATE = (
+    "eJztXVlz27YW/isYvzidkRNbibPdJ3lJ4tZLxsttp3FGhUlI4oQiFS52dDv57/ccLNwpkS"
+    "IlSgofmsokDgh+OADOzn93xrbOTPf5tW2ynffk3x2LjvFH7HqH7NDJJLyKFzz6wCl2HGjB"
+    "r9AH13Oo5sHFATVdBpd05mqOMfEM28Km2BnhXRCHTRzmMsszrCHxXeYQ3g8xLOKNGHGnrs"
+    "fGz7Fb3dagX2i2UA/3FpK470lPHxtWh9z4E+Y8Gq7tdMgV/KQe/jo2DegIn+Zbxnef9T17"
+    "yKAXB5755StcNiyd/YDXlH9OvvUHBjP1GGKGjh3w631vOuHXzizvA2+IL/LQ12zTH1th48"
+    "nUG9lW0NoQYxgyCwfGsHvP8RFIyzdNCbjCVow0bCKGGKHR2YD6Jk4HUqdno+d79p5haQ4b"
+    "w8uTiWOMqTMl39g0Cbuk12wLZxhG6fIXH+LT97oHr968evvy9au30ISPMLjy5qd47RATQc"
+    "iRubzd+cnvU4+KFhzeEE/+/xSixyPqZEOq2idAhSEnQVUQLgNVzqE4lPdkl/PcbofshlyH"
+    "fym+w9+C83YLIj6mP/oms4beCP483J8B739718efetfPDvd/w75tWJhiuV7KO11+C2cgRD"
+    "z6Kingb9mPHF5OkC2Ev0Q3gF81CfEP95TZE3DFf1GTRK4Te8A3BUfuZvOhngHt7elft9jJ"
+    "2HW/m1FIn130/uJoj6fyzvnV5UfVPDIFx+dXRwnoYRUiOH3qpZE/gTueMWbZ6McpE+Drkv"
+    "S5+rHIUlh4LtTF+YwN76BfWeZUcsIs9M8uTm9uexefY1Nw0rs9xTvdGPzq6rPXiUUQdEL+"
+    "PLv9RPBP8vfV5SlH0Ha9ocOfGLa7/XsHx0Rhy+xb9lOf6pEtQV1VwMQm1p/oC05snLKd2E"
+    "Ynlg8ej/7Bt8hhhRceqPbtiTp6P3YnwgAgmvRx4+k7zKQIoJvmhCPZyYc/rmWjjDmXItkd"
+    "dKjEspXNuDjXqOsaQ4vpxLP5forvVmo/Da9GMbW7dh6o6Vvj7jgX5wxkL6g1vbXxX77Kzu"
+    "D51NKyBIUIvKsUGO5C0fXZGIa5B1IZ/v+3asB25Av1EwK9ej3OjLC7qNuBGD+wHY48yoEK"
+    "1r4QV4NZkfc4V4tb3six/eEoh00BZbjGPCHB9W6Oeyd8SfaToi5nB3h7OuSX8JV/duJjz1"
+    "BS1DvlKykBc8xXUvh8ZKgY1DQ5v8/VUcp2cG/d8asatciIPoJ+A+xiTEwmuUJCGyy4vrgc"
+    "5RUSbC0jY/K8mB7zJSE5wDx+bXWbFek2OI9l9ZsoTbM6zh3vgEQH1LzywsbUMMvgGRCsBZ"
+    "h8NATED9gw3EUQPdgvAim0ysWU34uDOoET/8mGHX9E3VEZcFOE9YC8uPzyCcYBgosa1yII"
+    "dw8PCyAMrXIR5vfiCBtuH44j4zFjKziyYaOnVs4mG6VLgPsAhMtCN+DqGLp/jvgxE5xRhG"
+    "qa7cPOa7gkHGYltfvo6uo8phocnSX16ruLo1NgcQ4/NDKEvKF24xBzz/7GrP4jHLqZlo7c"
+    "gy1FN/+Mqwv2/TTmZ+p4E/K4wx5heHDUsUfD9l1zCti7PtyDqYAthfDBF91Zajn+WuvGli"
+    "nBrXVjSyf2l7ducJ2Nq2VwYEWVqYrWjehaUcaTvht4A6pBFXoVlEdhtaCpp4oT/9nYdz2h"
+    "wAY3kDEq2jFiECrkAERbPqMiuzWNYfj8FIqRW3XjGLAiyJd6RQTPoYsVO3gkd0WtkSNq6S"
+    "YT69eUI6oJLOwOmoxR1KoBq2PRUwP729PIJrDpj2wHMUOktHAsNYGlcX9mTXAJ5+h2AxYs"
+    "Rc2kxtgN9rWqyEFn67UqNTWkJQFX16m6eugiG30UPBsVTbYk9Hh/tS1T6GvLVynaMAxv2j"
+    "ftYUW0erKrc3vYEFjAbQPbGXO0GDfPiPGuyouXOi0mjj0wzCwLmOzgymK3NvxT9MhY6fK9"
+    "i9q7TMP6pvyjfNnicKJSnRhgLRLdLG9o6M6r5g1dVBXbEG+oer2kNzR0Jse9oRGPZ9IZGn"
+    "WU1uANFbaWue7QvLjN6PNmu0X7JQI4sdc9EYOZ530Uns9sr2gx0nvrgk5c6SoVgQZGfnho"
+    "hqPzy46KS+DxXl/bAM5mnJyt1XcrjINpq29kFyy4WiIUq/OZLCWQqW7XCN+CS2EZoWgay4"
+    "pm0zqwTFmt49Cmcf0AegLM/R9s2QFha2eNxgORPgUHX5SRMkWS1JqvAcytCVxMghnZ4bLB"
+    "zPemVAyBnCkjZti3M6TFbCt4vtwY2lpi9qr5AmT4oL3QSVBAeixId28dAYO4JHAO4HyHg3"
+    "UJiPNEYCVEJt+Bo5G5QBgxwuSa4MOUIZLj7MgXSePmqQC1VjhthdNWOG1DEtqJzQpJiM6r"
+    "2jLLCcsJqqYF5lpd5nWrIpFTvRTGKbqmUa7dqb5kRWWW62oD1JWVxTAkZe4U481XY/Ldqx"
+    "sA9EoCbpIgJ3bQdVJueOhJhjqjQlLyFZgg7mW+yoKdZaXzTGwPf1FTOnlA63DIg+8aFkbb"
+    "2pOJ7Xgw554B6kVKn6mj03vrmFrkIa7chpoPqjoD2zTtpz2/Sk5Qh3wJfe0JZoAl4vkcxw"
+    "hdm0W0Kh1mYDiu1y+bRxSnajovA1fCLnArDoosmk20lNwXky4AboxoTbDFMa0XtE3nalWG"
+    "dE2ztQCaUtwaEDRcs0OiyocDTcYPhb0x8QStIph28yHtphAND7g0pKcw0JSoGFeMAurVsS"
+    "20Bow8EGmYmO8MaUaM6z3ZjbTFYjSxP7771DTgrdWdR+bIOybo9QtVrDk4KMLzB/ksf5Cc"
+    "n/I5XI1kbx2kJyKavfUwJQzGNSXCAvUfDGCbUIftUUvfc5/oRCRvgaw3gqeQ01s6fHE22L"
+    "ugnjZqxlTQWk+3wsjWWk+3dGLzo6UXM6PmkS+0ha5lKsiSTXwpAFdngFpLuItan/IYr6wZ"
+    "KnJ0bXYmDxfgolHuIBWYtjVEV3c16KuWYpprqlN45VjsInDONtzF0hYKGvAUWMLmhrYxpP"
+    "qGNjfVG7EtzsB55rpSXdxbp1QbBTRYBsF1bc1AHiFPhjcilLcksHrC7AUQBCk37ha213E8"
+    "xJJoTXBNhBGETBsHNb9cZoSkaWuGXHLEg8GW2jwyJaK2LmYrjxZWNCIbV8HdKELRtIO5+i"
+    "HchhHXnMa3ZPldSbYVRfaCyfJrxapFRfXI+pzvh9/s2OwlpZwmEZ0boN2M2/2zY+u+linH"
+    "q1szZfiJaFRQfJddvrjBUA8ts/q/6hCd5a5oBr8HAwbTkxbmq3aY6XdX7vposc4wu1V0tk"
+    "CRzlaO/yU+NrD4diSZeWH3breQH7I7ww/ZTfshORolwFTt1wVMHMB7wp4Pn3fILhxCvoOn"
+    "ELq+rhk1ySn6z/ifcgtpP99Qn41RzUFiVOunmcIWpmVw+QnTYGszc/ztiiapjgqi55K4Ec"
+    "CDsVWC+uT0+Oyid/7s4LDTTdThVJi/SjFuq+RvqZLfehO3YmIXLw8pRWAhKddWESyiZaxe"
+    "OEimkmpBxZk1db3IkjgZ2lpYLCdfWZOKTTFdTRa3ydCo4JUHBq85JDtM62VliO+tCwx+x2"
+    "o7OA/CaSL8KpECO+2XENZf8RrAU8uHMEeJmtYa5CfcXIKjWi9FbHPjbANQ20jbnTql/QDX"
+    "9Yu1jcxxUdU1QrIuuJbi1Nab2srjraLVTmxu2OYauHUrVXJcYlnMpTh8S+i0US/WRiq0En"
+    "I+IfJlZJya0m8rKrWxk2fTC4JH0ao98jJVmbmOisyN4IOecdd/GBueF7jGayhdnbaPzAsl"
+    "UCWDlxxIsK6743JCDGqwQ80IHkjthfOsUv1ykQSi/z1lyCtSd2w+yb11i1HALnC+oY3CyA"
+    "HqxAMExO2o8SuzTFhoTZQ9tRXCmrJMBakH5YXqBOlaSdX4rT5RRVkd+k80PPULQr8tAnda"
+    "k5I7S6nFFKNpOpiyLrGu7ghVOZZyyMaJmoa2DhfQkuNUw6FUjKws/CGFNWTdosJPbN3Oj1"
+    "mdhJJJRXC3zoGZRDa+btcpeDWuQuZKoYWS0TI+dlXYR1owm2yet7RkN0XS0qT6UTExLba2"
+    "2tS0NjWtTU1rnSmtCrAxtso2QW2zEtS2RvBfdppaSaG/TVTb3EQ14QbJlPGlS2KWbK/cME"
+    "VEemibGbgohXTeF+HfrIBpdbPl+dJ9KGGeU4bLBSR1d8I0Y2BoUVlem1UsFvPcws9krLRa"
+    "bIwiVdE5nya2jttCtI2qGhtYJjFwUu7kreegSmLQFFO+DKvvsEeDPeEfsEpt8xFuFJyGWA"
+    "TduwIBdO9y4+ferVH2V62SAEK/9slfbd3JZrSIVufeUp27DWDciolNRTOpE3KBiU2Q1jCz"
+    "9YV7Bz50IXyjB51XWR/bj0K0LisabMiMK3xmruVftNZoiTi3uo/FfP2pLOb1fMupPtQjHx"
+    "CKaa4oTrHmgd8WU3G1sM3WtNlQXGynmm3z1yhKvAScy1UlnrNTbyLoNW/LpXEv+OW3Iukc"
+    "A8NkdYTbf4B+mrCVcKzxJZaUjlBT4gYMtaG8jQCkjSqYHfJUnv9CMdwcH0Y/YPCijgzOTG"
+    "FAkQv7Gzoi+GXqeVQbibgiHg2vyt+hdyLPq7F4h/y73PjRO5d8PvnQIb9//tghny8/co+G"
+    "jX4J0QuXKErEJiEuYuPwJ6ZN9dZhsOov15msP6HeKNtnkI1rjKhpQ/VnGIeKoOQs+AwY9A"
+    "Xw5wtgz6IpjImCcMUqws0qCZf+gJXxv4w6BUfGMJd7FUXDih/ubgTHQgyLPEw9VrT4g+Dc"
+    "d93uy5dvuvsvX789fPXmzeHb/YCF07dm8fLR2Udk5xjiGZ9OHtHu4esyzBxSNFy54OZTbw"
+    "9GQkbsB9GNIXM9Yg9CtsZvgqnzvyxHv35VgKFfv8rlZ7yViCKK7NYpsOfZiWOka2UoDu2J"
+    "HHM0J6rhFsR9WwzIWdF44WFd2MISkjRvYKkmpC/dtiKVtMqmlQYyjpej/nRSRpWQm9Yuum"
+    "lmIkNc55qnJ5RNY0D0C6cfzFIPynVSLIUB+62cwRDOextV1CYwtAkMbTBFKzJthsmuzV7Y"
+    "tOyFbRBDl5+6ME8SbTMXtiNzoad5xqPhTc/t4U6GaB+9PVOyp7Jh37SHBQV71TcBkiyR3B"
+    "eVi3gZHLTNodXCnboeG6fl+wp93VvABgNfEABM5tQzNFfK9LrhYSeGWdTm38rsqyqao2UH"
+    "oOcbQkOKpiX2Hh8JmTAHeG7M9I76BIwMMRVqJcb9A6iPzMFL+NGzhaL/l/PhHerAEhAIlp"
+    "iCBFnT83ALD+Y2aD6s92SXg4ywiyK7/BfOxGJelkJOlhKf3ZHoldpJYjRNy4dnJ8riL4ZF"
+    "MPPMW+mG0iqlW6+UbocKFRwOfL2EZ1fjGtTmS/uLQ7vpwr6Sbq9t0/QnO1kCf6LJbKFfNe"
+    "47vHXRD20yZ0+n04iwzauTMsclYwQV/oO5oVy1NXTGRZ9OaGpPCf8V+7u3ZBGpvfDrQeTJ"
+    "MTwW+AAc+0n06XKWcZhmOzp+qJPgtw3GDIaiEXksoAfhHxjOP9CUekTzHQc6NKf3FsBhgv"
+    "IhYzmGxiOzZO4neRGkSMPPMOYQ/lDlyTRmYg3QEzhRLJerMbx73SaW7RGYI3MqUrLlaLAs"
+    "KMY/4Zu7ZB8Tr3d3icuffW+J5URCRiYjGzgov1wovBDf6Hnn+CvMpU0mX6cC+8MSXW2J0Y"
+    "a0JTl9aSknG1HZfJZos+K9+/aY4BLnmVB8cevBKnxiwOrB4nNKVhidASsKMwmhMeT/tMoz"
+    "P/88pG5a8/kT9w5DbZS6VH3cQONxQy0oqH28kBZ0cFhACzo4zP8kzmEq0GxGCYCcCKgm0v"
+    "530qAfi6NA7vkd3I+NQbB9Gxp/3gIY1/+FnMXy6epIo1sI7P2MDVklC6hBdeAM5GhbRTGu"
+    "Wd9cNGOunkS52nENh9U4shtV8HcWpnJMAaALbAx1G0nwfCjj3VXtGwX0kn9sDMVzJSNwkz"
+    "+edyBFN4NkkGReFtI0YaPYHovyUFFAVTAUH6nPTdvK8NUQznwQfRcm39IzRIUPpk1noZ0i"
+    "TyA+QPoVYn7jj8fKK5BEGWciMtJqAu/V3dH5Kfl8fXp8dnN2dRk37fGbXMMLvrR9fdo7L/"
+    "d1o6WaNxhI16OdLKuGuNOZacwI28yzYORbWX8dB2FxS/OSVdvcCkn5CkF+iaRVK2LFUYxL"
+    "/IdF1CpolS/zH6YUK1waJUCUzTcTwKV8q1VmsKRB/P3m6jJPXgpIEkDeWfCCX3QDxUHTcL"
+    "2v6wnrDBTxrWMuo1QoaTJqtBP3BWEHR00fLz//DzeemL4="
+)
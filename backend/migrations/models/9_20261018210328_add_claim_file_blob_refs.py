@@ -0,0 +1,113 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "claim_files" ADD "filename" VARCHAR(255);
+        COMMENT ON COLUMN "claim_files"."file_path" IS 'Path to the file (PDF/JPG/PNG); a content-addressed blob for hashed files';
+        COMMENT ON COLUMN "claim_files"."filename" IS 'Name the file was uploaded under';
+        CREATE INDEX IF NOT EXISTS "idx_claim_files_sha256_dbcb17" ON "claim_files" ("sha256");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_claim_files_sha256_dbcb17";
+        ALTER TABLE "claim_files" DROP COLUMN "filename";
+        COMMENT ON COLUMN "claim_files"."file_path" IS 'Path to the file (PDF/JPG/PNG)';"""
+
+
+MODELS_STATE = (
+    "eJztXVlz27YW/isYvzidkRNbibP1yXac1LdeMl5uO40zKkxBEicUqXKxo9vJf7/nYCG4Sq"
+    "RIiZLCh6YyiQOCHw6As/PfnbHTZ5b3/Nqx2M578u+OTcf4I3a9Q3boZKKv4gWfPnCKHRda"
+    "8Cv0wfNdavhwcUAtj8GlPvMM15z4pmNjU+yM8C6IyyYu85jtm/aQBB5zCe+HmDbxR4x4U8"
+    "9n4+fYbd8xoF9otlAP9zaSeO/JUX9s2h1yE0yY+2h6jtshV/CT+vjrxDKhI3xaYJv/BKzn"
+    "O0MGvbjwzC9f4bJp99l3eE355+Rbb2Ayqx9DzOxjB/x6z59O+LUz2//IG+KLPPQMxwrGtm"
+    "48mfojxw5bm2IMQ2bjwBh277sBAmkHliUBV9iKkeomYogRmj4b0MDC6UDq9GwcBb6zZ9qG"
+    "y8bw8mTimmPqTsk3Nk3CLukNx8YZhlF6/MWH+PS97sGrN6/evnz96i004SMMr7z5IV5bYy"
+    "IIOTKXtzs/+H3qU9GCw6vx5P9PIXoyom42pKp9AlQYchJUBeEyUOUcikN5T3Y5z+12yK7m"
+    "OvxL8R3+Fpy3WxDxMf3es5g99Efw5+H+DHj/e3R98tvR9bPD/V+wbwcWpliul/JOl9/CGd"
+    "CIR18lBfwt+57DywmyhfCX6IbwqyYaf72nzJ6AK/6LWiRynTgDvim4cjebD/UMaG9P/7zF"
+    "Tsae948VhfTZxdGfHO3xVN45v7r8pJpHpuDk/Oo4AT2sQgSnR/008h/gjm+OWTb6ccoE+H"
+    "1J+lz9WGQpLDwX6uJ8xoZ36F/Z1lRywiz0zy5Ob26PLj7HpuDD0e0p3unG4FdXn71OLIKw"
+    "E/LH2e1vBP8kf11dnnIEHc8fuvyJut3tXzs4JgpbZs92nnq0H9kS1FUFTGxig0l/wYmNU7"
+    "YT2+jE8sHj0T/4Fjms8MIDNb49Ubffi92JMACIJj3ceHousygC6KU54Vh28vH3a9koY86l"
+    "SHYHHSqxbGUzLs416nnm0GZ94jt8P8V3K7Wf6qtRTJ2ukwdq+ta4O87FOQPZC2pPbx38l6"
+    "+yM3g+tY0sQSEC7yoFhjstuj4bwzD3QCrD//9SDdiOfKFeQqBXr8eZEXYXdTsU4weOy5FH"
+    "OVDB2hPiajgr8h7nanHLH7lOMBzlsCmgDNeYLyS4o5uTow98SfaSoi5nB3h7OuSX8JV/dO"
+    "Jjz1BS1DvlKykhc8xXUvh8ZKgY1LI4v8/VUcp2cG/f8asGtcmIPoJ+A+xiTiwmuUJCGy64"
+    "nrgc5RUSbi0jc/K8mB7zJSE5wDx+bXWbFek2OI9l9ZsoTbM6zh3vgEQH1LzywsbUtMrgGR"
+    "KsBZh8NATED9gwvEUQPdgvAim0ysWU34uDOoET/8mBHX9EvVEZcFOE9YC8uPzyG4wDBBc1"
+    "rkUQ7h4eFkAYWuUizO/FETa9HhxH5mPGVnDswEZP7ZxNNkqXAPcBCJeFbsjVMXT/GPFjJj"
+    "yjCDUMJ4Cd1/SIHmYltfv46uo8phocnyX16ruL41NgcQ4/NDKFvKF2Y42573xjdu8RDt1M"
+    "S0fuwZaim3/G1QX7fhrzM3W8CXncZY8wPDjq2KPpBJ41Bey9AO7BVMCWQvjgi+4stRx/rX"
+    "Vjy5Tg1rqxpRP701s3uM7G1TI4sKLKVEXrRnStKONJzwu9AdWg0l4F5VFYLWjqqeLEfzYO"
+    "PF8osOENZIyKdowYhAo5ANGRz6jIbk1jqJ+fQjFyq24cQ1YE+bJfEcFz6GLFDh7JXVFr5I"
+    "jafYuJ9WvJEdUEFnYHTcYoatWA1YnoqYH97WnkENj0R46LmCFShh5LTWAZ3J9ZE1zCObrd"
+    "gIVL0bCoOfbCfa0qctDZeq1KQw1pScDVdaquHrrIRh8Fz0FFky0JPd5fbcsU+tryVYo2DN"
+    "Of9ixnWBGtI9nVuTNsCCzgtoHjjjlajJtnxHhX5cVLnRYT1xmYVpYFTHZwZbNbB/4pemSs"
+    "dPneRe1dlml/U/5RvmxxOFGpTgywFoluljdUu/OqeUMXVcU2xBuqXi/pDdXO5Lg3NOLxTD"
+    "pDo47SGryhwtYy1x2aF7cZfd5st2ivRAAn9ronYjDzvI/C85ntFS1Gem9f0IknXaUi0MDM"
+    "Dw/NcHR+2VFxCTze62sbwNmMk7O1+m6FcTBt9Y3sggVXS4RidT6TpQQy1e0a4VtwKSwjFE"
+    "1jWdFsWgeWKat1HNo0rh9BT4C5/50tOyBs7azReCDSp/DgizJSpkiSWvM1gLk1gYtJMCM7"
+    "XDaY+d6UiiGQM2XEDPt2hrSYbQXPlxu1rSVmr5ovQOoH7WknQQHpsSDdvX0MDOKR0DmA86"
+    "0H6xEQ54nASohMgQtHI/OAMGKEyTXB65QhkuPsyBdJ4+apELVWOG2F01Y4bUMS2onNCkmI"
+    "zqvaMssJywmqpgXmWl3mdasikVO9FMYpuqZRrt2pvmRFZZbragPUlZXFMCRl7hTjzVdj8t"
+    "2rGwD0SgJukiAndtB1Um546EmGOqNCUvIVmDDuZb7Kgp1lpfNMHB9/UUs6eUDrcMlD4Jk2"
+    "Rts6k4nj+jDnvgnqRUqfqaPTe/uE2uQhrtxqzQdVnYFjWc7TXlAlJ6hDvmhfe4IZYIn4Ac"
+    "cxQtdmEa1KhxmYruf3yuYRxamazsvAlbAL3IqDIotmEy0l98WiC4AbI1oTbHFM6wVt07la"
+    "lSFd02wtgKYUt4YEDdfskKjy4UCT8UNhb0w8QasIpt18SLspRPUBl4b0FAaaEhXjilFIvT"
+    "q2hdaAkQ8iDRPznSHNiHG9J7uRtliMJvbHPwG1THhrdeeRufKOBXr9QhVrDg6K8PxBPssf"
+    "JOenfA5XI9lbB+mJiGZvPUwJg3FNibBA/YoBbBPqsj1q9/e8JzoRyVsg643gKeT0lg5fnA"
+    "32LqhvjJoxFbTW060wsrXW0y2d2Pxo6cXMqHnkC22ha5kKsmQTXwrA1Rmg1hLuotanPMYr"
+    "a4aKHF2bncnDBbholDtIBZZjD9HVXQ36qqWY5prqFF45FrsInLMNd7G0hYIGPAWWsLmhbQ"
+    "ypvqHNTfVGHJszcJ65rlQX9/YpNUYhDZZB8DzHMJFHyJPpjwjlLQmsHp29AIIg5cbdwvY6"
+    "jodYEq0JrokwAs20cVDzy2VGSJq2ZsglR3wYbKnNI1MiautitvJoYUUjsnEV3I0iFE07mK"
+    "sfwm0Ycc1pfEuW35VkW1FkL5gsv1asWlRUj6zP+X74zY7NXlLKaRLRuQHazbjdP7tOPzAy"
+    "5Xh1a6YMPxGNCorvsssXNxjqYWRW/1cdorPcE83g92DAYHrSwnzVDjP97spdHy3WqbNbRW"
+    "cLFOls5fif4mMDi29HkpkXdu92C/khuzP8kN20H5KjUQJM1X5dwMQBvCfs+fB5h+zCIRS4"
+    "eAqh6+uaUYucov+M/ym3kPbzDfXZGNUcJEa1fpopbGFGBpd/YAZsbVaOv13RJNVRQfRcEj"
+    "cCeDi2SlB/OD05uzg6f3Zw2Okm6nAqzF+lGLdV8rdUyW+9iVsxsYuXh5QisJCUa6sIFtEy"
+    "Vi8cJFNJjbDizJq6XmRJnAxtTRfLyVfWpGJTTFeTxW0yNCp45YHJaw7JDtN6WRnie/sCg9"
+    "+x2g7Og3CaCL9KpMBO+yWE9Ve8BvDU8iHMUaKmtQb5CTeP4KjWSxHb3DjbENQ20nanTmk/"
+    "xHX9Ym0jc1xUdY2QrAuupTi19aa28niraLUTmxu2uQZu3UqVHJdYFnMpDt8SOm3Ui7WRCq"
+    "2EnE+IfBkZp6b024pKbezk2fSC4FG0ao+8TFVmrqMicyP4oGfcCx7Gpu+HrvEaSlen7SPz"
+    "QglUyeAlBxKs6+64nBCDGuxQM4IHUnvhPKtUr1wkgeh/TxnyitQdm09yb99iFLAHnG8aIx"
+    "05QN14gIC4HTV+ZZYJ09ZE2VNbIawpy1SYelBeqE6QrpVUjd/qE1WU1aH/RPWpXxD6bRG4"
+    "05qU3FlKLaYYTdPBlHWJdXVHqMqxlEM2TtQ0tHW4gJYcp6qHUjGysvCHFNaQdYsKP7F1Oz"
+    "9mdaIlk4rgbp0DM4lsfN2uU/BqXIXMlUILJaNlfOyqsI+0YDbZPG9pyW6KpKVJ9aNiYlps"
+    "bbWpaW1qWpua1jpTWhVgY2yVbYLaZiWobY3gv+w0tZJCf5uotrmJasINkinjS5fELNleuW"
+    "GKiPTQNjNwUQrpvC/Cv1kB0+ply/Ol+1DCPKfUywUkdW/CDHNgGlFZ3phVLBbz3PRnMlZa"
+    "LTZGkaronE8TW8dtIdpGVY0NLJMYOil38tZzWCUxbIopX6bdc9mjyZ7wD1iljvUINwpOQy"
+    "yC7l2BALp3ufFz79Yo+6tWSQChX/vkr7buZDNaRKtzb6nO3QYwbsXEpqKZ1Am5wMQmSGuY"
+    "2frCvUMfuhC+0YPOq6yPnUchWpcVDTZkxhU+M9fyT1prtEScW93HYr7+VBbzer7lVB/qkQ"
+    "8IxTRXFKdY88Bvi6m4Wthma9psKC62U822+XMUJV4CzuWqEs/ZqTcR9Jq35dK4F/zyW5F0"
+    "joFpsTrC7T9CP03YSjjW+BJLSkeoKXEDhtpQ3kYI0kYVzNY8lee/UAw3x4fRCxm8qCODM5"
+    "MOKPJgf0NHBL9MfZ8aIxFXxKPhVfk79E7keTUW75B/lxs/eueRzx8+dsh/Pn/qkM+Xn7hH"
+    "w0G/hOiFSxQlYpMQF7FxBBPLof2IX8Eb0e7h69Z5sMKv2FmsN6H+KNt/kI1rjKhpo/VnGI"
+    "eKpuTs+AyY9QXw6gtg1V9+xZg6x8YPO+7J7HC0vVrOA18NI+qN4O9wlZavI1eskNysSnKp"
+    "XHwcTfnvCmqahrPxL2EYejbQOqOWOQmgs8UKHhweFql4cHiYX/IA7yW+L2b+LwPjY3OYu6"
+    "Eoiob1cjx8CI6FmDZ5mPqFeVdsJu+63Zcv33T3X75+e/jqzZvDt/vhrpK+NWt7OT77hDtM"
+    "DPGML1uLPb0EM2uKhln55rejPRgJGbHvpG8OmecTZ6B5W24sC+0cr18VYOjXr3L5GW8lgr"
+    "wih2kK7Hlm/BjpWtnxtbk3tZ8UxH1b7PtZwZJalipsANMkzdu/qulQSzd9SR26suWrgYTw"
+    "5WinnZTNS3PT2gWfzcwziavE89S4slkmiH7h7JBZ2lu5ToplmGC/lRNM9Ly3QV9tfkmbX9"
+    "LGurQi02ZYVNvkkk1LLtkGMXT5mSXzJNE2sWQ7EkuODN98NP3puTPcyRDto7dnSvZUNuxZ"
+    "zrCgYK/6JkCSJZIHorAUr1KEtjm0WnhTz2fjtHxfoa97G9hgEAgCgMma+qbhSZm+b/rYiW"
+    "kVdcm0MvuqahoZ2fkB+YZQTdG0xH7ER0ImzAWeG7N+R32hR0YAC7US0zIA1Efm4iX8Jt1C"
+    "yRnL+S4SdWEJCARLTEGCrOl5uIUHcxs0H9Z7sstBRthFDWT+C2diMW9WIWdWia8iSfRK7S"
+    "Qxmqblw7MPyuIvhkUwMdBf6YbSKqVbr5RuhwoVHg58veizq3ENavOl/cWh3XRhX0m3145l"
+    "BZOdLIE/0WS20K8a91zeuuh3UJm716fTiLDNi8cy1yNjBBX+g7mhXLU1+4yLPh1tak8J/x"
+    "X7u7dlja89/XEn8uSaPgt9AK7zJPr0OMu4zHDcPn5HleCnJ8YMhmIQeSygB+FvGM7f0JT6"
+    "xAhcFzq0pvc2wGGB8iHDa4bmI7Nlai55EWaww08dEgp/qOpxBrOwROsHOFFsj6sxvPu+Q2"
+    "zHJzBH1lRkzMvRYNVWDE/DN/fIPubF7+4Sjz/73hbLiWhGJiMHOCi/miu8EN/oeef4S6c6"
+    "J3PjU3kXuoJaWwG2IW1JTl9ayslGVDafJdqseO++PSG4xHmiGl/c/XAVPjFg9XDxuSULwM"
+    "6AFYWZhNCo+T+t8swvD6Cpm9Z8/sC9w1QbZV+qPl6o8XhaCwpLUy+kBR0UCTU7yI80O0gH"
+    "ms2o0JATAdVEVYadNOgn4iiQe34H92NzEG7fpsGftwDG9X/AaLF0xzqyHBcCez9jQ1a5HG"
+    "pQHTgDOdp2UYxr1jcXTWisJ4+xdlz1sBpHdqPqMc/CVI4pBHSBjaFuIwmeD2W8u6p9o4Be"
+    "8m/BoXiuZARu8sfzDqToZpAMawCUhTRN2Ci2J6J6VxRQFQzFRxpw07YyfDWEMx9Ez4PJt/"
+    "sZosJHy6Gz0E6RJxAfIP0KMb8JxmPlFUiijDMRGWk1gffq7vj8lHy+Pj05uzm7uoyb9vhN"
+    "ruGFH0K/Pj06L/fxqaWaNxhI16OdLKuGuNOZaczQbeZZMPKtrD+Pg7C4pXnJqm1uAat8hS"
+    "C/gtWqFbHiKC4/gweXRgkQZfPNBHApn9KVGSxpEP9zc3WZJy+FJAkg72x4wS99E8VBy/T8"
+    "r+sJ6wwU8a1jLqNUKGkyarQT9wVhB8dNHy8//g9SLh6+"
+)
@@ -0,0 +1,29 @@
+import asyncio
+
+from tortoise import Tortoise
+
+from app.config import TORTOISE_CONFIG
+from app.services.rollup_service import RollupService
+
+
+async def rebuild_rollups() -> None:
+    """
+    Initialize Tortoise ORM and recompute the analytics rollups from the
+    leads, claims and client_products tables.
+
+    The add_analytics_rollups migration backfills the table itself; run this
+    whenever data was changed outside the services (manual SQL, cascading
+    deletes). Safe on a live system: writes to the source tables wait until
+    the rebuild commits.
+    """
+    await Tortoise.init(config=TORTOISE_CONFIG)
+
+    rows = await RollupService.rebuild()
+    print(f"Wrote {rows} analytics rollup rows")
+
+    await Tortoise.close_connections()
+    print("Done.")
+
+
+if __name__ == "__main__":
+    asyncio.run(rebuild_rollups())
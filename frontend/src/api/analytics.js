@@ -15,3 +15,10 @@ export const getClaimsAnalytics = () => api.get('/analytics/claims');
 // Get supervisors analytics
 export const getSupervisorsAnalytics = () => api.get('/analytics/supervisors');
 
+
+// Get several analytics sections in one request (defaults to all sections)
+export const getDashboardAnalytics = (sections) =>
+  api.get('/analytics/dashboard', {
+    params: { sections },
+    paramsSerializer: { indexes: null },
+  });
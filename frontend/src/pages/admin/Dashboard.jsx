@@ -9,12 +9,7 @@ import {
   TeamOutlined,
   ShoppingOutlined,
 } from '@ant-design/icons';
-import {
-  getLeadsAnalytics,
-  getClientsAnalytics,
-  getRevenueAnalytics,
-  getClaimsAnalytics,
-} from '../../api/analytics';
+import { getDashboardAnalytics } from '../../api/analytics';
 
 const AdminDashboard = () => {
   const [stats, setStats] = useState({
@@ -28,17 +23,13 @@ const AdminDashboard = () => {
   useEffect(() => {
     const fetchStats = async () => {
       try {
-        const [leads, clients, revenue, claims] = await Promise.all([
-          getLeadsAnalytics(),
-          getClientsAnalytics(),
-          getRevenueAnalytics(),
-          getClaimsAnalytics(),
-        ]);
+        const response = await getDashboardAnalytics(['leads', 'clients', 'revenue', 'claims']);
+        const { leads, clients, revenue, claims } = response.data.sections;
         setStats({
-          leads: leads.data?.total_leads || 0,
-          clients: clients.data?.total_clients || 0,
-          revenue: revenue.data?.total_revenue || 0,
-          claims: claims.data?.total_claims || 0,
+          leads: leads?.total_leads || 0,
+          clients: clients?.total_clients || 0,
+          revenue: revenue?.total_revenue || 0,
+          claims: claims?.total_claims || 0,
         });
       } catch (error) {
         console.error('Error fetching stats:', error);
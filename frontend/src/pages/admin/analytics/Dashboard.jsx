@@ -6,13 +6,7 @@ import {
   FileTextOutlined,
   RiseOutlined,
 } from '@ant-design/icons';
-import {
-  getLeadsAnalytics,
-  getClientsAnalytics,
-  getRevenueAnalytics,
-  getClaimsAnalytics,
-  getSupervisorsAnalytics,
-} from '../../../api/analytics';
+import { getDashboardAnalytics } from '../../../api/analytics';
 
 const AdminAnalyticsDashboard = () => {
   const [leadsData, setLeadsData] = useState(null);
@@ -25,18 +19,13 @@ const AdminAnalyticsDashboard = () => {
   useEffect(() => {
     const fetchAnalytics = async () => {
       try {
-        const [leads, clients, revenue, claims, supervisors] = await Promise.all([
-          getLeadsAnalytics(),
-          getClientsAnalytics(),
-          getRevenueAnalytics(),
-          getClaimsAnalytics(),
-          getSupervisorsAnalytics(),
-        ]);
-        setLeadsData(leads.data);
-        setClientsData(clients.data);
-        setRevenueData(revenue.data);
-        setClaimsData(claims.data);
-        setSupervisorsData(supervisors.data);
+        const response = await getDashboardAnalytics();
+        const { leads, clients, revenue, claims, supervisors } = response.data.sections;
+        setLeadsData(leads);
+        setClientsData(clients);
+        setRevenueData(revenue);
+        setClaimsData(claims);
+        setSupervisorsData(supervisors);
       } catch (error) {
         console.error('Error fetching analytics:', error);
       } finally {
@@ -97,7 +97,11 @@ const claimsSlice = createSlice({
           state.items[index] = action.payload;
         }
         if (state.currentClaim?.id === action.payload.id) {
-          state.currentClaim = action.payload;
+          // Update responses leave comments out; keep the ones already loaded
+          state.currentClaim = {
+            ...action.payload,
+            comments: action.payload.comments ?? state.currentClaim.comments,
+          };
         }
       })
       .addCase(updateClaim.rejected, (state, action) => {
@@ -102,7 +102,11 @@ const leadsSlice = createSlice({
           state.items[index] = action.payload;
         }
         if (state.currentLead?.id === action.payload.id) {
-          state.currentLead = action.payload;
+          // Update responses leave comments out; keep the ones already loaded
+          state.currentLead = {
+            ...action.payload,
+            comments: action.payload.comments ?? state.currentLead.comments,
+          };
         }
       })
       .addCase(updateLead.rejected, (state, action) => {